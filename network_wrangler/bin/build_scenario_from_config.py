@@ -24,20 +24,52 @@ The configuration file should be in YAML format and include the following inform
 The script reads the configuration file, creates a base scenario using the base network
 information, and then creates a scenario by applying projects from the project card file to
 the base scenario. The modified network can be written out to files if specified.
+
+Multiple scenarios:
+    python build_scenario.py alt1.yaml alt2.yaml alt3.yaml --max-workers 3
+
+    Given more than one configuration file, each base scenario is loaded once and the scenarios
+    built from it are built in parallel worker processes, up to `--max-workers` at a time and as
+    many as are expected to fit in available memory. The time and memory used by each scenario
+    is reported.
 """
 
 import argparse
 from pathlib import Path
 
-from network_wrangler.scenario import build_scenario_from_config
+from network_wrangler.scenario import build_scenario_from_config, build_scenarios_from_configs
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Build a scenario from a configuration file.")
+    parser = argparse.ArgumentParser(
+        description="Build one or more scenarios from configuration files."
+    )
     parser.add_argument(
         "config_file",
         type=Path,
-        help="Path to configuration file.",
+        nargs="+",
+        help="Path to configuration file, or paths to one for each scenario.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Maximum number of scenarios to build at once. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--memory-per-scenario",
+        type=float,
+        default=None,
+        help="Memory in GB each scenario is expected to use in addition to its base. "
+        "Defaults to the size of the base scenario's tables.",
     )
     args = parser.parse_args()
 
-    build_scenario_from_config(args.config_file)
+    if len(args.config_file) == 1:
+        build_scenario_from_config(args.config_file[0])
+    else:
+        memory_per_scenario = args.memory_per_scenario and args.memory_per_scenario * 2**30
+        build_scenarios_from_configs(
+            args.config_file,
+            max_workers=args.max_workers,
+            memory_per_scenario=memory_per_scenario,
+        )
@@ -60,6 +60,9 @@ If not provided, Wrangler will use reasonable defaults.
             geojson: 0.03
             json: 0.15
             txt: 0.04
+    VALIDATION:
+        MODE: full
+        STAMP_FILES: false
     ```
 
 Extended usage:
@@ -207,6 +210,26 @@ class CpuConfig(ConfigItem):
     )
 
 
+@dataclass
+class ValidationConfig(ConfigItem):
+    """Configuration for how tables are validated to their data models.
+
+    Attributes:
+        MODE: How much of a table is validated. One of `full`, `incremental`, or `trusted`.
+            `full` validates every table in full whenever it is created or edited.
+            `incremental` only validates the rows and columns of a table which were edited since
+            it was last validated. `trusted` also only checks the schema and dtypes of files
+            which Wrangler wrote itself and stamped with the hash of their data model, and
+            validates edits incrementally. Defaults to `full`.
+        STAMP_FILES: If True, valid tables which are written are stamped with the hash of their
+            data model in a `<file>.stamp` file next to them so they can be read in `trusted`
+            mode. Defaults to False.
+    """
+
+    MODE: Literal["full", "incremental", "trusted"] = "full"
+    STAMP_FILES: bool = False
+
+
 @dataclass
 class WranglerConfig(ConfigItem):
     """Configuration for Network Wrangler.
@@ -216,12 +239,14 @@ class WranglerConfig(ConfigItem):
         MODEL_ROADWAY: Parameters governing how the model roadway is created.
         CPU: Parameters for accessing CPU information. Will not change any outcomes.
         EDITS: Parameters governing how edits are handled.
+        VALIDATION: Parameters governing how tables are validated.
     """
 
     IDS: IdGenerationConfig = IdGenerationConfig()
     MODEL_ROADWAY: ModelRoadwayConfig = ModelRoadwayConfig()
     CPU: CpuConfig = CpuConfig()
     EDITS: EditsConfig = EditsConfig()
+    VALIDATION: ValidationConfig = ValidationConfig()
 
 
 DefaultConfig = WranglerConfig()
@@ -85,6 +85,10 @@ class RoadwayPropertyChangeError(Exception):
     """Raised when there is an issue with applying a roadway property change."""
 
 
+class ScenarioBuildError(Exception):
+    """Raised when one or more scenarios fail to build."""
+
+
 class ScenarioConflictError(Exception):
     """Raised when a conflict is detected."""
 
@@ -1,6 +1,9 @@
 import copy
 import hashlib
 from collections import defaultdict
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from functools import cache
 from typing import Callable, ClassVar, Optional
 
 import pandas as pd
@@ -9,8 +12,9 @@ from pandera.errors import SchemaErrors
 
 from ...logger import WranglerLogger
 from ...params import SMALL_RECS
-from ...utils.data import fk_in_pk
-from ...utils.models import validate_df_to_model
+from ...utils.data import copy_validated, fk_in_pk
+from ...utils.models import ValidationModes, validate_df_to_model
+from ...utils.utils import next_version
 
 
 class RequiredTableError(Exception):
@@ -69,10 +73,16 @@ class DBModelMixin:
     """An mixin class for interrelated pandera DataFrameModel tables.
 
     Contains a bunch of convenience methods and overrides the dunder methods
-        __deepcopy__ and __eq__.
+        __copy__, __deepcopy__ and __eq__.
 
     Methods:
         hash: hash of tables
+        version: tuple of versions of tables which changes every time a table is set
+        mark_modified: assign new versions to tables which were mutated in place
+        batch_update: context manager which defers fk checks until all tables are set
+        key_index: cached unique values of a table field used as or referenced by an fk
+        copy: copy of db whose tables share data with this one until they are set
+        materialize: replace tables with deep copies so they can be mutated in place
         deepcopy: deepcopy of tables which references a custom __deepcopy__
         get_table: retrieve table by name
         table_names_with_field: returns tables in `table_names` with field name
@@ -90,6 +100,8 @@ class DBModelMixin:
         _converters: mapping of `<table_name>:<converter_method>` where converter method should
             have a function signature of `(<table>, self.**kwargs)` .  Called on `__setattr__` if
             initial validation fails.
+        validation_mode: how tables are validated when they are set. One of `full`,
+            `incremental` or `trusted`. See `validate_df_to_model`. Defaults to `full`.
 
     Where metadata variable _fk = {<table_field>:[<fk table>,<fk field>]}
 
@@ -109,6 +121,9 @@ class DBModelMixin:
     # mapping of <table_name>:<conversion method> to use iff df validation fails.
     _converters: ClassVar[dict[str, Callable]] = {}
 
+    # how tables are validated when they are set.
+    validation_mode: ValidationModes = "full"
+
     def __setattr__(self, key, value):
         """Override the default setattr behavior to handle DataFrame validation.
 
@@ -126,6 +141,7 @@ class DBModelMixin:
             WranglerLogger.debug(f"Validating + coercing value to {key}")
             df = self.validate_coerce_table(key, value)
             super().__setattr__(key, df)
+            self.mark_modified(key)
         else:
             super().__setattr__(key, value)
 
@@ -135,7 +151,7 @@ class DBModelMixin:
         table_model = self._table_models[table_name]
         converter = self._converters.get(table_name)
         try:
-            validated_df = validate_df_to_model(table, table_model)
+            validated_df = validate_df_to_model(table, table_model, mode=self.validation_mode)
         except SchemaErrors as e:
             if not converter:
                 raise e
@@ -147,6 +163,12 @@ class DBModelMixin:
             converted_df = converter(table, **self.__dict__)
             validated_df = validate_df_to_model(converted_df, table_model)
 
+        _deferred_fk_tables = self.__dict__.get("_deferred_fk_tables")
+        if _deferred_fk_tables is not None:
+            # keep the table it replaces in case the batch is rolled back
+            _deferred_fk_tables.setdefault(table_name, self.__dict__.get(table_name))
+            return validated_df
+
         # Do this in both directions so that ordering of tables being added doesn't matter.
         self.check_table_fks(table_name, table=validated_df)
         self.check_referenced_fks(table_name, table=validated_df)
@@ -172,13 +194,82 @@ class DBModelMixin:
         self.table_names += _opt_tables
 
         # Set tables in order
-        for table in self.table_names:
-            WranglerLogger.info(f"Initializing {table}")
-            self.__setattr__(table, kwargs[table])
+        with self.batch_update():
+            for table in self.table_names:
+                WranglerLogger.info(f"Initializing {table}")
+                self.__setattr__(table, kwargs[table])
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Context manager which defers fk checks until all the tables in it have been set.
+
+        Tables are still validated to their models as they are set, but foreign keys are checked
+        once on exit for every fk which uses or references a table that was set, rather than in
+        both directions each time a table is set. Nested calls are checked by the outermost one.
+
+        If the fk checks or anything else in the batch fails, the tables which were set and
+        their versions are rolled back to what they were before the batch.
+
+        Example:
+            ```python
+            with feed.batch_update():
+                feed.shapes = shapes_df
+                feed.trips = trips_df
+                feed.stops = stops_df
+                feed.stop_times = stop_times_df
+            ```
+
+        Raises:
+            ForeignKeyValueError: on exit if fk values used in a table that was set are missing.
+        """
+        if self.__dict__.get("_deferred_fk_tables") is not None:
+            yield
+            return
+        _prev_tables: dict[str, Optional[pd.DataFrame]] = {}
+        _prev_versions = dict(self.__dict__.get("_table_versions", {}))
+        self.__dict__["_deferred_fk_tables"] = _prev_tables
+        try:
+            try:
+                yield
+            finally:
+                self.__dict__.pop("_deferred_fk_tables")
+            self.check_deferred_fks(_prev_tables)
+        except Exception:
+            WranglerLogger.debug(f"Rolling back tables set in failed batch: {list(_prev_tables)}")
+            for table_name, prev_table in _prev_tables.items():
+                if prev_table is None:
+                    self.__dict__.pop(table_name, None)
+                else:
+                    self.__dict__[table_name] = prev_table
+            self.__dict__["_table_versions"] = _prev_versions
+            raise
+
+    def check_deferred_fks(self, table_names: Collection[str]) -> bool:
+        """Check each fk which uses or references tables in table_names once.
+
+        Raises:
+            ForeignKeyValueError: if fk values used in any of table_names are missing.
+        """
+        table_names = [t for t in self.table_names if t in table_names]
+        all_valid = True
+        for table_name in table_names:
+            valid = self.check_table_fks(table_name, raise_error=False)
+            all_valid = valid and all_valid
+        if not all_valid:
+            msg = f"FK fields/ values referenced in {table_names} missing."
+            raise ForeignKeyValueError(msg)
+        # fks used by tables in table_names have already been checked above.
+        for table_name in table_names:
+            self.check_referenced_fks(table_name, skip_tables=table_names)
+        return all_valid
 
     @classmethod
+    @cache
     def fks(cls) -> DbForeignKeys:
-        """Return the fk field constraints as `{ <table>:{<field>:[<fk_table>,<fk_field>]} }`."""
+        """Return the fk field constraints as `{ <table>:{<field>:[<fk_table>,<fk_field>]} }`.
+
+        Cached for each class because the table models don't change.
+        """
         fk_fields = {}
         for table_name, table_model in cls._table_models.items():
             config = table_model.Config
@@ -188,12 +279,14 @@ class DBModelMixin:
         return fk_fields
 
     @classmethod
+    @cache
     def fields_as_fks(cls) -> DbForeignKeyUsage:
         """Returns mapping of tables that have fields that other tables use as fks.
 
         `{ <table>:{<field>:[(<table using FK>,<field using fk>)]} }`
 
         Useful for knowing if you should check FK validation when changing a field value.
+        Cached for each class because the table models don't change.
         """
         pks_as_fks: defaultdict = defaultdict(lambda: defaultdict(list))
         for t, field_fk in cls.fks().items():
@@ -202,13 +295,38 @@ class DBModelMixin:
                 pks_as_fks[fk_table][fk_field].append((t, f))
         return {k: dict(v) for k, v in pks_as_fks.items()}
 
+    def key_index(self, table_name: str, field: str) -> pd.Index:
+        """Unique non-null values of table_name.field to check fks against.
+
+        Cached for each table and field until the table is set or marked as modified, so that
+        setting one table doesn't re-scan the fields of every table it is related to.
+        """
+        table = self.get_table(table_name)
+        version = self.__dict__.get("_table_versions", {}).get(table_name, 0)
+        _key_indices = self.__dict__.setdefault("_key_indices", {})
+        cached_version, index = _key_indices.get((table_name, field), (None, None))
+        if cached_version != version:
+            index = pd.Index(table[field].dropna().unique(), name=field)
+            _key_indices[(table_name, field)] = (version, index)
+        return index
+
     def check_referenced_fk(
-        self, pk_table_name: str, pk_field: str, pk_table: Optional[pd.DataFrame] = None
+        self,
+        pk_table_name: str,
+        pk_field: str,
+        pk_table: Optional[pd.DataFrame] = None,
+        skip_tables: Collection[str] = (),
     ) -> bool:
         """True if table.field has the values referenced in any table referencing fields as fk.
 
         For example. If routes.route_id is referenced in trips table, we need to check that
         if a route_id is deleted, it isn't referenced in trips.route_id.
+
+        Args:
+            pk_table_name: name of the table with the referenced field.
+            pk_field: field referenced as an fk.
+            pk_table: table to check. Defaults to the table set as pk_table_name.
+            skip_tables: referencing tables to skip, e.g. because they were already checked.
         """
         msg = f"Checking tables which referenced {pk_table_name}.{pk_field} as an FK"
         # WranglerLogger.debug(msg)
@@ -232,6 +350,8 @@ class DBModelMixin:
         all_valid = True
 
         for ref_table_name, ref_field in fields_as_fks[pk_table_name][pk_field]:
+            if ref_table_name in skip_tables:
+                continue
             if ref_table_name not in self.table_names:
                 WranglerLogger.debug(
                     f"Referencing table {ref_table_name} not in self.table_names - \
@@ -255,7 +375,9 @@ class DBModelMixin:
                 )
                 continue
 
-            valid, _missing = fk_in_pk(pk_table[pk_field], ref_table[ref_field])
+            valid, _missing = fk_in_pk(
+                pk_table[pk_field], self.key_index(ref_table_name, ref_field).to_series()
+            )
             all_valid = all_valid and valid
             if _missing:
                 WranglerLogger.error(
@@ -264,11 +386,21 @@ class DBModelMixin:
                 )
         return all_valid
 
-    def check_referenced_fks(self, table_name: str, table: Optional[pd.DataFrame] = None) -> bool:
+    def check_referenced_fks(
+        self,
+        table_name: str,
+        table: Optional[pd.DataFrame] = None,
+        skip_tables: Collection[str] = (),
+    ) -> bool:
         """True if this table has the values referenced in any table referencing fields as fk.
 
         For example. If routes.route_id is referenced in trips table, we need to check that
         if a route_id is deleted, it isn't referenced in trips.route_id.
+
+        Args:
+            table_name: name of the table with fields referenced as fks.
+            table: table to check. Defaults to the table set as table_name.
+            skip_tables: referencing tables to skip, e.g. because they were already checked.
         """
         # WranglerLogger.debug(f"Checking referenced foreign keys for {table_name}")
         all_valid = True
@@ -276,7 +408,9 @@ class DBModelMixin:
             table = self.get_table(table_name)
         all_valid = True
         for field in self.fields_as_fks().get(table_name, {}):
-            valid = self.check_referenced_fk(table_name, field, pk_table=table)
+            valid = self.check_referenced_fk(
+                table_name, field, pk_table=table, skip_tables=skip_tables
+            )
             all_valid = valid and all_valid
         return all_valid
 
@@ -331,7 +465,7 @@ class DBModelMixin:
                 pass
                 # WranglerLogger.debug(f"PK values:\n{pkref_table[pkref_field]}.")
             # WranglerLogger.debug(f"Checking {table_name}.{field} foreign key")
-            valid, missing = fk_in_pk(pkref_table[pkref_field], table[field])
+            valid, missing = fk_in_pk(self.key_index(pkref_table_name, pkref_field), table[field])
             if missing:
                 WranglerLogger.error(
                     f"!!! {pkref_table_name}.{pkref_field} missing values used as FK\
@@ -383,6 +517,26 @@ class DBModelMixin:
         """Returns tables in the class instance which contain the field."""
         return [t for t in self.table_names if field in self.get_table(t).columns]
 
+    @property
+    def version(self) -> tuple[int, ...]:
+        """Versions of the tables in self.table_names used to detect changes in O(1).
+
+        Unlike `hash`, this will change whenever a table is set even if its content hasn't.
+        """
+        _versions = self.__dict__.get("_table_versions", {})
+        return tuple(_versions.get(t, 0) for t in self.table_names)
+
+    def mark_modified(self, *table_names: str) -> None:
+        """Assign new versions to tables which have been set or mutated in place.
+
+        Args:
+            table_names: names of tables which were modified. If none are given, all tables
+                will be marked as modified.
+        """
+        _versions = self.__dict__.setdefault("_table_versions", {})
+        for t in table_names or self.table_names:
+            _versions[t] = next_version()
+
     @property
     def hash(self) -> str:
         """A hash representing the contents of the tables in self.table_names."""
@@ -398,6 +552,44 @@ class DBModelMixin:
             return self.hash == other.hash
         return False
 
+    def __copy__(self):
+        """Copy-on-write copy of the db object called by copy.copy().
+
+        Tables are shallow copies which share data with this instance, so setting a table (or a
+        whole column of a table) on the copy doesn't change this instance and vice versa. Tables
+        are not re-validated because their content hasn't changed.
+
+        Tables on the copy must NOT be mutated in place (e.g. `db.trips.loc[...] = ...`), which
+        raises a ValueError with pandas < 3, see `utils.data.copy_on_write`. Instead, set a new
+        table, using `utils.data.copy_on_write` to get a table whose edited columns can be
+        written to.
+        """
+        new_instance = self.__class__.__new__(self.__class__)
+        for attr_name, attr_value in self.__dict__.items():
+            if attr_name == "_deferred_fk_tables":
+                continue
+            if isinstance(attr_value, pd.DataFrame):
+                new_instance.__dict__[attr_name] = copy_validated(attr_value, deep=False)
+            elif attr_name in ["_table_versions", "_key_indices"]:
+                new_instance.__dict__[attr_name] = dict(attr_value)
+            else:
+                new_instance.__dict__[attr_name] = attr_value
+        return new_instance
+
+    def copy(self):
+        """Convenience method to execute copy-on-write copy of instance."""
+        return copy.copy(self)
+
+    def materialize(self) -> None:
+        """Replace tables with deep copies so they can be mutated in place.
+
+        Needed for tables of a copy-on-write copy which will be mutated in place, so the change
+        doesn't leak to the db they were copied from or vice versa. Versions are unchanged.
+        """
+        for table_name in self.table_names:
+            if table_name in self.__dict__:
+                self.__dict__[table_name] = copy_validated(self.__dict__[table_name])
+
     def __deepcopy__(self, memo):
         """Custom implementation of __deepcopy__ method.
 
@@ -414,9 +606,13 @@ class DBModelMixin:
 
         # Copy all attributes to the new instance
         for attr_name, attr_value in self.__dict__.items():
+            if attr_name == "_deferred_fk_tables":
+                continue
             # Use copy.deepcopy to create deep copies of mutable objects
             if isinstance(attr_value, pd.DataFrame):
                 setattr(new_instance, attr_name, copy.deepcopy(attr_value, memo))
+            elif attr_name in ["_table_versions", "_key_indices"]:
+                new_instance.__dict__[attr_name] = dict(attr_value)
             else:
                 setattr(new_instance, attr_name, attr_value)
 
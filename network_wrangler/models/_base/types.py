@@ -50,11 +50,14 @@ Latitude = Annotated[float, Field(ge=-90, le=90, description="Latitude of stop."
 Longitude = Annotated[float, Field(ge=-180, le=180, description="Longitude of stop.")]
 
 PhoneNum = Annotated[str, Field("", description="Phone number for the specified location.")]
+TIME_STRING_PATTERN = r"^(\d+):([0-5]\d)(:[0-5]\d)?$"
+"""Pattern TimeStrings must match, capturing hours, minutes and optionally `:<seconds>`."""
+
 TimeString = Annotated[
     str,
     Field(
         description="A time string in the format HH:MM or HH:MM:SS",
-        pattern=r"^(\d+):([0-5]\d)(:[0-5]\d)?$",
+        pattern=TIME_STRING_PATTERN,
     ),
 ]
 TimespanString = Annotated[
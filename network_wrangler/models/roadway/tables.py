@@ -17,7 +17,6 @@ import datetime as dt
 from typing import Any, ClassVar, Optional
 
 import numpy as np
-import pandas as pd
 import pandera as pa
 from pandas import Int64Dtype as Int64
 from pandera import DataFrameModel
@@ -26,8 +25,7 @@ from pandera.typing.geopandas import GeoSeries
 
 from ...logger import WranglerLogger
 from .._base.db import TableForeignKeys, TablePrimaryKeys
-from .._base.tables import validate_pyd
-from .types import ScopedLinkValueList
+from .types import valid_scoped_link_values
 
 RoadLinksAttrs = {
     "name": "road_links",
@@ -304,16 +302,15 @@ class RoadLinksTable(DataFrameModel):
         coerce = True
         unique: ClassVar[list[str]] = ["A", "B"]
 
-    @pa.check("sc_*", regex=True, element_wise=True)
-    def check_scoped_fields(cls, scoped_value: Series) -> Series[bool]:
+    @pa.check("sc_*", regex=True)
+    def check_scoped_fields(cls, scoped_values: Series) -> Series[bool]:
         """Checks that all fields starting with 'sc_' or 'sc_ML_' are valid ScopedLinkValueList.
 
         Custom check to validate fields starting with 'sc_' or 'sc_ML_'
         against a ScopedLinkValueItem model, handling both mandatory and optional fields.
+        Checks the whole column at once rather than creating a pydantic model for each value.
         """
-        if scoped_value is None or (not isinstance(scoped_value, list) and pd.isna(scoped_value)):
-            return True
-        return validate_pyd(scoped_value, ScopedLinkValueList)
+        return valid_scoped_link_values(scoped_values)
 
 
 RoadNodesAttrs = {
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
 from datetime import datetime
-from typing import ClassVar, Optional, Union
+from decimal import Decimal
+from typing import Any, ClassVar, Optional, Union
 
+import numpy as np
+import pandas as pd
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -24,7 +28,7 @@ from ...utils.time import dt_overlaps, str_to_time_list
 from .._base.geo import LatLongCoordinates
 from .._base.records import RecordModel
 from .._base.root import RootListMixin
-from .._base.types import AnyOf, TimeString
+from .._base.types import TIME_STRING_PATTERN, AnyOf, TimeString
 
 
 class ScopedLinkValueItem(RecordModel):
@@ -91,6 +95,157 @@ class ScopedLinkValueList(RootListMixin, RootModel):
         return self
 
 
+SCOPED_LINK_VALUE_FIELDS = frozenset(["category", "timespan", "value"])
+"""Fields of a ScopedLinkValueItem."""
+
+_SCOPED_VALUE_TYPES = (int, float, str, bytes, Decimal, np.integer, np.floating, np.bool_)
+_SCOPED_CATEGORY_TYPES = (int, str, bytes, np.integer, np.bool_)
+"""Types of ScopedLinkValueItem values and categories which pydantic accepts."""
+
+
+def valid_scoped_link_values(scoped_values: pd.Series) -> pd.Series:
+    """Checks which values of a series are valid ScopedLinkValueLists without pydantic.
+
+    Columnar equivalent of validating each value to ScopedLinkValueList: all the scoped values
+    are flattened once and their fields, timespan formats, value types and conflicting scopes
+    are checked for the whole series with vectorized operations. Missing values are valid.
+    Timespans which are None are treated as DEFAULT_TIMESPAN.
+
+    Args:
+        scoped_values: series of lists of ScopedLinkValueItems or their dictionary equivalent.
+
+    Returns:
+        Boolean series with the same index as scoped_values which is False for invalid values.
+    """
+    valid = np.ones(len(scoped_values), dtype=bool)
+    pos, categories, starts, ends, values = [], [], [], [], []
+    for i, scoped_list in enumerate(scoped_values.to_numpy()):
+        if not isinstance(scoped_list, (list, tuple, np.ndarray)):
+            valid[i] = scoped_list is None or bool(pd.isna(scoped_list))
+            continue
+        for item in scoped_list:
+            fields = _scoped_link_value_fields(item)
+            if fields is None:
+                valid[i] = False
+                continue
+            pos.append(i)
+            categories.append(fields[0])
+            starts.append(fields[1][0])
+            ends.append(fields[1][1])
+            values.append(fields[2])
+    if not pos:
+        return pd.Series(valid, index=scoped_values.index)
+
+    pos = np.array(pos, dtype=np.int64)
+    start_sec, start_ok = _time_strings_to_seconds(starts)
+    end_sec, end_ok = _time_strings_to_seconds(ends)
+    item_ok = (
+        _valid_scoped_categories(categories)
+        & _isinstance_mask(values, _SCOPED_VALUE_TYPES)
+        & start_ok
+        & end_ok
+    )
+    valid[pos[~item_ok]] = False
+
+    # Non-default scopes conflict with other scopes of the same category they overlap in time.
+    items_df = pd.DataFrame(
+        {
+            "pos": pos,
+            "category": pd.Series(categories, dtype=object),
+            "start": pd.Series(starts, dtype=object),
+            "end": pd.Series(ends, dtype=object),
+            "value": pd.Series(values, dtype=object),
+            "start_sec": start_sec,
+            "end_sec": np.where(end_sec < start_sec, end_sec + 24 * 3600, end_sec),
+        }
+    ).loc[item_ok & valid[pos]]
+    _default_ts = (items_df["start"] == DEFAULT_TIMESPAN[0]) & (
+        items_df["end"] == DEFAULT_TIMESPAN[1]
+    )
+    pairs_df = items_df.loc[~_default_ts].merge(
+        items_df, on=["pos", "category"], suffixes=("_i", "_j")
+    )
+    _same_item = (
+        (pairs_df["start_i"] == pairs_df["start_j"])
+        & (pairs_df["end_i"] == pairs_df["end_j"])
+        & (pairs_df["value_i"] == pairs_df["value_j"])
+    )
+    _overlaps = (pairs_df["start_sec_i"] < pairs_df["end_sec_j"]) & (
+        pairs_df["start_sec_j"] < pairs_df["end_sec_i"]
+    )
+    valid[pairs_df.loc[_overlaps & ~_same_item, "pos"].to_numpy()] = False
+
+    if not valid.all():
+        WranglerLogger.error(f"{(~valid).sum()} values aren't valid ScopedLinkValueLists.")
+    return pd.Series(valid, index=scoped_values.index)
+
+
+def _scoped_link_value_fields(item: Any) -> Optional[tuple[Any, Any, Any]]:
+    """Category, timespan and value of a scoped link value, or None if it is malformed."""
+    if isinstance(item, ScopedLinkValueItem):
+        return item.category, item.timespan or DEFAULT_TIMESPAN, item.value
+    if (
+        not isinstance(item, dict)
+        or "value" not in item
+        or not item.keys() <= SCOPED_LINK_VALUE_FIELDS
+    ):
+        return None
+    category = item.get("category", DEFAULT_CATEGORY)
+    timespan = item.get("timespan")
+    if item.get("category") is None and timespan is None:
+        return None
+    if timespan is None:
+        timespan = DEFAULT_TIMESPAN
+    elif isinstance(timespan, np.ndarray):
+        # lists are read from parquet as arrays
+        timespan = timespan.tolist()
+    if not isinstance(timespan, (list, tuple)) or len(timespan) != 2:  # noqa: PLR2004
+        return None
+    if not isinstance(category, Hashable):
+        return None
+    return category, timespan, item["value"]
+
+
+def _isinstance_mask(objs: list, types: tuple) -> np.ndarray:
+    """Vectorized isinstance(obj, types) for each of objs which checks each distinct type once."""
+    obj_types = pd.Series([type(obj) for obj in objs], dtype=object)
+    ok_types = [t for t in obj_types.unique() if issubclass(t, types)]
+    return obj_types.isin(ok_types).to_numpy()
+
+
+def _valid_scoped_categories(categories: list) -> np.ndarray:
+    """True for categories which are None, strings, integers or floats with integer values."""
+    category_s = pd.Series(categories, dtype=object)
+    _floats = _isinstance_mask(categories, (float, np.floating))
+    _integer_floats = np.zeros(len(categories), dtype=bool)
+    _integer_floats[_floats] = category_s[_floats].astype(float).mod(1).eq(0).to_numpy()
+    return category_s.isna().to_numpy() & ~_floats | (
+        _isinstance_mask(categories, _SCOPED_CATEGORY_TYPES) | _integer_floats
+    )
+
+
+def _time_strings_to_seconds(times: list) -> tuple[np.ndarray, np.ndarray]:
+    """Seconds from midnight of a list of TimeStrings and whether each is a valid TimeString.
+
+    Each distinct string is only parsed once. Hours past 24 are kept as the next day. Invalid
+    TimeStrings are given 0 seconds.
+    """
+    seconds = np.zeros(len(times), dtype=np.int64)
+    time_ok = np.zeros(len(times), dtype=bool)
+    _is_str = _isinstance_mask(times, (str,))
+    codes, uniques = pd.factorize(pd.Series(times, dtype=object)[_is_str])
+    parts = pd.Series(uniques, dtype=object).str.extract(TIME_STRING_PATTERN)
+    unique_ok = parts[0].notna().to_numpy()
+    unique_seconds = (
+        pd.to_numeric(parts[0], errors="coerce").fillna(0) * 3600
+        + pd.to_numeric(parts[1], errors="coerce").fillna(0) * 60
+        + pd.to_numeric(parts[2].str.slice(1), errors="coerce").fillna(0)
+    ).to_numpy(dtype=np.int64)
+    seconds[_is_str] = unique_seconds[codes]
+    time_ok[_is_str] = unique_ok[codes]
+    return seconds, time_ok
+
+
 class LocationReference(BaseModel):
     """SharedStreets-defined object for location reference."""
 
@@ -22,7 +22,6 @@ write_roadway(clipped_network, out_dir, prefix="ecolab", format="geojson", true_
 
 from __future__ import annotations
 
-import copy
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
@@ -88,9 +87,10 @@ def clip_roadway_to_dfs(
     filtered_shapes_df = network.shapes_df[
         network.shapes_df.index.isin(filtered_links_df["shape_id"])
     ]
-    trimmed_links_df = copy.deepcopy(filtered_links_df)
-    trimmed_nodes_df = copy.deepcopy(filtered_nodes_df)
-    trimmed_shapes_df = copy.deepcopy(filtered_shapes_df)
+    # boolean selections are already copies, so only detach them from the network's tables
+    trimmed_links_df = filtered_links_df.copy(deep=False)
+    trimmed_nodes_df = filtered_nodes_df.copy(deep=False)
+    trimmed_shapes_df = filtered_shapes_df.copy(deep=False)
     return trimmed_links_df, trimmed_nodes_df, trimmed_shapes_df
 
 
@@ -0,0 +1,442 @@
+"""Array-backed directed graph of a roadway network stored in compressed sparse row (CSR) format.
+
+An alternative to the osmnx-flavored networkx graphs in `roadway.graph` which avoids creating
+python objects for every node and link when all that is needed is a shortest path or the
+connectivity of the network.
+
+- Node ids are mapped to positions `0..n-1` of the sorted `node_ids` array.
+- Outgoing edges of node position `i` are `indices[indptr[i]:indptr[i + 1]]` with weights
+    `weights[...]` and link ids (e.g. `model_link_id`) `link_ids[...]`.
+
+If scipy is installed `scipy.sparse.csgraph` is used for shortest paths and strongly connected
+components, otherwise equivalent pure-python implementations iterate directly over the CSR arrays.
+
+Usage:
+
+```python
+G = CSRGraph(links_df.A, links_df.B, links_df.distance, links_df.model_link_id)
+G.shortest_path(O_id, D_id)
+G.strongly_connected_components()
+nx_G = G.to_networkx()
+```
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Optional
+
+import networkx as nx
+import numpy as np
+
+from ..errors import NodeNotFoundError
+from ..logger import WranglerLogger
+
+
+class CSRGraph:
+    """Directed multigraph stored as compressed sparse row arrays.
+
+    Attributes:
+        node_ids (np.ndarray): sorted unique node ids. Position in array is the node index.
+        indptr (np.ndarray): edges leaving node index `i` are `indptr[i]:indptr[i+1]`.
+        indices (np.ndarray): node index of the end of each edge.
+        weights (np.ndarray): weight of each edge.
+        link_ids (np.ndarray): link id of each edge.
+    """
+
+    def __init__(
+        self,
+        A,
+        B,
+        weights,
+        link_ids,
+        node_ids=None,
+    ):
+        """Constructor for CSRGraph.
+
+        Args:
+            A: array-like of start node ids for each edge.
+            B: array-like of end node ids for each edge.
+            weights: array-like of non-negative weights for each edge.
+            link_ids: array-like of link ids for each edge.
+            node_ids: optional array-like of additional node ids so that nodes without any
+                edges are included in the graph.
+        """
+        self._build(A, B, weights, link_ids, node_ids=node_ids)
+
+    def _build(self, A, B, weights, link_ids, node_ids=None) -> None:
+        """Create the CSR arrays from edge arrays."""
+        A = np.asarray(A)
+        B = np.asarray(B)
+        weights = np.asarray(weights, dtype=float)
+        link_ids = np.asarray(link_ids)
+        if not len(A) == len(B) == len(weights) == len(link_ids):
+            msg = "A, B, weights and link_ids must all be the same length."
+            raise ValueError(msg)
+        if (weights < 0).any():
+            msg = "CSRGraph weights must be non-negative."
+            raise ValueError(msg)
+
+        _all_nodes = [A, B]
+        if node_ids is not None:
+            _all_nodes.append(np.asarray(node_ids))
+        self.node_ids = np.unique(np.concatenate(_all_nodes))
+
+        u = np.searchsorted(self.node_ids, A)
+        v = np.searchsorted(self.node_ids, B)
+        order = np.argsort(u, kind="stable")
+        self._edge_u = u[order]
+        self.indices = v[order]
+        self.weights = weights[order]
+        self.link_ids = link_ids[order]
+        self.indptr = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(u, minlength=len(self.node_ids)), out=self.indptr[1:])
+        self._adjacency: Optional[tuple[list, list, list]] = None
+
+    def update(
+        self,
+        remove_link_ids=None,
+        A=(),
+        B=(),
+        weights=(),
+        link_ids=(),
+        node_ids=None,
+        remove_node_ids=None,
+    ) -> None:
+        """Remove and add edges and nodes, patching the CSR arrays of this graph.
+
+        Removed edges are masked out and added edges are inserted at the end of the rows of
+        their start nodes, so the edges don't need to be sorted again and the ends of the kept
+        edges are only re-indexed if nodes are added or removed. The arrays are still copied
+        by numpy, but unlike constructing the graph, nothing is sorted or searched that scales
+        with the number of edges in the graph rather than the number which changed.
+
+        Args:
+            remove_link_ids: array-like of link ids of edges to remove.
+            A: array-like of start node ids for each edge to add.
+            B: array-like of end node ids for each edge to add.
+            weights: array-like of non-negative weights for each edge to add.
+            link_ids: array-like of link ids for each edge to add.
+            node_ids: optional array-like of node ids to add even if they have no edges.
+            remove_node_ids: optional array-like of node ids to remove. Nodes which are the
+                start or end of an edge are not removed.
+        """
+        _node_dtype = self.node_ids.dtype
+        A = np.asarray(A, dtype=_node_dtype)
+        B = np.asarray(B, dtype=_node_dtype)
+        weights = np.asarray(weights, dtype=float)
+        link_ids = np.asarray(link_ids, dtype=self.link_ids.dtype)
+        if not len(A) == len(B) == len(weights) == len(link_ids):
+            msg = "A, B, weights and link_ids must all be the same length."
+            raise ValueError(msg)
+        if (weights < 0).any():
+            msg = "CSRGraph weights must be non-negative."
+            raise ValueError(msg)
+
+        if remove_link_ids is not None:
+            _keep = ~np.isin(self.link_ids, np.asarray(remove_link_ids))
+            if not _keep.all():
+                self._edge_u = self._edge_u[_keep]
+                self.indices = self.indices[_keep]
+                self.weights = self.weights[_keep]
+                self.link_ids = self.link_ids[_keep]
+
+        _add = [A, B] if node_ids is None else [A, B, np.asarray(node_ids, dtype=_node_dtype)]
+        _add_node_ids = np.concatenate(_add)
+        _drop = np.zeros(self.num_nodes, dtype=bool)
+        if remove_node_ids is not None:
+            _drop = np.isin(self.node_ids, np.asarray(remove_node_ids))
+            _drop &= ~np.isin(self.node_ids, _add_node_ids)
+            _drop[self._edge_u] = False
+            _drop[self.indices] = False
+        _new_node_ids = np.setdiff1d(_add_node_ids, self.node_ids)
+        if _drop.any() or len(_new_node_ids):
+            _node_ids = np.union1d(self.node_ids[~_drop], _new_node_ids)
+            # positions of the kept nodes only shift, so rows stay in order
+            _positions = np.searchsorted(_node_ids, self.node_ids)
+            self._edge_u = _positions[self._edge_u]
+            self.indices = _positions[self.indices]
+            self.node_ids = _node_ids
+
+        if len(A):
+            u = np.searchsorted(self.node_ids, A)
+            order = np.argsort(u, kind="stable")
+            _at = np.searchsorted(self._edge_u, u[order], side="right")
+            self._edge_u = np.insert(self._edge_u, _at, u[order])
+            self.indices = np.insert(self.indices, _at, np.searchsorted(self.node_ids, B)[order])
+            self.weights = np.insert(self.weights, _at, weights[order])
+            self.link_ids = np.insert(self.link_ids, _at, link_ids[order])
+
+        self.indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self._edge_u, minlength=self.num_nodes), out=self.indptr[1:])
+        self._adjacency = None
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges in the graph."""
+        return len(self.indices)
+
+    def __contains__(self, node_id) -> bool:
+        """True if node_id is a node in the graph."""
+        i = np.searchsorted(self.node_ids, node_id)
+        return bool(i < len(self.node_ids) and self.node_ids[i] == node_id)
+
+    def node_index(self, node_id) -> int:
+        """Position of node_id in the graph arrays.
+
+        Raises:
+            NodeNotFoundError: if node_id is not in the graph.
+        """
+        if node_id not in self:
+            msg = f"Node {node_id} not found in graph."
+            raise NodeNotFoundError(msg)
+        return int(np.searchsorted(self.node_ids, node_id))
+
+    def _adjacency_lists(self) -> tuple[list, list, list]:
+        """Python lists of indptr, indices and weights which are much faster to iterate over."""
+        if self._adjacency is None:
+            self._adjacency = (
+                self.indptr.tolist(),
+                self.indices.tolist(),
+                self.weights.tolist(),
+            )
+        return self._adjacency
+
+    def shortest_path(self, O_id, D_id, weights=None) -> Optional[list]:
+        """Node ids of the least-weight path from O_id to D_id or None if there isn't one.
+
+        Uses Dijkstra's algorithm, see `shortest_paths`.
+
+        Args:
+            O_id: start node id.
+            D_id: end node id.
+            weights: optional array of weights to use instead of `self.weights`, in the same
+                order as `self.link_ids`.
+
+        Raises:
+            NodeNotFoundError: if O_id or D_id aren't in the graph.
+        """
+        return self.shortest_paths(O_id, [D_id], weights=weights)[D_id]
+
+    def shortest_paths(self, O_id, D_ids: list, weights=None) -> dict:
+        """Least-weight paths from O_id to each of D_ids from a single search.
+
+        Uses `scipy.sparse.csgraph.dijkstra` if scipy is installed, otherwise a pure-python
+        Dijkstra's algorithm which stops as soon as all of D_ids are settled.
+
+        Args:
+            O_id: start node id.
+            D_ids: list of end node ids.
+            weights: optional array of weights to use instead of `self.weights`, in the same
+                order as `self.link_ids`.
+
+        Returns: dictionary mapping each of D_ids to a list of node ids in the path or None if
+            there isn't a path.
+
+        Raises:
+            NodeNotFoundError: if O_id or any of D_ids aren't in the graph.
+        """
+        source = self.node_index(O_id)
+        targets = {self.node_index(D_id): D_id for D_id in D_ids}
+        if weights is None:
+            weights = self.weights
+        else:
+            weights = np.asarray(weights, dtype=float)
+            if len(weights) != self.num_edges:
+                msg = f"Expected {self.num_edges} weights, got {len(weights)}."
+                raise ValueError(msg)
+            if (weights < 0).any():
+                msg = "CSRGraph weights must be non-negative."
+                raise ValueError(msg)
+
+        try:
+            from scipy.sparse.csgraph import dijkstra
+        except ModuleNotFoundError:
+            pred = self._dijkstra_predecessors(source, set(targets), weights)
+        else:
+            _, pred = dijkstra(
+                self._min_weight_matrix(weights),
+                directed=True,
+                indices=source,
+                return_predecessors=True,
+            )
+
+        paths: dict[Any, Optional[list]] = {}
+        for target, D_id in targets.items():
+            if target != source and pred[target] < 0:
+                WranglerLogger.debug(f"No SP from {O_id} to {D_id} Found.")
+                paths[D_id] = None
+                continue
+            path = [target]
+            while path[-1] != source:
+                path.append(pred[path[-1]])
+            paths[D_id] = self.node_ids[path[::-1]].tolist()
+        return paths
+
+    def _min_weight_matrix(self, weights: np.ndarray):
+        """Sparse matrix with the least weight of the edges between each pair of nodes.
+
+        Parallel edges are reduced to the least-weight one first because scipy sums duplicate
+        entries. Zero weights are kept as explicit entries so they still count as edges.
+        """
+        from scipy.sparse import csr_matrix
+
+        _pair = self._edge_u * self.num_nodes + self.indices
+        order = np.lexsort((weights, _pair))
+        _first = np.ones(len(order), dtype=bool)
+        _first[1:] = _pair[order][1:] != _pair[order][:-1]
+        order = order[_first]
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self._edge_u[order], minlength=self.num_nodes), out=indptr[1:])
+        return csr_matrix(
+            (weights[order], self.indices[order], indptr),
+            shape=(self.num_nodes, self.num_nodes),
+        )
+
+    def _dijkstra_predecessors(self, source: int, targets: set, weights: np.ndarray) -> np.ndarray:
+        """Predecessor of each node index from Dijkstra's algorithm, -9999 if not reached.
+
+        Pure-python fallback for `scipy.sparse.csgraph.dijkstra` which stops as soon as all of
+        the targets are settled.
+        """
+        indptr, indices, _ = self._adjacency_lists()
+        _weights = weights.tolist()
+        dist = {source: 0.0}
+        pred = np.full(self.num_nodes, -9999, dtype=np.int64)
+        settled = set()
+        remaining = set(targets)
+        heap = [(0.0, source)]
+        while heap and remaining:
+            d, i = heapq.heappop(heap)
+            if i in settled:
+                continue
+            settled.add(i)
+            remaining.discard(i)
+            for e in range(indptr[i], indptr[i + 1]):
+                j = indices[e]
+                d_j = d + _weights[e]
+                if j not in dist or d_j < dist[j]:
+                    dist[j] = d_j
+                    pred[j] = i
+                    heapq.heappush(heap, (d_j, j))
+        pred[[j for j in dist if j not in settled]] = -9999
+        return pred
+
+    def link_ids_in_path(self, path: list) -> list:
+        """Link ids of the least-weight edges between consecutive node ids in a path.
+
+        Args:
+            path: list of node ids, e.g. as returned from `shortest_path`.
+        """
+        _link_ids = []
+        for a, b in zip(path[:-1], path[1:]):
+            i, j = self.node_index(a), self.node_index(b)
+            _edges = np.arange(self.indptr[i], self.indptr[i + 1])
+            _edges = _edges[self.indices[_edges] == j]
+            if len(_edges) == 0:
+                msg = f"No edge from {a} to {b} in graph."
+                raise ValueError(msg)
+            _link_ids.append(self.link_ids[_edges[np.argmin(self.weights[_edges])]])
+        return _link_ids
+
+    def strongly_connected_component_labels(self) -> np.ndarray:
+        """Array with a component label for each node index."""
+        try:
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import connected_components
+        except ModuleNotFoundError:
+            return self._tarjan_labels()
+
+        _matrix = csr_matrix(
+            (np.ones(self.num_edges), self.indices, self.indptr),
+            shape=(self.num_nodes, self.num_nodes),
+        )
+        _, labels = connected_components(_matrix, directed=True, connection="strong")
+        return labels
+
+    def _tarjan_labels(self) -> np.ndarray:
+        """Iterative version of Tarjan's strongly connected components algorithm."""
+        indptr, indices, _ = self._adjacency_lists()
+        n = self.num_nodes
+        labels = [-1] * n
+        order = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        stack: list[int] = []
+        counter = 0
+        n_components = 0
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            # call stack of (node, position of next edge to visit)
+            work = [(root, indptr[root])]
+            order[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                i, e = work[-1]
+                if e < indptr[i + 1]:
+                    work[-1] = (i, e + 1)
+                    j = indices[e]
+                    if order[j] == -1:
+                        order[j] = lowlink[j] = counter
+                        counter += 1
+                        stack.append(j)
+                        on_stack[j] = True
+                        work.append((j, indptr[j]))
+                    elif on_stack[j]:
+                        lowlink[i] = min(lowlink[i], order[j])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[i])
+                if lowlink[i] == order[i]:
+                    while True:
+                        j = stack.pop()
+                        on_stack[j] = False
+                        labels[j] = n_components
+                        if j == i:
+                            break
+                    n_components += 1
+        return np.array(labels, dtype=np.int64)
+
+    def strongly_connected_components(self) -> list[list]:
+        """List of strongly connected components as lists of node ids, largest first."""
+        labels = self.strongly_connected_component_labels()
+        order = np.argsort(labels, kind="stable")
+        _, starts = np.unique(labels[order], return_index=True)
+        components = [c.tolist() for c in np.split(self.node_ids[order], starts[1:])]
+        return sorted(components, key=len, reverse=True)
+
+    def is_strongly_connected(self) -> bool:
+        """True if every node can be reached from every other node."""
+        if self.num_nodes == 0:
+            msg = "Connectivity is undefined for the null graph."
+            raise ValueError(msg)
+        return len(np.unique(self.strongly_connected_component_labels())) == 1
+
+    def to_networkx(self, weight_property: str = "weight") -> nx.MultiDiGraph:
+        """Export to a networkx MultiDiGraph keyed by link id.
+
+        Args:
+            weight_property: edge attribute to store the weights in. Defaults to "weight".
+        """
+        G = nx.MultiDiGraph()
+        G.add_nodes_from(self.node_ids.tolist())
+        G.add_edges_from(
+            (a, b, k, {weight_property: w})
+            for a, b, k, w in zip(
+                self.node_ids[self._edge_u].tolist(),
+                self.node_ids[self.indices].tolist(),
+                self.link_ids.tolist(),
+                self.weights.tolist(),
+            )
+        )
+        return G
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import copy
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union
 
 import networkx as nx
+import numpy as np
 import osmnx as ox
+import pandas as pd
 from geopandas import GeoDataFrame
 from pandas import DataFrame
 
 from ..logger import WranglerLogger
+from .csr_graph import CSRGraph
 
 if TYPE_CHECKING:
     from .network import RoadwayNetwork
@@ -26,6 +28,13 @@ DEFAULT_GRAPH_WEIGHT_COL = "distance"
 """
 DEFAULT_GRAPH_WEIGHT_FACTOR = 1
 
+"""Graph implementations that can be created from a RoadwayNetwork.
+
+- `networkx`: osmnx-flavored networkx MultiDiGraph with all simple link and node properties.
+- `csr`: array-backed `CSRGraph` with only link ids and weights.
+"""
+GraphBackend = Literal["networkx", "csr"]
+
 
 def _drop_complex_df_columns(df: DataFrame) -> DataFrame:
     """Returns dataframe without columns with lists, tuples or dictionaries types."""
@@ -33,6 +42,9 @@ def _drop_complex_df_columns(df: DataFrame) -> DataFrame:
     _cols_to_search = [c for c in df.columns if c not in _cols_to_exclude]
     _drop_types = (list, dict, tuple)
 
+    # only object columns can hold lists, tuples or dictionaries
+    _cols_to_search = [c for c in _cols_to_search if df[c].dtype == object]
+
     _drop_cols = [c for c in _cols_to_search if df[c].apply(type).isin(_drop_types).any()]
 
     df = df.drop(_drop_cols, axis=1)
@@ -51,7 +63,7 @@ def _nodes_to_graph_nodes(nodes_df: GeoDataFrame) -> GeoDataFrame:
     Args:
         nodes_df (GeoDataFrame): nodes geodataframe from RoadwayNetwork instance
     """
-    graph_nodes_df = copy.deepcopy(nodes_df)
+    graph_nodes_df = nodes_df.copy(deep=False)
     graph_nodes_df.gdf_name = "network_nodes"
 
     # drop column types which could have complex types (i.e. lists, dicts, etc)
@@ -78,7 +90,7 @@ def _links_to_graph_links(
         sp_weight_col: column to use for weights. Defaults to `distance`.
         sp_weight_factor: multiple to apply to the weights. Defaults to 1.
     """
-    graph_links_df = copy.deepcopy(links_df)
+    graph_links_df = links_df.copy(deep=False)
 
     # drop column types which could have complex types (i.e. lists, dicts, etc)
     graph_links_df = _drop_complex_df_columns(graph_links_df)
@@ -166,36 +178,168 @@ def links_nodes_to_ox_graph(
     return G
 
 
-def net_to_graph(net: RoadwayNetwork, mode: Optional[str] = None) -> nx.MultiDiGraph:
-    """Converts a network to a MultiDiGraph.
+def _links_to_csr_weights(
+    links_df: DataFrame,
+    sp_weight_col: str = DEFAULT_GRAPH_WEIGHT_COL,
+    sp_weight_factor: float = DEFAULT_GRAPH_WEIGHT_FACTOR,
+) -> np.ndarray:
+    """Array of shortest path weights for each link in links_df."""
+    if sp_weight_col in links_df.columns:
+        return links_df[sp_weight_col].to_numpy(dtype=float) * sp_weight_factor
+    WranglerLogger.warning(f"{sp_weight_col} not in links_df so initializing weights to 1.")
+    return np.full(len(links_df), sp_weight_factor, dtype=float)
+
+
+def links_nodes_to_csr_graph(
+    links_df: DataFrame,
+    nodes_df: Optional[DataFrame] = None,
+    sp_weight_col: str = DEFAULT_GRAPH_WEIGHT_COL,
+    sp_weight_factor: float = DEFAULT_GRAPH_WEIGHT_FACTOR,
+) -> CSRGraph:
+    """Create an array-backed CSRGraph from nodes and links dfs.
+
+    Edges are keyed by the links_df index (i.e. `model_link_id`).
+
+    Args:
+        links_df: links_df from RoadwayNetwork
+        nodes_df: nodes_df from RoadwayNetwork. If provided, nodes in the index which aren't
+            in any link are added to the graph as isolated nodes.
+        sp_weight_col: column to use for weights. Defaults to `distance`.
+        sp_weight_factor: multiple to apply to the weights. Defaults to 1.
+    """
+    _weights = _links_to_csr_weights(links_df, sp_weight_col, sp_weight_factor)
+
+    _node_ids = None if nodes_df is None else nodes_df.index.to_numpy()
+
+    return CSRGraph(
+        links_df["A"].to_numpy(),
+        links_df["B"].to_numpy(),
+        _weights,
+        links_df.index.to_numpy(),
+        node_ids=_node_ids,
+    )
+
+
+def net_to_graph(
+    net: RoadwayNetwork, mode: Optional[str] = None, backend: GraphBackend = "networkx"
+) -> Union[nx.MultiDiGraph, CSRGraph]:
+    """Converts a network to a MultiDiGraph or CSRGraph.
 
     Args:
         net: RoadwayNetwork object
         mode: mode of the network, one of `drive`,`transit`,
             `walk`, `bike`
+        backend: graph implementation to create, either `networkx` or `csr`. Defaults to
+            `networkx`.
 
-    Returns: networkx: osmnx: DiGraph  of network
+    Returns: networkx: osmnx: DiGraph  of network or CSRGraph
     """
     _links_df = net.links_df.mode_query(mode)
 
     _nodes_df = net.nodes_in_links()
 
+    if backend == "csr":
+        return links_nodes_to_csr_graph(_links_df, _nodes_df)
+
     G = links_nodes_to_ox_graph(_links_df, _nodes_df)
 
     return G
 
 
+def _not_null_attrs(names: list, values) -> dict:
+    """Dictionary of non-null attributes, following `osmnx.graph_from_gdfs`."""
+    return {k: v for k, v in zip(names, values) if isinstance(v, list) or pd.notna(v)}
+
+
+def update_graph(
+    G: Union[nx.MultiDiGraph, CSRGraph],
+    links_df: DataFrame,
+    nodes_df: DataFrame,
+    prev_links_df: DataFrame,
+    link_ids: list,
+    node_ids: Optional[list] = None,
+    mode: Optional[str] = None,
+    sp_weight_col: str = DEFAULT_GRAPH_WEIGHT_COL,
+    sp_weight_factor: float = DEFAULT_GRAPH_WEIGHT_FACTOR,
+) -> None:
+    """Updates a graph created by `net_to_graph` in place to reflect changes to some links/nodes.
+
+    Edges for link_ids are removed and re-added if the link is still in links_df and is
+    accessible by the mode. The end nodes of these links and any node_ids are added to or
+    removed from the graph depending on if they are still used by any link and their attributes
+    are refreshed from nodes_df.
+
+    Args:
+        G: osmnx MultiDiGraph or CSRGraph created from prev_links_df.
+        links_df: links_df from RoadwayNetwork after the change.
+        nodes_df: nodes_df from RoadwayNetwork after the change.
+        prev_links_df: links_df from RoadwayNetwork which G was created from.
+        link_ids: ids of links which were added, deleted or edited.
+        node_ids: ids of nodes which were added, deleted or edited. Defaults to None.
+        mode: mode of the graph, one of `drive`,`transit`, `walk`, `bike`.
+        sp_weight_col: column to use for weights. Defaults to `distance`.
+        sp_weight_factor: multiple to apply to the weights. Defaults to 1.
+    """
+    _prev_links_df = prev_links_df.loc[prev_links_df.index.isin(link_ids)]
+    _links_df = links_df.loc[links_df.index.isin(link_ids)]
+    _modal_links_df = _links_df.mode_query(mode)
+
+    _node_ids = pd.unique(
+        np.concatenate(
+            [
+                _prev_links_df.A.to_numpy(),
+                _prev_links_df.B.to_numpy(),
+                _links_df.A.to_numpy(),
+                _links_df.B.to_numpy(),
+                np.asarray([] if node_ids is None else node_ids, dtype=_links_df.A.dtype),
+            ]
+        )
+    )
+    _in_links = np.isin(_node_ids, links_df.A) | np.isin(_node_ids, links_df.B)
+    _in_links &= np.isin(_node_ids, nodes_df.index)
+    _keep_node_ids, _drop_node_ids = _node_ids[_in_links], _node_ids[~_in_links]
+
+    if isinstance(G, CSRGraph):
+        G.update(
+            remove_link_ids=_prev_links_df.index.to_numpy(),
+            A=_modal_links_df.A.to_numpy(),
+            B=_modal_links_df.B.to_numpy(),
+            weights=_links_to_csr_weights(_modal_links_df, sp_weight_col, sp_weight_factor),
+            link_ids=_modal_links_df.index.to_numpy(),
+            node_ids=_keep_node_ids,
+            remove_node_ids=_drop_node_ids,
+        )
+        return
+
+    G.remove_edges_from(zip(_prev_links_df.A, _prev_links_df.B, _prev_links_df.index))
+    graph_links_df = _links_to_graph_links(_modal_links_df, sp_weight_col, sp_weight_factor)
+    _link_attr_names = graph_links_df.columns.to_list()
+    for (u, v, k), attr_vals in zip(graph_links_df.index, graph_links_df.to_numpy()):
+        G.add_edge(u, v, key=k, **_not_null_attrs(_link_attr_names, attr_vals))
+
+    G.remove_nodes_from(_drop_node_ids)
+    graph_nodes_df = _nodes_to_graph_nodes(nodes_df.loc[_keep_node_ids])
+    graph_nodes_df = graph_nodes_df.drop(columns=["geometry"], errors="ignore")
+    _node_attr_names = graph_nodes_df.columns.to_list()
+    for n, attr_vals in zip(graph_nodes_df.index, graph_nodes_df.to_numpy()):
+        G.add_node(n)
+        G.nodes[n].clear()
+        G.nodes[n].update(_not_null_attrs(_node_attr_names, attr_vals))
+    WranglerLogger.debug(f"Updated {len(link_ids)} links and {len(_node_ids)} nodes in graph.")
+
+
 def shortest_path(
-    G: nx.MultiDiGraph, O_id, D_id, sp_weight_property="weight"
+    G: Union[nx.MultiDiGraph, CSRGraph], O_id, D_id, sp_weight_property="weight"
 ) -> Union[list, None]:
     """Calculates the shortest path between two nodes in a network.
 
     Args:
-        G: osmnx MultiDiGraph, created using links_nodes_to_ox_graph
+        G: osmnx MultiDiGraph, created using links_nodes_to_ox_graph, or a CSRGraph, created
+            using links_nodes_to_csr_graph.
         O_id: primary key for start node
         D_id: primary key for end node
         sp_weight_property: link property to use as weight in finding shortest path.
-            Defaults to "weight".
+            Defaults to "weight". Ignored for CSRGraph which stores a single weight.
 
     Returns: tuple with length of four
     - Boolean if shortest path found
@@ -203,6 +347,9 @@ def shortest_path(
     - route of shortest path nodes as List
     - links in shortest path selected from links_df
     """
+    if isinstance(G, CSRGraph):
+        return G.shortest_path(O_id, D_id)
+
     try:
         sp_route = nx.shortest_path(G, O_id, D_id, weight=sp_weight_property)
         WranglerLogger.debug("Shortest path successfully routed")
@@ -219,6 +366,7 @@ def assess_connectivity(
     net: RoadwayNetwork,
     mode: str = "",
     ignore_end_nodes: bool = True,
+    backend: GraphBackend = "networkx",
 ):
     """Network graph and list of disconnected subgraphs described by a list of their member nodes.
 
@@ -227,19 +375,24 @@ def assess_connectivity(
         mode:  mode of the network, one of `drive`,`transit`,
             `walk`, `bike`
         ignore_end_nodes: if True, ignores stray singleton nodes
+        backend: graph implementation to use, either `networkx` or `csr`. Defaults to
+            `networkx`.
 
     Returns: Tuple of
-        Network Graph (osmnx flavored networkX DiGraph)
+        Network Graph (osmnx flavored networkX DiGraph or CSRGraph)
         List of disconnected subgraphs described by the list of their
             member nodes (as described by their `model_node_id`)
     """
     WranglerLogger.debug(f"Assessing network connectivity for mode: {mode}")
 
-    G = net.get_modal_graph(mode)
+    G = net.get_modal_graph(mode, backend=backend)
 
-    sub_graph_nodes = [
-        list(s) for s in sorted(nx.strongly_connected_components(G), key=len, reverse=True)
-    ]
+    if isinstance(G, CSRGraph):
+        sub_graph_nodes = G.strongly_connected_components()
+    else:
+        sub_graph_nodes = [
+            list(s) for s in sorted(nx.strongly_connected_components(G), key=len, reverse=True)
+        ]
 
     # sorted on decreasing length, dropping the main sub-graph
     disconnected_sub_graph_nodes = sub_graph_nodes[1:]
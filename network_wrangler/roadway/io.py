@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from geopandas import GeoDataFrame
 
 from ..configs import ConfigInputTypes, DefaultConfig, WranglerConfig, load_wrangler_config
 from ..logger import WranglerLogger
 from ..params import LAT_LON_CRS
-from ..utils.io_table import read_table
-from .links.io import read_links, write_links
+from ..utils.io_table import read_table, run_table_writes
+from .links.io import read_links, restore_omitted_link_columns, write_links
 from .nodes.io import read_nodes, write_nodes
 from .shapes.io import read_shapes, write_shapes
 
@@ -32,6 +33,9 @@ def load_roadway(
     boundary_file: Optional[Path] = None,
     filter_links_to_nodes: Optional[bool] = None,
     config: ConfigInputTypes = DefaultConfig,
+    chunk_size: Optional[int] = None,
+    links_columns: Optional[list[str]] = None,
+    links_filters: Optional[list] = None,
 ) -> RoadwayNetwork:
     """Reads a network from the roadway network standard.
 
@@ -58,6 +62,15 @@ def load_roadway(
         config: a Configuration object to update with the new configuration. Can be
             a dictionary, a path to a file, or a list of paths to files or a
             WranglerConfig instance. Defaults to None and will load defaults.
+        chunk_size: if provided, will read, filter, and validate links, nodes, and shapes in
+            chunks of this many records to limit peak memory use for very large files.
+            Defaults to None, which reads each file at once.
+        links_columns: link properties to read. Required RoadLinksTable fields are always read
+            and omitted columns are restored from links_file when the network is written.
+            Defaults to None, which reads all columns.
+        links_filters: predicates links must match in the form of pyarrow parquet filters, i.e.
+            `[("drive_access", "==", True)]`. Pushed down into the reader for parquet files.
+            Defaults to None.
 
     Returns: a RoadwayNetwork instance
     """
@@ -77,6 +90,7 @@ def load_roadway(
             boundary_gdf=boundary_gdf,
             boundary_geocode=boundary_geocode,
             boundary_file=boundary_file,
+            chunk_size=chunk_size,
         )
     else:
         shapes_df = None
@@ -87,6 +101,7 @@ def load_roadway(
         boundary_gdf=boundary_gdf,
         boundary_geocode=boundary_geocode,
         boundary_file=boundary_file,
+        chunk_size=chunk_size,
     )
 
     if filter_links_to_nodes is None and any(
@@ -102,6 +117,9 @@ def load_roadway(
         config=config,
         nodes_df=nodes_df,
         filter_to_nodes=filter_links_to_nodes,
+        chunk_size=chunk_size,
+        columns=links_columns,
+        filters=links_filters,
     )
 
     roadway_network = RoadwayNetwork(
@@ -114,6 +132,7 @@ def load_roadway(
         roadway_network._shapes_file = shapes_file
     roadway_network._links_file = links_file
     roadway_network._nodes_file = nodes_file
+    roadway_network._omitted_columns = {"links": links_df.attrs.get("omitted_columns", [])}
 
     return roadway_network
 
@@ -161,6 +180,9 @@ def load_roadway_from_dir(
     boundary_file: Optional[Path] = None,
     filter_links_to_nodes: Optional[bool] = None,
     config: ConfigInputTypes = DefaultConfig,
+    chunk_size: Optional[int] = None,
+    links_columns: Optional[list[str]] = None,
+    links_filters: Optional[list] = None,
 ) -> RoadwayNetwork:
     """Reads a network from the roadway network standard.
 
@@ -183,6 +205,15 @@ def load_roadway_from_dir(
         config: a Configuration object to update with the new configuration. Can be
             a dictionary, a path to a file, or a list of paths to files or a
             WranglerConfig instance. Defaults to None and will load defaults.
+        chunk_size: if provided, will read, filter, and validate links, nodes, and shapes in
+            chunks of this many records to limit peak memory use for very large files.
+            Defaults to None, which reads each file at once.
+        links_columns: link properties to read. Required RoadLinksTable fields are always read
+            and omitted columns are restored from links_file when the network is written.
+            Defaults to None, which reads all columns.
+        links_filters: predicates links must match in the form of pyarrow parquet filters, i.e.
+            `[("drive_access", "==", True)]`. Pushed down into the reader for parquet files.
+            Defaults to None.
 
     Returns: a RoadwayNetwork instance
     """
@@ -198,6 +229,9 @@ def load_roadway_from_dir(
         boundary_file=boundary_file,
         filter_links_to_nodes=filter_links_to_nodes,
         config=config,
+        chunk_size=chunk_size,
+        links_columns=links_columns,
+        links_filters=links_filters,
     )
 
 
@@ -209,9 +243,16 @@ def write_roadway(
     file_format: RoadwayFileTypes = "geojson",
     overwrite: bool = True,
     true_shape: bool = False,
+    spatial_index: bool = False,
+    tile_level: Optional[int] = None,
+    max_workers: int = 1,
 ) -> None:
     """Writes a network in the roadway network standard.
 
+    Each file is written atomically, so a failed write never leaves a partially written file.
+    Files are stamped as valid to the data model of their table if the network's
+    `config.VALIDATION.STAMP_FILES` is set.
+
     Args:
         net: RoadwayNetwork or ModelRoadwayNetwork instance to write out.
         out_dir: the path were the output will be saved. Defaults to ".".
@@ -223,6 +264,44 @@ def write_roadway(
         overwrite: if True, will overwrite the files if they already exist. Defaults to True.
         true_shape: if True, will write the true shape of the links as found from shapes.
             Defaults to False.
+        spatial_index: if True and file_format is parquet, will write links, nodes, and shapes
+            sorted along a Hilbert curve in row groups with bounding box statistics so readers
+            filtering to a boundary can skip whole row groups. Defaults to False.
+        tile_level: if provided and file_format is parquet, will write each table as a
+            directory partitioned by web mercator tiles at this zoom level so readers filtering
+            to a boundary can skip whole tiles. Implies spatial_index. Defaults to None.
+        max_workers: maximum number of files to write at once in separate threads. Defaults
+            to 1, which writes them one at a time.
+    """
+    writes = roadway_table_writes(
+        net,
+        out_dir=out_dir,
+        convert_complex_link_properties_to_single_field=convert_complex_link_properties_to_single_field,
+        prefix=prefix,
+        file_format=file_format,
+        overwrite=overwrite,
+        true_shape=true_shape,
+        spatial_index=spatial_index,
+        tile_level=tile_level,
+    )
+    run_table_writes(writes, max_workers=max_workers)
+
+
+def roadway_table_writes(
+    net: Union[RoadwayNetwork, ModelRoadwayNetwork],
+    out_dir: Union[Path, str] = ".",
+    convert_complex_link_properties_to_single_field: bool = False,
+    prefix: str = "",
+    file_format: RoadwayFileTypes = "geojson",
+    overwrite: bool = True,
+    true_shape: bool = False,
+    spatial_index: bool = False,
+    tile_level: Optional[int] = None,
+) -> dict[str, Callable[[], None]]:
+    """Functions which each write one table of a roadway network, keyed by table name.
+
+    Used by `write_roadway` and to write roadway tables alongside other tables with
+    `run_table_writes`. Arguments are the same as for `write_roadway`.
     """
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -233,19 +312,58 @@ def write_roadway(
     if true_shape:
         links_df = links_df.true_shape(net.shapes_df)
 
-    write_links(
-        net.links_df,
-        convert_complex_properties_to_single_field=convert_complex_link_properties_to_single_field,
-        out_dir=out_dir,
-        prefix=prefix,
-        file_format=file_format,
-        overwrite=overwrite,
-        include_geometry=true_shape,
-    )
-    write_nodes(net.nodes_df, out_dir, prefix, file_format, overwrite)
+    schema_stamp = getattr(net, "config", DefaultConfig).VALIDATION.STAMP_FILES
+
+    def _write_links():
+        # don't silently drop columns which weren't read in with `links_columns`
+        write_links_df = net.links_df
+        omitted_link_columns = getattr(net, "omitted_columns", {}).get("links")
+        if omitted_link_columns:
+            write_links_df = restore_omitted_link_columns(
+                write_links_df, net._links_file, omitted_link_columns
+            )
+        write_links(
+            write_links_df,
+            convert_complex_properties_to_single_field=convert_complex_link_properties_to_single_field,
+            out_dir=out_dir,
+            prefix=prefix,
+            file_format=file_format,
+            overwrite=overwrite,
+            include_geometry=true_shape,
+            spatial_index=spatial_index,
+            tile_level=tile_level,
+            schema_stamp=schema_stamp,
+        )
 
-    if not true_shape and not net.shapes_df.empty:
-        write_shapes(net.shapes_df, out_dir, prefix, file_format, overwrite)
+    writes: dict[str, Callable[[], None]] = {
+        "links": _write_links,
+        "nodes": partial(
+            write_nodes,
+            net.nodes_df,
+            out_dir,
+            prefix,
+            file_format,
+            overwrite,
+            spatial_index=spatial_index,
+            tile_level=tile_level,
+            schema_stamp=schema_stamp,
+        ),
+    }
+
+    shapes_df = net.shapes_df
+    if not true_shape and not shapes_df.empty:
+        writes["shapes"] = partial(
+            write_shapes,
+            shapes_df,
+            out_dir,
+            prefix,
+            file_format,
+            overwrite,
+            spatial_index=spatial_index,
+            tile_level=tile_level,
+            schema_stamp=schema_stamp,
+        )
+    return writes
 
 
 def convert_roadway_file_serialization(
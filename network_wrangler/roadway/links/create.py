@@ -23,7 +23,7 @@ from ...utils.geo import (
     linestring_from_nodes,
     offset_geometry_meters,
 )
-from ...utils.models import validate_call_pyd, validate_df_to_model
+from ...utils.models import ValidationModes, validate_call_pyd, validate_df_to_model
 from ..utils import create_unique_shape_id, set_df_index_to_pk
 
 
@@ -73,6 +73,7 @@ def data_to_links_df(
     links_df: Union[pd.DataFrame, list[dict]],
     in_crs: int = LAT_LON_CRS,
     nodes_df: Union[None, DataFrame[RoadNodesTable]] = None,
+    validation_mode: ValidationModes = "full",
 ) -> DataFrame[RoadLinksTable]:
     """Create a links dataframe from list of link properties + link geometries or associated nodes.
 
@@ -85,6 +86,8 @@ def data_to_links_df(
             Defaults to LAT_LON_CRS. Will convert everything to LAT_LON_CRSif it doesn't match.
         nodes_df: Associated notes geodataframe to use if geometries or location references not
             present. Defaults to None.
+        validation_mode: how links_df is validated. See `validate_df_to_model`. Defaults to
+            `full`.
 
     Returns:
         pd.DataFrame: _description_
@@ -110,7 +113,7 @@ def data_to_links_df(
     links_df.attrs.update(RoadLinksAttrs)
     links_df = set_df_index_to_pk(links_df)
     links_df.gdf_name = links_df.attrs["name"]
-    links_df = validate_df_to_model(links_df, RoadLinksTable)
+    links_df = validate_df_to_model(links_df, RoadLinksTable, mode=validation_mode)
 
     if len(links_df) < SMALL_RECS:
         WranglerLogger.debug(
@@ -38,9 +38,15 @@ from ...models.projects.roadway_changes import (
 )
 from ...models.roadway.tables import RoadLinksAttrs, RoadLinksTable, RoadNodesAttrs, RoadNodesTable
 from ...models.roadway.types import ScopedLinkValueItem
-from ...utils.data import validate_existing_value_in_df
-from ...utils.geo import offset_geometry_meters, update_nodes_in_linestring_geometry
-from ...utils.models import default_from_datamodel, validate_call_pyd, validate_df_to_model
+from ...utils.data import copy_on_write, validate_existing_value_in_df
+from ...utils.geo import move_linestring_vertices_to_nodes, offset_geometry_meters
+from ...utils.models import (
+    default_from_datamodel,
+    edit_validation_mode,
+    validate_call_pyd,
+    validate_df_to_model,
+)
+from .links import NodeIncidenceIndex
 from .scopes import (
     _filter_to_conflicting_scopes,
     _filter_to_matching_scope,
@@ -358,7 +364,10 @@ def edit_link_properties(
         project_name: optional name of the project to be applied
         config: WranglerConfig instance. Defaults to DefaultConfig.
     """
-    links_df = copy.deepcopy(links_df)
+    edit_cols = ["projects", *property_changes, *[f"sc_{p}" for p in property_changes]]
+    if any(p.startswith("ML_") for p in property_changes):
+        edit_cols += ["managed", *[c for c in links_df.columns if c.startswith("ML_")]]
+    links_df = copy_on_write(links_df, edit_cols, rows=link_idx)
     # TODO write wrapper on validate call so don't have to do this
     links_df.attrs.update(RoadLinksAttrs)
     ml_property_changes = bool([k for k in property_changes if k.startswith("ML_")])
@@ -395,7 +404,9 @@ def edit_link_properties(
             )
             links_df.loc[link_idx, "ML_egress_point"] = True
 
-    links_df = validate_df_to_model(links_df, RoadLinksTable)
+    links_df = validate_df_to_model(
+        links_df, RoadLinksTable, mode=edit_validation_mode(config.VALIDATION.MODE)
+    )
     return links_df
 
 
@@ -404,32 +415,37 @@ def edit_link_geometry_from_nodes(
     links_df: DataFrame[RoadLinksTable],
     nodes_df: DataFrame[RoadNodesTable],
     node_ids: list[int],
+    node_incidence: Optional[NodeIncidenceIndex] = None,
 ) -> DataFrame[RoadLinksTable]:
     """Returns a copy of links with updated geometry for given links for a given list of nodes.
 
-    Should be called by any function that changes a node location.
+    Should be called by any function that changes a node location. Only the end vertices of
+    links which start or end at node_ids are patched.
 
     Args:
         links_df: RoadLinksTable to update
         nodes_df: RoadNodesTable to get updated node geometry from
         node_ids: list of node PKs with updated geometry
+        node_incidence: NodeIncidenceIndex of links_df used to find the links using node_ids.
+            If None, will be created from the links with node_ids.
     """
-    # WranglerLogger.debug(f"nodes_df.loc[node_ids]:\n {nodes_df.loc[node_ids]}")
     # TODO write wrapper on validate call so don't have to do this
     links_df.attrs.update(RoadLinksAttrs)
     nodes_df.attrs.update(RoadNodesAttrs)
-    links_df = copy.deepcopy(links_df)
+    if node_incidence is None:
+        _a_or_b_mask = links_df.A.isin(node_ids) | links_df.B.isin(node_ids)
+        node_incidence = NodeIncidenceIndex(links_df.loc[_a_or_b_mask])
 
-    updated_a_geometry = update_nodes_in_linestring_geometry(
-        links_df.loc[links_df.A.isin(node_ids)], nodes_df, 0
-    )
-    links_df.update(updated_a_geometry)
+    links_df = copy_on_write(links_df, ["geometry"])
+    node_links_df = node_incidence.links(node_ids)
+    if node_links_df.empty:
+        return links_df
 
-    updated_b_geometry = update_nodes_in_linestring_geometry(
-        links_df.loc[links_df.B.isin(node_ids)], nodes_df, -1
+    updated_geometry = move_linestring_vertices_to_nodes(
+        links_df["geometry"], node_links_df, nodes_df, "link_idx"
+    )
+    links_df.loc[updated_geometry.index, "geometry"] = updated_geometry.values
+    WranglerLogger.debug(
+        f"links_df: \n{links_df.loc[updated_geometry.index, ['A', 'B', 'geometry']]}"
     )
-    links_df.update(updated_b_geometry)
-
-    _a_or_b_mask = links_df.A.isin(node_ids) | links_df.B.isin(node_ids)
-    WranglerLogger.debug(f"links_df: \n{links_df.loc[_a_or_b_mask, ['A', 'B', 'geometry']]}")
     return links_df
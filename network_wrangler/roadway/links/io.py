@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import pandas as pd
+from geopandas import GeoDataFrame
 from pandera.typing import DataFrame
+from shapely.geometry import box
 
 from ...configs import DefaultConfig, WranglerConfig
 from ...logger import WranglerLogger
@@ -15,8 +17,20 @@ from ...models._base.types import GeoFileTypes
 from ...models.roadway.converters import translate_links_df_v1_to_v0
 from ...models.roadway.tables import RoadLinksAttrs, RoadLinksTable, RoadNodesAttrs, RoadNodesTable
 from ...params import LAT_LON_CRS
-from ...utils.io_table import read_table, write_table
-from ...utils.models import order_fields_from_data_model, validate_call_pyd
+from ...utils.io_table import (
+    file_validation_mode,
+    read_and_transform_table,
+    read_table,
+    read_table_columns,
+    write_schema_stamp,
+    write_spatial_parquet,
+    write_table,
+)
+from ...utils.models import (
+    order_fields_from_data_model,
+    required_fields_from_model,
+    validate_call_pyd,
+)
 from .create import data_to_links_df
 
 
@@ -27,11 +41,18 @@ def read_links(
     config: WranglerConfig = DefaultConfig,
     nodes_df: DataFrame[RoadNodesTable] = None,
     filter_to_nodes: bool = False,
+    chunk_size: Optional[int] = None,
+    columns: Optional[list[str]] = None,
+    filters: Optional[list] = None,
 ) -> DataFrame[RoadLinksTable]:
     """Reads links and returns a geodataframe of links conforming to RoadLinksTable.
 
     Sets index to be a copy of the primary key.
-    Validates output dataframe using RoadLinksTable
+    Validates output dataframe using RoadLinksTable, or only checks its dtypes if
+    `config.VALIDATION.MODE` is `trusted` and filename was stamped as valid when it was written.
+
+    If filename is a directory of parquet tile partitions and filter_to_nodes is True, tiles
+    outside of the bounds of nodes_df aren't read.
 
     Args:
         filename (str): file to read links in from.
@@ -42,6 +63,15 @@ def read_links(
             provided. Defaults to None.
         filter_to_nodes: if True, will filter links to only those that connect to nodes. Requires
             nodes_df to be provided. Defaults to False.
+        chunk_size: if provided, will read, filter, and validate links in chunks of this many
+            records so that peak memory use stays close to the size of the final table.
+            Defaults to None, which reads the whole file at once.
+        columns: link properties to read. Required RoadLinksTable fields and scoped `sc_`
+            versions of the properties are always read. Columns which aren't read are listed in
+            `links_df.attrs["omitted_columns"]`. Defaults to None, which reads all columns.
+        filters: predicates links must match in the form of pyarrow parquet filters, i.e.
+            `[("drive_access", "==", True), ("roadway", "in", ["primary", "secondary"])]`.
+            Pushed down into the reader for parquet files. Defaults to None.
     """
     WranglerLogger.info(f"Reading links from {filename}.")
     start_t = time.time()
@@ -49,17 +79,40 @@ def read_links(
         msg = "If filter_to_nodes is True, nodes_df must be provided."
         raise ValueError(msg)
 
-    links_df = read_table(filename, read_speed=config.CPU.EST_PD_READ_SPEED)
-
-    if filter_to_nodes:
+    def _filter_to_nodes(df):
         WranglerLogger.debug("Filtering links to only those that connect to nodes.")
-        links_df = links_df[
-            links_df["A"].isin(nodes_df.model_node_id) & links_df["B"].isin(nodes_df.model_node_id)
-        ]
-
-    WranglerLogger.debug(f"Read {len(links_df)} links in {round(time.time() - start_t, 2)}.")
-    links_df = data_to_links_df(links_df, in_crs=in_crs, nodes_df=nodes_df)
+        return df[df["A"].isin(nodes_df.model_node_id) & df["B"].isin(nodes_df.model_node_id)]
+
+    # links connecting nodes_df are within its bounds, so tiles outside of them can be skipped
+    boundary_kwargs = {}
+    if filter_to_nodes and Path(filename).is_dir():
+        boundary_kwargs["boundary_gdf"] = GeoDataFrame(
+            geometry=[box(*nodes_df.total_bounds)], crs=nodes_df.crs
+        )
+
+    omitted_columns = []
+    if columns is not None:
+        _required = required_fields_from_model(RoadLinksTable)
+        columns = list(dict.fromkeys([*_required, *columns, *[f"sc_{c}" for c in columns]]))
+        omitted_columns = [c for c in read_table_columns(filename) if c not in columns]
+        WranglerLogger.debug(f"Omitting link columns: {omitted_columns}")
+
+    validation_mode = file_validation_mode(filename, RoadLinksTable, config.VALIDATION.MODE)
+    links_df = read_and_transform_table(
+        filename,
+        lambda df: data_to_links_df(
+            df, in_crs=in_crs, nodes_df=nodes_df, validation_mode=validation_mode
+        ),
+        filter_func=_filter_to_nodes if filter_to_nodes else None,
+        chunk_size=chunk_size,
+        model=RoadLinksTable,
+        read_speed=config.CPU.EST_PD_READ_SPEED,
+        columns=columns,
+        filters=filters,
+        **boundary_kwargs,
+    )
     links_df.attrs["source_file"] = filename
+    links_df.attrs["omitted_columns"] = omitted_columns
     WranglerLogger.info(
         f"Read + transformed {len(links_df)} links from \
             {filename} in {round(time.time() - start_t, 2)}."
@@ -67,6 +120,34 @@ def read_links(
     return links_df
 
 
+def restore_omitted_link_columns(
+    links_df: DataFrame[RoadLinksTable],
+    source_file: Path,
+    omitted_columns: list[str],
+) -> DataFrame[RoadLinksTable]:
+    """Returns a copy of links_df with columns omitted when reading it added back from source.
+
+    Links which aren't in the source file (i.e. added by projects) will have missing values.
+
+    Args:
+        links_df: RoadLinksTable which was read with some columns omitted.
+        source_file: file links_df was read from.
+        omitted_columns: columns which weren't read.
+    """
+    if not Path(source_file).exists():
+        msg = f"Can't restore omitted link columns {omitted_columns}: {source_file} not found."
+        WranglerLogger.error(msg)
+        raise FileNotFoundError(msg)
+    WranglerLogger.debug(f"Restoring omitted link columns from {source_file}.")
+    source_df = pd.DataFrame(read_table(source_file, columns=["model_link_id", *omitted_columns]))
+    source_df = source_df.set_index("model_link_id").reindex(links_df["model_link_id"])
+    links_df = links_df.copy(deep=False)
+    for col in omitted_columns:
+        if col in source_df.columns and col not in links_df.columns:
+            links_df[col] = source_df[col].to_numpy()
+    return links_df
+
+
 @validate_call_pyd
 def write_links(
     links_df: DataFrame[RoadLinksTable],
@@ -76,6 +157,9 @@ def write_links(
     file_format: GeoFileTypes = "json",
     overwrite: bool = False,
     include_geometry: bool = False,
+    spatial_index: bool = False,
+    tile_level: Optional[int] = None,
+    schema_stamp: bool = False,
 ) -> None:
     """Writes links to a file.
 
@@ -89,9 +173,26 @@ def write_links(
         file_format: file format to write out to. Defaults to "json".
         overwrite: if True, will overwrite existing files. Defaults to False.
         include_geometry: if True, will include geometry in the output. Defaults to False.
+        spatial_index: if True and file_format is parquet, will sort links along a Hilbert
+            curve of their geometry and write them in spatially compact row groups. Defaults
+            to False.
+        tile_level: if provided and file_format is parquet, will write links as a directory
+            partitioned by web mercator tiles at this zoom level. Implies spatial_index.
+            Defaults to None.
+        schema_stamp: if True, will stamp the file as valid to RoadLinksTable if links_df
+            was validated to it since it was last modified, unless complex properties are
+            converted. Defaults to False.
     """
     if not include_geometry and file_format == "geojson":
         file_format = "json"
+    spatial_index = spatial_index or tile_level is not None
+    if spatial_index and file_format != "parquet":
+        WranglerLogger.warning(
+            f"spatial_index and tile_level only apply to parquet, not {file_format}. Ignoring."
+        )
+        spatial_index = False
+    link_geometry = links_df.geometry if spatial_index else None
+    validated_links_df = links_df if schema_stamp else None
 
     links_file = Path(out_dir) / f"{prefix}link.{file_format}"
 
@@ -104,6 +205,8 @@ def write_links(
             convert_complex_properties_to_single_field = False
         v1_links_df = links_df.copy()
         links_df = translate_links_df_v1_to_v0(v1_links_df)
+        # v0 links aren't valid to RoadLinksTable
+        validated_links_df = None
 
     if not include_geometry:
         geo_cols = links_df.select_dtypes(include=["geometry"]).columns.tolist()
@@ -111,4 +214,14 @@ def write_links(
         links_df = links_df.drop(columns=geo_cols)
 
     links_df = order_fields_from_data_model(links_df, RoadLinksTable)
-    write_table(links_df, links_file, overwrite=overwrite)
+    if spatial_index:
+        write_spatial_parquet(
+            links_df,
+            links_file,
+            overwrite=overwrite,
+            geometry=link_geometry,
+            tile_level=tile_level,
+        )
+    else:
+        write_table(links_df, links_file, overwrite=overwrite)
+    write_schema_stamp(validated_links_df, links_file, RoadLinksTable)
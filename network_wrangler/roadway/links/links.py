@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 
@@ -106,6 +107,85 @@ def shape_ids_unique_to_link_ids(
     return list(set(selected_link_shape_ids) - set(unselected_link_shape_ids))
 
 
+class NodeIncidenceIndex:
+    """Index from model_node_id to the links and shapes which start or end at each node.
+
+    Built once from the `A`, `B` and `shape_id` columns of a links table and sorted by node so
+    that the links and shapes using a set of nodes are found with a binary search, scaling with
+    the number of nodes looked up rather than with the size of the network. The index only
+    depends on link topology, so it stays valid when nodes are moved.
+
+    Vertex positions follow link direction: 0 for a link's `A` node and -1 for its `B` node.
+
+    Usage:
+
+    ```
+    incidence = NodeIncidenceIndex(links_df)
+    node_links_df = incidence.links([1, 2])
+    ```
+    """
+
+    def __init__(self, links_df: DataFrame[RoadLinksTable]):
+        """Constructor for NodeIncidenceIndex.
+
+        Args:
+            links_df: links table to index.
+        """
+        n_links = len(links_df)
+        node_ids = np.concatenate([links_df["A"].to_numpy(), links_df["B"].to_numpy()])
+        order = np.argsort(node_ids, kind="stable")
+        self._node_ids = node_ids[order]
+        self._link_labels = np.tile(links_df.index.to_numpy(), 2)[order]
+        self._vertex_pos = np.repeat(np.array([0, -1]), n_links)[order]
+        if "shape_id" in links_df.columns:
+            self._shape_ids = np.tile(links_df["shape_id"].to_numpy(dtype=object), 2)[order]
+        else:
+            self._shape_ids = np.full(len(node_ids), None, dtype=object)
+
+    def _positions(self, node_ids: list[int]) -> np.ndarray:
+        """Positions in the sorted index of entries for node_ids."""
+        node_ids = np.unique(np.asarray(node_ids, dtype=self._node_ids.dtype))
+        starts = np.searchsorted(self._node_ids, node_ids, side="left")
+        counts = np.searchsorted(self._node_ids, node_ids, side="right") - starts
+        return np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+
+    def links(self, node_ids: list[int]) -> pd.DataFrame:
+        """Links which start or end at node_ids.
+
+        Returns:
+            DataFrame with one record per link and node with columns `link_idx` (links_df index
+            label), `model_node_id` and `vertex_pos`.
+        """
+        pos = self._positions(node_ids)
+        return pd.DataFrame(
+            {
+                "link_idx": self._link_labels[pos],
+                "model_node_id": self._node_ids[pos],
+                "vertex_pos": self._vertex_pos[pos],
+            }
+        )
+
+    def shapes(self, node_ids: list[int]) -> pd.DataFrame:
+        """Shapes of links which start or end at node_ids.
+
+        Returns:
+            DataFrame with one record per shape_id, model_node_id and vertex_pos.
+        """
+        pos = self._positions(node_ids)
+        shapes_df = pd.DataFrame(
+            {
+                "shape_id": self._shape_ids[pos],
+                "model_node_id": self._node_ids[pos],
+                "vertex_pos": self._vertex_pos[pos],
+            }
+        )
+        return shapes_df.dropna(subset=["shape_id"]).drop_duplicates(ignore_index=True)
+
+    def link_labels(self, node_ids: list[int]) -> list:
+        """Unique links_df index labels of links which start or end at node_ids."""
+        return pd.unique(self._link_labels[self._positions(node_ids)]).tolist()
+
+
 def calc_lane_miles(links_df: DataFrame[RoadLinksTable]) -> pd.Series:
     """Calculates default lane miles for each link in the links dataframe.
 
@@ -4,12 +4,17 @@ This module provides various utility functions for filtering and querying scoped
 on scoping dimensions such as category and timespan. It includes functions for filtering scoped
 values based on non-overlapping or overlapping timespans, non-overlapping or overlapping
 categories, and matching exact category and timespan. It also includes functions for creating
-exploded dataframes for scoped properties and filtering them based on scope.
+normalized tables of scoped properties and filtering them based on scope.
 
 Public Functions:
 - prop_for_scope: Creates a dataframe with the value of a property for a given category and
     timespan. Can return maximum overlapping timespan value given a minimum number of overlapping
     minutes, or strictly enforce timespans.
+- props_for_scopes: Creates a wide dataframe with the values of several properties for each
+    combination of named timespans and categories in one pass.
+- scoped_prop_table: Creates a normalized table of the scoped values of a property with one row
+    per scoped value and timespans as seconds from midnight.
+- update_scoped_prop_table: Updates a scoped property table for added, deleted or edited links.
 
 Internal function terminology for scopes:
 
@@ -33,31 +38,31 @@ model_links_df["lanes_AM_sov"] = prop_for_scope(links_df, ["6:00":"9:00"], categ
 """
 
 import copy
-from typing import Any, Union
+from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 from pydantic import validate_call
 from typing_extensions import TypeGuard
 
+from ...configs import DefaultConfig, WranglerConfig
 from ...errors import InvalidScopedLinkValue
 from ...logger import WranglerLogger
-from ...models._base.types import TimeString
+from ...models._base.types import TimespanString, TimeString
 from ...models.projects.roadway_changes import IndivScopedPropertySetItem
-from ...models.roadway.tables import (
-    ExplodedScopedLinkPropertyTable,
-    RoadLinksAttrs,
-    RoadLinksTable,
-)
+from ...models.roadway.tables import RoadLinksAttrs, RoadLinksTable
 from ...models.roadway.types import ScopedLinkValueItem
 from ...params import DEFAULT_CATEGORY, DEFAULT_TIMESPAN
-from ...utils.models import validate_call_pyd, validate_df_to_model
+from ...utils.models import edit_validation_mode, validate_call_pyd, validate_df_to_model
 from ...utils.time import (
-    convert_timespan_to_start_end_dt,
     dt_contains,
     dt_list_overlaps,
-    filter_df_to_max_overlapping_timespans,
+    max_overlap_positions,
+    seconds_contains,
+    seconds_overlap_duration,
     str_to_time,
+    timespan_to_seconds,
 )
 
 
@@ -224,96 +229,182 @@ def _filter_to_conflicting_scopes(
     return conflicting_scopes
 
 
-def _create_exploded_df_for_scoped_prop(
+SCOPED_PROP_TABLE_COLUMNS = ["link_idx", "category", "start_sec", "end_sec", "value"]
+
+
+def _has_scoped_values(scoped_values: Any) -> bool:
+    if isinstance(scoped_values, (list, tuple, np.ndarray)):
+        return len(scoped_values) > 0
+    return scoped_values is not None and not pd.isna(scoped_values)
+
+
+def _scoped_item_fields(item: Any) -> tuple[Any, Any, Any]:
+    """Category, timespan and value of a ScopedLinkValueItem or its dictionary equivalent."""
+    if isinstance(item, dict):
+        return item.get("category"), item.get("timespan"), item.get("value")
+    return item.category, item.timespan, item.value
+
+
+def scoped_prop_table(
     links_df: DataFrame[RoadLinksTable],
     prop_name: str,
-    default_category=DEFAULT_CATEGORY,
-) -> DataFrame[ExplodedScopedLinkPropertyTable]:
-    """Creates a tidy df of `default`,`category`,`timespan`,`start_time`,`end_time`,`scoped`.
-
-    Steps:
-
-        1. Filter to records that have scoped values
-        2. Create a record for each scope (explode records)
-        3. Normalize dictionary to columns for category, timespan, value (explode columns)
-        4. Fill default category
-        5. Separate timespan to start_time and end_time of dt type to facilitate queries
-        6. Tidy up and align with data model for export
+    default_category: Union[str, int] = DEFAULT_CATEGORY,
+) -> pd.DataFrame:
+    """Creates a normalized table of the scoped values in `sc_<prop_name>`.
+
+    Each ScopedLinkValueItem becomes a row with columns:
+
+    - `link_idx`: index of the link in links_df
+    - `category`: category of the scoped value, filled with `default_category` if missing.
+    - `start_sec`, `end_sec`: timespan as seconds from midnight where end times earlier than
+        start times are moved to the next day.
+    - `value`: scoped value
+
+    Rows are ordered by link and then by the order of the scoped values for the link.
+
+    Args:
+        links_df: RoadLinksTable
+        prop_name: name of property to create the table for, e.g. `lanes` for `sc_lanes`
+        default_category: category to use if it isn't specified. Defaults to DEFAULT_CATEGORY.
     """
-    # 1. Filter to records that have scoped values
-    keep_cols = ["model_link_id", prop_name, f"sc_{prop_name}"]
-    scoped_values_df = links_df.loc[links_df[f"sc_{prop_name}"].notna(), keep_cols]
-
-    # 2. Create a record for each scope
-    exp_df = scoped_values_df.explode(f"sc_{prop_name}")
-    WranglerLogger.debug(f"Exploded Records: \n{exp_df}")
-
-    # 3. normalize dictionary to columns for each dictionary key: category, timespan, value
-    #       convert to dictionary from data model
-    exp_df[f"sc_{prop_name}"] = exp_df[f"sc_{prop_name}"].apply(
-        lambda x: x.model_dump() if hasattr(x, "model_dump") else x
+    sc_col = f"sc_{prop_name}"
+    if sc_col not in links_df.columns:
+        return pd.DataFrame({c: pd.Series(dtype=object) for c in SCOPED_PROP_TABLE_COLUMNS})
+
+    link_idx, categories, start_secs, end_secs, values = [], [], [], [], []
+    scoped_s = links_df[sc_col]
+    for idx, scoped_values in zip(scoped_s.index, scoped_s.to_numpy()):
+        if not _has_scoped_values(scoped_values):
+            continue
+        for item in scoped_values:
+            category, timespan, value = _scoped_item_fields(item)
+            start_sec, end_sec = timespan_to_seconds(timespan if timespan else DEFAULT_TIMESPAN)
+            link_idx.append(idx)
+            categories.append(default_category if category is None else category)
+            start_secs.append(start_sec)
+            end_secs.append(end_sec)
+            values.append(value)
+
+    return pd.DataFrame(
+        {
+            "link_idx": pd.Index(link_idx, dtype=links_df.index.dtype),
+            "category": pd.Series(categories, dtype=object),
+            "start_sec": np.array(start_secs, dtype=np.int32),
+            "end_sec": np.array(end_secs, dtype=np.int32),
+            "value": pd.Series(values, dtype=None if values else object),
+        }
     )
-    normalized_scope_df = pd.json_normalize(exp_df.pop(f"sc_{prop_name}")).set_index(exp_df.index)
-    exp_df = scoped_values_df[["model_link_id"]].join(normalized_scope_df)
-    WranglerLogger.debug(f"Exploded columns: \n{exp_df}")
 
-    # 4. Fill default category (timespan query should take care of this itself)
-    if "category" not in exp_df.columns:
-        exp_df["category"] = default_category
-    else:
-        exp_df.loc[exp_df["category"].isna(), "category"] = default_category
 
-    # 5. Separate timespan to start_time and end_time of dt type to facilitate queries
-    exp_df[["start_time", "end_time"]] = convert_timespan_to_start_end_dt(exp_df.timespan)
+def update_scoped_prop_table(
+    scoped_table: pd.DataFrame,
+    links_df: DataFrame[RoadLinksTable],
+    prop_name: str,
+    link_idx: list,
+) -> pd.DataFrame:
+    """Updates a table from `scoped_prop_table` for links which were added, deleted or edited.
+
+    Args:
+        scoped_table: table created by `scoped_prop_table` before the change.
+        links_df: RoadLinksTable after the change.
+        prop_name: name of the property the table is for.
+        link_idx: index of links in links_df which were added, deleted or edited.
+    """
+    keep_table = scoped_table.loc[~scoped_table["link_idx"].isin(link_idx)]
+    changed_links_df = links_df.loc[links_df.index.isin(link_idx)]
+    changed_table = scoped_prop_table(changed_links_df, prop_name)
+    if changed_table.empty:
+        return keep_table.reset_index(drop=True)
+    if keep_table.empty:
+        return changed_table
+    return pd.concat([keep_table, changed_table], ignore_index=True)
+
+
+def _scoped_rows_for_timespans(
+    scoped_table: pd.DataFrame,
+    timespans: list[list[TimeString]],
+    category: Union[str, int, list] = DEFAULT_CATEGORY,
+    strict_timespan_match: bool = False,
+    min_overlap_minutes: int = 60,
+) -> list[np.ndarray]:
+    """Positions of the rows in a table from `scoped_prop_table` applying to each timespan.
 
-    # 6. Tidy up and align with data model for export
-    exp_df = exp_df.rename(columns={"value": "scoped"})
-    exp_df = ExplodedScopedLinkPropertyTable(exp_df)
-    WranglerLogger.debug(f"exp_df: \n{exp_df}")
+    Overlaps between every scoped value and every timespan are calculated at once. If more than
+    one scoped value applies to a link for a timespan, the one with the most overlap is used.
+    For the default timespan, all scoped values apply and the last one for a link is used.
 
-    return exp_df
+    Args:
+        scoped_table: table created by `scoped_prop_table`.
+        timespans: list of TimespanStrings of format ['HH:MM','HH:MM'] to query for.
+        category: category or list of categories to query for. Defaults to DEFAULT_CATEGORY.
+        strict_timespan_match: boolean indicating if the returned rows should only contain
+            records that fully contain the query timespan. If set to True, min_overlap_minutes
+            does not apply. Defaults to False.
+        min_overlap_minutes: minimum number of minutes the timespans need to overlap to keep.
+            Defaults to 60.
 
+    Returns:
+        list with an array of row positions for each timespan with at most one row per link.
+    """
+    rows = np.arange(len(scoped_table))
+    if category != DEFAULT_CATEGORY:
+        categories = category if isinstance(category, list) else [category]
+        rows = rows[scoped_table["category"].isin([*categories, DEFAULT_CATEGORY]).to_numpy()]
+    link_codes = pd.factorize(scoped_table["link_idx"])[0][rows]
+    start_sec = scoped_table["start_sec"].to_numpy()[rows, None]
+    end_sec = scoped_table["end_sec"].to_numpy()[rows, None]
+
+    q_sec = np.array([timespan_to_seconds(ts) for ts in timespans]).reshape(-1, 2)
+    q_start, q_end = q_sec[:, 0], q_sec[:, 1]
+    overlap_sec = seconds_overlap_duration(start_sec, end_sec, q_start, q_end)
+    if strict_timespan_match:
+        keep = seconds_contains(start_sec, end_sec, q_start, q_end)
+    else:
+        keep = overlap_sec > min_overlap_minutes * 60
 
-@validate_call(config={"arbitrary_types_allowed": True})
-def _filter_exploded_df_to_scope(
-    exp_scoped_prop_df: DataFrame[ExplodedScopedLinkPropertyTable],
+    timespan_rows = []
+    for i, timespan in enumerate(timespans):
+        if timespan == DEFAULT_TIMESPAN:
+            ts_keep, score = slice(None), np.arange(len(rows))
+        else:
+            ts_keep, score = keep[:, i], overlap_sec[:, i]
+        ts_rows = rows[ts_keep]
+        timespan_rows.append(ts_rows[max_overlap_positions(link_codes[ts_keep], score[ts_keep])])
+    return timespan_rows
+
+
+def _filter_scoped_prop_table_to_scope(
+    scoped_table: pd.DataFrame,
     timespan: list[TimeString] = DEFAULT_TIMESPAN,
-    category: Union[str, int] = DEFAULT_CATEGORY,
+    category: Union[str, int, list] = DEFAULT_CATEGORY,
     strict_timespan_match: bool = False,
     min_overlap_minutes: int = 60,
 ) -> pd.DataFrame:
-    """Queries an exploded dataframe of prop_name to determine value for scope for each link.
+    """Filters a table from `scoped_prop_table` to the scoped value applying to each link.
 
     Args:
-        exp_scoped_prop_df: `ExplodedScopedLinkPropertyTable` for property `prop_name `
-        timespan: TimespanString of format ['HH:MM','HH:MM'] to query orig_df for overlapping
+        scoped_table: table created by `scoped_prop_table`.
+        timespan: TimespanString of format ['HH:MM','HH:MM'] to query for overlapping
             records. Defaults to DEFAULT_TIMESPAN.
-        category: category to query orig_df for overlapping records. Defaults to DEFAULT_CATEGORY.
+        category: category or list of categories to query for. Defaults to DEFAULT_CATEGORY.
         strict_timespan_match: boolean indicating if the returned df should only contain
             records that fully contain the query timespan. If set to True, min_overlap_minutes
             does not apply. Defaults to False.
         min_overlap_minutes: minimum number of minutes the timespans need to overlap to keep.
-            Defaults to 0.
+            Defaults to 60.
 
     Returns:
-        pd.DataFrame with `model_link_id` and `prop_name`
+        rows of scoped_table with at most one row per `link_idx`. If more than one scoped value
+            applies, the one with the most overlap with the timespan is used.
     """
-    match_df = exp_scoped_prop_df
-    # Filter dataframe based on matching category and timespan
-    if category != DEFAULT_CATEGORY:
-        match_df = match_df[
-            (match_df["category"] == category) | (match_df["category"] == DEFAULT_CATEGORY)
-        ]
-
-    if timespan != DEFAULT_TIMESPAN:
-        match_df = filter_df_to_max_overlapping_timespans(
-            match_df,
-            timespan,
-            strict_match=strict_timespan_match,
-            min_overlap_minutes=min_overlap_minutes,
-        )
-    WranglerLogger.debug(f"match_df: \n{match_df}")
-    return match_df
+    (rows,) = _scoped_rows_for_timespans(
+        scoped_table,
+        [timespan],
+        category=category,
+        strict_timespan_match=strict_timespan_match,
+        min_overlap_minutes=min_overlap_minutes,
+    )
+    return scoped_table.iloc[np.sort(rows)]
 
 
 @validate_call_pyd
@@ -325,6 +416,8 @@ def prop_for_scope(
     strict_timespan_match: bool = False,
     min_overlap_minutes: int = 60,
     allow_default: bool = True,
+    scoped_table: Optional[pd.DataFrame] = None,
+    config: WranglerConfig = DefaultConfig,
 ) -> pd.DataFrame:
     """Creates a df with the value of a property for a given category and timespan.
 
@@ -341,11 +434,19 @@ def prop_for_scope(
             Defaults to 0.
         allow_default: boolean indicating if the default value should be returned if no scoped
             values are found. Defaults to True.
+        scoped_table: table of scoped values for `prop_name` from `scoped_prop_table` for
+            links_df. If provided, links_df is assumed to already be a valid RoadLinksTable.
+            If None, will be created from links_df. Defaults to None.
+        config: WranglerConfig instance which sets how links_df is validated. Defaults to
+            DefaultConfig.
 
     Returns:
         pd.DataFrame with `model_link_id` and `prop_name`
     """
-    links_df = validate_df_to_model(links_df, RoadLinksTable)
+    if scoped_table is None:
+        links_df = validate_df_to_model(
+            links_df, RoadLinksTable, mode=edit_validation_mode(config.VALIDATION.MODE)
+        )
     timespan = timespan if timespan is not None else DEFAULT_TIMESPAN
     category = category if category is not None else DEFAULT_CATEGORY
 
@@ -353,8 +454,11 @@ def prop_for_scope(
         msg = f"{prop_name} not in dataframe."
         raise ValueError(msg)
 
+    if scoped_table is None:
+        scoped_table = scoped_prop_table(links_df, prop_name)
+
     # Check if scoped values even exist and if can just return the default.
-    if f"sc_{prop_name}" not in links_df.columns or links_df[f"sc_{prop_name}"].isna().all():
+    if scoped_table.empty:
         if not allow_default:
             msg = f"{prop_name} does not have a scoped property column or it is null."
             WranglerLogger.error(
@@ -364,12 +468,9 @@ def prop_for_scope(
         WranglerLogger.debug(f"No scoped values {prop_name}. Returning default.")
         return copy.deepcopy(links_df[["model_link_id", prop_name]])
 
-    # All possible scopings
-    candidate_scoped_prop_df = _create_exploded_df_for_scoped_prop(links_df, prop_name)
-
     # Find scopes that apply
-    scoped_prop_df = _filter_exploded_df_to_scope(
-        candidate_scoped_prop_df,
+    scoped_prop_df = _filter_scoped_prop_table_to_scope(
+        scoped_table,
         timespan=timespan,
         category=category,
         strict_timespan_match=strict_timespan_match,
@@ -378,8 +479,96 @@ def prop_for_scope(
 
     # Attach them back to all links and update default.
     result_df = copy.deepcopy(links_df[["model_link_id", prop_name]])
-    result_df.loc[scoped_prop_df.index, prop_name] = scoped_prop_df["scoped"]
+    result_df.loc[scoped_prop_df["link_idx"], prop_name] = scoped_prop_df["value"].to_numpy()
     WranglerLogger.debug(
-        f"result_df[prop_name]: \n{result_df.loc[scoped_prop_df.index, prop_name]}"
+        f"result_df[prop_name]: \n{result_df.loc[scoped_prop_df['link_idx'], prop_name]}"
     )
     return result_df
+
+
+@validate_call_pyd
+def props_for_scopes(
+    links_df: DataFrame[RoadLinksTable],
+    prop_names: list[str],
+    timespans: dict[str, TimespanString],
+    categories: Optional[list[Union[str, int]]] = None,
+    strict_timespan_match: bool = False,
+    min_overlap_minutes: int = 60,
+    scoped_tables: Optional[dict[str, pd.DataFrame]] = None,
+    config: WranglerConfig = DefaultConfig,
+) -> pd.DataFrame:
+    """Creates a wide df with the value of properties for every timespan and category.
+
+    Each scoped property is normalized once and all timespans are resolved together rather
+    than calling `prop_for_scope` for each property, timespan and category.
+
+    Usage:
+
+    ```python
+    model_links_df = props_for_scopes(
+        links_df,
+        ["lanes", "price"],
+        {"AM": ["6:00", "9:00"], "PM": ["16:00", "19:00"]},
+        categories=["any", "sov"],
+    )
+    ```
+
+    Returns columns `model_link_id`, `lanes_AM`, `lanes_PM`, `lanes_sov_AM`, `lanes_sov_PM`,
+    `price_AM` and so on.
+
+    Args:
+        links_df: RoadLinksTable
+        prop_names: names of properties to query.
+        timespans: dictionary mapping a name used in output column names to a TimespanString of
+            format ['HH:MM','HH:MM'].
+        categories: list of categories to query. The default category is omitted from output
+            column names. Defaults to [DEFAULT_CATEGORY].
+        strict_timespan_match: boolean indicating if the values should only come from
+            records that fully contain the query timespan. If set to True, min_overlap_minutes
+            does not apply. Defaults to False.
+        min_overlap_minutes: minimum number of minutes the timespans need to overlap to keep.
+            Defaults to 60.
+        scoped_tables: dictionary of property name to tables from `scoped_prop_table` for
+            links_df. If provided, links_df is assumed to already be a valid RoadLinksTable.
+            Tables which are missing will be created from links_df. Defaults to None.
+        config: WranglerConfig instance which sets how links_df is validated. Defaults to
+            DefaultConfig.
+
+    Returns:
+        pd.DataFrame with `model_link_id` and a column for each property, category and timespan.
+    """
+    if scoped_tables is None:
+        links_df = validate_df_to_model(
+            links_df, RoadLinksTable, mode=edit_validation_mode(config.VALIDATION.MODE)
+        )
+        scoped_tables = {}
+    categories = categories if categories else [DEFAULT_CATEGORY]
+    missing_props = [p for p in prop_names if p not in links_df.columns]
+    if missing_props:
+        msg = f"Properties not in dataframe: {missing_props}."
+        raise ValueError(msg)
+
+    result_cols = {"model_link_id": links_df["model_link_id"]}
+    for prop_name in prop_names:
+        scoped_table = scoped_tables.get(prop_name)
+        if scoped_table is None:
+            scoped_table = scoped_prop_table(links_df, prop_name)
+        link_pos = links_df.index.get_indexer(scoped_table["link_idx"])
+        scoped_values = scoped_table["value"]
+        for category in categories:
+            timespan_rows = _scoped_rows_for_timespans(
+                scoped_table,
+                list(timespans.values()),
+                category=category,
+                strict_timespan_match=strict_timespan_match,
+                min_overlap_minutes=min_overlap_minutes,
+            )
+            for ts_name, rows in zip(timespans, timespan_rows):
+                col = f"{prop_name}_{ts_name}"
+                if category != DEFAULT_CATEGORY:
+                    col = f"{prop_name}_{category}_{ts_name}"
+                values_s = links_df[prop_name].copy()
+                if len(rows):
+                    values_s.iloc[link_pos[rows]] = scoped_values.iloc[rows].to_numpy()
+                result_cols[col] = values_s
+    return pd.DataFrame(result_cols, index=links_df.index)
@@ -16,6 +16,7 @@ from ..logger import WranglerLogger
 from ..models._base.types import RoadwayFileTypes
 from ..models.roadway.tables import RoadLinksTable, RoadNodesTable, RoadShapesTable
 from ..utils.data import concat_with_attr
+from ..utils.ids import IdAllocator
 from .io import write_roadway
 from .links.create import copy_links, data_to_links_df
 from .links.edit import _initialize_links_as_managed_lanes
@@ -83,7 +84,7 @@ class ModelRoadwayNetwork:
             managed lane counterparts.
         ml_node_id_lookup: lookup from general purpose node ids to node ids of their
             managed lane counterparts.
-        _net_hash: hash of the the input links and nodes in order to detect changes.
+        _net_version: version of the input links and nodes in order to detect changes.
 
     """
 
@@ -112,11 +113,15 @@ class ModelRoadwayNetwork:
         if ml_link_id_lookup is None:
             if self.net.config.IDS.ML_LINK_ID_METHOD == "range":
                 self.ml_link_id_lookup = _generate_ml_link_id_lookup_from_range(
-                    self.net.links_df, self.net.config.IDS.ML_LINK_ID_RANGE
+                    self.net.links_df,
+                    self.net.config.IDS.ML_LINK_ID_RANGE,
+                    id_allocator=self.net.link_id_allocator,
                 )
             elif self.net.config.IDS.ML_LINK_ID_METHOD == "scalar":
                 self.ml_link_id_lookup = _generate_ml_link_id_lookup_from_scalar(
-                    self.net.links_df, self.net.config.IDS.ML_LINK_ID_SCALAR
+                    self.net.links_df,
+                    self.net.config.IDS.ML_LINK_ID_SCALAR,
+                    id_allocator=self.net.link_id_allocator,
                 )
             else:
                 msg = "ml_link_id_method must be 'range' or 'scalar'."
@@ -128,11 +133,17 @@ class ModelRoadwayNetwork:
         if ml_node_id_lookup is None:
             if self.net.config.IDS.ML_NODE_ID_METHOD == "range":
                 self.ml_node_id_lookup = _generate_ml_node_id_from_range(
-                    self.net.nodes_df, self.net.links_df, self.net.config.IDS.ML_NODE_ID_RANGE
+                    self.net.nodes_df,
+                    self.net.links_df,
+                    self.net.config.IDS.ML_NODE_ID_RANGE,
+                    id_allocator=self.net.node_id_allocator,
                 )
             elif self.net.config.IDS.ML_NODE_ID_METHOD == "scalar":
                 self.ml_node_id_lookup = _generate_ml_node_id_lookup_from_scalar(
-                    self.net.nodes_df, self.net.links_df, self.net.config.IDS.ML_NODE_ID_SCALAR
+                    self.net.nodes_df,
+                    self.net.links_df,
+                    self.net.config.IDS.ML_NODE_ID_SCALAR,
+                    id_allocator=self.net.node_id_allocator,
                 )
             else:
                 msg = "ml_node_id_method must be 'range' or 'scalar'."
@@ -147,7 +158,7 @@ class ModelRoadwayNetwork:
             self.links_df, self.nodes_df = model_links_nodes_from_net(
                 self.net, self.ml_link_id_lookup, self.ml_node_id_lookup
             )
-        self._net_hash = copy.deepcopy(net.network_hash)
+        self._net_version = net.network_version
 
     @property
     def ml_config(self) -> dict:
@@ -223,52 +234,59 @@ class ModelRoadwayNetwork:
         )
 
 
-def _generate_ml_link_id_lookup_from_range(links_df, link_id_range: tuple[int]):
+def _generate_ml_link_id_lookup_from_range(
+    links_df, link_id_range: tuple[int, int], id_allocator: Optional[IdAllocator] = None
+):
     """Generate a lookup from general purpose link ids to link ids their managed lane counterparts.
 
     Will be divisable by LINK_IDS_DIVISIBLE_BY which defaults to 10.
+
+    Args:
+        links_df: links to generate managed lane link ids for.
+        link_id_range: range of link ids to use.
+        id_allocator: allocator with the taken link ids. Defaults to None, which will scan
+            links_df.model_link_id.
     """
     LINK_IDS_DIVISIBLE_BY = 10
     og_ml_link_ids = links_df.of_type.managed.model_link_id
-    link_id_list = [i for i in range(*link_id_range) if i % LINK_IDS_DIVISIBLE_BY == 0]
-    avail_ml_link_ids = set(link_id_list) - set(links_df.model_link_id.unique().tolist())
-    if len(avail_ml_link_ids) < len(og_ml_link_ids):
-        msg = f"{len(avail_ml_link_ids)} of {len(og_ml_link_ids )} new link ids\
-                         available for provided range: {link_id_range}."
-        raise ValueError(msg)
-    new_link_ids = list(avail_ml_link_ids)[: len(og_ml_link_ids)]
-    return dict(zip(og_ml_link_ids, new_link_ids))
+    if id_allocator is None:
+        id_allocator = IdAllocator(links_df.model_link_id)
+    new_link_ids = id_allocator.from_range(
+        len(og_ml_link_ids), link_id_range, step=LINK_IDS_DIVISIBLE_BY, reserve=False
+    )
+    return dict(zip(og_ml_link_ids, new_link_ids.tolist()))
 
 
-def _generate_ml_node_id_from_range(nodes_df, links_df, node_id_range: tuple[int]):
+def _generate_ml_node_id_from_range(
+    nodes_df, links_df, node_id_range: tuple[int, int], id_allocator: Optional[IdAllocator] = None
+):
     """Generate a lookup for managed lane node ids to their general purpose lane counterparts."""
     og_ml_node_ids = node_ids_in_links(links_df.of_type.managed, nodes_df)
-    avail_ml_node_ids = set(range(*node_id_range)) - set(nodes_df.model_node_id.unique().tolist())
-    if len(avail_ml_node_ids) < len(og_ml_node_ids):
-        msg = f"{len(avail_ml_node_ids)} of {len(og_ml_node_ids )} new nodes ids\
-               available for provided range: {node_id_range}."
-        raise ValueError(msg)
-    new_ml_node_ids = list(avail_ml_node_ids)[: len(og_ml_node_ids)]
-    return dict(zip(og_ml_node_ids.tolist(), new_ml_node_ids))
+    if id_allocator is None:
+        id_allocator = IdAllocator(nodes_df.model_node_id)
+    new_ml_node_ids = id_allocator.from_range(len(og_ml_node_ids), node_id_range, reserve=False)
+    return dict(zip(og_ml_node_ids.tolist(), new_ml_node_ids.tolist()))
 
 
-def _generate_ml_link_id_lookup_from_scalar(links_df: DataFrame[RoadLinksTable], scalar: int):
+def _generate_ml_link_id_lookup_from_scalar(
+    links_df: DataFrame[RoadLinksTable], scalar: int, id_allocator: Optional[IdAllocator] = None
+):
     """Generate a lookup from general purpose link ids to their managed lane counterparts."""
     og_ml_link_ids = links_df.of_type.managed.model_link_id
-    link_id_list = [i + scalar for i in og_ml_link_ids]
-    if links_df.model_link_id.isin(link_id_list).any():
-        msg = f"New link ids generated by scalar {scalar} already exist. Try a different scalar."
-        raise ValueError(msg)
-    return dict(zip(og_ml_link_ids, link_id_list))
+    if id_allocator is None:
+        id_allocator = IdAllocator(links_df.model_link_id)
+    link_id_list = id_allocator.from_scalar(og_ml_link_ids, scalar, reserve=False)
+    return dict(zip(og_ml_link_ids, link_id_list.tolist()))
 
 
-def _generate_ml_node_id_lookup_from_scalar(nodes_df, links_df, scalar: int):
+def _generate_ml_node_id_lookup_from_scalar(
+    nodes_df, links_df, scalar: int, id_allocator: Optional[IdAllocator] = None
+):
     """Generate a lookup for managed lane node ids to their general purpose lane counterparts."""
     og_ml_node_ids = node_ids_in_links(links_df.of_type.managed, nodes_df)
-    node_id_list = og_ml_node_ids + scalar
-    if nodes_df.model_node_id.isin(node_id_list).any():
-        msg = f"New node ids generated by scalar {scalar} already exist. Try a different scalar."
-        raise ValueError(msg)
+    if id_allocator is None:
+        id_allocator = IdAllocator(nodes_df.model_node_id)
+    node_id_list = id_allocator.from_scalar(og_ml_node_ids, scalar, reserve=False)
     return dict(zip(og_ml_node_ids.tolist(), node_id_list.tolist()))
 
 
@@ -17,7 +17,6 @@ write_roadway(net, "my_out_prefix", "my_dir", file_format="parquet")
 
 from __future__ import annotations
 
-import copy
 import hashlib
 from collections import defaultdict
 from pathlib import Path
@@ -44,13 +43,30 @@ from ..logger import WranglerLogger
 from ..models.projects.roadway_selection import SelectFacility, SelectLinksDict, SelectNodesDict
 from ..models.roadway.tables import RoadLinksTable, RoadNodesTable, RoadShapesTable
 from ..params import DEFAULT_CATEGORY, DEFAULT_TIMESPAN, LAT_LON_CRS
-from ..utils.data import concat_with_attr
-from ..utils.models import empty_df_from_datamodel, validate_df_to_model
+from ..utils.data import (
+    TokenIndex,
+    concat_with_attr,
+    copy_validated,
+    mark_modified_for_validation,
+)
+from ..utils.ids import IdAllocator
+from ..utils.models import (
+    edit_validation_mode,
+    empty_df_from_datamodel,
+    stamp_validated,
+    validate_df_to_model,
+)
+from ..utils.utils import next_version
+from .csr_graph import CSRGraph
 from .links.create import data_to_links_df
 from .links.delete import delete_links_by_ids
 from .links.edit import edit_link_geometry_from_nodes
 from .links.filters import filter_links_to_ids, filter_links_to_node_ids
-from .links.links import node_ids_unique_to_link_ids, shape_ids_unique_to_link_ids
+from .links.links import (
+    NodeIncidenceIndex,
+    node_ids_unique_to_link_ids,
+    shape_ids_unique_to_link_ids,
+)
 from .model_roadway import ModelRoadwayNetwork
 from .nodes.create import data_to_nodes_df
 from .nodes.delete import delete_nodes_by_ids
@@ -63,6 +79,7 @@ from .projects import (
     apply_roadway_deletion,
     apply_roadway_property_change,
 )
+from .segment import DEFAULT_SUBNET_SP_WEIGHT_FACTOR, resolve_segments
 from .selection import (
     RoadwayLinkSelection,
     RoadwayNodeSelection,
@@ -78,10 +95,21 @@ if TYPE_CHECKING:
 
     from ..models._base.types import TimespanString
     from ..transit.network import TransitNetwork
+    from .graph import GraphBackend
 
 
 Selections = Union[RoadwayLinkSelection, RoadwayNodeSelection]
 
+"""Link fields included in the RoadwayNetwork.link_token_index."""
+LINK_TOKEN_INDEX_FIELDS: list[str] = ["name", "ref"]
+
+"""Mapping of RoadwayNetwork table attributes to the table name used for versioning."""
+TABLE_VERSION_KEYS: dict[str, str] = {
+    "links_df": "links",
+    "nodes_df": "nodes",
+    "_shapes_df": "shapes",
+}
+
 
 class RoadwayNetwork(BaseModel):
     """Representation of a Roadway Network.
@@ -138,10 +166,18 @@ class RoadwayNetwork(BaseModel):
             `RoadwayLinkSelection.sel_key` or `RoadwayNodeSelection.sel_key` in case they are
                 made repeatedly.
         network_hash: dynamic property of the hashed value of links_df and nodes_df. Used for
-            quickly identifying if a network has changed since various expensive operations have
-            taken place (i.e. generating a ModelRoadwayNetwork or a network graph)
+            identifying if two networks have the same content, i.e. across processes or files.
+        versions: dictionary of `<table>: <version>` for links, nodes and shapes. A new version
+            number is assigned each time a table is set or modified through network methods.
+            Used for quickly identifying if a network has changed since various expensive
+            operations have taken place (i.e. generating a ModelRoadwayNetwork or a network
+            graph) without re-hashing the tables.
+        network_version: tuple of the links and nodes versions.
+        omitted_columns: dictionary of `<table>: <columns>` which weren't read in when the
+            network was loaded (i.e. with `links_columns`) and are restored from the source
+            files when the network is written.
         model_net (ModelRoadwayNetwork): referenced `ModelRoadwayNetwork` object which will be
-            lazily created if None or if the `network_hash` has changed.
+            lazily created if None or if the `network_version` has changed.
         config (WranglerConfig): wrangler configuration object
     """
 
@@ -152,18 +188,53 @@ class RoadwayNetwork(BaseModel):
     _links_file: Optional[Path] = None
     _nodes_file: Optional[Path] = None
     _shapes_file: Optional[Path] = None
+    _omitted_columns: dict[str, list[str]] = {}
 
     config: WranglerConfig = DefaultConfig
 
     _model_net: Optional[ModelRoadwayNetwork] = None
     _selections: dict[str, Selections] = {}
-    _modal_graphs: dict[str, dict] = defaultdict(lambda: {"graph": None, "hash": None})
+    _modal_graphs: dict[tuple[str, str], dict] = defaultdict(
+        lambda: {"graph": None, "version": None, "links_df": None}
+    )
+    _modal_graph_builds: int = 0
+    _link_token_index: Optional[TokenIndex] = None
+    _link_token_index_version: Optional[int] = None
+    _link_id_allocator: Optional[IdAllocator] = None
+    _link_id_allocator_version: Optional[int] = None
+    _node_id_allocator: Optional[IdAllocator] = None
+    _node_id_allocator_version: Optional[int] = None
+    _node_incidence_index: Optional[NodeIncidenceIndex] = None
+    _node_incidence_index_version: Optional[int] = None
+    _scoped_prop_tables: dict[str, dict] = {}
+    _versions: dict[str, int] = {"links": 0, "nodes": 0, "shapes": 0}
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Assign initial versions to the tables."""
+        self.mark_modified()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Override the default setattr behavior to assign a new version to modified tables.
+
+        Note: this is NOT called when a dataframe is mutated in place. In that case, use
+            `mark_modified()` to flag the change.
+        """
+        super().__setattr__(name, value)
+        if name in TABLE_VERSION_KEYS:
+            self._versions[TABLE_VERSION_KEYS[name]] = next_version()
 
     @field_validator("config")
     def validate_config(cls, v):
         """Validate config."""
         return load_wrangler_config(v)
 
+    @field_validator("nodes_df", "links_df")
+    def stamp_validated_tables(cls, v, info):
+        """Record that tables were validated to their data model so edits can be incremental."""
+        return stamp_validated(
+            v, RoadNodesTable if info.field_name == "nodes_df" else RoadLinksTable
+        )
+
     @field_validator("nodes_df", "links_df")
     def coerce_crs(cls, v):
         """Coerce crs of nodes_df and links_df to LAT_LON_CRS."""
@@ -200,6 +271,137 @@ class RoadwayNetwork(BaseModel):
     def shapes_df(self, value):
         self._shapes_df = df_to_shapes_df(value, config=self.config)
 
+    @property
+    def omitted_columns(self) -> dict[str, list[str]]:
+        """Columns of each table which weren't read from its source file, i.e. `links`.
+
+        Restored from the source file when the network is written.
+        """
+        return self._omitted_columns
+
+    @property
+    def versions(self) -> dict[str, int]:
+        """Current version of the links, nodes and shapes tables."""
+        return dict(self._versions)
+
+    @property
+    def network_version(self) -> tuple[int, int]:
+        """Version of the links and nodes tables used to detect changes in O(1)."""
+        return self._versions["links"], self._versions["nodes"]
+
+    def mark_modified(self, *tables: str) -> None:
+        """Assign new versions to tables which have been mutated in place.
+
+        Args:
+            tables: names of tables which were modified, i.e. `links`, `nodes` or `shapes`.
+                If none are given, all tables will be marked as modified.
+        """
+        tables = tables or tuple(self._versions)
+        for t in tables:
+            if t not in self._versions:
+                msg = f"Can't mark unknown table as modified: {t}"
+                raise ValueError(msg)
+            self._versions[t] = next_version()
+
+    def __copy__(self) -> RoadwayNetwork:
+        """Copy-on-write copy of the network called by copy.copy().
+
+        Tables are shallow copies which share data with this network, so the copy takes little
+        memory until its tables are set. Like the network's own edits, edits to the copy must set
+        new tables, using `utils.data.copy_on_write` to get tables whose edited columns can be
+        written to, rather than mutating them in place. Use `materialize()` first if they will be.
+
+        Caches which are updated in place, such as modal graphs and selections, aren't copied.
+        """
+        copied_net = RoadwayNetwork.model_construct(
+            nodes_df=copy_validated(self.nodes_df, deep=False),
+            links_df=copy_validated(self.links_df, deep=False),
+            config=self.config,
+        )
+        if self._shapes_df is not None:
+            copied_net._shapes_df = copy_validated(self._shapes_df, deep=False)
+        copied_net._links_file = self._links_file
+        copied_net._nodes_file = self._nodes_file
+        copied_net._shapes_file = self._shapes_file
+        copied_net._omitted_columns = dict(self._omitted_columns)
+        # same content so same versions
+        copied_net._versions = dict(self._versions)
+        return copied_net
+
+    def materialize(self) -> None:
+        """Replace tables with deep copies so they can be mutated in place.
+
+        Needed for tables of a copy-on-write copy of a network which will be mutated in place,
+        e.g. by `pycode` projects, so the change doesn't leak to the network they were copied
+        from or vice versa.
+        """
+        _versions = dict(self._versions)
+        self.nodes_df = copy_validated(self.nodes_df)
+        self.links_df = copy_validated(self.links_df)
+        if self._shapes_df is not None:
+            self._shapes_df = copy_validated(self._shapes_df)
+        # content is unchanged
+        self._versions = _versions
+
+    @property
+    def link_token_index(self) -> TokenIndex:
+        """Inverted index of `name` and `ref` tokens to links_df index.
+
+        Lazily created and re-created when links_df changes.
+        """
+        if (
+            self._link_token_index is None
+            or self._link_token_index_version != self._versions["links"]
+        ):
+            self._link_token_index = TokenIndex(self.links_df, LINK_TOKEN_INDEX_FIELDS)
+            self._link_token_index_version = self._versions["links"]
+        return self._link_token_index
+
+    @property
+    def link_id_allocator(self) -> IdAllocator:
+        """Allocator of model_link_ids which aren't used in links_df.
+
+        Lazily created from links_df and kept up to date by `update_caches` so links_df doesn't
+        have to be re-scanned after each change. IDs of deleted links may stay taken.
+        """
+        if (
+            self._link_id_allocator is None
+            or self._link_id_allocator_version != self._versions["links"]
+        ):
+            self._link_id_allocator = IdAllocator(self.links_df.model_link_id)
+            self._link_id_allocator_version = self._versions["links"]
+        return self._link_id_allocator
+
+    @property
+    def node_id_allocator(self) -> IdAllocator:
+        """Allocator of model_node_ids which aren't used in nodes_df.
+
+        Lazily created from nodes_df and kept up to date by `update_caches` so nodes_df doesn't
+        have to be re-scanned after each change. IDs of deleted nodes may stay taken.
+        """
+        if (
+            self._node_id_allocator is None
+            or self._node_id_allocator_version != self._versions["nodes"]
+        ):
+            self._node_id_allocator = IdAllocator(self.nodes_df.model_node_id)
+            self._node_id_allocator_version = self._versions["nodes"]
+        return self._node_id_allocator
+
+    @property
+    def node_incidence_index(self) -> NodeIncidenceIndex:
+        """Index of the links and shapes which start or end at each node.
+
+        Lazily created and re-created when links_df changes, except when nodes are moved since
+        that doesn't change which links use them.
+        """
+        if (
+            self._node_incidence_index is None
+            or self._node_incidence_index_version != self._versions["links"]
+        ):
+            self._node_incidence_index = NodeIncidenceIndex(self.links_df)
+            self._node_incidence_index_version = self._versions["links"]
+        return self._node_incidence_index
+
     @property
     def network_hash(self) -> str:
         """Hash of the links and nodes dataframes."""
@@ -211,7 +413,7 @@ class RoadwayNetwork(BaseModel):
     @property
     def model_net(self) -> ModelRoadwayNetwork:
         """Return a ModelRoadwayNetwork object for this network."""
-        if self._model_net is None or self._model_net._net_hash != self.network_hash:
+        if self._model_net is None or self._model_net._net_version != self.network_version:
             self._model_net = ModelRoadwayNetwork(self)
         return self._model_net
 
@@ -230,8 +432,7 @@ class RoadwayNetwork(BaseModel):
 
         returns: shapes merged to links dataframe
         """
-        _links_df = copy.deepcopy(self.links_df)
-        link_shapes_df = _links_df.merge(
+        link_shapes_df = self.links_df.merge(
             self.shapes_df,
             left_on="shape_id",
             right_on="shape_id",
@@ -275,8 +476,134 @@ class RoadwayNetwork(BaseModel):
             category=category,
             strict_timespan_match=strict_timespan_match,
             min_overlap_minutes=min_overlap_minutes,
+            scoped_table=self.scoped_prop_table(link_property),
+            config=self.config,
         )
 
+    def get_properties_by_timespans_and_groups(
+        self,
+        link_properties: list[str],
+        timespans: dict[str, TimespanString],
+        categories: Optional[list[Union[str, int]]] = None,
+        strict_timespan_match: bool = False,
+        min_overlap_minutes: int = 60,
+    ) -> pd.DataFrame:
+        """Returns a wide dataframe of link properties for every timespan and category.
+
+        Columns are named `<property>_<timespan name>` for the default category and
+        `<property>_<category>_<timespan name>` otherwise, e.g. `lanes_AM` or `price_sov_PM`.
+
+        Args:
+            link_properties: link properties to query.
+            timespans: dictionary mapping a timespan name to a timespan in the form of
+                ["HH:MM","HH:MM"], e.g. `{"AM": ["6:00", "9:00"], "PM": ["16:00", "19:00"]}`.
+            categories: list of categories to query. Defaults to [DEFAULT_CATEGORY].
+            strict_timespan_match: If True, will only return links that match the timespan exactly.
+                Defaults to False.
+            min_overlap_minutes: If strict_timespan_match is False, will return links that overlap
+                with the timespan by at least this many minutes. Defaults to 60.
+        """
+        from .links.scopes import props_for_scopes
+
+        return props_for_scopes(
+            self.links_df,
+            link_properties,
+            timespans,
+            categories=categories,
+            strict_timespan_match=strict_timespan_match,
+            min_overlap_minutes=min_overlap_minutes,
+            scoped_tables={p: self.scoped_prop_table(p) for p in link_properties},
+            config=self.config,
+        )
+
+    def scoped_prop_table(self, link_property: str) -> pd.DataFrame:
+        """Normalized table of the scoped values of a link property.
+
+        Has one row per scoped value with columns `link_idx`, `category`, `start_sec`,
+        `end_sec` and `value`. Lazily created from `sc_<link_property>` and kept in sync with
+        links_df as links are added, deleted or edited through network methods.
+
+        Args:
+            link_property: link property to get scoped values of, e.g. `lanes` for `sc_lanes`.
+        """
+        from .links.scopes import scoped_prop_table
+
+        _table = self._scoped_prop_tables.get(link_property)
+        if _table is None or _table["version"] != self._versions["links"]:
+            _table = {
+                "table": scoped_prop_table(self.links_df, link_property),
+                "version": self._versions["links"],
+            }
+            self._scoped_prop_tables[link_property] = _table
+        return _table["table"]
+
+    def update_scoped_prop_tables(self, prev_links_version: int, link_ids: list) -> None:
+        """Updates cached scoped property tables rather than re-creating them after a change.
+
+        Tables which weren't current as of `prev_links_version` are left alone and will be
+        re-created the next time they are requested.
+
+        Args:
+            prev_links_version: version of links_df before the change was made.
+            link_ids: ids of links which were added, deleted or edited.
+        """
+        from .links.scopes import update_scoped_prop_table
+
+        for link_property, _table in self._scoped_prop_tables.items():
+            if _table["version"] != prev_links_version:
+                continue
+            if len(link_ids):
+                _table["table"] = update_scoped_prop_table(
+                    _table["table"], self.links_df, link_property, link_ids
+                )
+            _table["version"] = self._versions["links"]
+
+    def update_caches(
+        self,
+        prev_version: tuple[int, int],
+        link_ids: list,
+        node_ids: Optional[list] = None,
+    ) -> None:
+        """Updates cached modal graphs, scoped property tables and id allocators after a change.
+
+        Args:
+            prev_version: `network_version` before the change was made.
+            link_ids: ids of links which were added, deleted or edited.
+            node_ids: ids of nodes which were added, deleted or edited. Defaults to None.
+        """
+        self.update_modal_graphs(prev_version, link_ids, node_ids=node_ids)
+        self.update_scoped_prop_tables(prev_version[0], link_ids)
+        self.update_id_allocators(prev_version, link_ids, node_ids=node_ids)
+
+    def update_id_allocators(
+        self,
+        prev_version: tuple[int, int],
+        link_ids: list,
+        node_ids: Optional[list] = None,
+    ) -> None:
+        """Marks ids of changed links and nodes as taken in allocators that were up to date.
+
+        Allocators that weren't up to date with prev_version are left to be re-created lazily.
+
+        Args:
+            prev_version: `network_version` before the change was made.
+            link_ids: ids of links which were added, deleted or edited.
+            node_ids: ids of nodes which were added, deleted or edited. Defaults to None.
+        """
+        prev_links_version, prev_nodes_version = prev_version
+        if (
+            self._link_id_allocator is not None
+            and self._link_id_allocator_version == prev_links_version
+        ):
+            self._link_id_allocator.take(link_ids)
+            self._link_id_allocator_version = self._versions["links"]
+        if (
+            self._node_id_allocator is not None
+            and self._node_id_allocator_version == prev_nodes_version
+        ):
+            self._node_id_allocator.take(node_ids or [])
+            self._node_id_allocator_version = self._versions["nodes"]
+
     def get_selection(
         self,
         selection_dict: Union[dict, SelectFacility],
@@ -317,6 +644,39 @@ class RoadwayNetwork(BaseModel):
         WranglerLogger.error(msg + f" Received: {selection_dict}")
         raise SelectionError(msg)
 
+    def get_segment_selections(
+        self,
+        selection_dicts: list[Union[dict, SelectFacility]],
+        off_name_penalty: float = DEFAULT_SUBNET_SP_WEIGHT_FACTOR,
+    ) -> list[Selections]:
+        """Return selections for many selection dictionaries, finding any segments together.
+
+        Segments are found using one shared graph for each set of modes rather than a subnet
+        per segment. See `roadway.segment.resolve_segments`. Selections are stored so that
+        subsequent calls to `get_selection` with the same selection dictionary reuse them.
+
+        Args:
+            selection_dicts: list of SelectFacility dictionaries, typically with `links`, `from`
+                and `to` keys. Selections which aren't segments are returned as usual.
+            off_name_penalty: weight of links which don't match a segment's name or ref relative
+                to those that do. Defaults to DEFAULT_SUBNET_SP_WEIGHT_FACTOR.
+        """
+        selections = []
+        for selection_dict in selection_dicts:
+            selection = self.get_selection(selection_dict)
+            self._selections[_create_selection_key(selection_dict)] = selection
+            selections.append(selection)
+
+        segments = [
+            s.segment
+            for s in selections
+            if isinstance(s, RoadwayLinkSelection)
+            and s.selection_method == "segment"
+            and s.segment is not None
+        ]
+        resolve_segments(self, segments, off_name_penalty=off_name_penalty)
+        return selections
+
     def modal_graph_hash(self, mode) -> str:
         """Hash of the links in order to detect a network change from when graph created."""
         _value = str.encode(self.links_df.df_hash() + "-" + mode)
@@ -324,18 +684,69 @@ class RoadwayNetwork(BaseModel):
 
         return _hash
 
-    def get_modal_graph(self, mode) -> MultiDiGraph:
-        """Return a networkx graph of the network for a specific mode.
+    def get_modal_graph(
+        self, mode, backend: GraphBackend = "networkx"
+    ) -> Union[MultiDiGraph, CSRGraph]:
+        """Return a graph of the network for a specific mode.
 
         Args:
             mode: mode of the network, one of `drive`,`transit`,`walk`, `bike`
+            backend: graph implementation, either `networkx` for an osmnx-flavored networkx
+                MultiDiGraph or `csr` for an array-backed CSRGraph. Defaults to `networkx`.
         """
         from .graph import net_to_graph
 
-        if self._modal_graphs[mode]["hash"] != self.modal_graph_hash(mode):
-            self._modal_graphs[mode]["graph"] = net_to_graph(self, mode)
+        _graph = self._modal_graphs[(mode, backend)]
+        if _graph["version"] != self.network_version:
+            _graph["graph"] = net_to_graph(self, mode, backend=backend)
+            _graph["version"] = self.network_version
+            _graph["links_df"] = self.links_df
+            self._modal_graph_builds += 1
+
+        return _graph["graph"]
 
-        return self._modal_graphs[mode]["graph"]
+    @property
+    def modal_graph_builds(self) -> int:
+        """Number of times a modal graph has been built from scratch rather than updated."""
+        return self._modal_graph_builds
+
+    def update_modal_graphs(
+        self,
+        prev_version: tuple[int, int],
+        link_ids: list,
+        node_ids: Optional[list] = None,
+    ) -> None:
+        """Updates cached modal graphs from their edges rather than from the whole network.
+
+        networkx graphs are edited in place. CSRGraph arrays are patched by removing and
+        inserting the changed edges, see `CSRGraph.update`.
+
+        Should be called after any change to links_df or nodes_df which is fully described by
+        link_ids and node_ids. Graphs which weren't current as of `prev_version` are left
+        alone and will be rebuilt the next time they are requested.
+
+        Args:
+            prev_version: `network_version` before the change was made.
+            link_ids: ids of links which were added, deleted or edited.
+            node_ids: ids of nodes which were added, deleted or edited. Defaults to None.
+        """
+        from .graph import update_graph
+
+        for (mode, _backend), _graph in self._modal_graphs.items():
+            if _graph["version"] != prev_version or _graph["graph"] is None:
+                continue
+            if len(link_ids) or node_ids:
+                update_graph(
+                    _graph["graph"],
+                    self.links_df,
+                    self.nodes_df,
+                    _graph["links_df"],
+                    link_ids,
+                    node_ids=node_ids,
+                    mode=mode,
+                )
+            _graph["version"] = self.network_version
+            _graph["links_df"] = self.links_df
 
     def apply(
         self,
@@ -450,9 +861,15 @@ class RoadwayNetwork(BaseModel):
 
         if add_links_df.attrs.get("name") != "road_links":
             add_links_df = data_to_links_df(add_links_df, nodes_df=self.nodes_df, in_crs=in_crs)
+        _prev_version = self.network_version
+        links_df = concat_with_attr([self.links_df, add_links_df], axis=0)
+        mark_modified_for_validation(
+            links_df, rows=add_links_df.index.to_list(), validated_df=self.links_df
+        )
         self.links_df = validate_df_to_model(
-            concat_with_attr([self.links_df, add_links_df], axis=0), RoadLinksTable
+            links_df, RoadLinksTable, mode=edit_validation_mode(self.config.VALIDATION.MODE)
         )
+        self.update_caches(_prev_version, add_links_df.index.to_list())
 
     def add_nodes(
         self,
@@ -475,9 +892,15 @@ class RoadwayNetwork(BaseModel):
 
         if add_nodes_df.attrs.get("name") != "road_nodes":
             add_nodes_df = data_to_nodes_df(add_nodes_df, in_crs=in_crs, config=self.config)
+        _prev_version = self.network_version
+        nodes_df = concat_with_attr([self.nodes_df, add_nodes_df], axis=0)
+        mark_modified_for_validation(
+            nodes_df, rows=add_nodes_df.index.to_list(), validated_df=self.nodes_df
+        )
         self.nodes_df = validate_df_to_model(
-            concat_with_attr([self.nodes_df, add_nodes_df], axis=0), RoadNodesTable
+            nodes_df, RoadNodesTable, mode=edit_validation_mode(self.config.VALIDATION.MODE)
         )
+        self.update_caches(_prev_version, [], node_ids=add_nodes_df.index.to_list())
         if self.nodes_df.attrs.get("name") != "road_nodes":
             msg = f"Expected nodes_df to have name 'road_nodes', got {self.nodes_df.attrs.get('name')}"
             raise NotNodesError(msg)
@@ -505,8 +928,12 @@ class RoadwayNetwork(BaseModel):
         WranglerLogger.debug(f"add_shapes_df: \n{add_shapes_df}")
         WranglerLogger.debug(f"self.shapes_df: \n{self.shapes_df}")
 
+        shapes_df = concat_with_attr([self.shapes_df, add_shapes_df], axis=0)
+        mark_modified_for_validation(
+            shapes_df, rows=add_shapes_df.index.to_list(), validated_df=self.shapes_df
+        )
         self.shapes_df = validate_df_to_model(
-            concat_with_attr([self.shapes_df, add_shapes_df], axis=0), RoadShapesTable
+            shapes_df, RoadShapesTable, mode=edit_validation_mode(self.config.VALIDATION.MODE)
         )
 
     def delete_links(
@@ -542,6 +969,9 @@ class RoadwayNetwork(BaseModel):
         if isinstance(selection, RoadwayNodeSelection):
             msg = "Selection should be for links, but got nodes."
             raise SelectionError(msg)
+        _prev_version = self.network_version
+        del_link_ids = selection.selected_links
+        node_ids_to_delete = []
         if clean_nodes:
             node_ids_to_delete = node_ids_unique_to_link_ids(
                 selection.selected_links, selection.selected_links_df, self.nodes_df
@@ -564,10 +994,11 @@ class RoadwayNetwork(BaseModel):
 
         self.links_df = delete_links_by_ids(
             self.links_df,
-            selection.selected_links,
+            del_link_ids,
             ignore_missing=selection.ignore_missing,
             transit_net=transit_net,
         )
+        self.update_caches(_prev_version, del_link_ids, node_ids=node_ids_to_delete)
 
     def delete_nodes(
         self,
@@ -582,7 +1013,7 @@ class RoadwayNetwork(BaseModel):
                 If False, will only remove nodes if they are not associated with any links.
                 Defaults to False.
 
-        raises:
+        Raises:
             NodeDeletionError: If not ignore_missing and selected nodes to delete aren't in network
         """
         if not isinstance(selection_dict, SelectNodesDict):
@@ -600,9 +1031,11 @@ class RoadwayNetwork(BaseModel):
             unused_node_ids = node_ids_without_links(self.nodes_df, self.links_df)
             del_node_ids = list(set(selection.selected_nodes).intersection(unused_node_ids))
 
+        _prev_version = self.network_version
         self.nodes_df = delete_nodes_by_ids(
             self.nodes_df, del_node_ids, ignore_missing=selection.ignore_missing
         )
+        self.update_caches(_prev_version, [], node_ids=del_node_ids)
 
     def clean_unused_shapes(self):
         """Removes any unused shapes from network that aren't referenced by links_df."""
@@ -633,11 +1066,26 @@ class RoadwayNetwork(BaseModel):
         node_geometry_change_table = NodeGeometryChangeTable(node_geometry_change_table)
         node_ids = node_geometry_change_table.model_node_id.to_list()
         WranglerLogger.debug(f"Moving nodes: {node_ids}")
-        self.nodes_df = edit_node_geometry(self.nodes_df, node_geometry_change_table)
-        self.links_df = edit_link_geometry_from_nodes(self.links_df, self.nodes_df, node_ids)
-        self.shapes_df = edit_shape_geometry_from_nodes(
-            self.shapes_df, self.links_df, self.nodes_df, node_ids
+        _prev_version = self.network_version
+        node_incidence = self.node_incidence_index
+        prev_nodes_df = self.nodes_df
+        self.nodes_df = edit_node_geometry(prev_nodes_df, node_geometry_change_table)
+        self.links_df = edit_link_geometry_from_nodes(
+            self.links_df, self.nodes_df, node_ids, node_incidence=node_incidence
         )
+        if not self.shapes_df.empty:
+            self._shapes_df = edit_shape_geometry_from_nodes(
+                self.shapes_df,
+                self.links_df,
+                self.nodes_df,
+                node_ids,
+                node_incidence=node_incidence,
+                prev_nodes_df=prev_nodes_df,
+            )
+        # moving nodes doesn't change which links use them
+        self._node_incidence_index_version = self._versions["links"]
+        link_ids = node_incidence.link_labels(node_ids)
+        self.update_caches(_prev_version, link_ids, node_ids=node_ids)
 
     def has_node(self, model_node_id: int) -> bool:
         """Queries if network has node based on model_node_id.
@@ -661,15 +1109,20 @@ class RoadwayNetwork(BaseModel):
         )
         return has_link
 
-    def is_connected(self, mode: str) -> bool:
+    def is_connected(self, mode: str, backend: GraphBackend = "networkx") -> bool:
         """Determines if the network graph is "strongly" connected.
 
         A graph is strongly connected if each vertex is reachable from every other vertex.
 
         Args:
             mode:  mode of the network, one of `drive`,`transit`,`walk`, `bike`
+            backend: graph implementation to use, either `networkx` or `csr`. Defaults to
+                `networkx`.
         """
-        is_connected = nx.is_strongly_connected(self.get_modal_graph(mode))
+        G = self.get_modal_graph(mode, backend=backend)
+        if isinstance(G, CSRGraph):
+            return G.is_strongly_connected()
+        is_connected = nx.is_strongly_connected(G)
 
         return is_connected
 
@@ -5,6 +5,7 @@ import time
 from typing import Union
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 from pydantic import validate_call
@@ -15,7 +16,8 @@ from ...logger import WranglerLogger
 from ...models.roadway.tables import RoadLinksTable, RoadNodesAttrs, RoadNodesTable
 from ...params import LAT_LON_CRS, SMALL_RECS
 from ...utils.geo import get_point_geometry_from_linestring, point_from_xy
-from ...utils.models import validate_df_to_model
+from ...utils.ids import IdAllocator
+from ...utils.models import ValidationModes, validate_df_to_model
 from ..utils import set_df_index_to_pk
 
 
@@ -67,6 +69,7 @@ def data_to_nodes_df(
     nodes_df: Union[pd.DataFrame, gpd.GeoDataFrame, list[dict]],
     config: WranglerConfig = DefaultConfig,  # noqa: ARG001
     in_crs: int = LAT_LON_CRS,
+    validation_mode: ValidationModes = "full",
 ) -> DataFrame[RoadNodesTable]:
     """Turn nodes data into official nodes dataframe.
 
@@ -81,6 +84,8 @@ def data_to_nodes_df(
         config: WranglerConfig instance. Defaults to DefaultConfig. NOTE: Not currently used.
         in_crs: Coordinate references system id incoming data xy is in, if it isn't already
             in a GeoDataFrame. Defaults to LAT_LON_CRS.
+        validation_mode: how nodes_df is validated. See `validate_df_to_model`. Defaults to
+            `full`.
 
     Returns:
         gpd.GeoDataFrame: _description_
@@ -103,7 +108,7 @@ def data_to_nodes_df(
         WranglerLogger.debug(f"nodes_df: \n{nodes_df[['model_node_id', 'geometry', 'X', 'Y']]}")
 
     # Validate and coerce to schema
-    nodes_df = validate_df_to_model(nodes_df, RoadNodesTable)
+    nodes_df = validate_df_to_model(nodes_df, RoadNodesTable, mode=validation_mode)
     nodes_df.attrs.update(RoadNodesAttrs)
     nodes_df.gdf_name = nodes_df.attrs["name"]
     nodes_df = set_df_index_to_pk(nodes_df)
@@ -157,10 +162,10 @@ def generate_node_ids(nodes_df: DataFrame[RoadNodesTable], range: tuple[int], n:
     """
     if n <= 0:
         return []
-    existing_ids = set(nodes_df["model_node_id"].unique())
-    new_ids = set(range) - existing_ids
+    candidate_ids = np.fromiter(range, dtype=np.int64)
+    new_ids = candidate_ids[~IdAllocator(nodes_df["model_node_id"]).is_taken(candidate_ids)]
     if len(new_ids) < n:
         msg = f"Only {len(new_ids)} new ids available, need {n}."
         raise NodeAddError(msg)
 
-    return list(new_ids)[:n]
+    return new_ids[:n].tolist()
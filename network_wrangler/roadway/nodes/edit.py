@@ -4,7 +4,6 @@ NOTE: Each public method will return a new, whole copy of the RoadNodesTable wit
 Private methods may return mutated originals.
 """
 
-import copy
 from typing import Optional, Union
 
 import geopandas as gpd
@@ -19,8 +18,11 @@ from ...models._base.records import RecordModel
 from ...models.projects.roadway_changes import RoadPropertyChange
 from ...models.roadway.tables import RoadNodesAttrs, RoadNodesTable
 from ...params import LAT_LON_CRS
-from ...utils.data import update_df_by_col_value, validate_existing_value_in_df
-from ...utils.models import validate_call_pyd, validate_df_to_model
+from ...utils.data import (
+    copy_on_write,
+    validate_existing_value_in_df,
+)
+from ...utils.models import edit_validation_mode, validate_call_pyd, validate_df_to_model
 
 
 class NodeGeometryChangeTable(DataFrameModel):
@@ -77,11 +79,18 @@ def edit_node_geometry(
     geo_df = geo_df.to_crs(LAT_LON_CRS)
     WranglerLogger.debug(f"Updated geometry geo_df: \n{geo_df}")
 
-    # Update the nodes table with the new geometry
-    nodes_df = update_df_by_col_value(
-        nodes_df, geo_df, "model_node_id", properties=["X", "Y", "geometry"]
-    )
-    nodes_df = validate_df_to_model(nodes_df, RoadNodesTable)
+    # Update only the moved nodes, found through the nodes_df index of model_node_ids
+    node_pos = nodes_df.index.get_indexer(geo_df.model_node_id)
+    if (node_pos < 0).any():
+        missing_ids = geo_df.model_node_id[node_pos < 0].tolist()
+        msg = f"Nodes to move missing from nodes_df: {missing_ids}"
+        WranglerLogger.error(msg)
+        raise NodeChangeError(msg)
+    node_idx = nodes_df.index[node_pos]
+    nodes_df = copy_on_write(nodes_df, ["X", "Y", "geometry"], rows=node_idx)
+    nodes_df.loc[node_idx, "X"] = geo_df.geometry.x.values
+    nodes_df.loc[node_idx, "Y"] = geo_df.geometry.y.values
+    nodes_df.loc[node_idx, "geometry"] = geo_df.geometry.values
 
     WranglerLogger.debug(f"Updated nodes_df: \n{nodes_df.head()}")
 
@@ -131,7 +140,7 @@ def edit_node_property(
     ):
         return nodes_df
 
-    nodes_df = copy.deepcopy(nodes_df)
+    nodes_df = copy_on_write(nodes_df, [prop_name, "projects"], rows=node_idx)
 
     # if it is a new attribute then initialize with NaN values
     if prop_name not in nodes_df:
@@ -151,7 +160,9 @@ def edit_node_property(
     if project_name is not None:
         nodes_df.loc[node_idx, "projects"] += f"{project_name},"
 
-    nodes_df = validate_df_to_model(nodes_df, RoadNodesTable)
+    nodes_df = validate_df_to_model(
+        nodes_df, RoadNodesTable, mode=edit_validation_mode(config.VALIDATION.MODE)
+    )
     return nodes_df
 
 
@@ -15,8 +15,19 @@ from ...logger import WranglerLogger
 from ...models._base.types import GeoFileTypes
 from ...models.roadway.tables import RoadNodesAttrs, RoadNodesTable
 from ...params import LAT_LON_CRS
-from ...utils.io_table import read_table, write_table
-from ...utils.models import order_fields_from_data_model, validate_call_pyd, validate_df_to_model
+from ...utils.io_table import (
+    file_validation_mode,
+    read_and_transform_table,
+    write_schema_stamp,
+    write_spatial_parquet,
+    write_table,
+)
+from ...utils.models import (
+    edit_validation_mode,
+    order_fields_from_data_model,
+    validate_call_pyd,
+    validate_df_to_model,
+)
 from .create import data_to_nodes_df
 
 if TYPE_CHECKING:
@@ -32,11 +43,13 @@ def read_nodes(
     boundary_geocode: Optional[str] = None,
     boundary_file: Optional[Path] = None,
     config: WranglerConfig = DefaultConfig,
+    chunk_size: Optional[int] = None,
 ) -> DataFrame[RoadNodesTable]:
     """Reads nodes and returns a geodataframe of nodes.
 
     Sets index to be a copy of the primary key.
-    Validates output dataframe using NodesSchema.
+    Validates output dataframe using NodesSchema, or only checks its dtypes if
+    `config.VALIDATION.MODE` is `trusted` and filename was stamped as valid when it was written.
 
     Args:
         filename (Path,str): file to read links in from.
@@ -48,28 +61,33 @@ def read_nodes(
         boundary_file: File to load as a boundary to filter the input data to. Only used for
             geographic data. Defaults to None.
         config: WranglerConfig instance. Defaults to DefaultConfig.
+        chunk_size: if provided, will read, filter, and validate nodes in chunks of this many
+            records so that peak memory use stays close to the size of the final table.
+            Defaults to None, which reads the whole file at once.
     """
     WranglerLogger.debug(f"Reading nodes from {filename}.")
 
     start_time = time.time()
 
-    nodes_df = read_table(
+    validation_mode = file_validation_mode(filename, RoadNodesTable, config.VALIDATION.MODE)
+    nodes_df = read_and_transform_table(
         filename,
+        lambda df: validate_df_to_model(
+            data_to_nodes_df(df, in_crs=in_crs, config=config, validation_mode=validation_mode),
+            RoadNodesTable,
+            mode=edit_validation_mode(config.VALIDATION.MODE),
+        ),
+        chunk_size=chunk_size,
+        model=RoadNodesTable,
         boundary_gdf=boundary_gdf,
         boundary_geocode=boundary_geocode,
         boundary_file=boundary_file,
         read_speed=config.CPU.EST_PD_READ_SPEED,
     )
-    WranglerLogger.debug(
-        f"Read {len(nodes_df)} nodes from file in {round(time.time() - start_time, 2)}."
-    )
-
-    nodes_df = data_to_nodes_df(nodes_df, in_crs=in_crs, config=config)
     nodes_df.attrs["source_file"] = filename
     WranglerLogger.info(
         f"Read {len(nodes_df)} nodes from {filename} in {round(time.time() - start_time, 2)}."
     )
-    nodes_df = validate_df_to_model(nodes_df, RoadNodesTable)
     return nodes_df
 
 
@@ -104,8 +122,11 @@ def write_nodes(
     prefix: str,
     file_format: GeoFileTypes = "geojson",
     overwrite: bool = True,
+    spatial_index: bool = False,
+    tile_level: Optional[int] = None,
+    schema_stamp: bool = False,
 ) -> None:
-    """Writes RoadNodesTable to file.
+    """Writes RoadNodesTable to file and optionally stamps it as valid to RoadNodesTable.
 
     Args:
         nodes_df: nodes dataframe
@@ -114,10 +135,23 @@ def write_nodes(
         file_format: format to write nodes in. e.g. "geojson" shp" "parquet" "csv" "txt". Defaults
             to "geojson".
         overwrite: whether to overwrite existing nodes file. Defaults to True.
+        spatial_index: if True and file_format is parquet, will write nodes sorted along a
+            Hilbert curve in row groups with bounding box statistics. Defaults to False.
+        tile_level: if provided and file_format is parquet, will write nodes as a directory
+            partitioned by web mercator tiles at this zoom level. Implies spatial_index.
+            Defaults to None.
+        schema_stamp: if True, will stamp the file as valid to RoadNodesTable if nodes_df
+            was validated to it since it was last modified. Defaults to False.
     """
     nodes_file = Path(out_dir) / f"{prefix}node.{file_format}"
-    nodes_df = order_fields_from_data_model(nodes_df, RoadNodesTable)
-    write_table(nodes_df, nodes_file, overwrite=overwrite)
+    ordered_nodes_df = order_fields_from_data_model(nodes_df, RoadNodesTable)
+    if (spatial_index or tile_level is not None) and file_format == "parquet":
+        write_spatial_parquet(
+            ordered_nodes_df, nodes_file, overwrite=overwrite, tile_level=tile_level
+        )
+    else:
+        write_table(ordered_nodes_df, nodes_file, overwrite=overwrite)
+    write_schema_stamp(nodes_df if schema_stamp else None, nodes_file, RoadNodesTable)
 
 
 def get_nodes(
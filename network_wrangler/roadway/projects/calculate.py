@@ -21,7 +21,11 @@ def apply_calculated_roadway(
         pycode: python code which changes values in the roadway network object
     """
     WranglerLogger.debug("Applying calculated roadway project.")
+    # pycode may mutate tables in place, so they can't share data with another network
+    roadway_net.materialize()
     self = roadway_net
     exec(pycode)
+    # pycode may mutate tables in place, which doesn't change their versions
+    roadway_net.mark_modified()
 
     return roadway_net
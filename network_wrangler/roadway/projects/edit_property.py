@@ -72,31 +72,36 @@ def apply_roadway_property_change(
     """
     WranglerLogger.debug("Applying roadway property change project.")
 
+    _prev_version = roadway_net.network_version
     if isinstance(selection, RoadwayLinkSelection):
+        _link_ids = selection.selected_links
         roadway_net.links_df = edit_link_properties(
             roadway_net.links_df,
-            selection.selected_links,
+            _link_ids,
             property_changes,
             project_name=project_name,
+            config=roadway_net.config,
         )
+        roadway_net.update_caches(_prev_version, _link_ids)
 
     elif isinstance(selection, RoadwayNodeSelection):
         non_geo_changes = {
             k: v for k, v in property_changes.items() if k not in NodeGeometryChange.model_fields
         }
+        _node_ids = selection.selected_nodes
         for property, property_dict in non_geo_changes.items():
             prop_change = RoadPropertyChange(**property_dict)
             roadway_net.nodes_df = edit_node_property(
                 roadway_net.nodes_df,
-                selection.selected_nodes,
+                _node_ids,
                 property,
                 prop_change,
                 project_name=project_name,
+                config=roadway_net.config,
             )
+        roadway_net.update_caches(_prev_version, [], node_ids=_node_ids)
 
-        geo_changes_df = _node_geo_change_from_property_changes(
-            property_changes, selection.selected_nodes
-        )
+        geo_changes_df = _node_geo_change_from_property_changes(property_changes, _node_ids)
         if geo_changes_df is not None:
             roadway_net.move_nodes(geo_changes_df)
 
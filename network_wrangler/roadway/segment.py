@@ -23,7 +23,7 @@ segment.segment_nodes
 from __future__ import annotations
 
 import copy
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -33,12 +33,14 @@ from ..errors import SegmentFormatError, SegmentSelectionError, SubnetCreationEr
 from ..logger import WranglerLogger
 from ..models.projects.roadway_selection import SelectLinksDict, SelectNodeDict
 from ..params import DEFAULT_SEARCH_MODES
-from .graph import shortest_path
+from .graph import links_nodes_to_csr_graph, shortest_path
 from .links.filters import filter_links_to_path
 from .subnet import Subnet
 
 if TYPE_CHECKING:
     from ..models.roadway.tables import RoadLinksTable, RoadNodesTable
+    from ..utils.data import TokenIndex
+    from .csr_graph import CSRGraph
     from .network import RoadwayNetwork
     from .selection import RoadwayLinkSelection
 
@@ -86,7 +88,8 @@ class Segment:
         selection: RoadwayLinkSelection
         from_node_id: value of the primary key (usually model_node_id) for segment start node
         to_node_id: value of the primary key (usually model_node_id) for segment end node
-        subnet: Subnet object (and associated graph) on which to do shortest path search
+        subnet: Subnet object (and associated graph) on which to do shortest path search. Lazily
+            generated if the segment wasn't found using `resolve_segments`.
         segment_nodes: list of primary keys of nodes within the selected segment. Will be lazily
             evaluated as the result of connected_path_search().
         segment_nodes_df: dataframe selection from net.modes_df for segment_nodes. Lazily evaluated
@@ -127,10 +130,20 @@ class Segment:
         self._from_node_id: Union[int, None] = None
         self._to_node_id: Union[int, None] = None
 
-        self.subnet = self._generate_subnet(self.segment_sel_dict)
+        self._subnet: Union[Subnet, None] = None
 
         WranglerLogger.debug(f"Segment created: {self}")
 
+    @property
+    def subnet(self) -> Subnet:
+        """Subnet object on which to do the shortest path search.
+
+        Lazily generated because it isn't needed if the segment is found by `resolve_segments`.
+        """
+        if self._subnet is None:
+            self._subnet = self._generate_subnet(self.segment_sel_dict)
+        return self._subnet
+
     @property
     def modes(self) -> list[str]:
         """List of modes in the selection."""
@@ -309,6 +322,30 @@ def _generate_subnet_link_selection_dict_options(
     return options
 
 
+def _select_subnet_links(
+    links_df: DataFrame[RoadLinksTable],
+    link_selection_dict: dict,
+    token_index: Optional[TokenIndex] = None,
+    version: Optional[int] = None,
+) -> DataFrame[RoadLinksTable]:
+    """Links selected by the first of the link selection dictionary options which finds any.
+
+    Args:
+        links_df: links to select from, already filtered to the relevant modes.
+        link_selection_dict: dictionary of attributes to search for.
+        token_index: optional TokenIndex of name and ref in links_df to speed up the search.
+        version: optional version of the links table links_df was selected from so that
+            factorized columns are re-used between the selection options.
+    """
+    link_sd_options = _generate_subnet_link_selection_dict_options(link_selection_dict)
+    for sd in link_sd_options:
+        WranglerLogger.debug(f"Trying link selection:\n{sd}")
+        subnet_links_df = links_df.dict_query(sd, token_index=token_index, version=version)
+        if len(subnet_links_df) > 0:
+            break
+    return subnet_links_df
+
+
 def generate_subnet_from_link_selection_dict(
     net,
     link_selection_dict: dict,
@@ -334,13 +371,12 @@ def generate_subnet_from_link_selection_dict(
     Returns:
         Subnet: Subnet object.
     """
-    link_sd_options = _generate_subnet_link_selection_dict_options(link_selection_dict)
-    for sd in link_sd_options:
-        WranglerLogger.debug(f"Trying link selection:\n{sd}")
-        subnet_links_df = copy.deepcopy(net.links_df.mode_query(modes))
-        subnet_links_df = subnet_links_df.dict_query(sd)
-        if len(subnet_links_df) > 0:
-            break
+    subnet_links_df = _select_subnet_links(
+        net.links_df.mode_query(modes),
+        link_selection_dict,
+        token_index=net.link_token_index,
+        version=net.versions["links"],
+    ).copy(deep=False)
     if len(subnet_links_df) == 0:
         WranglerLogger.error(f"Selection didn't return subnet links: {link_selection_dict}")
         msg = "No links found with selection."
@@ -362,6 +398,70 @@ def generate_subnet_from_link_selection_dict(
     return subnet
 
 
+def resolve_segments(
+    net: RoadwayNetwork,
+    segments: list[Segment],
+    off_name_penalty: float = DEFAULT_SUBNET_SP_WEIGHT_FACTOR,
+) -> None:
+    """Finds the nodes of many segments together using one shared graph per set of modes.
+
+    Rather than growing a Subnet for each segment and rebuilding its graph at every expansion,
+    the network's CSRGraph for the segment modes is reused with a weight of 1 for links which
+    match the segment link selection (i.e. name or ref) and a weight of `off_name_penalty` for
+    all other links. Segments with the same link selection share weights and segments which
+    also share a start node are found with a single shortest path search.
+
+    Segments for which a path isn't found are left alone and will fall back to
+    `Segment.connected_path_search` when their nodes are accessed.
+
+    Args:
+        net: RoadwayNetwork which the segments are on.
+        segments: list of Segment objects to find nodes for.
+        off_name_penalty: weight of links which don't match the segment link selection.
+            Defaults to DEFAULT_SUBNET_SP_WEIGHT_FACTOR.
+    """
+    # {(modes, link selection): {from_node_id: [segments]}}
+    _groups: dict[tuple, dict] = {}
+    for seg in segments:
+        if seg._segment_nodes is not None:
+            continue
+        _key = (tuple(seg.modes), repr(sorted(seg.segment_sel_dict.items())))
+        _groups.setdefault(_key, {}).setdefault(seg.from_node_id, []).append(seg)
+
+    _graphs: dict[tuple, CSRGraph] = {}
+    for (modes, _), segs_by_origin in _groups.items():
+        _first_seg = next(iter(segs_by_origin.values()))[0]
+        _modal_links_df = net.links_df.mode_query(list(modes))
+        if modes not in _graphs:
+            if len(modes) == 1:
+                _graphs[modes] = net.get_modal_graph(modes[0], backend="csr")
+            else:
+                _graphs[modes] = links_nodes_to_csr_graph(_modal_links_df, net.nodes_in_links())
+        G = _graphs[modes]
+
+        _on_name_links_df = _select_subnet_links(
+            _modal_links_df,
+            _first_seg.segment_sel_dict,
+            token_index=net.link_token_index,
+            version=net.versions["links"],
+        )
+        _weights = np.where(
+            np.isin(G.link_ids, _on_name_links_df.index.to_numpy()), 1.0, off_name_penalty
+        )
+        for from_node_id, segs in segs_by_origin.items():
+            _to_node_ids = [seg.to_node_id for seg in segs]
+            if from_node_id not in G or not all(n in G for n in _to_node_ids):
+                continue
+            _paths = G.shortest_paths(from_node_id, _to_node_ids, weights=_weights)
+            for seg in segs:
+                seg._segment_nodes = _paths[seg.to_node_id]
+
+    WranglerLogger.debug(
+        f"Resolved {sum(s._segment_nodes is not None for s in segments)} of {len(segments)}\
+        segments."
+    )
+
+
 def identify_segment_endpoints(
     net,
     mode: str = "drive",
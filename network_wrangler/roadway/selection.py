@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 import hashlib
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, ClassVar, Literal, Union
@@ -146,7 +145,7 @@ class RoadwaySelection(ABC):
             self._selection_data = self.validate_selection(selection_input)
 
         self._selection_dict = self._selection_data.asdict
-        self._stored_net_hash = copy.deepcopy(self.net.network_hash)
+        self._stored_net_version = self.net.network_version
 
     @property
     def node_query_fields(self) -> list[str]:
@@ -339,11 +338,11 @@ class RoadwayLinkSelection(RoadwaySelection):
     def selected_links_df(self) -> DataFrame[RoadLinksTable]:
         """Lazily evaluates selection for links or returns stored value in self._selected_links_df.
 
-        Will re-evaluate if the current network hash is different than the stored one from the
+        Will re-evaluate if the current network version is different than the stored one from the
         last selection.
         """
-        if self._selected_links_df is None or self._stored_net_hash != self.net.network_hash:
-            self._stored_net_hash = copy.deepcopy(self.net.network_hash)
+        if self._selected_links_df is None or self._stored_net_version != self.net.network_version:
+            self._stored_net_version = self.net.network_version
             self._selected_links_df = self._perform_selection()
 
         return self._selected_links_df
@@ -370,7 +369,9 @@ class RoadwayLinkSelection(RoadwaySelection):
 
         if self.selection_method == "query":
             _selected_links_df = self.net.links_df.isin_dict(
-                self.initial_query_selection_dict, ignore_missing=self.ignore_missing
+                self.initial_query_selection_dict,
+                ignore_missing=self.ignore_missing,
+                token_index=self.net.link_token_index,
             )
 
         elif self.selection_method == "segment":
@@ -397,7 +398,11 @@ class RoadwayLinkSelection(RoadwaySelection):
             WranglerLogger.debug(
                 f"Selecting from selection based on: {self.secondary_selection_dict}"
             )
-            _selected_links_df = _selected_links_df.dict_query(self.secondary_selection_dict)
+            _selected_links_df = _selected_links_df.dict_query(
+                self.secondary_selection_dict,
+                token_index=self.net.link_token_index,
+                version=self.net.versions["links"],
+            )
 
         if not len(_selected_links_df):
             WranglerLogger.warning("No links found matching criteria.")
@@ -539,11 +544,11 @@ class RoadwayNodeSelection(RoadwaySelection):
     def selected_nodes_df(self) -> DataFrame[RoadNodesTable]:
         """Lazily evaluates selection for nodes or returns stored value in self._selected_nodes_df.
 
-        Will re-evaluate if the current network hash is different than the stored one from the
+        Will re-evaluate if the current network version is different than the stored one from the
         last selection.
         """
-        if self._selected_nodes_df is None or self._stored_net_hash != self.net.network_hash:
-            self._stored_net_hash = self.net.network_hash
+        if self._selected_nodes_df is None or self._stored_net_version != self.net.network_version:
+            self._stored_net_version = self.net.network_version
             self._selected_nodes_df = self._perform_selection()
 
         return self._selected_nodes_df
@@ -586,7 +591,9 @@ class RoadwayNodeSelection(RoadwaySelection):
             WranglerLogger.debug(
                 f"Selecting from selection based on: {self.secondary_selection_dict}"
             )
-            _selected_nodes_df = _selected_nodes_df.dict_query(self.secondary_selection_dict)
+            _selected_nodes_df = _selected_nodes_df.dict_query(
+                self.secondary_selection_dict, version=self.net.versions["nodes"]
+            )
 
         if not len(_selected_nodes_df):
             WranglerLogger.warning("No nodes found matching criteria.")
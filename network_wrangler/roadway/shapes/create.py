@@ -15,7 +15,7 @@ from ...params import LAT_LON_CRS
 from ...utils.data import coerce_gdf, concat_with_attr
 from ...utils.geo import offset_geometry_meters
 from ...utils.ids import generate_list_of_new_ids_from_existing
-from ...utils.models import validate_df_to_model
+from ...utils.models import ValidationModes, validate_df_to_model
 from ..utils import set_df_index_to_pk
 
 
@@ -23,6 +23,7 @@ def df_to_shapes_df(
     shapes_df: gpd.GeoDataFrame,
     in_crs: int = LAT_LON_CRS,
     config: WranglerConfig = DefaultConfig,  # noqa: ARG001
+    validation_mode: ValidationModes = "full",
 ) -> DataFrame[RoadShapesTable]:
     """Sets index to be a copy of the primary key, validates to RoadShapesTable and aligns CRS.
 
@@ -31,6 +32,8 @@ def df_to_shapes_df(
         in_crs: coordinate reference system number of incoming df. ONLY used if shapes_df is not
             already set. Defaults to LAT_LON_CRS.
         config: WranglerConfig instance. Defaults to DefaultConfig. NOTE: Not currently used.
+        validation_mode: how shapes_df is validated. See `validate_df_to_model`. Defaults to
+            `full`.
 
     Returns:
         DataFrame[RoadShapesTable]
@@ -47,7 +50,7 @@ def df_to_shapes_df(
     shapes_df.attrs.update(RoadShapesAttrs)
     shapes_df = set_df_index_to_pk(shapes_df)
     shapes_df.gdf_name = shapes_df.attrs["name"]
-    shapes_df = validate_df_to_model(shapes_df, RoadShapesTable)
+    shapes_df = validate_df_to_model(shapes_df, RoadShapesTable, mode=validation_mode)
 
     return shapes_df
 
@@ -6,12 +6,16 @@ Private methods may return mutated originals.
 
 from __future__ import annotations
 
-import copy
+from typing import Optional
 
+import numpy as np
+import shapely
 from pandera.typing import DataFrame
 
 from ...models.roadway.tables import RoadLinksTable, RoadNodesTable, RoadShapesTable
-from ...utils.geo import update_nodes_in_linestring_geometry
+from ...utils.data import copy_on_write
+from ...utils.geo import move_linestring_vertices_to_nodes
+from ..links.links import NodeIncidenceIndex
 
 
 def edit_shape_geometry_from_nodes(
@@ -19,38 +23,57 @@ def edit_shape_geometry_from_nodes(
     links_df: DataFrame[RoadLinksTable],
     nodes_df: DataFrame[RoadNodesTable],
     node_ids: list[int],
+    node_incidence: Optional[NodeIncidenceIndex] = None,
+    prev_nodes_df: Optional[DataFrame[RoadNodesTable]] = None,
 ) -> DataFrame[RoadShapesTable]:
     """Updates the geometry for shapes for a given list of nodes.
 
     Should be called by any function that changes a node location.
 
-    NOTE: This will mutate the geometry of a shape in place for the start and end node
-            ...but not the nodes in-between.  Something to consider.
+    NOTE: This will update the start and end vertex of a shape ...but not the vertices
+        in-between.  Something to consider.
 
     Args:
         shapes_df: RoadShapesTable
         links_df: RoadLinksTable
         nodes_df: RoadNodesTable
         node_ids: list of node PKs with updated geometry
+        node_incidence: NodeIncidenceIndex of links_df used to find the shapes using node_ids.
+            If None, will be created from the links with node_ids.
+        prev_nodes_df: RoadNodesTable from before the nodes were moved. If given, the end of
+            the shape closest to the previous node location is moved, which is needed when
+            links in both directions share a shape. Otherwise, assumes shapes are in the
+            direction of their links.
     """
-    shapes_df = copy.deepcopy(shapes_df)
-    links_A_df = links_df.loc[links_df.A.isin(node_ids)]
-    _tempshape_A_df = shapes_df[["shape_id", "geometry"]].merge(
-        links_A_df[["shape_id", "A"]], on="shape_id", how="inner"
-    )
-    _shape_ids_A = _tempshape_A_df.shape_id.unique().tolist()
-    if _shape_ids_A:
-        shapes_df[_shape_ids_A, "geometry"] = update_nodes_in_linestring_geometry(
-            _tempshape_A_df, nodes_df, 0
-        )
-
-    links_B_df = links_df.loc[links_df.B.isin(node_ids)]
-    _tempshape_B_df = shapes_df[["shape_id", "geometry"]].merge(
-        links_B_df[["shape_id", "B"]], on="shape_id", how="inner"
+    if node_incidence is None:
+        _a_or_b_mask = links_df.A.isin(node_ids) | links_df.B.isin(node_ids)
+        node_incidence = NodeIncidenceIndex(links_df.loc[_a_or_b_mask])
+
+    shapes_df = copy_on_write(shapes_df, ["geometry"])
+    node_shapes_df = node_incidence.shapes(node_ids)
+    node_shapes_df = node_shapes_df.loc[shapes_df.index.get_indexer(node_shapes_df.shape_id) >= 0]
+    node_shapes_df = node_shapes_df.drop_duplicates(subset=["shape_id", "model_node_id"])
+    if node_shapes_df.empty:
+        return shapes_df
+
+    if prev_nodes_df is not None:
+        node_shapes_df = _vertex_pos_closest_to_nodes(node_shapes_df, shapes_df, prev_nodes_df)
+
+    updated_geometry = move_linestring_vertices_to_nodes(
+        shapes_df["geometry"], node_shapes_df, nodes_df, "shape_id"
     )
-    _shape_ids_B = _tempshape_B_df.shape_id.unique().tolist()
-    if _shape_ids_A:
-        shapes_df[_shape_ids_B, "geometry"] = update_nodes_in_linestring_geometry(
-            _tempshape_A_df, nodes_df, -1
-        )
+    shapes_df.loc[updated_geometry.index, "geometry"] = updated_geometry.values
     return shapes_df
+
+
+def _vertex_pos_closest_to_nodes(
+    node_shapes_df, shapes_df: DataFrame[RoadShapesTable], nodes_df: DataFrame[RoadNodesTable]
+):
+    """Sets vertex_pos in node_shapes_df to whichever end of the shape is closest to the node."""
+    shape_geoms = shapes_df.loc[node_shapes_df.shape_id, "geometry"].values
+    node_geoms = nodes_df.loc[node_shapes_df.model_node_id, "geometry"].values
+    start_dist = shapely.distance(shapely.get_point(shape_geoms, 0), node_geoms)
+    end_dist = shapely.distance(shapely.get_point(shape_geoms, -1), node_geoms)
+    node_shapes_df = node_shapes_df.copy()
+    node_shapes_df["vertex_pos"] = np.where(start_dist <= end_dist, 0, -1)
+    return node_shapes_df
@@ -13,8 +13,15 @@ from ...configs import DefaultConfig, WranglerConfig
 from ...logger import WranglerLogger
 from ...models.roadway.tables import RoadShapesTable
 from ...params import LAT_LON_CRS
-from ...utils.io_table import read_table, write_table
+from ...utils.io_table import (
+    file_validation_mode,
+    read_and_transform_table,
+    write_schema_stamp,
+    write_spatial_parquet,
+    write_table,
+)
 from ...utils.models import (
+    edit_validation_mode,
     empty_df_from_datamodel,
     order_fields_from_data_model,
     validate_call_pyd,
@@ -32,13 +39,15 @@ def read_shapes(
     boundary_file: Optional[Path] = None,
     filter_to_shape_ids: Optional[list] = None,
     config: WranglerConfig = DefaultConfig,
+    chunk_size: Optional[int] = None,
 ) -> DataFrame[RoadShapesTable]:
     """Reads shapes and returns a geodataframe of shapes if filename is found.
 
     Otherwise, returns empty GeoDataFrame conforming to ShapesSchema.
 
     Sets index to be a copy of the primary key.
-    Validates output dataframe using ShapesSchema.
+    Validates output dataframe using ShapesSchema, or only checks its dtypes if
+    `config.VALIDATION.MODE` is `trusted` and filename was stamped as valid when it was written.
 
     Args:
         filename (str): file to read shapes in from.
@@ -51,6 +60,9 @@ def read_shapes(
             geographic data. Defaults to None.
         filter_to_shape_ids: List of shape_ids to filter the input data to. Defaults to None.
         config: WranglerConfig instance. Defaults to DefaultConfig.
+        chunk_size: if provided, will read, filter, and validate shapes in chunks of this many
+            records so that peak memory use stays close to the size of the final table.
+            Defaults to None, which reads the whole file at once.
     """
     if not Path(filename).exists():
         WranglerLogger.warning(
@@ -64,24 +76,29 @@ def read_shapes(
     start_time = time.time()
     WranglerLogger.debug(f"Reading shapes from {filename}.")
 
-    shapes_df = read_table(
+    def _filter_to_shape_ids(df):
+        return df[df["shape_id"].isin(filter_to_shape_ids)]
+
+    validation_mode = file_validation_mode(filename, RoadShapesTable, config.VALIDATION.MODE)
+    shapes_df = read_and_transform_table(
         filename,
+        lambda df: validate_df_to_model(
+            df_to_shapes_df(df, in_crs=in_crs, validation_mode=validation_mode),
+            RoadShapesTable,
+            mode=edit_validation_mode(config.VALIDATION.MODE),
+        ),
+        filter_func=_filter_to_shape_ids if filter_to_shape_ids else None,
+        chunk_size=chunk_size,
+        model=RoadShapesTable,
         boundary_gdf=boundary_gdf,
         boundary_geocode=boundary_geocode,
         boundary_file=boundary_file,
         read_speed=config.CPU.EST_PD_READ_SPEED,
     )
-    if filter_to_shape_ids:
-        shapes_df = shapes_df[shapes_df["shape_id"].isin(filter_to_shape_ids)]
-    WranglerLogger.debug(
-        f"Read {len(shapes_df)} shapes from file in {round(time.time() - start_time, 2)}."
-    )
-    shapes_df = df_to_shapes_df(shapes_df, in_crs=in_crs)
     shapes_df.attrs["source_file"] = filename
     WranglerLogger.info(
         f"Read {len(shapes_df)} shapes from {filename} in {round(time.time() - start_time, 2)}."
     )
-    shapes_df = validate_df_to_model(shapes_df, RoadShapesTable)
     return shapes_df
 
 
@@ -92,8 +109,11 @@ def write_shapes(
     prefix: str,
     format: str,
     overwrite: bool,
+    spatial_index: bool = False,
+    tile_level: Optional[int] = None,
+    schema_stamp: bool = False,
 ) -> None:
-    """Writes shapes to file.
+    """Writes shapes to file and optionally stamps it as valid to RoadShapesTable.
 
     Args:
         shapes_df: DataFrame of shapes to write.
@@ -101,7 +121,20 @@ def write_shapes(
         prefix: prefix to add to file name.
         format: format to write shapes in.
         overwrite: whether to overwrite file if it exists.
+        spatial_index: if True and format is parquet, will write shapes sorted along a Hilbert
+            curve in row groups with bounding box statistics. Defaults to False.
+        tile_level: if provided and format is parquet, will write shapes as a directory
+            partitioned by web mercator tiles at this zoom level. Implies spatial_index.
+            Defaults to None.
+        schema_stamp: if True, will stamp the file as valid to RoadShapesTable if shapes_df
+            was validated to it since it was last modified. Defaults to False.
     """
     shapes_file = Path(out_dir) / f"{prefix}shape.{format}"
-    shapes_df = order_fields_from_data_model(shapes_df, RoadShapesTable)
-    write_table(shapes_df, shapes_file, overwrite=overwrite)
+    ordered_shapes_df = order_fields_from_data_model(shapes_df, RoadShapesTable)
+    if (spatial_index or tile_level is not None) and format == "parquet":
+        write_spatial_parquet(
+            ordered_shapes_df, shapes_file, overwrite=overwrite, tile_level=tile_level
+        )
+    else:
+        write_table(ordered_shapes_df, shapes_file, overwrite=overwrite)
+    write_schema_stamp(shapes_df if schema_stamp else None, shapes_file, RoadShapesTable)
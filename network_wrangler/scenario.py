@@ -155,9 +155,16 @@ my_scenario = load_scenario("output_dir/scenario_name_to_use_scenario.yml")
 from __future__ import annotations
 
 import copy
+import multiprocessing
+import multiprocessing.connection
+import os
 import pprint
+import sys
+import time
+import traceback
 from collections import defaultdict, deque
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
@@ -174,17 +181,18 @@ from .configs import (
 from .configs.scenario import ScenarioInputConfig, ScenarioOutputConfig
 from .errors import (
     ProjectCardError,
+    ScenarioBuildError,
     ScenarioConflictError,
     ScenarioCorequisiteError,
     ScenarioPrerequisiteError,
 )
 from .logger import WranglerLogger
-from .roadway.io import load_roadway_from_dir, write_roadway
+from .roadway.io import load_roadway_from_dir, roadway_table_writes, write_roadway
 from .roadway.network import RoadwayNetwork
-from .transit.io import load_transit, write_transit
+from .transit.io import load_transit, transit_table_writes, write_transit
 from .transit.network import TransitNetwork
 from .utils.io_dict import load_dict
-from .utils.io_table import prep_dir
+from .utils.io_table import _available_memory, atomic_write_path, prep_dir, run_table_writes
 from .utils.utils import topological_sort
 
 if TYPE_CHECKING:
@@ -295,6 +303,7 @@ class Scenario:
         project_card_list: Optional[list[ProjectCard]] = None,
         config: Optional[Union[WranglerConfig, dict, Path, list[Path]]] = None,
         name: str = "",
+        shared_base: bool = False,
     ):
         """Constructor.
 
@@ -309,6 +318,11 @@ class Scenario:
                 default to the values in the default configuration in
                 `/configs/wrangler/default.yml`.
             name: Optional name for the scenario.
+            shared_base: If True, the scenario's networks are copy-on-write copies of the base
+                scenario's networks which share their tables until they are edited, so many
+                scenarios can be built from one base for about the memory of one base plus the
+                edits. The base networks must not be mutated in place while they are shared. If
+                False (default), the base networks are deep copied.
         """
         WranglerLogger.info("Creating Scenario")
         self.config = load_wrangler_config(config)
@@ -316,8 +330,11 @@ class Scenario:
         if project_card_list is None:
             project_card_list = []
 
+        # don't pop attributes from the base scenario so more scenarios can be created from it
         if isinstance(base_scenario, Scenario):
-            base_scenario = base_scenario.__dict__
+            base_scenario = dict(base_scenario.__dict__)
+        else:
+            base_scenario = dict(base_scenario)
 
         self.base_scenario: dict = extract_base_scenario_metadata(base_scenario)
 
@@ -327,13 +344,14 @@ class Scenario:
             )
         self.name: str = name
         # if the base scenario had roadway or transit networks, use them as the basis.
-        self.road_net: Optional[RoadwayNetwork] = copy.deepcopy(
-            base_scenario.pop("road_net", None)
-        )
-
-        self.transit_net: Optional[TransitNetwork] = copy.deepcopy(
-            base_scenario.pop("transit_net", None)
-        )
+        self.road_net: Optional[RoadwayNetwork] = base_scenario.pop("road_net", None)
+        self.transit_net: Optional[TransitNetwork] = base_scenario.pop("transit_net", None)
+        if shared_base:
+            self.road_net = copy.copy(self.road_net)
+            self.transit_net = copy.copy(self.transit_net)
+        else:
+            self.road_net = copy.deepcopy(self.road_net)
+            self.transit_net = copy.deepcopy(self.transit_net)
         if self.road_net and self.transit_net:
             self.transit_net.road_net = self.road_net
 
@@ -346,11 +364,11 @@ class Scenario:
         self.project_cards: dict[str, ProjectCard] = {}
         self._planned_projects: list[str] = []
         self._queued_projects = None
-        self.applied_projects: list[str] = base_scenario.pop("applied_projects", [])
+        self.applied_projects: list[str] = list(base_scenario.pop("applied_projects", []))
 
-        self.prerequisites: dict[str, list[str]] = base_scenario.pop("prerequisites", {})
-        self.corequisites: dict[str, list[str]] = base_scenario.pop("corequisites", {})
-        self.conflicts: dict[str, list[str]] = base_scenario.pop("conflicts", {})
+        self.prerequisites: dict[str, list[str]] = dict(base_scenario.pop("prerequisites", {}))
+        self.corequisites: dict[str, list[str]] = dict(base_scenario.pop("corequisites", {}))
+        self.conflicts: dict[str, list[str]] = dict(base_scenario.pop("conflicts", {}))
 
         for p in project_card_list:
             self._add_project(p)
@@ -714,9 +732,14 @@ class Scenario:
         transit_prefix: Optional[str] = None,
         transit_file_format: TransitFileTypes = "txt",
         projects_out_dir: Optional[Path] = None,
+        max_workers: int = 1,
     ) -> Path:
         """Writes scenario networks and summary to disk and returns path to scenario file.
 
+        Roadway, transit, and project card files are written atomically, so a failed write
+        never leaves a partially written file. With max_workers > 1, the roadway and transit
+        tables and project cards are all written at once in separate threads.
+
         Args:
             path: Path to write scenario networks and scenario summary to.
             name: Name to use.
@@ -734,16 +757,19 @@ class Scenario:
             transit_prefix: Prefix to add to the file name.
             transit_file_format: File format to write the transit network to
             projects_out_dir: Path to write the project cards to.
+            max_workers: maximum number of files to write at once in separate threads.
+                Defaults to 1, which writes them one at a time.
         """
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
 
+        writes = {}
         if self.road_net and roadway_write:
             if roadway_out_dir is None:
                 roadway_out_dir = path / "roadway"
             roadway_out_dir.mkdir(parents=True, exist_ok=True)
 
-            write_roadway(
+            roadway_writes = roadway_table_writes(
                 net=self.road_net,
                 out_dir=roadway_out_dir,
                 prefix=roadway_prefix or name,
@@ -752,25 +778,29 @@ class Scenario:
                 true_shape=roadway_true_shape,
                 overwrite=overwrite,
             )
+            writes.update({f"roadway {k}": v for k, v in roadway_writes.items()})
         if self.transit_net and transit_write:
             if transit_out_dir is None:
                 transit_out_dir = path / "transit"
             transit_out_dir.mkdir(parents=True, exist_ok=True)
-            write_transit(
+            transit_writes = transit_table_writes(
                 self.transit_net,
                 out_dir=transit_out_dir,
                 prefix=transit_prefix or name,
                 file_format=transit_file_format,
                 overwrite=overwrite,
             )
+            writes.update({f"transit {k}": v for k, v in transit_writes.items()})
         if projects_write:
             if projects_out_dir is None:
                 projects_out_dir = path / "projects"
-            write_applied_projects(
+            writes["project cards"] = partial(
+                write_applied_projects,
                 self,
                 out_dir=projects_out_dir,
                 overwrite=overwrite,
             )
+        run_table_writes(writes, max_workers=max_workers)
 
         scenario_data = self.summary
         if transit_write:
@@ -786,7 +816,7 @@ class Scenario:
         if projects_write:
             scenario_data["project_cards"] = {"dir": str(projects_out_dir)}
         scenario_file_path = Path(path) / f"{name}_scenario.yml"
-        with scenario_file_path.open("w") as f:
+        with atomic_write_path(scenario_file_path) as tmp_path, tmp_path.open("w") as f:
             yaml.dump(scenario_data, f, default_flow_style=False, allow_unicode=True)
         return scenario_file_path
 
@@ -821,6 +851,7 @@ def create_scenario(
     project_card_filepath: Optional[Union[list[Path], Path]] = None,
     filter_tags: Optional[list[str]] = None,
     config: Optional[Union[dict, Path, list[Path], WranglerConfig]] = None,
+    shared_base: bool = False,
 ) -> Scenario:
     """Creates scenario from a base scenario and adds project cards.
 
@@ -845,12 +876,14 @@ def create_scenario(
             which means no tag-filtering will occur.
         config: Optional wrangler configuration file or dictionary or instance. Defaults to
             default config.
+        shared_base: If True, the scenario's networks are copy-on-write copies of the base
+            scenario's networks rather than deep copies. See `Scenario`.
     """
     base_scenario = base_scenario or {}
     project_card_list = project_card_list or []
     filter_tags = filter_tags or []
 
-    scenario = Scenario(base_scenario, config=config, name=name)
+    scenario = Scenario(base_scenario, config=config, name=name, shared_base=shared_base)
 
     if project_card_filepath:
         project_card_list += list(
@@ -883,7 +916,8 @@ def write_applied_projects(scenario: Scenario, out_dir: Path, overwrite: bool =
             continue
         filename = Path(card.__dict__.get("file", f"{p}.yml")).name
         outpath = outdir / filename
-        write_card(card, outpath)
+        with atomic_write_path(outpath) as tmp_path:
+            write_card(card, tmp_path)
 
 
 def load_scenario(
@@ -1035,6 +1069,215 @@ def build_scenario_from_config(
     return my_scenario
 
 
+def build_scenarios_from_configs(
+    scenario_configs: list[Union[Path, list[Path], ScenarioConfig, dict]],
+    max_workers: Optional[int] = None,
+    memory_per_scenario: Optional[float] = None,
+    memory_fraction: float = 0.6,
+) -> list[dict]:
+    """Builds many scenarios from configurations, loading each base scenario only once.
+
+    Scenarios whose configurations have the same base scenario share one loaded base. Each
+    scenario is built in a forked worker process, which inherits the loaded base from this
+    process copy-on-write, applies its own projects to shared-base copies of the base networks
+    (see `Scenario`) and writes its own output. If processes can't be forked (i.e. on Windows)
+    or only one worker can be used, scenarios are built one at a time in this process instead.
+
+    Concurrency is capped so that the scenarios being built at once are expected to fit in
+    `memory_fraction` of the memory available after the base scenarios are loaded.
+
+    Args:
+        scenario_configs: configuration for each scenario as a path to a configuration file,
+            list of paths, ScenarioConfig or dictionary. Base scenarios are loaded using the
+            wrangler configuration of the first scenario which uses them.
+        max_workers: maximum number of scenarios to build at once. Defaults to the number of
+            CPUs.
+        memory_per_scenario: memory in bytes which building each scenario is expected to use in
+            addition to its base. Defaults to the in-memory size of the largest base scenario's
+            tables, which is about the most a scenario adds if it edits every table.
+        memory_fraction: fraction of available memory to use at once. Defaults to 0.6.
+
+    Returns:
+        list with a report for each scenario, in the order of `scenario_configs`, with its
+            `name`, the `seconds` it took to build and write, the `memory_bytes` used only by
+            its worker and not shared with the base, the `peak_memory_bytes` resident in its
+            worker including the shared base and the `error` and its `traceback` if it failed.
+            When scenarios are built in this process, memory is for this process, including the
+            base.
+
+    Raises:
+        ScenarioBuildError: after all the scenarios are built, if any of them failed.
+    """
+    configs: list[ScenarioConfig] = [load_scenario_config(c) for c in scenario_configs]
+    base_scenarios: dict[str, dict] = {}
+    for scenario_config in configs:
+        base_key = _base_scenario_key(scenario_config)
+        if base_key in base_scenarios:
+            continue
+        WranglerLogger.info(f"Loading base scenario for {scenario_config.name}")
+        base_scenario = create_base_scenario(
+            **scenario_config.base_scenario.to_dict(), config=scenario_config.wrangler_config
+        )
+        # read lazily-loaded shapes now so that workers share them rather than each reading them
+        if base_scenario["road_net"] is not None:
+            base_scenario["road_net"].shapes_df  # noqa: B018
+        base_scenarios[base_key] = base_scenario
+
+    if memory_per_scenario is None:
+        memory_per_scenario = max(_base_scenario_memory(b) for b in base_scenarios.values())
+    max_workers = min(max_workers or os.cpu_count() or 1, len(configs))
+    max_memory_workers = int(_available_memory() * memory_fraction // max(memory_per_scenario, 1))
+    n_workers = max(1, min(max_workers, max_memory_workers))
+    WranglerLogger.info(
+        f"Building {len(configs)} scenarios from {len(base_scenarios)} base "
+        f"scenarios with {n_workers} workers."
+    )
+
+    if n_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        reports = _build_scenarios_in_forks(configs, base_scenarios, n_workers)
+    else:
+        reports = [
+            _build_scenario_from_base(c, base_scenarios[_base_scenario_key(c)]) for c in configs
+        ]
+
+    for report in reports:
+        WranglerLogger.info(
+            f"Built {report['name']} in {round(report['seconds'], 2)} seconds using "
+            f"{round(report['memory_bytes'] / 2**20)} MB of unshared memory "
+            f"({round(report['peak_memory_bytes'] / 2**20)} MB peak)."
+        )
+    _failed = [r["name"] for r in reports if "error" in r]
+    if _failed:
+        msg = f"Failed to build scenarios: {_failed}"
+        raise ScenarioBuildError(msg)
+    return reports
+
+
+def _base_scenario_key(scenario_config: ScenarioConfig) -> str:
+    """Key identifying scenario configurations which have the same base scenario."""
+    return repr(scenario_config.base_scenario.to_dict())
+
+
+def _base_scenario_memory(base_scenario: dict) -> int:
+    """Memory in bytes used by the tables of the networks in a base scenario."""
+    tables = []
+    if base_scenario.get("road_net") is not None:
+        road_net = base_scenario["road_net"]
+        tables += [road_net.links_df, road_net.nodes_df, road_net.shapes_df]
+    if base_scenario.get("transit_net") is not None:
+        tables += base_scenario["transit_net"].feed.tables
+    return sum(int(t.memory_usage(deep=True).sum()) for t in tables)
+
+
+def _build_scenarios_in_forks(
+    scenario_configs: list[ScenarioConfig], base_scenarios: dict[str, dict], n_workers: int
+) -> list[dict]:
+    """Builds each scenario in its own forked process, running up to n_workers at once.
+
+    Forked processes inherit the loaded base scenarios without pickling them and share their
+    memory until it is written to. Each process builds one scenario so its memory use is only
+    from that scenario, and a process which dies (i.e. runs out of memory) is reported as an
+    error rather than stopping the other scenarios.
+    """
+    fork_context = multiprocessing.get_context("fork")
+    reports: list[dict] = [{} for _ in scenario_configs]
+    pending = list(range(len(scenario_configs)))
+    running: dict[int, tuple] = {}
+    while pending or running:
+        while pending and len(running) < n_workers:
+            i = pending.pop(0)
+            receiver, sender = fork_context.Pipe(duplex=False)
+            base_scenario = base_scenarios[_base_scenario_key(scenario_configs[i])]
+            process = fork_context.Process(
+                target=_send_scenario_build_report,
+                args=(scenario_configs[i], base_scenario, sender),
+            )
+            process.start()
+            sender.close()
+            running[i] = (process, receiver, time.time())
+        # receivers are ready when a report is sent or when a worker exits without sending one
+        ready = multiprocessing.connection.wait([r for _, r, _ in running.values()])
+        for i, (process, receiver, start_t) in list(running.items()):
+            if receiver not in ready:
+                continue
+            try:
+                reports[i] = receiver.recv()
+            except EOFError:
+                process.join()
+                reports[i] = {
+                    "name": scenario_configs[i].name,
+                    "error": f"Worker process exited with code {process.exitcode}.",
+                    "seconds": time.time() - start_t,
+                    "memory_bytes": 0,
+                    "peak_memory_bytes": 0,
+                }
+                WranglerLogger.error(
+                    f"Error building scenario {reports[i]['name']}: {reports[i]['error']}"
+                )
+            process.join()
+            receiver.close()
+            del running[i]
+    return reports
+
+
+def _send_scenario_build_report(
+    scenario_config: ScenarioConfig,
+    base_scenario: dict,
+    sender: multiprocessing.connection.Connection,
+) -> None:
+    """Builds a scenario in a forked process and sends its report back to the parent process."""
+    sender.send(_build_scenario_from_base(scenario_config, base_scenario))
+    sender.close()
+
+
+def _build_scenario_from_base(scenario_config: ScenarioConfig, base_scenario: dict) -> dict:
+    """Builds and writes a scenario from a loaded base scenario, reporting time and memory.
+
+    Errors are logged and reported rather than raised so that other scenarios still build.
+    """
+    start_t = time.time()
+    report: dict = {"name": scenario_config.name}
+    try:
+        my_scenario = create_scenario(
+            base_scenario=base_scenario,
+            name=scenario_config.name,
+            config=scenario_config.wrangler_config,
+            shared_base=True,
+            **scenario_config.projects.to_dict(),
+        )
+        my_scenario.apply_all_projects()
+        write_args = _scenario_output_config_to_scenario_write(scenario_config.output_scenario)
+        my_scenario.write(**write_args, name=scenario_config.name)
+    except Exception as err:
+        WranglerLogger.exception(f"Error building scenario {scenario_config.name}")
+        report["error"] = f"{type(err).__name__}: {err}"
+        report["traceback"] = traceback.format_exc()
+    report["seconds"] = time.time() - start_t
+    report.update(_process_memory())
+    return report
+
+
+def _process_memory() -> dict[str, int]:
+    """Memory in bytes used only by this process and peak memory resident in this process."""
+    import psutil
+
+    process = psutil.Process()
+    try:
+        memory_bytes = process.memory_full_info().uss
+    except psutil.AccessDenied:
+        memory_bytes = process.memory_info().rss
+    try:
+        import resource
+
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        peak_memory_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            peak_memory_bytes *= 1024
+    except ImportError:
+        peak_memory_bytes = process.memory_info().peak_wset
+    return {"memory_bytes": memory_bytes, "peak_memory_bytes": peak_memory_bytes}
+
+
 def _scenario_output_config_to_scenario_write(
     scenario_output_config: ScenarioOutputConfig,
 ) -> dict:
@@ -20,6 +20,7 @@ from ...models.gtfs.tables import (
     WranglerTripsTable,
 )
 from ...utils.data import update_df_by_col_value
+from ...utils.models import ValidationModes
 
 
 class Feed(DBModelMixin):
@@ -73,21 +74,24 @@ class Feed(DBModelMixin):
 
     optional_table_names: ClassVar[list[str]] = ["agencies"]
 
-    def __init__(self, **kwargs):
+    def __init__(self, validation_mode: ValidationModes = "full", **kwargs):
         """Create a Feed object from a dictionary of DataFrames representing a GTFS feed.
 
         Args:
+            validation_mode: how the tables are validated when they are set. Should only be
+                `trusted` for tables read from files stamped as valid. Defaults to `full`.
             kwargs: A dictionary containing DataFrames representing the tables of a GTFS feed.
         """
         self._net = None
-        self.feed_path: Path = None
+        self.feed_path: Optional[Path] = None
+        self.validation_mode = validation_mode
         self.initialize_tables(**kwargs)
 
         # Set extra provided attributes but just FYI in logger.
         extra_attr = {k: v for k, v in kwargs.items() if k not in self.table_names}
         if extra_attr:
             WranglerLogger.info(f"Adding additional attributes to Feed: {extra_attr.keys()}")
-        for k, v in extra_attr:
+        for k, v in extra_attr.items():
             self.__setattr__(k, v)
 
     def set_by_id(
@@ -116,6 +120,7 @@ class Feed(DBModelMixin):
         table_df = self.get_table(table_name)
         updated_df = update_df_by_col_value(table_df, set_df, id_property, properties=properties)
         self.__dict__[table_name] = updated_df
+        self.mark_modified(table_name)
 
 
 PickupDropoffAvailability = Literal["either", "both", "pickup_only", "dropoff_only", "any"]
@@ -1,19 +1,27 @@
 """Functions for reading and writing transit feeds and networks."""
 
+from functools import partial
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Callable, Literal, Optional, Union
 
 import geopandas as gpd
 import pandas as pd
 
-from ..configs import DefaultConfig, WranglerConfig
+from ..configs import ConfigInputTypes, DefaultConfig, WranglerConfig, load_wrangler_config
 from ..errors import FeedReadError
 from ..logger import WranglerLogger
 from ..models._base.db import RequiredTableError
 from ..models._base.types import TransitFileTypes
 from ..models.gtfs.gtfs import GtfsModel
 from ..utils.geo import to_points_gdf
-from ..utils.io_table import unzip_file, write_table
+from ..utils.io_table import (
+    file_validation_mode,
+    run_table_writes,
+    unzip_file,
+    write_schema_stamp,
+    write_table,
+)
+from ..utils.models import ValidationModes, edit_validation_mode
 from .feed.feed import Feed
 from .network import TransitNetwork
 
@@ -29,17 +37,26 @@ def _feed_path_ref(path: Path) -> Path:
 
 
 def load_feed_from_path(
-    feed_path: Union[Path, str], file_format: TransitFileTypes = "txt"
+    feed_path: Union[Path, str],
+    file_format: TransitFileTypes = "txt",
+    config: ConfigInputTypes = DefaultConfig,
 ) -> Feed:
     """Create a Feed object from the path to a GTFS transit feed.
 
+    If `config.VALIDATION.MODE` is `trusted` and all the table files were stamped as valid when
+    they were written, only their dtypes are checked.
+
     Args:
         feed_path (Union[Path, str]): The path to the GTFS transit feed.
         file_format: the format of the files to read. Defaults to "txt"
+        config: a WranglerConfig instance or anything `load_wrangler_config` accepts.
+            Defaults to DefaultConfig.
 
     Returns:
         Feed: The TransitNetwork object created from the GTFS transit feed.
     """
+    if not isinstance(config, WranglerConfig):
+        config = load_wrangler_config(config)
     feed_path = _feed_path_ref(Path(feed_path))  # unzips if needs to be unzipped
 
     if not feed_path.is_dir():
@@ -71,7 +88,15 @@ def load_feed_from_path(
     feed_files = {t: f[0] for t, f in feed_possible_files.items()}
     feed_dfs = {table: _read_table_from_file(table, file) for table, file in feed_files.items()}
 
-    return load_feed_from_dfs(feed_dfs)
+    _file_modes = {
+        file_validation_mode(file, Feed._table_models[table], config.VALIDATION.MODE)
+        for table, file in feed_files.items()
+    }
+    feed = load_feed_from_dfs(
+        feed_dfs, validation_mode="trusted" if _file_modes == {"trusted"} else "full"
+    )
+    feed.validation_mode = edit_validation_mode(config.VALIDATION.MODE)
+    return feed
 
 
 def _read_table_from_file(table: str, file: Path) -> pd.DataFrame:
@@ -87,11 +112,13 @@ def _read_table_from_file(table: str, file: Path) -> pd.DataFrame:
         raise FeedReadError(msg) from e
 
 
-def load_feed_from_dfs(feed_dfs: dict) -> Feed:
+def load_feed_from_dfs(feed_dfs: dict, validation_mode: ValidationModes = "full") -> Feed:
     """Create a TransitNetwork object from a dictionary of DataFrames representing a GTFS feed.
 
     Args:
         feed_dfs (dict): A dictionary containing DataFrames representing the tables of a GTFS feed.
+        validation_mode: how the tables are validated. Should only be `trusted` for tables read
+            from files stamped as valid. Defaults to `full`.
 
     Returns:
         Feed: A Feed object representing the transit network.
@@ -113,7 +140,7 @@ def load_feed_from_dfs(feed_dfs: dict) -> Feed:
         msg = f"feed_dfs must contain the following tables: {Feed.table_names}"
         raise ValueError(msg)
 
-    feed = Feed(**feed_dfs)
+    feed = Feed(validation_mode=validation_mode, **feed_dfs)
 
     return feed
 
@@ -121,7 +148,7 @@ def load_feed_from_dfs(feed_dfs: dict) -> Feed:
 def load_transit(
     feed: Union[Feed, GtfsModel, dict[str, pd.DataFrame], str, Path],
     file_format: TransitFileTypes = "txt",
-    config: WranglerConfig = DefaultConfig,
+    config: ConfigInputTypes = DefaultConfig,
 ) -> "TransitNetwork":
     """Create a TransitNetwork object.
 
@@ -133,7 +160,8 @@ def load_transit(
     Args:
         feed: Feed boject, dict of transit data frames, or path to transit feed data
         file_format: the format of the files to read. Defaults to "txt"
-        config: WranglerConfig object. Defaults to DefaultConfig.
+        config: a WranglerConfig instance or anything `load_wrangler_config` accepts.
+            Defaults to DefaultConfig.
 
     Returns:
     A TransitNetwork object representing the loaded transit network.
@@ -154,9 +182,11 @@ def load_transit(
     ```
 
     """
+    if not isinstance(config, WranglerConfig):
+        config = load_wrangler_config(config)
     if isinstance(feed, (Path, str)):
         feed = Path(feed)
-        feed_obj = load_feed_from_path(feed, file_format=file_format)
+        feed_obj = load_feed_from_path(feed, file_format=file_format, config=config)
         feed_obj.feed_path = feed
     elif isinstance(feed, dict):
         feed_obj = load_feed_from_dfs(feed)
@@ -177,9 +207,14 @@ def write_transit(
     prefix: Optional[Union[Path, str]] = None,
     file_format: Literal["txt", "csv", "parquet"] = "txt",
     overwrite: bool = True,
+    max_workers: int = 1,
 ) -> None:
     """Writes a network in the transit network standard.
 
+    Each file is written atomically, so a failed write never leaves a partially written file.
+    Files are stamped as valid to the data model of their table if the transit network's
+    `config.VALIDATION.STAMP_FILES` is set.
+
     Args:
         transit_net: a TransitNetwork instance
         out_dir: directory to write the network to
@@ -187,14 +222,51 @@ def write_transit(
             file format.
         prefix: prefix to add to the file name
         overwrite: if True, will overwrite the files if they already exist. Defaults to True
+        max_workers: maximum number of files to write at once in separate threads. Defaults
+            to 1, which writes them one at a time.
+    """
+    writes = transit_table_writes(
+        transit_net, out_dir=out_dir, prefix=prefix, file_format=file_format, overwrite=overwrite
+    )
+    run_table_writes(writes, max_workers=max_workers)
+    WranglerLogger.info(f"Wrote {len(writes)} files to {out_dir}")
+
+
+def transit_table_writes(
+    transit_net,
+    out_dir: Union[Path, str] = ".",
+    prefix: Optional[Union[Path, str]] = None,
+    file_format: Literal["txt", "csv", "parquet"] = "txt",
+    overwrite: bool = True,
+) -> dict[str, Callable[[], None]]:
+    """Functions which each write one table of a transit network, keyed by table name.
+
+    Used by `write_transit` and to write transit tables alongside other tables with
+    `run_table_writes`. Arguments are the same as for `write_transit`.
     """
     out_dir = Path(out_dir)
     prefix = f"{prefix}_" if prefix else ""
+    schema_stamp = transit_net.config.VALIDATION.STAMP_FILES
+    writes: dict[str, Callable[[], None]] = {}
     for table in transit_net.feed.table_names:
         df = transit_net.feed.get_table(table)
         outpath = out_dir / f"{prefix}{table}.{file_format}"
-        write_table(df, outpath, overwrite=overwrite)
-    WranglerLogger.info(f"Wrote {len(transit_net.feed.tables)} files to {out_dir}")
+        writes[table] = partial(
+            _write_feed_table,
+            df,
+            outpath,
+            transit_net.feed._table_models[table],
+            overwrite,
+            schema_stamp=schema_stamp,
+        )
+    return writes
+
+
+def _write_feed_table(
+    df: pd.DataFrame, outpath: Path, model: type, overwrite: bool, schema_stamp: bool = False
+) -> None:
+    write_table(df, outpath, overwrite=overwrite)
+    write_schema_stamp(df if schema_stamp else None, outpath, model)
 
 
 def convert_transit_serialization(
@@ -26,8 +26,8 @@ class ModelTransit:
         """ModelTransit class for managing consistency between roadway and transit networks."""
         self.transit_net = transit_net
         self.roadway_net = roadway_net
-        self._roadway_net_hash = None
-        self._transit_feed_hash = None
+        self._roadway_net_version = None
+        self._transit_feed_version = None
         self._transit_shifted_to_ML = shift_transit_to_managed_lanes
 
     @property
@@ -39,8 +39,8 @@ class ModelTransit:
     def consistent_nets(self) -> bool:
         """Indicate if roadway and transit networks have changed since self.m_feed updated."""
         return bool(
-            self.roadway_net.network_hash == self._roadway_net_hash
-            and self.transit_net.feed_hash == self._transit_feed_hash
+            self.roadway_net.network_version == self._roadway_net_version
+            and self.transit_net.feed_version == self._transit_feed_version
         )
 
     @property
@@ -49,9 +49,9 @@ class ModelTransit:
         if self.consistent_nets:
             return self._m_feed
         # NOTE: look at this
-        # If netoworks have changed, updated model transit and update reference hash
-        self._roadway_net_hash = copy.deepcopy(self.roadway_net.network_hash)
-        self._transit_feed_hash = copy.deepcopy(self.transit_net.feed_hash)
+        # If netoworks have changed, updated model transit and update reference version
+        self._roadway_net_version = self.roadway_net.network_version
+        self._transit_feed_version = self.transit_net.feed_version
 
         if not self._transit_shifted_to_ML:
             self._m_feed = copy.deepcopy(self.transit_net.feed)
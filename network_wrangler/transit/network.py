@@ -34,6 +34,7 @@ from ..errors import (
 )
 from ..logger import WranglerLogger
 from ..utils.geo import to_points_gdf
+from ..utils.models import edit_validation_mode
 from ..utils.utils import dict_to_hexkey
 from .feed.feed import Feed, _get_applied_projects_from_tables
 from .geo import (
@@ -92,6 +93,7 @@ class TransitNetwork:
         self.feed: Feed = feed
         self.graph: nx.MultiDiGraph = None
         self.config: WranglerConfig = config
+        self.feed.validation_mode = edit_validation_mode(config.VALIDATION.MODE)
         # initialize
         self._consistent_with_road_net = False
 
@@ -126,7 +128,7 @@ class TransitNetwork:
             raise TransitValidationError(msg)
         if self._road_net is None or transit_road_net_consistency(feed, self._road_net):
             self._feed = feed
-            self._stored_feed_hash = copy.deepcopy(feed.hash)
+            self._stored_feed_version = feed.version
         else:
             msg = "Can't assign Feed inconsistent with set Roadway Network."
             WranglerLogger.error(msg)
@@ -146,7 +148,7 @@ class TransitNetwork:
             raise TransitValidationError(msg)
         if transit_road_net_consistency(self.feed, road_net_in):
             self._road_net = road_net_in
-            self._stored_road_net_hash = copy.deepcopy(road_net_in.network_hash)
+            self._stored_road_net_version = road_net_in.network_version
             self._consistent_with_road_net = True
         else:
             msg = "Can't assign inconsistent RoadwayNetwork - Roadway Network not \
@@ -159,15 +161,20 @@ class TransitNetwork:
         """Return the hash of the feed."""
         return self.feed.hash
 
+    @property
+    def feed_version(self) -> tuple[int, ...]:
+        """Return the version of the feed."""
+        return self.feed.version
+
     @property
     def consistent_with_road_net(self) -> bool:
         """Indicate if road_net is consistent with transit network.
 
         Will return True if road_net is None, but provide a warning.
 
-        Checks the network hash of when consistency was last evaluated. If transit network or
+        Checks the network versions of when consistency was last evaluated. If transit network or
         roadway network has changed, will re-evaluate consistency and return the updated value and
-        update self._stored_road_net_hash.
+        update self._stored_road_net_version.
 
         Returns:
             Boolean indicating if road_net is consistent with transit network.
@@ -175,15 +182,28 @@ class TransitNetwork:
         if self.road_net is None:
             WranglerLogger.warning("Roadway Network not set, cannot accurately check consistency.")
             return True
-        updated_road = self.road_net.network_hash != self._stored_road_net_hash
-        updated_feed = self.feed_hash != self._stored_feed_hash
+        updated_road = self.road_net.network_version != self._stored_road_net_version
+        updated_feed = self.feed_version != self._stored_feed_version
 
         if updated_road or updated_feed:
             self._consistent_with_road_net = transit_road_net_consistency(self.feed, self.road_net)
-            self._stored_road_net_hash = copy.deepcopy(self.road_net.network_hash)
-            self._stored_feed_hash = copy.deepcopy(self.feed_hash)
+            self._stored_road_net_version = self.road_net.network_version
+            self._stored_feed_version = self.feed_version
         return self._consistent_with_road_net
 
+    def __copy__(self):
+        """Copy-on-write copy of the network called by copy.copy().
+
+        The feed is a copy-on-write copy of this network's feed (see `Feed.copy()`), so its
+        tables share data with this network's until they are set. References the same roadway
+        network. Cached selections aren't copied.
+        """
+        copied_net = self.__class__.__new__(self.__class__)
+        copied_net.__dict__.update(self.__dict__)
+        copied_net._feed = self.feed.copy()
+        copied_net._selections = {}
+        return copied_net
+
     def __deepcopy__(self, memo):
         """Returns copied TransitNetwork instance with deep copy of Feed but not roadway net."""
         COPY_REF_NOT_VALUE = ["_road_net"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Union
 
@@ -85,11 +84,12 @@ def _add_route_to_feed(
     """
     WranglerLogger.debug(f"Adding route {len(add_routes)} to feed.")
 
-    shapes_df = copy.deepcopy(feed.shapes)
-    trips_df = copy.deepcopy(feed.trips)
-    stop_times_df = copy.deepcopy(feed.stop_times)
-    stops_df = copy.deepcopy(feed.stops)
-    frequencies_df = copy.deepcopy(feed.frequencies)
+    # existing tables are only ever concatenated to, which creates new tables, so aren't copied
+    shapes_df = feed.shapes
+    trips_df = feed.trips
+    stop_times_df = feed.stop_times
+    stops_df = feed.stops
+    frequencies_df = feed.frequencies
 
     add_routes_df = pd.DataFrame(
         [{k: v for k, v in r.items() if k != "trips"} for r in add_routes]
@@ -126,12 +126,13 @@ def _add_route_to_feed(
                     [stop_times_df, add_stop_times_df], ignore_index=True, sort=False
                 )
 
-    feed.routes = routes_df
-    feed.shapes = shapes_df
-    feed.trips = trips_df
-    feed.stops = stops_df
-    feed.stop_times = stop_times_df
-    feed.frequencies = frequencies_df
+    with feed.batch_update():
+        feed.routes = routes_df
+        feed.shapes = shapes_df
+        feed.trips = trips_df
+        feed.stops = stops_df
+        feed.stop_times = stop_times_df
+        feed.frequencies = frequencies_df
 
     return feed
 
@@ -25,6 +25,10 @@ def apply_calculated_transit(
         pycode: python code which changes values in the transit network object
     """
     WranglerLogger.debug("Applying calculated transit project.")
+    # pycode may mutate tables in place, so they can't share data with another feed
+    net.feed.materialize()
     exec(pycode)
+    # pycode may mutate tables in place, which doesn't change their versions
+    net.feed.mark_modified()
 
     return net
@@ -65,32 +65,33 @@ def _delete_trips_from_feed(
     """
     WranglerLogger.debug("Deleting service from feed.")
 
-    trips_df = feed.trips.copy()
-    stop_times_df = feed.stop_times.copy()
-    frequencies_df = feed.frequencies.copy()
+    trips_df = feed.trips
+    stop_times_df = feed.stop_times
+    frequencies_df = feed.frequencies
 
     trips_df = trips_df[~trips_df.trip_id.isin(trip_ids)]
     stop_times_df = stop_times_df[~stop_times_df.trip_id.isin(trip_ids)]
     frequencies_df = frequencies_df[~frequencies_df.trip_id.isin(trip_ids)]
 
-    if clean_shapes:
-        shapes_df = feed.shapes.copy()
-        # don't delete shapes that are still used by other trips
-        del_shape_ids = list(
-            set(shape_ids_for_trip_ids(feed.trips, trip_ids)) - set(trips_df.shape_id.unique())
-        )
-        feed.shapes = shapes_df[~shapes_df.shapes_id.isin(del_shape_ids)]
-
-    if clean_routes:
-        routes_df = feed.routes.copy()
-        # don't delete shapes that are still used by other trips
-        del_route_ids = list(
-            set(route_ids_for_trip_ids(feed.trips, trip_ids)) - set(trips_df.route_id.unique())
-        )
-        feed.routes = routes_df[~routes_df.route_id.isin(del_route_ids)]
-
-    feed.stop_times = stop_times_df
-    feed.frequencies = frequencies_df
-    feed.trips = trips_df
+    with feed.batch_update():
+        if clean_shapes:
+            shapes_df = feed.shapes
+            # don't delete shapes that are still used by other trips
+            del_shape_ids = list(
+                set(shape_ids_for_trip_ids(feed.trips, trip_ids)) - set(trips_df.shape_id.unique())
+            )
+            feed.shapes = shapes_df[~shapes_df.shapes_id.isin(del_shape_ids)]
+
+        if clean_routes:
+            routes_df = feed.routes
+            # don't delete shapes that are still used by other trips
+            del_route_ids = list(
+                set(route_ids_for_trip_ids(feed.trips, trip_ids)) - set(trips_df.route_id.unique())
+            )
+            feed.routes = routes_df[~routes_df.route_id.isin(del_route_ids)]
+
+        feed.stop_times = stop_times_df
+        feed.frequencies = frequencies_df
+        feed.trips = trips_df
 
     return feed
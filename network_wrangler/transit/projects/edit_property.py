@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING, Optional
 
 from ...errors import ProjectCardError, TransitPropertyChangeError
 from ...logger import WranglerLogger
-from ...utils.data import validate_existing_value_in_df
+from ...utils.data import copy_on_write, validate_existing_value_in_df
 
 if TYPE_CHECKING:
     from ...transit.network import TransitNetwork
@@ -94,7 +93,7 @@ def _apply_transit_property_change_to_table(
     ):
         return net
 
-    set_df = copy.deepcopy(table_df)
+    set_df = copy_on_write(table_df, [prop_name, "projects"])
 
     # Calculate build value
     if "set" in prop_change:
@@ -9,7 +9,6 @@ import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 
-from ...configs import DefaultConfig
 from ...errors import TransitRoutingChangeError
 from ...logger import WranglerLogger
 from ...models.gtfs.tables import (
@@ -18,18 +17,19 @@ from ...models.gtfs.tables import (
     WranglerStopTimesTable,
     WranglerTripsTable,
 )
-from ...utils.data import concat_with_attr, segment_data_by_selection_min_overlap
+from ...utils.data import (
+    concat_with_attr,
+    copy_on_write,
+    segment_data_by_selection_min_overlap,
+)
 from ...utils.ids import generate_list_of_new_ids_from_existing, generate_new_id_from_existing
 from ...utils.models import validate_df_to_model
 from ..feed.shapes import (
     find_nearest_stops,
-    node_pattern_for_shape_id,
     shape_ids_for_trip_ids,
     shapes_for_shape_id,
 )
-from ..feed.stop_times import stop_times_for_trip_id
 from ..feed.stops import node_is_stop
-from ..feed.trips import trip_ids_for_shape_id
 from ..validate import (
     shape_links_without_road_links,
 )
@@ -118,52 +118,12 @@ def _create_shapes(
     return new_shape_rows_df
 
 
-def _add_new_shape_copy(
-    old_shape_id: str,
-    trip_ids: list[str],
-    feed: Feed,
-    id_scalar: int = DefaultConfig.IDS.TRANSIT_SHAPE_ID_SCALAR,
-    project_name: Optional[str] = None,
-) -> tuple[DataFrame[WranglerShapesTable], DataFrame[WranglerTripsTable], str]:
-    """Create an identical new shape_id from shape matching old_shape_id for the trip_ids.
-
-    Args:
-        old_shape_id (str): ID of shape to copy
-        trip_ids (list[str]): list of trip IDS to associate with new shape
-        feed: Input transit feed
-        id_scalar (int): scalar value to add to old_shape_id to create new_shape_id. Defaults to
-            SHAPE_ID_SCALAR.
-        project_name (str, optional): Name of the project. Defaults to None.
-
-    Returns:
-        tuple[pd.DataFrame]: updated (shapes_df, trips_df, new_shape_id)
-    """
-    WranglerLogger.debug(
-        f"Adding a new shape for shape_id: {old_shape_id} using scalar: {id_scalar}"
-    )
-    shapes = copy.deepcopy(feed.shapes)
-    trips = copy.deepcopy(feed.trips)
-    new_shape = copy.deepcopy(shapes[shapes.shape_id == old_shape_id])
-    new_shape_id = generate_new_id_from_existing(old_shape_id, shapes["shape_id"], id_scalar)
-    new_shape["shape_id"] = new_shape_id
-
-    if project_name is not None:
-        new_shape["projects"] = f"{project_name},"
-    shapes = concat_with_attr([shapes, new_shape], ignore_index=True)
-
-    trips.loc[trips.trip_id.isin(trip_ids), "shape_id"] = new_shape_id
-    return shapes, trips, new_shape_id
-
-
-def _replace_shapes_segment(
+def _shape_segment_positions(
     routing_to_replace: list[int],
-    shape_id: str,
+    existing_shape_df: DataFrame[WranglerShapesTable],
     set_routing: list[int],
-    feed: Feed,
-    road_net: RoadwayNetwork,
-    project_name: Optional[str] = None,
-) -> DataFrame[WranglerShapesTable]:
-    """Returns shapes with a replaced segment for a given shape_id.
+) -> tuple[list[int], np.ndarray, np.ndarray]:
+    """Returns positions of existing shape records to keep before and after a replaced segment.
 
     Segment to replace is defined by existing_routing but will be updated based on:
     1. Expanding to shape start or shape end if it is the first or last stop respectfully
@@ -172,22 +132,19 @@ def _replace_shapes_segment(
 
     Args:
         routing_to_replace: list of depicting start and end node ids for segment to replace
-        shape_id: shape_id to be modified.
+        existing_shape_df: existing shape records for a single shape sorted by shape_pt_sequence
         set_routing (list): list of node ids to replace existing routing with
-        feed: Feed object
-        road_net: Reference roadway network
-        project_name: Name of the project. Defaults to None.
 
     Returns:
-        pd.DataFrame: Updated shape records
+        tuple of updated set_routing and positions of records before and after the segment.
     """
     routing_to_replace = [int(abs(int(i))) for i in routing_to_replace]
-
-    existing_shape_df = shapes_for_shape_id(feed.shapes, shape_id)
-
-    _disp_col = ["shape_id", "shape_pt_sequence", "shape_model_node_id"]
-    # WranglerLogger.debug(f"\nExisting Shape\n{existing_shape_df[_disp_col]}")
-
+    node_pattern_df = pd.DataFrame(
+        {
+            "shape_model_node_id": existing_shape_df["shape_model_node_id"].to_numpy(),
+            "_pos": np.arange(len(existing_shape_df)),
+        }
+    )
     (
         set_routing,
         (
@@ -197,22 +154,31 @@ def _replace_shapes_segment(
         ),
     ) = segment_data_by_selection_min_overlap(
         routing_to_replace,
-        existing_shape_df,
+        node_pattern_df,
         "shape_model_node_id",
         set_routing,
     )
-    # Create new segment
-    updated_segment_shapes_df = _create_shapes(
-        set_routing, shape_id, road_net, project_name=project_name
-    )
+    return set_routing, before_segment["_pos"].to_numpy(), after_segment["_pos"].to_numpy()
+
+
+def _splice_shape_segment(
+    existing_shape_df: DataFrame[WranglerShapesTable],
+    before_pos: np.ndarray,
+    segment_shapes_df: DataFrame[WranglerShapesTable],
+    after_pos: np.ndarray,
+) -> DataFrame[WranglerShapesTable]:
+    """Returns shape records with segment_shapes_df between existing records at positions."""
+    _disp_col = ["shape_id", "shape_pt_sequence", "shape_model_node_id"]
+    before_segment = existing_shape_df.iloc[before_pos]
+    after_segment = existing_shape_df.iloc[after_pos]
 
     msg = f"\nShapes Segments: \nBefore: \n{before_segment[_disp_col]}\
-                         \nReplacement: \n{updated_segment_shapes_df[_disp_col]}\
+                         \nReplacement: \n{segment_shapes_df[_disp_col]}\
                          \nAfter: \n{after_segment[_disp_col]}"
     # WranglerLogger.debug(msg)
 
     # Only concatenate those that aren't empty bc NaN values will transfer integers to floats.
-    dfs = [before_segment, updated_segment_shapes_df, after_segment]
+    dfs = [before_segment, segment_shapes_df, after_segment]
     concat_dfs = [df for df in dfs if not df.empty]
 
     updated_shape = concat_with_attr(concat_dfs, ignore_index=True, sort=False)
@@ -224,9 +190,49 @@ def _replace_shapes_segment(
     return updated_shape
 
 
+def _replace_shapes_segment(
+    routing_to_replace: list[int],
+    shape_id: str,
+    set_routing: list[int],
+    feed: Feed,
+    road_net: RoadwayNetwork,
+    project_name: Optional[str] = None,
+) -> DataFrame[WranglerShapesTable]:
+    """Returns shapes with a replaced segment for a given shape_id.
+
+    Segment to replace is defined by existing_routing but will be updated based on:
+    1. Expanding to shape start or shape end if it is the first or last stop respectfully
+    2. Shrinking if replacement segment has overlap with existing_routing so that existing
+        data can be preserved.
+
+    Args:
+        routing_to_replace: list of depicting start and end node ids for segment to replace
+        shape_id: shape_id to be modified.
+        set_routing (list): list of node ids to replace existing routing with
+        feed: Feed object
+        road_net: Reference roadway network
+        project_name: Name of the project. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Updated shape records
+    """
+    existing_shape_df = shapes_for_shape_id(feed.shapes, shape_id)
+    set_routing, before_pos, after_pos = _shape_segment_positions(
+        routing_to_replace, existing_shape_df, set_routing
+    )
+    # Create new segment
+    updated_segment_shapes_df = _create_shapes(
+        set_routing, shape_id, road_net, project_name=project_name
+    )
+    return _splice_shape_segment(
+        existing_shape_df, before_pos, updated_segment_shapes_df, after_pos
+    )
+
+
 def _replace_stop_times_segment_for_trip(
     existing_stop_nodes: list[int],
     trip_id: str,
+    this_trip_stoptimes: DataFrame[WranglerStopTimesTable],
     set_stops_nodes: list[int],
     feed: Feed,
     project_name: Optional[str] = None,
@@ -236,6 +242,7 @@ def _replace_stop_times_segment_for_trip(
     Args:
         existing_stop_nodes: list of roadway node ids for the existing segment to replace
         trip_id: selected trip_id to update
+        this_trip_stoptimes: existing stop_times for trip_id sorted by stop_sequence
         set_stops_nodes: list of roadway node ids to make stops
         feed: transit feed
         project_name: Name of the project. Defaults to None.
@@ -244,7 +251,6 @@ def _replace_stop_times_segment_for_trip(
         WranglerStopTimesTable: stop_time records for a trip_id with updated segment
     """
     # WranglerLogger.debug(f"Replacing existing nodes pattern: {existing_stop_nodes}")
-    this_trip_stoptimes = stop_times_for_trip_id(feed.stop_times, trip_id)
 
     _disp_col = ["stop_id", "stop_sequence"]
 
@@ -302,14 +308,11 @@ def _replace_stop_times_segment_for_trip(
 
 
 def _consistent_routing(
-    feed: Feed, shape_id: str, existing_routing: list[int], set_routing: list[int]
+    existing_pattern: list[int], existing_routing: list[int], set_routing: list[int]
 ) -> bool:
-    """Check if the routing is consistent with the existing routing."""
-    # WranglerLogger.debug(f"Checking if routing is consistent for shape_id: {shape_id}")
-
+    """Check if the routing is consistent with the existing routing of a shape node pattern."""
     if not existing_routing:
         return False
-    existing_pattern = node_pattern_for_shape_id(feed.shapes, shape_id)
     # WranglerLogger.debug(f"Existing pattern: {existing_pattern}")
     # WranglerLogger.debug(f"Existing routing: {existing_routing}")
     # WranglerLogger.debug(f"Set routing: {set_routing}")
@@ -323,9 +326,59 @@ def _consistent_routing(
     return bool(same_route)
 
 
+def _changed_pattern_segments(
+    shape_ids: list[str],
+    shapes_by_id: dict[str, DataFrame[WranglerShapesTable]],
+    set_routing: list[int],
+    existing_routing: list[int],
+    road_net: RoadwayNetwork,
+    project_name: Optional[str] = None,
+) -> list[tuple]:
+    """Interns shapes by node pattern and creates the new segment for each pattern with a change.
+
+    Args:
+        shape_ids: shape ids to update
+        shapes_by_id: shape records for each of shape_ids sorted by shape_pt_sequence, which
+            are empty if the shape_id isn't in the shapes table
+        set_routing: routing to set as a list of model_node_ids
+        existing_routing: existing routing extents to replace as a list of model_node_ids
+        road_net: Reference roadway network to make sure shapes follow real links
+        project_name: Name of the project. Defaults to None.
+
+    Returns:
+        list of the shape ids with each changed pattern, the new segment shape records, and the
+            positions of existing shape records to keep before and after the segment, which are
+            None if the whole shape is replaced.
+    """
+    pattern_shape_ids: dict[tuple, list[str]] = {}
+    for shape_id in shape_ids:
+        pattern = tuple(shapes_by_id[shape_id]["shape_model_node_id"])
+        pattern_shape_ids.setdefault(pattern, []).append(shape_id)
+    WranglerLogger.debug(f"Found {len(pattern_shape_ids)} unique shape node patterns.")
+
+    pattern_segments = []
+    for pattern, pattern_ids in pattern_shape_ids.items():
+        # ----- Don't need a new shape if its only the stops that change -----
+        if _consistent_routing(list(pattern), existing_routing, set_routing):
+            WranglerLogger.debug(f"No routing change for shape_ids: {pattern_ids}")
+            continue
+
+        # If "existing" is specified, replace only that segment else, replace the whole thing
+        segment_routing, before_pos, after_pos = set_routing, None, None
+        if existing_routing:
+            segment_routing, before_pos, after_pos = _shape_segment_positions(
+                existing_routing, shapes_by_id[pattern_ids[0]], set_routing
+            )
+        segment_shapes_df = _create_shapes(
+            segment_routing, pattern_ids[0], road_net, project_name=project_name
+        )
+        pattern_segments.append((pattern_ids, segment_shapes_df, before_pos, after_pos))
+    return pattern_segments
+
+
 def _update_shapes_and_trips(
     feed: Feed,
-    shape_id: str,
+    shape_ids: list[str],
     trip_ids: list[str],
     routing_set: list[int],
     shape_id_scalar: int,
@@ -335,9 +388,15 @@ def _update_shapes_and_trips(
 ) -> tuple[DataFrame[WranglerShapesTable], DataFrame[WranglerTripsTable]]:
     """Update shapes and trips for transit routing change.
 
+    Shapes with identical node patterns are interned so that the routing change is only
+    calculated once per unique pattern and then spliced into each shape with that pattern.
+
+    If a shape is also used by trips which are not in trip_ids, the updated shape is added with
+    a new shape_id for the selected trips and the existing shape is left as-is.
+
     Args:
         feed: feed we are updating
-        shape_id : shape id to update
+        shape_ids : shape ids to update
         trip_ids: selected trip_ids to update
         routing_set: routing extents to replace as a list of model_node_ids
         routing_existing: existing routing extents to replace as a list of model_node_ids
@@ -348,47 +407,80 @@ def _update_shapes_and_trips(
     Returns:
         Updated shapes and trips dataframes
     """
-    WranglerLogger.debug(f"Updating shapes and trips for shape_id: {shape_id}")
+    WranglerLogger.debug(f"Updating shapes and trips for {len(shape_ids)} shape_ids.")
     if routing_existing is None:
         routing_existing = []
     set_routing = [int(abs(int(i))) for i in routing_set]
     existing_routing = [int(abs(int(i))) for i in routing_existing]
 
-    # ----- Don't need a new shape if its only the stops that change -----
-    if _consistent_routing(feed, shape_id, existing_routing, set_routing):
-        WranglerLogger.debug("No routing change, returning shapes and trips as-is.")
-        return feed.shapes, feed.trips
-
-    # --- Create new shape if `shape_id` is used by trips that are not in selected trip_ids --
-    all_trips_using_shape_id = set(trip_ids_for_shape_id(feed.trips, shape_id))
-    sel_trips_using_shape_id = set(trip_ids) & all_trips_using_shape_id
-    if sel_trips_using_shape_id != all_trips_using_shape_id:
-        # adds copied shape with new shape_id to feed.shapes + references it in feed.trips
-        feed.shapes, feed.trips, shape_id = _add_new_shape_copy(
-            old_shape_id=shape_id,
-            trip_ids=list(sel_trips_using_shape_id),
-            feed=feed,
-            id_scalar=shape_id_scalar,
-            project_name=project_name,
-        )
+    sel_shapes = feed.shapes.loc[feed.shapes.shape_id.isin(shape_ids)]
+    sel_shapes = sel_shapes.sort_values(by=["shape_id", "shape_pt_sequence"])
+    shapes_by_id = dict(tuple(sel_shapes.groupby("shape_id", sort=False)))
+    shapes_by_id = {i: shapes_by_id.get(i, sel_shapes.iloc[:0]) for i in shape_ids}
 
-    # If "existing" is specified, replace only that segment else, replace the whole thing
-    if existing_routing:
-        this_shape = _replace_shapes_segment(
-            existing_routing, shape_id, set_routing, feed, road_net, project_name=project_name
+    sel_trips = feed.trips.loc[feed.trips.shape_id.isin(shape_ids)]
+    trips_by_shape_id = sel_trips.groupby("shape_id")["trip_id"].agg(set).to_dict()
+    existing_shape_ids = pd.Series(feed.shapes["shape_id"].unique())
+    new_shape_id_by_trip: dict[str, str] = {}
+    replaced_shape_ids, updated_shapes = [], []
+
+    for pattern_ids, segment_shapes_df, before_pos, after_pos in _changed_pattern_segments(
+        shape_ids,
+        shapes_by_id,
+        set_routing,
+        existing_routing,
+        road_net,
+        project_name=project_name,
+    ):
+        for shape_id in pattern_ids:
+            existing_shape_df = shapes_by_id[shape_id]
+            updated_shape_id = shape_id
+            # --- Create new shape if `shape_id` is used by trips that aren't selected ---
+            all_trips_using_shape_id = trips_by_shape_id.get(shape_id, set())
+            sel_trips_using_shape_id = all_trips_using_shape_id & set(trip_ids)
+            if sel_trips_using_shape_id != all_trips_using_shape_id:
+                new_shape_id = generate_new_id_from_existing(
+                    shape_id, existing_shape_ids, shape_id_scalar
+                )
+                WranglerLogger.debug(f"Adding new shape_id {new_shape_id} copied from {shape_id}")
+                existing_shape_ids = pd.concat(
+                    [existing_shape_ids, pd.Series([new_shape_id])], ignore_index=True
+                )
+                new_shape_id_by_trip.update(dict.fromkeys(sel_trips_using_shape_id, new_shape_id))
+                existing_shape_df = existing_shape_df.assign(shape_id=new_shape_id)
+                if project_name is not None:
+                    existing_shape_df["projects"] = f"{project_name},"
+                updated_shape_id = new_shape_id
+            else:
+                replaced_shape_ids.append(shape_id)
+
+            this_segment_df = segment_shapes_df.assign(shape_id=updated_shape_id)
+            if existing_routing:
+                this_shape = _splice_shape_segment(
+                    existing_shape_df, before_pos, this_segment_df, after_pos
+                )
+            else:
+                this_shape = this_segment_df
+            updated_shapes.append(this_shape)
+
+    # Add updated shapes back into shapes
+    shapes = feed.shapes
+    if updated_shapes:
+        unselected_shapes = shapes.loc[~shapes.shape_id.isin(replaced_shape_ids)]
+        shapes = concat_with_attr(
+            [unselected_shapes, *updated_shapes],
+            ignore_index=True,
+            sort=False,
         )
-    else:
-        this_shape = _create_shapes(set_routing, shape_id, road_net, project_name=project_name)
 
-    # Add rows back into shapes
-    unselected_shapes = feed.shapes[feed.shapes.shape_id != shape_id]
-    feed.shapes = concat_with_attr(
-        [unselected_shapes, this_shape],
-        ignore_index=True,
-        sort=False,
-    )
+    # Point selected trips at copied shapes
+    trips = feed.trips
+    if new_shape_id_by_trip:
+        trips = copy_on_write(trips, ["shape_id"])
+        new_shape_ids = trips["trip_id"].map(new_shape_id_by_trip)
+        trips.loc[new_shape_ids.notna(), "shape_id"] = new_shape_ids.dropna()
 
-    return feed.shapes, feed.trips
+    return shapes, trips
 
 
 def _update_stops(
@@ -470,27 +562,27 @@ def _deletion_candidates(routing_set: list[int]) -> list[int]:
     return deletion_candidate_nodes
 
 
-def _update_stop_times_for_trip(
+def _update_trip_stop_times(
     feed: Feed,
     trip_id: str,
+    this_trip_stop_times: DataFrame[WranglerStopTimesTable],
     routing_set: list[int],
     routing_existing: list[int],
     project_name: Optional[str] = None,
 ) -> DataFrame[WranglerStopTimesTable]:
-    """Update stop_times for a specific trip with new stop_times.
+    """Returns updated stop_times for a specific trip given its existing stop_times.
 
     Args:
         feed: Feed object
         trip_id: trip_id to update
+        this_trip_stop_times: existing stop_times for trip_id sorted by stop_sequence
         routing_set: List of model_node_ids to be stops
         routing_existing: List of model_node_ids to replace
         project_name: Name of the project. Defaults to None.
 
     Returns:
-        WranglerStopTimesTable: Updated stop_times.txt
+        WranglerStopTimesTable: Updated stop_times for trip_id
     """
-    WranglerLogger.debug(f"Updating stop times for trip: {trip_id}")
-
     existing_stops_nodes = [int(i) for i in routing_existing]
     set_stops_nodes = [int(i) for i in routing_set if int(i) > 0]
     del_stops_nodes = _deletion_candidates(routing_set)
@@ -499,12 +591,11 @@ def _update_stop_times_for_trip(
     # WranglerLogger.debug(f"Delete stops: {del_stops_nodes}")
 
     # --------------- replace segment, delete stops, or replace whole thing ---------------
-    this_trip_stop_times = stop_times_for_trip_id(feed.stop_times, trip_id)
-
     if existing_stops_nodes and set_stops_nodes:
         this_trip_stop_times = _replace_stop_times_segment_for_trip(
             existing_stops_nodes,
             trip_id,
+            this_trip_stop_times,
             set_stops_nodes,
             feed,
             project_name=project_name,
@@ -520,27 +611,122 @@ def _update_stop_times_for_trip(
         this_trip_stop_times = _create_stop_times(
             set_stops_nodes, trip_id, project_name=project_name
         )
+    return this_trip_stop_times
+
+
+def _update_stop_times_for_trips(
+    feed: Feed,
+    trip_ids: list[str],
+    routing_set: list[int],
+    routing_existing: list[int],
+    project_name: Optional[str] = None,
+) -> DataFrame[WranglerStopTimesTable]:
+    """Update stop_times for a list of trips with new stop_times.
+
+    Trips which share a shape and stop pattern get the same update, so the update is only
+    calculated for the first trip of each of those groups and then spliced into the rest of the
+    trips in the group by position.
+
+    Args:
+        feed: Feed object
+        trip_ids: trip_ids to update
+        routing_set: List of model_node_ids to be stops
+        routing_existing: List of model_node_ids to replace
+        project_name: Name of the project. Defaults to None.
+
+    Returns:
+        WranglerStopTimesTable: Updated stop_times.txt with the updated stop_times for trip_ids
+            after the stop_times for the rest of the trips.
+    """
+    WranglerLogger.debug(f"Updating stop times for {len(trip_ids)} trips.")
+    trip_ids = list(dict.fromkeys(trip_ids))
+    sel_mask = feed.stop_times.trip_id.isin(trip_ids)
+    sel_stop_times = feed.stop_times.loc[sel_mask].sort_values(by=["trip_id", "stop_sequence"])
+    # position of each stop_time within its trip so updated records can be matched across trips
+    sel_stop_times["_trip_pos"] = sel_stop_times.groupby("trip_id").cumcount()
+    stop_times_by_trip = dict(tuple(sel_stop_times.groupby("trip_id", sort=False)))
+    no_stop_times = sel_stop_times.iloc[:0]
+
+    shape_id_by_trip = feed.trips.set_index("trip_id")["shape_id"].to_dict()
+    trip_groups: dict[tuple, list[str]] = {}
+    for trip_id in trip_ids:
+        pattern = tuple(stop_times_by_trip.get(trip_id, no_stop_times)["stop_id"])
+        trip_groups.setdefault((shape_id_by_trip.get(trip_id), pattern), []).append(trip_id)
+    WranglerLogger.debug(f"Found {len(trip_groups)} unique shape and stop patterns.")
+
+    updated_stop_times = []
+    for group_trip_ids in trip_groups.values():
+        template_trip_id = group_trip_ids[0]
+        template = _update_trip_stop_times(
+            feed,
+            template_trip_id,
+            stop_times_by_trip.get(template_trip_id, no_stop_times),
+            routing_set,
+            routing_existing,
+            project_name=project_name,
+        ).reset_index(drop=True)
+        updated_stop_times.append(
+            _splice_template_stop_times(template, group_trip_ids, sel_stop_times)
+        )
+
+    trip_order = {trip_id: i for i, trip_id in enumerate(trip_ids)}
+    updated_sel_stop_times = concat_with_attr(updated_stop_times, ignore_index=True, sort=False)
+    updated_sel_stop_times["_trip_order"] = updated_sel_stop_times.trip_id.map(trip_order)
+    updated_sel_stop_times = updated_sel_stop_times.sort_values(by=["_trip_order", "_out_pos"])
+    updated_sel_stop_times = updated_sel_stop_times.drop(
+        columns=["_trip_order", "_trip_pos", "_out_pos"], errors="ignore"
+    )
 
-    # --------------- Replace stop_times for this trip with updated stop times ---------------
-    stop_times_not_this_trip = feed.stop_times[feed.stop_times.trip_id != trip_id]
     stop_times = concat_with_attr(
-        [stop_times_not_this_trip, this_trip_stop_times],
+        [feed.stop_times.loc[~sel_mask], updated_sel_stop_times],
         ignore_index=True,
         sort=False,
     )
-    _show_col = [
-        "trip_id",
-        "stop_id",
-        "stop_sequence",
-        "departure_time",
-        "arrival_time",
-    ]
-    msg = f"ST for trip: {stop_times.loc[stop_times.trip_id == trip_id, _show_col]}"
-    # WranglerLogger.debug(msg)
-
     return stop_times
 
 
+def _splice_template_stop_times(
+    template: DataFrame[WranglerStopTimesTable],
+    trip_ids: list[str],
+    sel_stop_times: DataFrame[WranglerStopTimesTable],
+) -> DataFrame[WranglerStopTimesTable]:
+    """Apply updated stop_times for one trip to other trips with the same stop pattern.
+
+    Args:
+        template: updated stop_times for a trip in trip_ids where records retained from the
+            trip's existing stop_times have their position in `_trip_pos` and new records have NA.
+        trip_ids: trip_ids with the same existing stop pattern as the template trip.
+        sel_stop_times: existing stop_times for at least trip_ids with `_trip_pos` of each record.
+
+    Returns:
+        Updated stop_times for trip_ids with `_out_pos` of each record in the updated trip.
+    """
+    if "_trip_pos" not in template.columns:
+        template = template.assign(_trip_pos=np.nan)
+    is_new = template["_trip_pos"].isna().to_numpy()
+    kept_template = pd.DataFrame(
+        {
+            "_trip_pos": template.loc[~is_new, "_trip_pos"].astype(int).to_numpy(),
+            "_out_pos": np.flatnonzero(~is_new),
+            "_new_stop_sequence": template.loc[~is_new, "stop_sequence"].to_numpy(),
+        }
+    )
+    kept_stop_times = sel_stop_times.loc[sel_stop_times.trip_id.isin(trip_ids)]
+    kept_stop_times = kept_stop_times.merge(kept_template, on="_trip_pos", how="inner")
+    kept_stop_times["stop_sequence"] = kept_stop_times.pop("_new_stop_sequence")
+
+    new_template = template.loc[is_new]
+    new_stop_times = new_template.iloc[np.tile(np.arange(len(new_template)), len(trip_ids))]
+    new_stop_times = new_stop_times.assign(
+        trip_id=np.repeat(trip_ids, len(new_template)),
+        _out_pos=np.tile(np.flatnonzero(is_new), len(trip_ids)),
+    )
+    dfs = [df for df in [kept_stop_times, new_stop_times] if not df.empty]
+    if not dfs:
+        return template.assign(_out_pos=pd.Series(dtype=int))
+    return concat_with_attr(dfs, ignore_index=True, sort=False)
+
+
 def apply_transit_routing_change(
     net: TransitNetwork,
     selection: TransitSelection,
@@ -571,12 +757,9 @@ def apply_transit_routing_change(
     WranglerLogger.debug(f"...routing: {routing_change}")
 
     # ---- Secure all inputs needed --------------
-    updated_feed = copy.deepcopy(net.feed)
+    # copy-on-write so that net.feed is unchanged if the routing change fails
+    updated_feed = copy.copy(net.feed)
     trip_ids = selection.selected_trips
-    if project_name:
-        updated_feed.trips.loc[updated_feed.trips.trip_id.isin(trip_ids), "projects"] += (
-            f"{project_name},"
-        )
 
     road_net = net.road_net if reference_road_net is None else reference_road_net
     if road_net is None:
@@ -588,13 +771,19 @@ def apply_transit_routing_change(
         msg = "Must have a reference road network set in order to update transit routing."
         raise TransitRoutingChangeError(msg)
 
-    # ---- update each shape that is used by selected trips to use new routing -------
-    shape_ids = shape_ids_for_trip_ids(updated_feed.trips, trip_ids)
-    # WranglerLogger.debug(f"shape_ids: {shape_ids}")
-    for shape_id in shape_ids:
+    # fks are checked once after all of the tables are updated
+    with updated_feed.batch_update():
+        if project_name:
+            trips = copy_on_write(updated_feed.trips, ["projects"])
+            trips.loc[trips.trip_id.isin(trip_ids), "projects"] += f"{project_name},"
+            updated_feed.trips = trips
+
+        # ---- update each shape that is used by selected trips to use new routing -------
+        shape_ids = shape_ids_for_trip_ids(updated_feed.trips, trip_ids)
+        # WranglerLogger.debug(f"shape_ids: {shape_ids}")
         updated_feed.shapes, updated_feed.trips = _update_shapes_and_trips(
             updated_feed,
-            shape_id,
+            shape_ids,
             trip_ids,
             routing_change["set"],
             net.config.IDS.TRANSIT_SHAPE_ID_SCALAR,
@@ -602,18 +791,17 @@ def apply_transit_routing_change(
             routing_existing=routing_change.get("existing", []),
             project_name=project_name,
         )
-    # WranglerLogger.debug(f"updated_feed.shapes: \n{updated_feed.shapes}")
-    # WranglerLogger.debug(f"updated_feed.trips: \n{updated_feed.trips}")
-    # ---- Check if any stops need adding to stops.txt and add if they do ----------
-    updated_feed.stops = _update_stops(
-        updated_feed, routing_change["set"], road_net, project_name=project_name
-    )
-    # WranglerLogger.debug(f"updated_feed.stops: \n{updated_feed.stops}")
-    # ---- Update stop_times --------------------------------------------------------
-    for trip_id in trip_ids:
-        updated_feed.stop_times = _update_stop_times_for_trip(
+        # WranglerLogger.debug(f"updated_feed.shapes: \n{updated_feed.shapes}")
+        # WranglerLogger.debug(f"updated_feed.trips: \n{updated_feed.trips}")
+        # ---- Check if any stops need adding to stops.txt and add if they do ----------
+        updated_feed.stops = _update_stops(
+            updated_feed, routing_change["set"], road_net, project_name=project_name
+        )
+        # WranglerLogger.debug(f"updated_feed.stops: \n{updated_feed.stops}")
+        # ---- Update stop_times --------------------------------------------------------
+        updated_feed.stop_times = _update_stop_times_for_trips(
             updated_feed,
-            trip_id,
+            trip_ids,
             routing_change["set"],
             routing_change.get("existing", []),
         )
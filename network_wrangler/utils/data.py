@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
+import re
+import weakref
 from collections.abc import Mapping
 from typing import Any, Optional, Union
 
@@ -381,11 +384,12 @@ def segment_data_by_selection(
     Returns:
         tuple: data broken out by beofore, selected segment, and after.
     """
-    ref_data = data
     if isinstance(data, pd.DataFrame):
-        ref_data = data[field].tolist()
+        ref_data = data[field].to_numpy()
     elif isinstance(data, pd.Series):
-        ref_data = data.tolist()
+        ref_data = data.to_numpy()
+    else:
+        ref_data = np.asarray(data, dtype=object)
 
     # ------- Replace "to the end" indicators with first or last value --------
     start_item, end_item = item_list[0], item_list[-1]
@@ -395,8 +399,8 @@ def segment_data_by_selection(
         end_item = ref_data[-1]
 
     # --------Find the start and end indices -----------------------------------
-    start_idxs = list({i for i, item in enumerate(ref_data) if item == start_item})
-    if not start_idxs:
+    start_idxs = np.flatnonzero(ref_data == start_item)
+    if not len(start_idxs):
         msg = f"Segment start item: {start_item} not in data."
         raise DataSegmentationError(msg)
     if len(start_idxs) > 1:
@@ -404,12 +408,12 @@ def segment_data_by_selection(
             f"Found multiple starting locations for data segment: {start_item}.\
                                 Choosing first ... largest segment being selected."
         )
-    start_idx = min(start_idxs)
+    start_idx = int(start_idxs[0])
 
     # find the end node starting from the start index.
-    end_idxs = [i + start_idx for i, item in enumerate(ref_data[start_idx:]) if item == end_item]
+    end_idxs = np.flatnonzero(ref_data[start_idx:] == end_item) + start_idx
     # WranglerLogger.debug(f"End indexes: {end_idxs}")
-    if not end_idxs:
+    if not len(end_idxs):
         msg = f"Segment end item: {end_item} not in data after starting idx."
         raise DataSegmentationError(msg)
     if len(end_idxs) > 1:
@@ -417,7 +421,7 @@ def segment_data_by_selection(
             f"Found multiple ending locations for data segment: {end_item}.\
                                 Choosing last ... largest segment being selected."
         )
-    end_idx = max(end_idxs) + 1
+    end_idx = int(end_idxs[-1]) + 1
     # WranglerLogger.debug(
     # f"Segmenting data fr {start_item} idx:{start_idx} to {end_item} idx:{end_idx}.\n{ref_data}")
     # -------- Extract the segments --------------------------------------------
@@ -468,7 +472,7 @@ def segment_data_by_selection_min_overlap(
     field = "i"
     replacements_list = [2,22,33]
 
-    returns:
+    Returns:
         [22,33]
         [1], [2,3,4,5], [6]
 
@@ -694,21 +698,309 @@ def dict_fields_in_df(d: dict, df: pd.DataFrame) -> bool:
     return True
 
 
+def copy_on_write(
+    df: pd.DataFrame, columns: Optional[list[str]] = None, rows: Optional[list] = None
+) -> pd.DataFrame:
+    """Copy of df which shares data with df except for `columns`, which can be written to.
+
+    Columns not in `columns` are shared with df until they are set as a whole (e.g.
+    `df_copy["col"] = values`), so they can't be edited in place (e.g. with `.loc`). With
+    pandas >= 3 (or with its copy-on-write mode enabled) pandas copies them on the first write
+    instead. Otherwise their numpy data is made read-only in the copy so that an edit in place
+    raises a ValueError rather than changing df; columns backed by extension arrays (e.g.
+    geometry) can't be protected this way. Columns that aren't in df yet can be added freely.
+
+    If df has been validated, its validation record is carried over to the copy with `rows` and
+    `columns` recorded as modified so that incremental validation only has to re-validate them.
+
+    Args:
+        df: DataFrame to copy.
+        columns: columns that will be edited in place in the copy. Defaults to None.
+        rows: index of the rows that will be edited. Defaults to None, meaning any row.
+    """
+    cow_df = _shallow_copy(df, columns)
+    if columns:
+        mark_modified_for_validation(cow_df, rows=rows, columns=columns, validated_df=df)
+    return cow_df
+
+
+def _pandas_copy_on_write() -> bool:
+    """True if pandas copies data shared between DataFrames the first time it is written to."""
+    if int(pd.__version__.split(".")[0]) >= 3:  # noqa: PLR2004
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _shallow_copy(df: pd.DataFrame, columns: Optional[list[str]] = None) -> pd.DataFrame:
+    """Copy of df which shares its data except for `columns`, see `copy_on_write`."""
+    df_copy = df.copy(deep=False)
+    for col in columns or []:
+        if col in df_copy.columns:
+            df_copy[col] = df_copy[col].copy()
+    if _pandas_copy_on_write():
+        return df_copy
+    _shared = {id(blk.values) for blk in df._mgr.blocks}
+    for blk in df_copy._mgr.blocks:
+        if isinstance(blk.values, np.ndarray) and id(blk.values) in _shared:
+            # a read-only view doesn't change whether df itself can be written to
+            values = blk.values.view()
+            values.flags.writeable = False
+            blk.values = values
+    return df_copy
+
+
+"""Key in DataFrame.attrs for the record of when and how a DataFrame was last validated."""
+VALIDATION_ATTR = "validation"
+
+_VALIDATION_TOKENS = itertools.count(1)
+
+"""Weak reference to the DataFrame each validation record was set on, keyed by its token."""
+_VALIDATED_DFS: dict[int, weakref.ref] = {}
+
+
+def validation_stamp(df: pd.DataFrame) -> Optional[dict]:
+    """Record of when and how df was last validated, or None if it wasn't.
+
+    pandas carries attrs over to copies, slices and concatenations of df, which may no longer
+    be valid, so the record is only returned for the DataFrame it was set on.
+    """
+    stamp = df.attrs.get(VALIDATION_ATTR)
+    if not stamp:
+        return None
+    _ref = _VALIDATED_DFS.get(stamp.get("token"))
+    if _ref is None or _ref() is not df:
+        return None
+    return stamp
+
+
+def set_validation_stamp(df: pd.DataFrame, stamp: dict) -> pd.DataFrame:
+    """Sets the record of when and how df was last validated, which only applies to df itself."""
+    token = next(_VALIDATION_TOKENS)
+    _VALIDATED_DFS[token] = weakref.ref(df, lambda _: _VALIDATED_DFS.pop(token, None))
+    # attrs may be shared with the df this was copied from, so replace rather than update them
+    df.attrs = {**df.attrs, VALIDATION_ATTR: {**stamp, "token": token}}
+    return df
+
+
+def mark_modified_for_validation(
+    df: pd.DataFrame,
+    rows: Optional[list] = None,
+    columns: Optional[list[str]] = None,
+    validated_df: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Records rows and columns of a validated df which were modified since it was validated.
+
+    Used by incremental validation to only re-validate what was modified. Calling this also
+    vouches that rows which were added or removed since df was validated are in `rows`, so
+    the number of records in df is updated. Does nothing if df hasn't been validated.
+
+    Args:
+        df: DataFrame which was modified. Its attrs are updated.
+        rows: index of rows which were modified or added. Defaults to None, meaning all rows.
+        columns: columns which were modified or added. Defaults to None, meaning all columns.
+        validated_df: validated DataFrame which df was created from, i.e. by concatenating
+            records to it, whose validation record is carried over to df. Defaults to df.
+    """
+    stamp = validation_stamp(df if validated_df is None else validated_df)
+    if not stamp:
+        return df
+    stamp = dict(stamp)
+    if rows is None or stamp["modified_rows"] is None:
+        stamp["modified_rows"] = None
+    else:
+        _rows = pd.Index(rows).tolist()
+        stamp["modified_rows"] = list(dict.fromkeys([*stamp["modified_rows"], *_rows]))
+    _columns = df.columns if columns is None else columns
+    stamp["modified_columns"] = list(dict.fromkeys([*stamp["modified_columns"], *_columns]))
+    stamp["n_rows"] = len(df)
+    return set_validation_stamp(df, stamp)
+
+
+PREDICATE_OPS: dict[str, Any] = {
+    "==": lambda s, v: s == v,
+    "=": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    ">": lambda s, v: s > v,
+    "<=": lambda s, v: s <= v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+"""Operators allowed in predicates for `filter_df_to_predicates`, same as pyarrow filters."""
+
+
+def filter_df_to_predicates(df: pd.DataFrame, filters: Optional[list]) -> pd.DataFrame:
+    """Filter df to records matching predicates in the same form as pyarrow parquet filters.
+
+    Used so that tables which can't push filters down to the reader (i.e. json or geojson) or
+    which are read in batches are filtered the same way as parquet reads.
+
+    Args:
+        df: dataframe to filter.
+        filters: list of `(column, op, value)` tuples which must all be true, or a list of
+            such lists where any must be true. Ops are the keys of `PREDICATE_OPS`.
+            If None or empty, df is returned as is.
+    """
+    if not filters:
+        return df
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+
+    mask = np.zeros(len(df), dtype=bool)
+    for conjunction in filters:
+        _and_mask = np.ones(len(df), dtype=bool)
+        for col, op, val in conjunction:
+            if op not in PREDICATE_OPS:
+                msg = f"Filter op {op} not one of {list(PREDICATE_OPS)}."
+                raise ValueError(msg)
+            if col not in df.columns:
+                msg = f"Filter column {col} not in dataframe columns."
+                raise DataframeSelectionError(msg)
+            _and_mask &= PREDICATE_OPS[op](df[col], val).fillna(False).to_numpy(dtype=bool)
+        mask |= _and_mask
+    return df.loc[mask]
+
+
+def copy_validated(df: pd.DataFrame, deep: bool = True) -> pd.DataFrame:
+    """Copy of df which keeps its validation record because it has the same records.
+
+    Args:
+        df: DataFrame to copy.
+        deep: if True, copies the data of df, otherwise shares it, in which case the copy
+            can't be edited in place, see `copy_on_write`. Defaults to True.
+    """
+    df_copy = df.copy() if deep else _shallow_copy(df)
+    return mark_modified_for_validation(df_copy, rows=[], columns=[], validated_df=df)
+
+
 def concat_with_attr(dfs: list[pd.DataFrame], **kwargs) -> pd.DataFrame:
-    """Concatenate a list of dataframes and retain the attributes of the first dataframe."""
+    """Concatenate a list of dataframes and retain the attributes of the first dataframe.
+
+    Except for the record of when it was validated, which doesn't apply to the concatenation.
+    Use `mark_modified_for_validation` with `validated_df` to carry it over.
+    """
     import copy
 
     if not dfs:
         msg = "No dataframes to concatenate."
         raise ValueError(msg)
-    attrs = copy.deepcopy(dfs[0].attrs)
+    attrs = copy.deepcopy({k: v for k, v in dfs[0].attrs.items() if k != VALIDATION_ATTR})
     df = pd.concat(dfs, **kwargs)
     df.attrs = attrs
     return df
 
 
+"""Pattern used to split string values into normalized (lower case) tokens."""
+TOKEN_PATTERN = r"[a-z0-9]+"
+
+_REGEX_SPECIAL_CHARS = set(r".^$*+?{}[]\|()")
+
+
+def _tokenize(value: str) -> list[str]:
+    return re.findall(TOKEN_PATTERN, value.lower())
+
+
+class TokenIndex:
+    """Inverted index from normalized tokens in string columns to dataframe index labels.
+
+    Used to narrow down which rows could contain a substring before doing a full
+    `str.contains`, so that looking up a name is a few dictionary hits rather than a scan of the
+    whole table. Candidates are a superset of the matching rows: a row is a candidate for a
+    value if every token in the value is part of a token in the row.
+
+    Usage:
+
+    ```
+    name_index = TokenIndex(links_df, ["name", "ref"])
+    candidate_idx = name_index.candidates("name", "6th St")
+    ```
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list[str]):
+        """Constructor for TokenIndex.
+
+        Args:
+            df: dataframe to index.
+            columns: columns with string values to index. Columns not in df are skipped.
+        """
+        self._index: dict[str, dict[str, np.ndarray]] = {}
+        self._token_matches: dict[tuple[str, str], np.ndarray] = {}
+        self._label_dtype = df.index.dtype
+        for col in columns:
+            if col not in df.columns:
+                continue
+            _tokens = df[col].dropna().astype(str).str.lower().str.findall(TOKEN_PATTERN)
+            _tokens = _tokens.explode().dropna()
+            self._index[col] = {
+                token: labels.to_numpy()
+                for token, labels in _tokens.index.groupby(_tokens.to_numpy()).items()
+            }
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns which are indexed."""
+        return list(self._index)
+
+    def _token_candidates(self, col: str, query_token: str) -> np.ndarray:
+        """Labels of rows with a token in col which contains query_token."""
+        key = (col, query_token)
+        if key not in self._token_matches:
+            _labels = [v for k, v in self._index[col].items() if query_token in k]
+            self._token_matches[key] = (
+                np.unique(np.concatenate(_labels))
+                if _labels
+                else np.array([], dtype=self._label_dtype)
+            )
+        return self._token_matches[key]
+
+    def candidates(self, col: str, value: Any) -> Optional[np.ndarray]:
+        """Labels of rows which could contain value as a substring in col.
+
+        Returns None if the index can't be used for col and value, e.g. because col isn't
+        indexed or the value isn't a string, has no tokens or contains regex special characters.
+        """
+        if col not in self._index or not isinstance(value, str):
+            return None
+        if _REGEX_SPECIAL_CHARS.intersection(value):
+            return None
+        query_tokens = _tokenize(value)
+        if not query_tokens:
+            return None
+        _candidates = self._token_candidates(col, query_tokens[0])
+        for query_token in query_tokens[1:]:
+            _candidates = np.intersect1d(_candidates, self._token_candidates(col, query_token))
+        return _candidates
+
+    def candidates_for_selection(self, selection_dict: Mapping[str, Any]) -> Optional[np.ndarray]:
+        """Labels of rows which could match all indexed fields of a selection dictionary.
+
+        Returns None if none of the fields can use the index.
+
+        Args:
+            selection_dict: dictionary of `<column>: <value or list of values>` where a list
+                means any of the values.
+        """
+        _candidates = None
+        for col, vals in selection_dict.items():
+            vals_list = vals if isinstance(vals, list) else [vals]
+            _col_candidates = [self.candidates(col, v) for v in vals_list]
+            if not _col_candidates or any(c is None for c in _col_candidates):
+                continue
+            _col_candidates = np.unique(np.concatenate(_col_candidates))
+            if _candidates is None:
+                _candidates = _col_candidates
+            else:
+                _candidates = np.intersect1d(_candidates, _col_candidates)
+        return _candidates
+
+
 def isin_dict(
-    df: pd.DataFrame, d: dict, ignore_missing: bool = True, strict_str: bool = False
+    df: pd.DataFrame,
+    d: dict,
+    ignore_missing: bool = True,
+    strict_str: bool = False,
+    token_index: Optional[TokenIndex] = None,
 ) -> pd.DataFrame:
     """Filter the dataframe using a dictionary - faster than using isin.
 
@@ -721,6 +1013,8 @@ def isin_dict(
         strict_str: if True, will not allow partial string matches and will force case-matching.
             Defaults to False. If False, will be overridden if key is in STRICT_MATCH_FIELDS or if
             ignore_missing is False.
+        token_index: optional TokenIndex of df used to narrow down the rows searched for
+            partial string matches.
     """
     sel_links_mask = np.zeros(len(df), dtype=bool)
     missing = {}
@@ -738,6 +1032,10 @@ def isin_dict(
 
         if isinstance(vals_list[0], str) and not _strict_str:
             vals_list = [val.lower() for val in vals_list]
+            if token_index is not None:
+                _candidates = token_index.candidates_for_selection({col: vals_list})
+                if _candidates is not None:
+                    _df = df.loc[df.index.isin(_candidates), [col]].reset_index(names=index_name)
             _df[col] = _df[col].str.lower()
 
             # Use str.contains for partial matching
@@ -1,12 +1,17 @@
 """Dataframe accessors that allow functions to be called directly on the dataframe."""
 
 import hashlib
+import re
+import weakref
+from collections.abc import Hashable
+from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..errors import SelectionError
 from ..logger import WranglerLogger
-from .data import dict_to_query, isin_dict
+from .data import TokenIndex, isin_dict
 
 
 @pd.api.extensions.register_dataframe_accessor("dict_query")
@@ -26,20 +31,51 @@ class DictQueryAccessor:
     selected_links_df = links_df.dict_query(selection_dict)
     ```
 
+    Selections are evaluated as boolean masks rather than with `DataFrame.query`:
+
+    - string values match rows containing the value (as a regular expression).
+    - other values match rows equal to the value.
+    - list values match rows matching any of the values in the list.
+    - cells which hold lists (e.g. `name` for some OSM links) match if any of their items match.
+    - masks for each field are combined so that rows must match all of the fields.
+
+    Object columns are factorized and each value is only tested against the unique values in
+    the column. Factorizations and unique-value masks are re-used by repeated selections
+    against the same dataframe which pass the same table `version`, e.g.
+    `RoadwayNetwork.versions["links"]`. Selections without a version re-factorize the columns
+    they use.
     """
 
     def __init__(self, pandas_obj):
         """Initialization function for the dictionary query accessor."""
         self._obj = pandas_obj
+        self._factorizations: dict[str, tuple[np.ndarray, pd.Index]] = {}
+        self._unique_masks: dict[tuple, np.ndarray] = {}
 
-    def __call__(self, selection_dict: dict, return_all_if_none: bool = False):
+    def __call__(
+        self,
+        selection_dict: dict,
+        return_all_if_none: bool = False,
+        token_index: Optional[TokenIndex] = None,
+        version: Optional[Hashable] = None,
+    ):
         """Queries the dataframe using the selection dictionary.
 
         Args:
             selection_dict (dict): _description_
             return_all_if_none (bool, optional): If True, will return entire df if dict has
                  no values. Defaults to False.
+            token_index: optional TokenIndex of the dataframe (or a dataframe it is a subset of)
+                used to narrow down the rows to query for string values.
+            version: optional version of the table the dataframe was selected from. Column
+                factorizations are only re-used between selections with the same version.
         """
+        # pandas < 3 caches the accessor on the dataframe, which may be edited in place between
+        # selections, so only re-use factorizations between selections with the same version.
+        if version is None:
+            self._factorizations, self._unique_masks = {}, {}
+        else:
+            self._factorizations, self._unique_masks = _query_cache(self._obj, version)
         _not_selection_keys = ["modes", "all", "ignore_missing"]
         _selection_dict = {
             k: v
@@ -57,9 +93,18 @@ class DictQueryAccessor:
             msg = f"Relevant part of selection dictionary is empty: {selection_dict}"
             raise SelectionError(msg)
 
-        _sel_query = dict_to_query(_selection_dict)
-        # WranglerLogger.debug(f"_sel_query: \n   {_sel_query}")
-        _df = self._obj.query(_sel_query, engine="python")
+        _rows = np.arange(len(self._obj))
+        if token_index is not None:
+            _candidates = token_index.candidates_for_selection(_selection_dict)
+            if _candidates is not None:
+                _rows = np.flatnonzero(self._obj.index.isin(_candidates))
+
+        _mask = np.ones(len(_rows), dtype=bool)
+        for k, v in _selection_dict.items():
+            if not _mask.any():
+                break
+            _mask &= self._field_mask(k, v, _rows)
+        _df = self._obj.iloc[_rows[_mask]]
 
         if len(_df) == 0:
             WranglerLogger.warning(
@@ -68,23 +113,171 @@ class DictQueryAccessor:
             )
         return _df
 
+    def _field_mask(self, field: str, value: Any, rows: np.ndarray) -> np.ndarray:
+        """Boolean mask of `rows` in `field` which match `value` or any value in a list."""
+        _values = _flatten_selection_values(value)
+        _col = self._obj[field]
+        _any_str = any(isinstance(v, str) for v in _values)
+        if not _any_str and _col.dtype != object:
+            return _col.iloc[rows].isin(_values).to_numpy()
+
+        _codes, _uniques = self._factorize(field)
+        _uniques_mask = np.zeros(len(_uniques) + 1, dtype=bool)
+        for v in _values:
+            _uniques_mask[:-1] |= self._unique_mask(field, _uniques, v)
+        # codes of -1 are missing values which pick up the trailing False
+        return _uniques_mask[_codes[rows]]
+
+    def _factorize(self, field: str) -> tuple[np.ndarray, pd.Index]:
+        """Codes and unique values for `field`, re-using the cached ones for the same version."""
+        _cached = self._factorizations.get(field)
+        if _cached is not None:
+            return _cached
+        _col = self._obj[field]
+        try:
+            _codes, _uniques = pd.factorize(_col)
+        except TypeError:
+            # unhashable list-like cells
+            _codes, _uniques = pd.factorize(_col.map(_list_like_to_tuple))
+        self._factorizations[field] = (_codes, _uniques)
+        return _codes, _uniques
+
+    def _unique_mask(self, field: str, uniques: pd.Index, value: Any) -> np.ndarray:
+        """Boolean mask of the unique values of `field` which match `value`."""
+        try:
+            _key = (field, type(value), value)
+            hash(_key)
+        except TypeError:
+            return _unique_values_mask(uniques, value)
+        if _key not in self._unique_masks:
+            self._unique_masks[_key] = _unique_values_mask(uniques, value)
+        return self._unique_masks[_key]
+
+
+# Not every pandas version caches accessors on the dataframe, so caches are kept here by id of
+# the dataframe and dropped when it is garbage collected.
+_QUERY_CACHES: dict[int, tuple[Hashable, dict, dict]] = {}
+
+
+def _query_cache(df: pd.DataFrame, version: Hashable) -> tuple[dict, dict]:
+    """Factorization and unique-mask caches of `df` for `version`, emptied if it changed."""
+    _cached = _QUERY_CACHES.get(id(df))
+    if _cached is None:
+        weakref.finalize(df, _QUERY_CACHES.pop, id(df), None)
+    elif _cached[0] == version:
+        return _cached[1], _cached[2]
+    _factorizations: dict = {}
+    _unique_masks: dict = {}
+    _QUERY_CACHES[id(df)] = (version, _factorizations, _unique_masks)
+    return _factorizations, _unique_masks
+
+
+def _flatten_selection_values(value: Any) -> list:
+    if isinstance(value, list):
+        return [i for v in value for i in _flatten_selection_values(v)]
+    return [value]
+
+
+def _list_like_to_tuple(x: Any) -> Any:
+    if isinstance(x, (list, np.ndarray)):
+        return tuple(x)
+    return x
+
+
+def _value_matcher(value: Any) -> Callable[[Any], bool]:
+    """Function returning True if a single (non list-like) cell value matches `value`."""
+    if isinstance(value, str):
+        _pattern = re.compile(value)
+        return lambda x: isinstance(x, str) and _pattern.search(x) is not None
+    return lambda x: not isinstance(x, str) and bool(x == value)
+
+
+def _unique_values_mask(uniques: pd.Index, value: Any) -> np.ndarray:
+    _match = _value_matcher(value)
+
+    def _cell_matches(x: Any) -> bool:
+        if isinstance(x, (list, tuple, np.ndarray)):
+            return any(_match(i) for i in x)
+        return _match(x)
+
+    return np.fromiter((_cell_matches(u) for u in uniques), dtype=bool, count=len(uniques))
+
+
+def _is_geometry_series(s: pd.Series) -> bool:
+    return getattr(s.dtype, "name", None) == "geometry"
+
+
+def _list_like_to_str(x) -> str:
+    if isinstance(x, np.ndarray):
+        x = x.tolist()
+    return repr(x)
+
+
+def hash_series(s: pd.Series) -> str:
+    """Content-exact hash of the values in a series (does not include the index).
+
+    - numeric, bool, string and categorical values are hashed with
+        `pd.util.hash_pandas_object` so that no python-level repr is created.
+    - geometry values are hashed from their WKB representation.
+    - columns with unhashable values such as lists or dicts (e.g. `sc_*` scoped properties)
+        are hashed from the repr of each value.
+
+    Args:
+        s: series to hash.
+
+    Returns: sha1 hexdigest of the series values and dtype.
+    """
+    if _is_geometry_series(s):
+        s = pd.Series(s.to_wkb(), index=s.index)
+    try:
+        _row_hashes = pd.util.hash_pandas_object(s, index=False).to_numpy()
+    except TypeError:
+        _row_hashes = pd.util.hash_pandas_object(s.map(_list_like_to_str), index=False).to_numpy()
+    _hash = hashlib.sha1(str(s.dtype).encode())
+    _hash.update(_row_hashes.tobytes())
+    return _hash.hexdigest()
+
 
 @pd.api.extensions.register_dataframe_accessor("df_hash")
 class dfHash:
-    """Creates a dataframe hash that is compatable with geopandas and various metadata.
+    """Creates a content-exact dataframe hash that is compatable with geopandas.
 
-    Definitely not the fastest, but she seems to work where others have failed.
+    Hashes each column separately (see `hash_series`) along with the index and column names so
+    that any change in any cell is reflected in the hash without building a string
+    representation of the whole dataframe.
+
+    Usage:
+
+    ```
+    links_df.df_hash()
+    links_df.df_hash.column_hashes()
+    ```
     """
 
     def __init__(self, pandas_obj):
         """Initialization function for the dataframe hash."""
         self._obj = pandas_obj
 
-    def __call__(self):
-        """Function to hash the dataframe."""
-        _value = str(self._obj.values).encode()
-        hash = hashlib.sha1(_value).hexdigest()
-        return hash
+    def column_hashes(self, columns: Optional[list[str]] = None) -> dict[str, str]:
+        """Returns a dictionary of `<column>: <hash>` for each column in the dataframe.
+
+        Args:
+            columns: list of columns to hash. Defaults to None, which will hash all columns.
+        """
+        if columns is None:
+            columns = self._obj.columns.tolist()
+        return {c: hash_series(self._obj[c]) for c in columns}
+
+    def __call__(self, columns: Optional[list[str]] = None) -> str:
+        """Function to hash the dataframe.
+
+        Args:
+            columns: list of columns to hash. Defaults to None, which will hash all columns.
+        """
+        _hash = hashlib.sha1(hash_series(self._obj.index.to_series()).encode())
+        for col, col_hash in self.column_hashes(columns).items():
+            _hash.update(f"{col}:{col_hash}".encode())
+        return _hash.hexdigest()
 
 
 @pd.api.extensions.register_dataframe_accessor("isin_dict")
@@ -8,7 +8,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from geographiclib.geodesic import Geodesic
 from pyproj import CRS, Proj, Transformer
 from shapely.geometry import LineString, Point
@@ -121,8 +123,6 @@ def linestring_from_nodes(
     """
     assert "geometry" in nodes_df.columns, "nodes_df must have a 'geometry' column"
 
-    idx_name = "index" if links_df.index.name is None else links_df.index.name
-    # WranglerLogger.debug(f"Index name: {idx_name}")
     required_link_cols = [from_node, to_node]
 
     if not all(col in links_df.columns for col in required_link_cols):
@@ -134,40 +134,22 @@ def linestring_from_nodes(
         msg = "links_df must have columns {required_link_cols} to create linestring from nodes"
         raise ValueError(msg)
 
-    links_geo_df = copy.deepcopy(links_df[required_link_cols])
-    # need to continuously reset the index to make sure the index is the same as the link index
-    links_geo_df = (
-        links_geo_df.reset_index()
-        .merge(
-            nodes_df[[node_pk, "geometry"]],
-            left_on=from_node,
-            right_on=node_pk,
-            how="left",
-        )
-        .set_index(idx_name)
-    )
-
-    links_geo_df = links_geo_df.rename(columns={"geometry": "geometry_A"})
-
-    links_geo_df = (
-        links_geo_df.reset_index()
-        .merge(
-            nodes_df[[node_pk, "geometry"]],
-            left_on=to_node,
-            right_on=node_pk,
-            how="left",
-        )
-        .set_index(idx_name)
-    )
-
-    links_geo_df = links_geo_df.rename(columns={"geometry": "geometry_B"})
+    # look up node coordinates by position rather than merging nodes to links
+    node_ids = pd.Index(nodes_df[node_pk])
+    from_pos = node_ids.get_indexer(links_df[from_node])
+    to_pos = node_ids.get_indexer(links_df[to_node])
+    node_x = shapely.get_x(nodes_df["geometry"].values)
+    node_y = shapely.get_y(nodes_df["geometry"].values)
+    coords = np.full((len(links_df), 2, 2), np.nan)
+    for i, pos in enumerate([from_pos, to_pos]):
+        found = pos >= 0
+        coords[found, i, 0] = node_x[pos[found]]
+        coords[found, i, 1] = node_y[pos[found]]
 
     # makes sure all nodes exist
-    _missing_geo_links_df = links_geo_df[
-        links_geo_df["geometry_A"].isnull() | links_geo_df["geometry_B"].isnull()
-    ]
-    if not _missing_geo_links_df.empty:
-        missing_nodes = _missing_geo_links_df[[from_node, to_node]].values
+    _missing_geo = np.isnan(coords).any(axis=(1, 2))
+    if _missing_geo.any():
+        missing_nodes = links_df.loc[_missing_geo, [from_node, to_node]].values
         WranglerLogger.error(
             f"Cannot create link geometry from nodes because the nodes are\
                              missing from the network. Missing nodes: {missing_nodes}"
@@ -176,13 +158,7 @@ def linestring_from_nodes(
         raise MissingNodesError(msg)
 
     # create geometry from points
-    links_geo_df["geometry"] = links_geo_df.apply(
-        lambda row: LineString([row["geometry_A"], row["geometry_B"]]), axis=1
-    )
-
-    # convert to GeoDataFrame
-    links_gdf = gpd.GeoDataFrame(links_geo_df["geometry"], geometry=links_geo_df["geometry"])
-    return links_gdf["geometry"]
+    return gpd.GeoSeries(shapely.linestrings(coords), index=links_df.index, name="geometry")
 
 
 def linestring_from_lats_lons(df, lat_fields, lon_fields) -> gpd.GeoSeries:
@@ -197,12 +173,9 @@ def linestring_from_lats_lons(df, lat_fields, lon_fields) -> gpd.GeoSeries:
         msg = "lon_fields and lat_fields lists must have the same length"
         raise ValueError(msg)
 
-    line_geometries = gpd.GeoSeries(
-        [
-            LineString([(row[lon], row[lat]) for lon, lat in zip(lon_fields, lat_fields)])
-            for _, row in df.iterrows()
-        ]
-    )
+    lons = df[list(lon_fields)].to_numpy(dtype=float)
+    lats = df[list(lat_fields)].to_numpy(dtype=float)
+    line_geometries = shapely.linestrings(np.stack([lons, lats], axis=-1))
 
     return gpd.GeoSeries(line_geometries)
 
@@ -275,6 +248,77 @@ def update_points_in_linestring(
     return LineString(coords)
 
 
+def update_linestring_vertices(
+    linestrings: Union[gpd.GeoSeries, np.ndarray],
+    geom_pos: np.ndarray,
+    vertex_pos: np.ndarray,
+    xy: np.ndarray,
+) -> np.ndarray:
+    """Returns copies of linestrings with some of their vertices moved to new coordinates.
+
+    Coordinates of all the linestrings are patched in a single array and the linestrings are
+    re-created at once, so cost scales with the number of linestrings given.
+
+    Args:
+        linestrings: linestrings to update.
+        geom_pos: position in linestrings of the linestring to update for each moved vertex.
+        vertex_pos: position of each moved vertex in its linestring. Negative positions count
+            from the end, i.e. -1 is the last vertex.
+        xy: array of shape (len(geom_pos), 2) with the new coordinates of each moved vertex.
+
+    Returns:
+        array of updated linestrings in the same order as linestrings.
+    """
+    linestrings = np.asarray(linestrings, dtype=object)
+    geom_pos = np.asarray(geom_pos, dtype=int)
+    vertex_pos = np.asarray(vertex_pos, dtype=int)
+    coords, coord_geom_pos = shapely.get_coordinates(linestrings, return_index=True)
+    num_coords = shapely.get_num_coordinates(linestrings)
+    first_coord = np.cumsum(num_coords) - num_coords
+    coord_pos = first_coord[geom_pos] + np.where(
+        vertex_pos < 0, num_coords[geom_pos] + vertex_pos, vertex_pos
+    )
+    coords[coord_pos] = xy
+    return shapely.linestrings(coords, indices=coord_geom_pos)
+
+
+def move_linestring_vertices_to_nodes(
+    linestrings: gpd.GeoSeries,
+    vertex_df: pd.DataFrame,
+    nodes_df: gpd.GeoDataFrame,
+    geom_label: str,
+    node_pk: str = "model_node_id",
+) -> gpd.GeoSeries:
+    """Returns the linestrings referenced in vertex_df with vertices moved to their nodes.
+
+    Args:
+        linestrings: GeoSeries of linestrings to update.
+        vertex_df: DataFrame with one record per vertex to move with columns geom_label
+            (linestrings index label), node_pk and `vertex_pos` (position of the vertex in the
+            linestring, where -1 is the last vertex).
+        nodes_df: GeoDataFrame of nodes indexed by node_pk with geometry to move vertices to.
+        geom_label: column in vertex_df with linestrings index labels.
+        node_pk: column in vertex_df with node primary keys. Defaults to "model_node_id".
+
+    Returns:
+        GeoSeries of updated linestrings indexed by label.
+    """
+    labels = pd.Index(pd.unique(vertex_df[geom_label]))
+    node_pos = nodes_df.index.get_indexer(vertex_df[node_pk])
+    if (node_pos < 0).any():
+        missing_nodes = vertex_df.loc[node_pos < 0, node_pk].unique().tolist()
+        msg = f"Cannot move linestring vertices to nodes missing from nodes_df: {missing_nodes}"
+        WranglerLogger.error(msg)
+        raise MissingNodesError(msg)
+    updated_geometry = update_linestring_vertices(
+        linestrings.loc[labels].values,
+        labels.get_indexer(vertex_df[geom_label]),
+        vertex_df["vertex_pos"].to_numpy(),
+        shapely.get_coordinates(nodes_df["geometry"].values[node_pos]),
+    )
+    return gpd.GeoSeries(updated_geometry, index=labels, name="geometry", crs=linestrings.crs)
+
+
 def update_nodes_in_linestring_geometry(
     original_df: gpd.GeoDataFrame,
     updated_nodes_df: gpd.GeoDataFrame,
@@ -288,26 +332,18 @@ def update_nodes_in_linestring_geometry(
         position: position in the linestring to update with the node.
     """
     LINK_FK_NODE = ["A", "B"]
-    original_index = original_df.index
-
-    updated_df = original_df.reset_index().merge(
-        updated_nodes_df[["model_node_id", "geometry"]],
-        left_on=LINK_FK_NODE[position],
-        right_on="model_node_id",
-        suffixes=("", "_node"),
+    node_pos = pd.Index(updated_nodes_df["model_node_id"]).get_indexer(
+        original_df[LINK_FK_NODE[position]]
     )
-
-    updated_df["geometry"] = updated_df.apply(
-        lambda row: update_points_in_linestring(
-            row["geometry"], row["geometry_node"].coords[0], position
-        ),
-        axis=1,
+    found = node_pos >= 0
+    xy = shapely.get_coordinates(updated_nodes_df["geometry"].values[node_pos[found]])
+    updated_geometry = update_linestring_vertices(
+        original_df["geometry"].values[found],
+        np.arange(found.sum()),
+        np.full(found.sum(), position),
+        xy,
     )
-
-    updated_df = updated_df.reset_index().set_index(original_index.names)
-
-    WranglerLogger.debug(f"updated_df - AFTER: \n {updated_df.geometry}")
-    return updated_df["geometry"]
+    return gpd.GeoSeries(updated_geometry, index=original_df.index[found], name="geometry")
 
 
 def get_point_geometry_from_linestring(polyline_geometry, pos: int = 0):
@@ -446,6 +482,83 @@ def get_bounding_polygon(
     return boundary_gs
 
 
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def lon_lat_to_tile_xy(lon, lat, level: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the web mercator tile x and y for arrays of lon/lat at a given zoom level.
+
+    Args:
+        lon: array-like of longitudes in WGS84 degrees.
+        lat: array-like of latitudes in WGS84 degrees.
+        level: zoom level of the tiles, where level 0 is a single tile for the globe.
+    """
+    n_tiles = 2**level
+    lon = np.asarray(lon, dtype=float)
+    lat_rad = np.radians(
+        np.clip(np.asarray(lat, dtype=float), -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT)
+    )
+    x = np.floor((lon + 180.0) / 360.0 * n_tiles)
+    y = np.floor((1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * n_tiles)
+    return (
+        np.clip(x, 0, n_tiles - 1).astype(np.int64),
+        np.clip(y, 0, n_tiles - 1).astype(np.int64),
+    )
+
+
+def tile_xy_to_quadkey(x, y, level: int) -> np.ndarray:
+    """Returns an array of Bing-style quadkey strings for arrays of tile x and y.
+
+    Quadkeys of the same length sort in the order of a Z-order curve and each quadkey is
+    prefixed by the quadkey of the tile containing it at lower zoom levels.
+    """
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    quadkeys = np.full(x.shape, "", dtype=f"<U{max(level, 1)}")
+    for i in range(level, 0, -1):
+        mask = 1 << (i - 1)
+        digit = ((x & mask) != 0).astype(np.int64) + 2 * ((y & mask) != 0).astype(np.int64)
+        quadkeys = np.char.add(quadkeys, digit.astype(str))
+    return quadkeys
+
+
+def lon_lat_to_quadkey(lon, lat, level: int) -> np.ndarray:
+    """Returns an array of quadkeys for the tiles containing arrays of lon/lat at a zoom level."""
+    x, y = lon_lat_to_tile_xy(lon, lat, level)
+    return tile_xy_to_quadkey(x, y, level)
+
+
+def quadkeys_for_geometry(geometry: gpd.GeoSeries, level: int) -> np.ndarray:
+    """Returns the quadkey for the tile containing the center of each geometry's bounding box.
+
+    Args:
+        geometry: GeoSeries. Will be reprojected to WGS84 if it has a different CRS.
+        level: zoom level of the tiles.
+    """
+    if geometry.crs is not None and geometry.crs != LAT_LON_CRS:
+        geometry = geometry.to_crs(LAT_LON_CRS)
+    bounds = shapely.bounds(geometry.values)
+    lon = (bounds[:, 0] + bounds[:, 2]) / 2
+    lat = (bounds[:, 1] + bounds[:, 3]) / 2
+    return lon_lat_to_quadkey(lon, lat, level)
+
+
+def quadkeys_for_bounds(bounds, level: int) -> list[str]:
+    """Returns quadkeys of all tiles at a zoom level which intersect a bounding box.
+
+    Args:
+        bounds: (minx, miny, maxx, maxy) in WGS84 degrees.
+        level: zoom level of the tiles.
+    """
+    minx, miny, maxx, maxy = bounds
+    x_min, y_max = lon_lat_to_tile_xy([minx], [miny], level)
+    x_max, y_min = lon_lat_to_tile_xy([maxx], [maxy], level)
+    xs, ys = np.meshgrid(
+        np.arange(x_min[0], x_max[0] + 1), np.arange(y_min[0], y_max[0] + 1), indexing="ij"
+    )
+    return tile_xy_to_quadkey(xs.ravel(), ys.ravel(), level).tolist()
+
+
 def _harmonize_crs(df: pd.DataFrame, crs: int = LAT_LON_CRS) -> pd.DataFrame:
     if isinstance(df, gpd.GeoDataFrame) and df.crs != crs:
         df = df.to_crs(crs)
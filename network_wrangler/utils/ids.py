@@ -1,15 +1,21 @@
 """Utilities for generating ID values."""
 
 import re
+from collections.abc import Iterable
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from network_wrangler.logger import WranglerLogger
 from network_wrangler.utils.utils import split_string_prefix_suffix_from_num
 
 
-class IdCreationError(Exception):
-    """Error raised when an ID cannot be created."""
+class IdCreationError(ValueError):
+    """Error raised when an ID cannot be created.
+
+    Subclasses ValueError, which is what some of the id helpers raised before.
+    """
 
 
 def generate_new_id_from_existing(
@@ -32,11 +38,17 @@ def generate_new_id_from_existing(
         iter_val: iteration value to use in the generation process.
         max_iter: maximum number of iterations allowed in the generation process.
     """
+    return _new_id_not_in(input_id, set(existing_ids), id_scalar, iter_val, max_iter)
+
+
+def _new_id_not_in(
+    input_id: str, taken_ids: set, id_scalar: int, iter_val: int, max_iter: int
+) -> str:
     str_prefix, input_id, str_suffix = split_string_prefix_suffix_from_num(input_id)
 
     for i in range(1, max_iter + 1):
         new_id = f"{str_prefix}{int(input_id) + id_scalar + (iter_val * i)}{str_suffix}"
-        if new_id not in existing_ids.values:
+        if new_id not in taken_ids:
             return new_id
     msg = f"Cannot generate new id within max iters of {max_iter}."
     WranglerLogger.error(msg)
@@ -68,20 +80,143 @@ def generate_list_of_new_ids_from_existing(
     """
     # keep new_ids as list to preserve order
     new_ids = []
-    existing_ids = set(existing_ids)
+    taken_ids = set(existing_ids)
     for i in input_ids:
-        new_id = generate_new_id_from_existing(
-            i,
-            pd.Series(list(existing_ids)),
-            id_scalar,
-            iter_val=iter_val,
-            max_iter=max_iter,
-        )
+        new_id = _new_id_not_in(i, taken_ids, id_scalar, iter_val=iter_val, max_iter=max_iter)
         new_ids.append(new_id)
-        existing_ids.add(new_id)
+        taken_ids.add(new_id)
     return new_ids
 
 
+def _is_in_sorted(values: np.ndarray, sorted_ids: np.ndarray) -> np.ndarray:
+    """Mask of values which are in the sorted array sorted_ids."""
+    if not len(sorted_ids):
+        return np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(sorted_ids, values).clip(max=len(sorted_ids) - 1)
+    return sorted_ids[pos] == values
+
+
+def available_ids_in_range(
+    n: int, taken_ids: np.ndarray, id_range: tuple[int, int], step: int = 1
+) -> np.ndarray:
+    """Returns the n smallest integer IDs in id_range which aren't in taken_ids.
+
+    Args:
+        n: number of IDs to return.
+        taken_ids: sorted array of IDs which are already taken.
+        id_range: (start, stop) of the IDs to choose from, exclusive of stop like `range`.
+        step: only IDs divisible by step are returned. Defaults to 1.
+
+    Raises:
+        IdCreationError: if there are fewer than n IDs available in id_range.
+    """
+    start, stop = id_range
+    start = -(-start // step) * step
+    candidates = np.arange(start, stop, step, dtype=np.int64)
+    available = candidates[~_is_in_sorted(candidates, taken_ids)]
+    if len(available) < n:
+        msg = f"{len(available)} of {n} new ids available for provided range: {id_range}."
+        WranglerLogger.error(msg)
+        raise IdCreationError(msg)
+    return available[:n]
+
+
+def scalar_ids(input_ids: Iterable[int], taken_ids: np.ndarray, scalar: int) -> np.ndarray:
+    """Returns input_ids + scalar, checking that none of them are in taken_ids.
+
+    Args:
+        input_ids: integer IDs to add the scalar to.
+        taken_ids: sorted array of IDs which are already taken.
+        scalar: value to add to each input ID.
+
+    Raises:
+        IdCreationError: if any of the new IDs are already taken or duplicated.
+    """
+    input_ids = input_ids if isinstance(input_ids, (pd.Series, np.ndarray)) else list(input_ids)
+    new_ids = np.asarray(input_ids, dtype=np.int64) + scalar
+    if _is_in_sorted(new_ids, taken_ids).any() or len(np.unique(new_ids)) < len(new_ids):
+        msg = f"New ids generated by scalar {scalar} already exist. Try a different scalar."
+        WranglerLogger.error(msg)
+        raise IdCreationError(msg)
+    return new_ids
+
+
+class IdAllocator:
+    """Allocates new integer IDs which aren't already taken.
+
+    Keeps a sorted array of taken IDs so that a table's IDs (e.g. `links_df.model_link_id`)
+    only have to be scanned once, no matter how many times new IDs are needed.
+
+    Usage:
+
+    ```python
+    allocator = IdAllocator(links_df.model_link_id)
+    new_link_ids = allocator.from_range(10, (950000, 999999), step=10)
+    ml_link_ids = allocator.from_scalar(gp_link_ids, 3000000, reserve=False)
+    ```
+    """
+
+    def __init__(self, taken_ids: Optional[Iterable[int]] = None):
+        """Constructor for IdAllocator.
+
+        Args:
+            taken_ids: IDs which are already taken. Non-integer and NA values are ignored.
+        """
+        self._taken = np.array([], dtype=np.int64)
+        if taken_ids is not None:
+            self.take(taken_ids)
+
+    @property
+    def taken_ids(self) -> np.ndarray:
+        """Sorted array of taken IDs."""
+        return self._taken
+
+    def take(self, ids: Iterable[int]) -> None:
+        """Mark ids as taken."""
+        ids_s = pd.Series(ids if isinstance(ids, (pd.Series, np.ndarray)) else list(ids))
+        if not pd.api.types.is_integer_dtype(ids_s):
+            ids_s = pd.to_numeric(ids_s, errors="coerce").dropna()
+        if ids_s.empty:
+            return
+        self._taken = np.union1d(self._taken, ids_s.to_numpy().astype(np.int64))
+
+    def is_taken(self, ids: Iterable[int]) -> np.ndarray:
+        """Mask of which ids are taken."""
+        ids = ids if isinstance(ids, (pd.Series, np.ndarray)) else list(ids)
+        return _is_in_sorted(np.asarray(ids, dtype=np.int64), self._taken)
+
+    def from_range(
+        self, n: int, id_range: tuple[int, int], step: int = 1, reserve: bool = True
+    ) -> np.ndarray:
+        """Returns the n smallest available IDs in id_range that are divisible by step.
+
+        Args:
+            n: number of IDs to return.
+            id_range: (start, stop) of the IDs to choose from, exclusive of stop like `range`.
+            step: only IDs divisible by step are returned. Defaults to 1.
+            reserve: if True, the returned IDs are marked as taken. Defaults to True.
+        """
+        new_ids = available_ids_in_range(n, self._taken, id_range, step=step)
+        if reserve:
+            self.take(new_ids)
+        return new_ids
+
+    def from_scalar(
+        self, input_ids: Iterable[int], scalar: int, reserve: bool = True
+    ) -> np.ndarray:
+        """Returns input_ids + scalar if none of them are taken.
+
+        Args:
+            input_ids: integer IDs to add the scalar to.
+            scalar: value to add to each input ID.
+            reserve: if True, the returned IDs are marked as taken. Defaults to True.
+        """
+        new_ids = scalar_ids(input_ids, self._taken, scalar)
+        if reserve:
+            self.take(new_ids)
+        return new_ids
+
+
 def _get_max_int_id_within_string_ids(id_s: pd.Series, prefix: str, suffix: str) -> int:
     pattern = re.compile(rf"{re.escape(prefix)}(\d+){re.escape(suffix)}")
     extracted_ids = id_s.dropna().apply(
@@ -1,20 +1,34 @@
 """Helper functions for reading and writing files to reduce boilerplate."""
 
+import hashlib
 import json
 import shutil
 import tempfile
+import time
+import uuid
 import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
 from ..configs import DefaultConfig
 from ..logger import WranglerLogger
-from .data import convert_numpy_to_list
-from .geo import get_bounding_polygon
+from ..params import LAT_LON_CRS
+from .data import (
+    concat_with_attr,
+    convert_numpy_to_list,
+    filter_df_to_predicates,
+    validation_stamp,
+)
+from .geo import get_bounding_polygon, quadkeys_for_geometry
+from .models import ValidationModes, schema_hash, stamp_validated, validate_unique_fields
 from .time import format_seconds_to_legible_str
 
 try:
@@ -49,6 +63,9 @@ def write_table(
 ) -> None:
     """Write a dataframe or geodataframe to a file.
 
+    Files other than shapefiles are written atomically: they are written to a temporary file
+    next to filename which then replaces it, so a failed write never leaves a partial file.
+
     Args:
         df (pd.DataFrame): dataframe to write.
         filename (Path): filename to write to.
@@ -67,27 +84,334 @@ def write_table(
     WranglerLogger.debug(f"Writing to {filename}.")
 
     if "shp" in filename.suffix:
+        # shapefiles are written as several files named after filename, so can't be renamed
         df.to_file(filename, index=False, **kwargs)
-    elif "parquet" in filename.suffix:
-        df.to_parquet(filename, index=False, **kwargs)
-    elif "csv" in filename.suffix or "txt" in filename.suffix:
-        df.to_csv(filename, index=False, date_format="%H:%M:%S", **kwargs)
-    elif "geojson" in filename.suffix:
+        return
+    with atomic_write_path(filename) as tmp_path:
+        _write_table_as(df, tmp_path, filename.suffix, **kwargs)
+
+
+def _write_table_as(
+    df: Union[pd.DataFrame, gpd.GeoDataFrame], path: Path, suffix: str, **kwargs
+) -> None:
+    """Write df to path in the file format of suffix."""
+    if "parquet" in suffix:
+        df.to_parquet(path, index=False, **kwargs)
+    elif "csv" in suffix or "txt" in suffix:
+        df.to_csv(path, index=False, date_format="%H:%M:%S", **kwargs)
+    elif "geojson" in suffix:
         # required due to issues with list-like columns
         if isinstance(df, gpd.GeoDataFrame):
             data = df.to_json(drop_id=True)
         else:
             data = df.to_json(orient="records", index=False)
-        with filename.open("w", encoding="utf-8") as file:
+        with path.open("w", encoding="utf-8") as file:
             file.write(data)
-    elif "json" in filename.suffix:
-        with filename.open("w") as f:
+    elif "json" in suffix:
+        with path.open("w") as f:
             f.write(df.to_json(orient="records"))
     else:
-        msg = f"Filetype {filename.suffix} not implemented."
+        msg = f"Filetype {suffix} not implemented."
         raise NotImplementedError(msg)
 
 
+@contextmanager
+def atomic_write_path(filename: Path) -> Iterator[Path]:
+    """Yields a temporary path to write to which replaces filename once the write succeeds.
+
+    The temporary path is in the same directory as filename so it can be renamed, and has a
+    `.tmp-` suffix so it isn't picked up as a network file if the process is killed mid-write.
+    It may be written as a file or a directory.
+    """
+    filename = Path(filename)
+    tmp_path = filename.with_name(f"{filename.name}.tmp-{uuid.uuid4().hex[:8]}")
+    try:
+        yield tmp_path
+        if filename.is_dir() or (filename.exists() and tmp_path.is_dir()):
+            # can't atomically replace a directory, so move the old one aside first
+            old_path = filename.with_name(f"{filename.name}.old-{uuid.uuid4().hex[:8]}")
+            filename.rename(old_path)
+            tmp_path.rename(filename)
+            _remove_path(old_path)
+        else:
+            tmp_path.replace(filename)
+    finally:
+        _remove_path(tmp_path)
+
+
+def _remove_path(path: Path) -> None:
+    """Removes a file or directory if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    elif path.exists():
+        path.unlink()
+
+
+def run_table_writes(
+    writes: dict[str, Callable[[], None]], max_workers: int = 1
+) -> dict[str, float]:
+    """Runs table write functions, up to max_workers at a time in threads, timing each one.
+
+    pyarrow, pyogrio, and most of pandas' writers release the GIL while serializing, so writes
+    of different tables overlap. When running in threads, every write is run even if one of
+    them fails and the first error is raised after they all finish.
+
+    Args:
+        writes: dictionary of functions which each write one table, keyed by a label for the
+            table used in logging.
+        max_workers: maximum number of tables to write at once. Defaults to 1, which writes
+            them one at a time in order.
+
+    Returns:
+        dictionary of the seconds each write took keyed by its label.
+    """
+
+    def _timed(write: Callable[[], None]) -> float:
+        start_t = time.time()
+        write()
+        return time.time() - start_t
+
+    timings: dict[str, float] = {}
+    if max_workers <= 1:
+        for label, write in writes.items():
+            timings[label] = _timed(write)
+    else:
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_timed, write): label for label, write in writes.items()}
+            for future in as_completed(futures):
+                try:
+                    timings[futures[future]] = future.result()
+                except Exception as err:
+                    WranglerLogger.error(f"Error writing {futures[future]}: {err}")
+                    errors.append(err)
+        if errors:
+            raise errors[0]
+
+    for label, seconds in timings.items():
+        WranglerLogger.info(f"Wrote {label} in {round(seconds, 2)} seconds.")
+    return timings
+
+
+SPATIAL_ROW_GROUP_SIZE: int = 10000
+"""Default number of records in each row group of spatially sorted parquet files."""
+
+TILE_PARTITION_PREFIX: str = "tile="
+TILE_INDEX_FILENAME: str = "_tiles.json"
+
+
+SCHEMA_STAMP_SUFFIX = ".stamp"
+"""Suffix of the file next to a table file stamping it as valid to a data model."""
+
+
+def write_schema_stamp(df: Optional[pd.DataFrame], filename: Path, model: type) -> bool:
+    """Stamps filename, which df was written to, as valid to model if df is.
+
+    Writes `<filename>.stamp` with the schema hash of model and a digest of the contents of
+    filename, so that readers can trust that the file is valid as long as neither it nor model
+    has changed. If df is None or wasn't validated to model since it was last modified, removes
+    any existing stamp instead. Stamping is opt-in with `WranglerConfig.VALIDATION.STAMP_FILES`,
+    so writers pass None unless it is set.
+
+    Args:
+        df: table which was written to filename, or None if what was written isn't valid.
+        filename: file or directory of tile partitions df was written to.
+        model: Pandera DataFrameModel df was validated to.
+
+    Returns:
+        True if filename was stamped.
+    """
+    stamp_file = _schema_stamp_path(filename)
+    validated = (None if df is None else validation_stamp(df)) or {}
+    if (
+        validated.get("model") != model.__name__
+        or validated.get("schema_hash") != schema_hash(model)
+        or validated.get("modified_columns")
+    ):
+        _remove_path(stamp_file)
+        return False
+    stamp = {
+        "model": model.__name__,
+        "schema_hash": schema_hash(model),
+        "digest": _file_digest(Path(filename)),
+    }
+    with atomic_write_path(stamp_file) as tmp_path, tmp_path.open("w") as f:
+        json.dump(stamp, f)
+    return True
+
+
+def has_schema_stamp(filename: Path, model: type) -> bool:
+    """True if filename has a stamp as valid to model and hasn't changed since it was stamped."""
+    stamp_file = _schema_stamp_path(filename)
+    if not stamp_file.exists():
+        return False
+    try:
+        with stamp_file.open() as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if stamp.get("model") != model.__name__ or stamp.get("schema_hash") != schema_hash(model):
+        return False
+    return stamp.get("digest") == _file_digest(Path(filename))
+
+
+def file_validation_mode(filename: Path, model: type, mode: ValidationModes) -> ValidationModes:
+    """Validation mode for a table read from filename given the configured validation mode.
+
+    Only files with a valid stamp are trusted. Other files are validated in full.
+    """
+    if mode == "trusted" and has_schema_stamp(filename, model):
+        WranglerLogger.debug(f"Trusting stamped {model.__name__} file {filename}.")
+        return "trusted"
+    return "full"
+
+
+def _schema_stamp_path(filename: Path) -> Path:
+    filename = Path(filename)
+    return filename.with_name(f"{filename.name}{SCHEMA_STAMP_SUFFIX}")
+
+
+def _file_digest(filename: Path) -> str:
+    """Digest of the contents of filename, or of the parquet files in it if it's a directory."""
+    digest = hashlib.blake2b(digest_size=16)
+    for file in _parquet_files(filename):
+        if filename.is_dir():
+            digest.update(file.relative_to(filename).as_posix().encode())
+        with file.open("rb") as f:
+            while block := f.read(1 << 20):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def write_spatial_parquet(
+    df: Union[pd.DataFrame, gpd.GeoDataFrame],
+    filename: Path,
+    overwrite: bool = False,
+    geometry: Optional[gpd.GeoSeries] = None,
+    row_group_size: int = SPATIAL_ROW_GROUP_SIZE,
+    tile_level: Optional[int] = None,
+) -> None:
+    """Write a table to parquet sorted along a Hilbert curve so row groups are spatially compact.
+
+    GeoDataFrames are written as GeoParquet with a bbox covering column, so each row group has
+    min/max bbox statistics and readers filtering to a bounding box can skip whole row groups.
+
+    If tile_level is given, filename is written as a directory with one partition per web
+    mercator tile, `<filename>/tile=<quadkey>/part-0.parquet`, with each record assigned to the
+    tile containing the center of its bounding box. A `_tiles.json` index of the bounds of the
+    records in each tile lets `read_table` skip tiles which don't intersect a boundary.
+
+    Args:
+        df: table to write.
+        filename: parquet filename (or partition directory if tile_level is given) to write to.
+        overwrite: whether to overwrite filename if it exists. Defaults to False.
+        geometry: geometry to sort and partition df by, aligned by position with df. Useful for
+            tables such as links which are written without their geometry. Defaults to the
+            geometry of df.
+        row_group_size: maximum number of records in each row group. Defaults to
+            SPATIAL_ROW_GROUP_SIZE.
+        tile_level: zoom level of tiles to partition by. Defaults to None (not partitioned).
+    """
+    filename = Path(filename)
+    if filename.exists() and not overwrite:
+        msg = f"File {filename} already exists and overwrite is False."
+        raise FileExistsError(msg)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+
+    if geometry is None:
+        if not isinstance(df, gpd.GeoDataFrame):
+            msg = "geometry must be provided to write a spatially sorted table without geometry."
+            raise ValueError(msg)
+        geometry = df.geometry
+    if len(geometry) != len(df):
+        msg = f"geometry has {len(geometry)} records but table has {len(df)}."
+        raise ValueError(msg)
+    geometry = gpd.GeoSeries(geometry.values, crs=geometry.crs)
+    if geometry.crs is not None and geometry.crs != LAT_LON_CRS:
+        geometry = geometry.to_crs(LAT_LON_CRS)
+
+    if len(geometry) > 1:
+        _order = np.argsort(geometry.hilbert_distance().to_numpy(), kind="stable")
+        df = df.iloc[_order]
+        geometry = geometry.iloc[_order].reset_index(drop=True)
+
+    if tile_level is None:
+        with atomic_write_path(filename) as tmp_path:
+            _write_sorted_parquet(df, tmp_path, row_group_size)
+        return
+    if tile_level < 1:
+        msg = f"tile_level must be at least 1, got {tile_level}."
+        raise ValueError(msg)
+
+    quadkeys = quadkeys_for_geometry(geometry, tile_level)
+    tile_bounds = {}
+    with atomic_write_path(filename) as tmp_path:
+        tmp_path.mkdir()
+        for quadkey in np.unique(quadkeys):
+            _in_tile = quadkeys == quadkey
+            tile_dir = tmp_path / f"{TILE_PARTITION_PREFIX}{quadkey}"
+            tile_dir.mkdir()
+            _write_sorted_parquet(df.iloc[_in_tile], tile_dir / "part-0.parquet", row_group_size)
+            tile_bounds[str(quadkey)] = geometry.iloc[_in_tile].total_bounds.tolist()
+        with (tmp_path / TILE_INDEX_FILENAME).open("w") as f:
+            json.dump({"level": tile_level, "tiles": tile_bounds}, f)
+    WranglerLogger.debug(f"Wrote {len(tile_bounds)} tiles to {filename}.")
+
+
+def _write_sorted_parquet(df: pd.DataFrame, filename: Path, row_group_size: int) -> None:
+    """Write df to parquet in row groups, with a bbox covering column for GeoDataFrames."""
+    WranglerLogger.debug(f"Writing to {filename}.")
+    if isinstance(df, gpd.GeoDataFrame):
+        try:
+            df.to_parquet(
+                filename, index=False, write_covering_bbox=True, row_group_size=row_group_size
+            )
+            return
+        except TypeError:
+            WranglerLogger.warning(
+                "Could not write bbox covering column. Upgrade to geopandas >= 1.0 so readers\
+                    can skip row groups by bounding box."
+            )
+    df.to_parquet(filename, index=False, row_group_size=row_group_size)
+
+
+def _parquet_files(filename: Path) -> list[Path]:
+    """Parquet files in filename, which may be a directory of tile partitions."""
+    if filename.is_dir():
+        return sorted(filename.glob(f"{TILE_PARTITION_PREFIX}*/*.parquet"))
+    return [filename]
+
+
+def _parquet_files_in_bounds(filename: Path, mask_gdf: Optional[gpd.GeoSeries]) -> list[Path]:
+    """Parquet files in filename, skipping tile partitions which don't intersect mask_gdf."""
+    files = _parquet_files(filename)
+    tile_index_file = filename / TILE_INDEX_FILENAME
+    if mask_gdf is None or not tile_index_file.exists():
+        return files
+    with tile_index_file.open() as f:
+        tile_bounds = json.load(f)["tiles"]
+
+    minx, miny, maxx, maxy = mask_gdf.to_crs(LAT_LON_CRS).total_bounds
+    _keep = {
+        quadkey
+        for quadkey, (t_minx, t_miny, t_maxx, t_maxy) in tile_bounds.items()
+        if t_minx <= maxx and t_maxx >= minx and t_miny <= maxy and t_maxy >= miny
+    }
+    in_bounds = [f for f in files if f.parent.name[len(TILE_PARTITION_PREFIX) :] in _keep]
+    WranglerLogger.debug(f"Reading {len(in_bounds)} of {len(files)} tiles in {filename}.")
+    return in_bounds
+
+
+def _parquet_covering_columns(geo_metadata: dict) -> list[str]:
+    """Names of bbox covering columns in GeoParquet metadata, which aren't part of the table."""
+    covering_cols = []
+    for col_meta in geo_metadata.get("columns", {}).values():
+        bbox_covering = col_meta.get("covering", {}).get("bbox")
+        if bbox_covering:
+            covering_cols.append(bbox_covering["xmin"][0])
+    return covering_cols
+
+
 def _estimate_read_time_of_file(
     filepath: Union[str, Path], read_speed: dict = DefaultConfig.CPU.EST_PD_READ_SPEED
 ) -> str:
@@ -113,6 +437,8 @@ def read_table(
     boundary_geocode: Optional[str] = None,
     boundary_file: Optional[Path] = None,
     read_speed: dict = DefaultConfig.CPU.EST_PD_READ_SPEED,
+    columns: Optional[list[str]] = None,
+    filters: Optional[list] = None,
 ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
     """Read file and return a dataframe or geodataframe.
 
@@ -126,6 +452,10 @@ def read_table(
     boundary_gdf, boundary_geocode, or boundary_file if provided. Note that you can only
     provide one of these boundary filters.
 
+    If columns or filters are provided, they are pushed down into the reader for parquet files
+    so that only the needed columns and row groups are read. Other file types are read in full
+    and then projected and filtered.
+
     NOTE:  if you are accessing multiple files from this zip file you will want to unzip it first
     and THEN access the table files so you don't create multiple duplicate unzipped tmp dirs.
 
@@ -140,6 +470,11 @@ def read_table(
             geographic data. Defaults to None.
         read_speed: dictionary of read speeds for different file types. Defaults to
             DefaultConfig.CPU.EST_PD_READ_SPEED.
+        columns: columns to read. Columns which aren't in the file are ignored. Defaults to
+            None, which reads all columns.
+        filters: predicates records must match, in the form of pyarrow parquet filters: a list
+            of `(column, op, value)` tuples which must all be true, or a list of such lists
+            where any must be true. Defaults to None.
     """
     filename = Path(filename)
     if not filename.exists():
@@ -164,26 +499,45 @@ def read_table(
         boundary_file=boundary_file,
     )
 
+    if "parquet" in filename.suffix:
+        return _read_parquet_table(filename, mask_gdf, columns=columns, filters=filters)
+
     if any(x in filename.suffix for x in ["geojson", "shp", "csv"]):
         try:
             # masking only supported by fiona engine, which is slower.
             if mask_gdf is None:
-                return gpd.read_file(filename, engine="pyogrio")
-            return gpd.read_file(filename, mask=mask_gdf, engine="fiona")
+                df = gpd.read_file(filename, engine="pyogrio")
+            else:
+                df = gpd.read_file(filename, mask=mask_gdf, engine="fiona")
         except Exception as err:
-            if "csv" in filename.suffix:
-                return pd.read_csv(filename)
-            raise FileReadError from err
-    elif "parquet" in filename.suffix:
-        return _read_parquet_table(filename, mask_gdf)
+            if "csv" not in filename.suffix:
+                raise FileReadError from err
+            df = pd.read_csv(filename)
     elif "json" in filename.suffix:
         with filename.open() as f:
-            return pd.read_json(f, orient="records")
-    msg = f"Filetype {filename.suffix} not implemented."
-    raise NotImplementedError(msg)
+            df = pd.read_json(f, orient="records")
+    else:
+        msg = f"Filetype {filename.suffix} not implemented."
+        raise NotImplementedError(msg)
+    return _project_and_filter_df(df, columns=columns, filters=filters)
+
+
+def _project_and_filter_df(
+    df: pd.DataFrame, columns: Optional[list[str]] = None, filters: Optional[list] = None
+) -> pd.DataFrame:
+    """Filter df to filters and then to columns (keeping any geometry) after it has been read."""
+    df = filter_df_to_predicates(df, filters)
+    if columns is None:
+        return df
+    _keep = [c for c in df.columns if c in columns]
+    if isinstance(df, gpd.GeoDataFrame) and df.geometry.name not in _keep:
+        _keep.append(df.geometry.name)
+    return df[_keep]
 
 
-def _read_parquet_table(filename, mask_gdf) -> Union[gpd.GeoDataFrame, pd.DataFrame]:
+def _read_parquet_table(
+    filename, mask_gdf, columns: Optional[list[str]] = None, filters: Optional[list] = None
+) -> Union[gpd.GeoDataFrame, pd.DataFrame]:
     """Read a parquet file and filter to a bounding box if provided.
 
     Converts numpy arrays to lists.
@@ -192,27 +546,388 @@ def _read_parquet_table(filename, mask_gdf) -> Union[gpd.GeoDataFrame, pd.DataFr
 
     Tries to filter to a bounding box if a mask_gdf is provided. If the geopandas version is
     less than 1.0, will return the unfiltered data.
+
+    Columns and filters are pushed down into pyarrow. Requested columns which aren't in the file
+    are ignored and the geometry column is always read.
+
+    If filename is a directory of tile partitions written by `write_spatial_parquet`, only the
+    tiles which intersect mask_gdf are read.
     """
+    filename = Path(filename)
+    if filename.is_dir():
+        files = _parquet_files(filename)
+        if not files:
+            msg = f"No parquet tile partitions found in {filename}."
+            raise FileReadError(msg)
+        in_bounds = _parquet_files_in_bounds(filename, mask_gdf)
+        if not in_bounds:
+            # no tiles in bounds, but keep the schema of the table
+            empty_df = _read_parquet_table(files[0], None, columns=columns, filters=filters)
+            return empty_df.iloc[:0]
+        dfs = [
+            _read_parquet_table(f, mask_gdf, columns=columns, filters=filters) for f in in_bounds
+        ]
+        return concat_with_attr(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+
+    kwargs: dict = {}
+    if columns is not None:
+        kwargs["columns"] = _parquet_columns_to_read(filename, columns)
+    if filters:
+        kwargs["filters"] = filters
     try:
         if mask_gdf is None:
-            df = gpd.read_parquet(filename)
+            df = gpd.read_parquet(filename, **kwargs)
         else:
             try:
-                df = gpd.read_parquet(filename, bbox=mask_gdf.total_bounds)
+                df = gpd.read_parquet(filename, bbox=mask_gdf.total_bounds, **kwargs)
             except TypeError:
                 WranglerLogger.warning(f"Could not filter to bounding box {mask_gdf}.\
                                         Try upgrading to geopandas > 1.0.\
                                         Returning unfiltered data.")
-                df = gpd.read_parquet(filename)
+                df = gpd.read_parquet(filename, **kwargs)
     except:
-        df = pd.read_parquet(filename)
+        df = pd.read_parquet(filename, **kwargs)
+
+    df = df.drop(columns=[c for c in _parquet_covering_columns_in(filename) if c in df.columns])
+    return _convert_numpy_cols_to_lists(df)
+
+
+def _read_parquet_geo_metadata(filename: Path) -> Optional[dict]:
+    """GeoParquet metadata of a parquet file, or None if it isn't a geoparquet file."""
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(filename).metadata or {}
+    return json.loads(metadata[b"geo"]) if b"geo" in metadata else None
+
+
+def _parquet_covering_columns_in(filename: Path) -> list[str]:
+    """Names of bbox covering columns in a parquet file."""
+    geo_metadata = _read_parquet_geo_metadata(filename)
+    return _parquet_covering_columns(geo_metadata) if geo_metadata else []
+
+
+def _parquet_columns_to_read(filename: Path, columns: list[str]) -> list[str]:
+    """Columns of a parquet file to read given requested columns, including any geometry."""
+    import pyarrow.parquet as pq
+
+    filename = _parquet_files(Path(filename))[0]
+    schema = pq.read_schema(filename)
+    geo_metadata = json.loads((schema.metadata or {}).get(b"geo", b"{}"))
+    geometry_cols = list(geo_metadata.get("columns", {}))
+    return [c for c in schema.names if c in columns or c in geometry_cols]
+
+
+def read_table_columns(filename: Path, sub_filename: Optional[str] = None) -> list[str]:
+    """Names of the columns in a table file without reading the whole file.
+
+    Reads the schema of parquet files, the field list of geojson and shapefiles, the header of
+    csv files, and the keys of the first record of json files.
+
+    Args:
+        filename (Path): filename to inspect.
+        sub_filename: if the file is a zip, the sub_filename to inspect.
+    """
+    filename = Path(filename)
+    if filename.suffix == ".zip":
+        if not sub_filename:
+            msg = "sub_filename must be provided for zip files."
+            raise ValueError(msg)
+        filename = unzip_file(filename) / sub_filename
+
+    if "parquet" in filename.suffix:
+        import pyarrow.parquet as pq
+
+        parquet_file = _parquet_files(filename)[0]
+        covering_cols = _parquet_covering_columns_in(parquet_file)
+        return [c for c in pq.read_schema(parquet_file).names if c not in covering_cols]
+    if any(x in filename.suffix for x in ["geojson", "shp"]):
+        from pyogrio import read_info
+
+        return [*read_info(filename)["fields"].tolist(), "geometry"]
+    if any(x in filename.suffix for x in ["csv", "txt"]):
+        return pd.read_csv(filename, nrows=0).columns.tolist()
+    if "json" in filename.suffix:
+        import ijson
+
+        with filename.open("rb") as f:
+            first_record: dict = next(ijson.items(f, "item"), {})
+        return list(first_record)
+    msg = f"Filetype {filename.suffix} not implemented."
+    raise NotImplementedError(msg)
+
 
+def _convert_numpy_cols_to_lists(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts numpy arrays in scoped property columns read from parquet to lists."""
     _cols = [col for col in df.columns if col.startswith("sc_")]
     for col in _cols:
         df[col] = df[col].apply(convert_numpy_to_list)
     return df
 
 
+def read_table_in_chunks(
+    filename: Path,
+    chunk_size: int,
+    sub_filename: Optional[str] = None,
+    boundary_gdf: Optional[gpd.GeoDataFrame] = None,
+    boundary_geocode: Optional[str] = None,
+    boundary_file: Optional[Path] = None,
+    read_speed: dict = DefaultConfig.CPU.EST_PD_READ_SPEED,
+    columns: Optional[list[str]] = None,
+    filters: Optional[list] = None,
+) -> Iterator[Union[pd.DataFrame, gpd.GeoDataFrame]]:
+    """Read file in chunks of up to chunk_size records so they can be processed one at a time.
+
+    Parquet files are read by record batch with pyarrow, json files are streamed with ijson,
+    and geojson and shapefiles are streamed as arrow batches with pyogrio. Other file types
+    are read with `read_table` and returned as a single chunk.
+
+    If a boundary is provided, each chunk of geographic data is filtered to records which
+    intersect it (or, for parquet files, its *bounding box*) as in `read_table`. Columns and
+    filters are applied to each chunk as in `read_table`, with columns only read from parquet
+    files if they are requested.
+
+    Args:
+        filename (Path): filename to load.
+        chunk_size: maximum number of records in each chunk.
+        sub_filename: if the file is a zip, the sub_filename to load.
+        boundary_gdf: GeoDataFrame to filter the input data to. Only used for geographic data.
+            Defaults to None.
+        boundary_geocode: Geocode to filter the input data to. Only used for geographic data.
+            Defaults to None.
+        boundary_file: File to load as a boundary to filter the input data to. Only used for
+            geographic data. Defaults to None.
+        read_speed: dictionary of read speeds for different file types. Defaults to
+            DefaultConfig.CPU.EST_PD_READ_SPEED.
+        columns: columns to read. Columns which aren't in the file are ignored. Defaults to
+            None, which reads all columns.
+        filters: predicates records must match, in the form of pyarrow parquet filters.
+            Defaults to None.
+    """
+    filename = Path(filename)
+    if not filename.exists():
+        msg = f"Input file {filename} does not exist."
+        raise FileNotFoundError(msg)
+    if filename.stat().st_size == 0:
+        msg = f"File {filename} is empty."
+        raise FileExistsError(msg)
+    if filename.suffix == ".zip":
+        if not sub_filename:
+            msg = "sub_filename must be provided for zip files."
+            raise ValueError(msg)
+        filename = unzip_file(filename) / sub_filename
+    WranglerLogger.debug(
+        f"Estimated read time: {_estimate_read_time_of_file(filename, read_speed)}."
+    )
+
+    mask_gdf = get_bounding_polygon(
+        boundary_gdf=boundary_gdf,
+        boundary_geocode=boundary_geocode,
+        boundary_file=boundary_file,
+    )
+
+    if any(x in filename.suffix for x in ["geojson", "shp"]):
+        chunks = _read_geo_file_in_chunks(filename, chunk_size)
+    elif "parquet" in filename.suffix:
+        chunks = (
+            chunk
+            for parquet_file in _parquet_files_in_bounds(filename, mask_gdf)
+            for chunk in _read_parquet_in_chunks(
+                parquet_file, chunk_size, columns=columns, mask_gdf=mask_gdf
+            )
+        )
+    elif "json" in filename.suffix:
+        chunks = _read_json_in_chunks(filename, chunk_size)
+    else:
+        chunks = iter([read_table(filename, read_speed=read_speed)])
+
+    for chunk in chunks:
+        chunk_df = chunk
+        if mask_gdf is not None and isinstance(chunk, gpd.GeoDataFrame):
+            chunk_df = _filter_chunk_to_mask(chunk, mask_gdf, bbox="parquet" in filename.suffix)
+        yield _project_and_filter_df(chunk_df, columns=columns, filters=filters)
+
+
+def read_and_transform_table(
+    filename: Path,
+    transform: Callable[[pd.DataFrame], pd.DataFrame],
+    filter_func: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    chunk_size: Optional[int] = None,
+    model: Optional[type] = None,
+    **kwargs,
+) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    """Read a table, filter and transform it, optionally one chunk at a time.
+
+    When reading in chunks, each chunk is filtered and transformed (i.e. coerced and validated)
+    before the next one is read so that peak memory use stays close to the size of the final
+    table rather than a multiple of it. Chunks which are empty after filtering are skipped.
+
+    Args:
+        filename: filename to load.
+        transform: function which takes a raw table or chunk and returns the transformed one.
+        filter_func: function which takes a raw table or chunk and returns the records to keep.
+            Applied before transform. Defaults to None.
+        chunk_size: if provided, will read and transform this many records at a time.
+            Defaults to None, which reads the whole file at once.
+        model: Pandera DataFrameModel whose unique fields are checked across chunks.
+            Defaults to None.
+        kwargs: additional arguments passed to `read_table` or `read_table_in_chunks`.
+    """
+    if chunk_size is None:
+        df = read_table(filename, **kwargs)
+        return transform(df if filter_func is None else filter_func(df))
+
+    transformed_dfs = []
+    chunk = None
+    for raw_chunk in read_table_in_chunks(filename, chunk_size, **kwargs):
+        chunk = raw_chunk if filter_func is None else filter_func(raw_chunk)
+        if not chunk.empty:
+            transformed_dfs.append(transform(chunk))
+    if not transformed_dfs:
+        return transform(chunk if chunk is not None else pd.DataFrame())
+    if len(transformed_dfs) == 1:
+        return transformed_dfs[0]
+
+    df = concat_with_attr(transformed_dfs)
+    if model is not None:
+        validate_unique_fields(df, model)
+        # chunks were each validated, so the whole table is too if their dtypes are consistent
+        _dtypes = {c: str(t) for c, t in df.dtypes.items()}
+        _stamps = [validation_stamp(d) for d in transformed_dfs]
+        if all(s and s["model"] == model.__name__ and s["dtypes"] == _dtypes for s in _stamps):
+            stamp_validated(df, model)
+    return df
+
+
+def _filter_chunk_to_mask(
+    chunk: gpd.GeoDataFrame, mask_gdf: gpd.GeoDataFrame, bbox: bool = False
+) -> gpd.GeoDataFrame:
+    """Filter chunk to records which intersect mask_gdf or its bounding box if bbox is True."""
+    if chunk.crs is not None:
+        mask_gdf = mask_gdf.to_crs(chunk.crs)
+    if bbox:
+        minx, miny, maxx, maxy = mask_gdf.total_bounds
+        return chunk.cx[minx:maxx, miny:maxy]
+    return chunk[chunk.intersects(mask_gdf.union_all())]
+
+
+def _read_geo_file_in_chunks(filename: Path, chunk_size: int) -> Iterator[gpd.GeoDataFrame]:
+    """Stream features of a geojson or shapefile as GeoDataFrames using pyogrio arrow batches."""
+    from pyogrio import open_arrow
+
+    try:
+        source = open_arrow(filename, batch_size=chunk_size, use_pyarrow=True)
+    except TypeError:
+        # pyogrio < 0.8 always returns a pyarrow reader
+        source = open_arrow(filename, batch_size=chunk_size)
+    with source as (meta, reader):
+        geom_col = meta.get("geometry_name") or "wkb_geometry"
+        for batch in reader:
+            df = batch.to_pandas()
+            df["geometry"] = gpd.GeoSeries.from_wkb(df.pop(geom_col), crs=meta["crs"])
+            yield gpd.GeoDataFrame(df, geometry="geometry", crs=meta["crs"])
+
+
+def _read_parquet_in_chunks(
+    filename: Path,
+    chunk_size: int,
+    columns: Optional[list[str]] = None,
+    mask_gdf: Optional[gpd.GeoSeries] = None,
+) -> Iterator[Union[gpd.GeoDataFrame, pd.DataFrame]]:
+    """Read parquet record batches with pyarrow, decoding geometry if it is a geoparquet file.
+
+    If mask_gdf is given and the file has a bbox covering column, row groups whose bbox
+    statistics don't intersect the bounding box of mask_gdf are skipped.
+    """
+    import pyarrow.parquet as pq
+    from pyproj import CRS
+
+    parquet_file = pq.ParquetFile(filename)
+    metadata = parquet_file.schema_arrow.metadata or {}
+    geo_metadata = json.loads(metadata[b"geo"]) if b"geo" in metadata else None
+    covering_cols: list[str] = []
+    if geo_metadata is not None:
+        geom_col = geo_metadata["primary_column"]
+        # per the geoparquet spec a missing crs is OGC:CRS84 and a null crs is undefined
+        _crs = geo_metadata["columns"][geom_col].get("crs", "OGC:CRS84")
+        if isinstance(_crs, dict):
+            crs = CRS.from_json_dict(_crs)
+        else:
+            crs = CRS.from_user_input(_crs) if _crs is not None else None
+        covering_cols = _parquet_covering_columns(geo_metadata)
+
+    if columns is not None:
+        columns = _parquet_columns_to_read(filename, columns)
+    elif covering_cols:
+        columns = [c for c in parquet_file.schema_arrow.names if c not in covering_cols]
+
+    row_groups = None
+    if mask_gdf is not None and covering_cols:
+        if crs is not None:
+            mask_gdf = mask_gdf.to_crs(crs)
+        row_groups = _row_groups_in_bbox(parquet_file, covering_cols[0], mask_gdf.total_bounds)
+        WranglerLogger.debug(
+            f"Reading {len(row_groups)} of {parquet_file.num_row_groups} row groups in {filename}."
+        )
+        if not row_groups:
+            return
+
+    for batch in parquet_file.iter_batches(
+        batch_size=chunk_size, row_groups=row_groups, columns=columns
+    ):
+        df = _convert_numpy_cols_to_lists(batch.to_pandas())
+        if geo_metadata is None:
+            yield df
+            continue
+        df[geom_col] = gpd.GeoSeries.from_wkb(df[geom_col], crs=crs)
+        yield gpd.GeoDataFrame(df, geometry=geom_col, crs=crs)
+
+
+def _row_groups_in_bbox(parquet_file, covering_col: str, bounds) -> list[int]:
+    """Indices of row groups whose bbox covering column statistics intersect bounds.
+
+    Row groups without statistics are always kept.
+    """
+    minx, miny, maxx, maxy = bounds
+    row_groups = []
+    for i in range(parquet_file.num_row_groups):
+        row_group = parquet_file.metadata.row_group(i)
+        stats = {}
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.path_in_schema.startswith(f"{covering_col}.") and column.is_stats_set:
+                stats[column.path_in_schema.split(".")[-1]] = column.statistics
+        if len(stats) < 4:  # noqa: PLR2004
+            row_groups.append(i)
+            continue
+        if (
+            stats["xmin"].min <= maxx
+            and stats["xmax"].max >= minx
+            and stats["ymin"].min <= maxy
+            and stats["ymax"].max >= miny
+        ):
+            row_groups.append(i)
+    return row_groups
+
+
+def _read_json_in_chunks(filename: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Stream records from a json file with a list of records using ijson."""
+    try:
+        import ijson
+    except ModuleNotFoundError as err:
+        msg = "ijson is required for chunked JSON processing."
+        raise ModuleNotFoundError(msg) from err
+
+    buffer = []
+    with filename.open("rb") as f:
+        for item in ijson.items(f, "item", use_float=True):
+            buffer.append(item)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer)
+                buffer = []
+    if buffer:
+        yield pd.DataFrame(buffer)
+
+
 def convert_file_serialization(
     input_file: Path,
     output_file: Path,
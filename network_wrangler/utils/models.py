@@ -1,15 +1,26 @@
 """Helper functions for data models."""
 
 import copy
-from functools import wraps
+import hashlib
+import re
+from functools import cache, wraps
 from pathlib import Path
-from typing import Optional, Union, _GenericAlias, get_args, get_origin, get_type_hints
+from typing import (
+    Literal,
+    Optional,
+    Union,
+    _GenericAlias,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import geopandas as gpd
 import pandas as pd
 import pandera as pa
 from pandas import DataFrame
 from pandera import DataFrameModel
+from pandera.engines import pandas_engine
 from pandera.errors import SchemaError, SchemaErrors
 from pandera.typing import DataFrame as PanderaDataFrame
 from pydantic import BaseModel, ValidationError, validate_call
@@ -17,7 +28,7 @@ from pydantic._internal._model_construction import ModelMetaclass
 
 from ..logger import WranglerLogger
 from ..params import LAT_LON_CRS, SMALL_RECS
-from .data import coerce_val_to_df_types
+from .data import coerce_val_to_df_types, set_validation_stamp, validation_stamp
 
 
 class DatamodelDataframeIncompatableError(Exception):
@@ -55,14 +66,20 @@ def default_from_datamodel(data_model: pa.DataFrameModel, field: str):
     return None
 
 
-def fill_df_with_defaults_from_model(df, model):
+def required_fields_from_model(model: DataFrameModel) -> list[str]:
+    """Returns the fields which are required in a pandera data model."""
+    return [c for c, col in model.to_schema().columns.items() if col.required]
+
+
+def fill_df_with_defaults_from_model(df, model, columns: Optional[list[str]] = None):
     """Fill a DataFrame with default values from a Pandera DataFrameModel.
 
     Args:
         df: DataFrame to fill with default values.
         model: Pandera DataFrameModel to get default values from.
+        columns: columns to fill. Defaults to None, which fills all columns.
     """
-    for c in df.columns:
+    for c in df.columns if columns is None else columns:
         default_value = default_from_datamodel(model, c)
         if default_value is None:
             df[c] = df[c].where(pd.notna(df[c]), None)
@@ -71,27 +88,189 @@ def fill_df_with_defaults_from_model(df, model):
     return df
 
 
+ValidationModes = Literal["full", "incremental", "trusted"]
+
+
+def edit_validation_mode(mode: ValidationModes) -> Literal["full", "incremental"]:
+    """Validation mode to use for tables edited in memory given the configured mode.
+
+    `trusted` only applies to tables read from stamped files, so edits are validated
+    incrementally instead.
+    """
+    return "full" if mode == "full" else "incremental"
+
+
+@cache
+def schema_hash(model: type) -> str:
+    """Hash of the fields, dtypes, and constraints of a Pandera DataFrameModel.
+
+    Changes whenever the data model does, so that tables validated to a previous version of
+    the data model aren't trusted.
+    """
+    from .. import __version__
+
+    schema = model.to_schema()
+    _fields = [
+        (
+            name,
+            str(col.dtype),
+            col.nullable,
+            col.unique,
+            col.required,
+            col.regex,
+            sorted(str(check.name) for check in col.checks),
+        )
+        for name, col in schema.columns.items()
+    ]
+    _value = repr((model.__name__, _fields, schema.unique, __version__))
+    return hashlib.sha256(_value.encode()).hexdigest()
+
+
+def stamp_validated(df: DataFrame, model: type) -> DataFrame:
+    """Records in df.attrs that df is valid to model as of now.
+
+    Tracks the number of records and dtypes of df so that incremental validation can tell
+    whether df was changed without being marked as modified. The record only applies to df
+    itself, not to copies of it, see `utils.data.validation_stamp`.
+    """
+    stamp = {
+        "model": model.__name__,
+        "schema_hash": schema_hash(model),
+        "n_rows": len(df),
+        "dtypes": {c: str(dtype) for c, dtype in df.dtypes.items()},
+        "modified_rows": [],
+        "modified_columns": [],
+    }
+    return set_validation_stamp(df, stamp)
+
+
+def _has_model_dtypes(df: DataFrame, model: type) -> bool:
+    """True if df has all the fields of model and they have the dtypes of the model."""
+    for name, col in model.to_schema().columns.items():
+        if col.regex:
+            continue
+        if name not in df.columns:
+            return False
+        if col.dtype is None:
+            continue
+        try:
+            if not col.dtype.check(pandas_engine.Engine.dtype(df[name].dtype)):
+                return False
+        except TypeError:
+            return False
+    return True
+
+
+def _modified_since_validated(
+    df: DataFrame, model: type
+) -> Optional[tuple[list[str], Optional[list]]]:
+    """Columns and rows of df modified since it was validated to model, if they are known.
+
+    In-place edits which weren't marked as modified, see `utils.data.copy_on_write`, can only
+    be detected if they changed the number of records or dtypes of df.
+
+    Returns:
+        Modified columns and index of modified rows, which is None if all rows were. Both are
+        empty if nothing was modified since df was validated. None if they aren't known because
+        df wasn't validated to this version of model or was changed without being marked as
+        modified.
+    """
+    stamp = validation_stamp(df)
+    if (
+        not stamp
+        or stamp["model"] != model.__name__
+        or stamp["schema_hash"] != schema_hash(model)
+        or stamp["n_rows"] != len(df)
+        or any(c not in df.columns for c in stamp["dtypes"])
+    ):
+        return None
+    _new_cols = [c for c in df.columns if c not in stamp["dtypes"]]
+    _cols = [c for c in df.columns if c in stamp["modified_columns"] or c in _new_cols]
+    _rows = None if _new_cols else stamp["modified_rows"]
+    if _rows == []:
+        _cols = []
+    if any(str(df[c].dtype) != stamp["dtypes"][c] for c in df.columns if c not in _cols):
+        return None
+    return _cols, _rows
+
+
+def _validate_modified_to_model(df: DataFrame, model: type) -> Optional[DataFrame]:
+    """Validates only the rows and columns of df modified since it was validated to model.
+
+    Uniqueness is still checked across all of df if anything was modified.
+
+    Returns:
+        The validated df, or None if df can't be validated incrementally because what was
+        modified since it was validated to model isn't known, see `_modified_since_validated`.
+    """
+    modified = _modified_since_validated(df, model)
+    if modified is None:
+        return None
+    _cols, _rows = modified
+    if not _cols:
+        WranglerLogger.debug(f"Skipping validation of unmodified df to {model.__name__}.")
+        return stamp_validated(df, model)
+
+    schema = model.to_schema()
+    _col_schemas = {
+        name: col
+        for name, col in schema.columns.items()
+        if name in _cols or (col.regex and any(re.match(name, str(c)) for c in _cols))
+    }
+    sub_df = df[_cols] if _rows is None else df.loc[df.index.isin(_rows), _cols]
+    sub_schema = pa.DataFrameSchema(_col_schemas, coerce=schema.coerce, name=schema.name)
+    valid_df = sub_schema.validate(sub_df, lazy=True)
+    # coercing the whole column would change records which weren't modified
+    if any(valid_df[c].dtype != df[c].dtype for c in _cols):
+        return None
+    validate_unique_fields(df, model)
+    WranglerLogger.debug(
+        f"Incrementally validated {len(sub_df)} of {len(df)} records and {len(_cols)} fields "
+        f"to {model.__name__}."
+    )
+    df = fill_df_with_defaults_from_model(df, model, columns=_cols)
+    return stamp_validated(df, model)
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 def validate_df_to_model(
-    df: DataFrame, model: type, output_file: Path = Path("validation_failure_cases.csv")
+    df: DataFrame,
+    model: type,
+    output_file: Path = Path("validation_failure_cases.csv"),
+    mode: ValidationModes = "full",
 ) -> DataFrame:
     """Wrapper to validate a DataFrame against a Pandera DataFrameModel with better logging.
 
-    Also copies the attrs from the input DataFrame to the validated DataFrame.
+    Also copies the attrs from the input DataFrame to the validated DataFrame and records in
+    them that it was validated, which is used by incremental validation.
 
     Args:
         df: DataFrame to validate.
         model: Pandera DataFrameModel to validate against.
         output_file: Optional file to write validation errors to. Defaults to
             validation_failure_cases.csv.
+        mode: How much of df to validate. `full` validates all of df. `incremental` only
+            validates the rows and columns modified since df was last validated to model.
+            `trusted` only checks that df has the fields and dtypes of model and should only be
+            used for data which was validated when it was written. Falls back to `full` if the
+            mode can't be used. Defaults to `full`.
     """
+    if mode == "trusted" and _has_model_dtypes(df, model):
+        WranglerLogger.debug(f"Trusting dtypes of {model.__name__} without validating values.")
+        df = fill_df_with_defaults_from_model(df, model)
+        return stamp_validated(df, model)
+
     attrs = copy.deepcopy(df.attrs)
     err_msg = f"Validation to {model.__name__} failed."
     try:
+        if mode == "incremental":
+            model_df = _validate_modified_to_model(df, model)
+            if model_df is not None:
+                return model_df
         model_df = model.validate(df, lazy=True)
         model_df = fill_df_with_defaults_from_model(model_df, model)
         model_df.attrs = attrs
-        return model_df
+        return stamp_validated(model_df, model)
     except (TypeError, ValueError) as e:
         WranglerLogger.error(f"Validation to {model.__name__} failed.\n{e}")
         raise TableValidationError(err_msg) from e
@@ -117,6 +296,35 @@ def validate_df_to_model(
         raise TableValidationError(err_msg) from e
 
 
+def validate_unique_fields(df: DataFrame, model: type) -> None:
+    """Checks the fields which a Pandera DataFrameModel requires to be unique.
+
+    Used for tables which are validated in chunks, where uniqueness can only be checked within
+    each chunk, without re-validating the whole table.
+
+    Args:
+        df: DataFrame to check.
+        model: Pandera DataFrameModel with the unique fields.
+
+    Raises:
+        TableValidationError: if any unique field or combination of fields is duplicated.
+    """
+    schema = model.to_schema()
+    _unique_cols = [c for c, col in schema.columns.items() if col.unique and c in df.columns]
+    _dupe_cols = [c for c in _unique_cols if not df[c].is_unique]
+    _unique_combo = schema.unique if isinstance(schema.unique, list) else []
+    if (
+        _unique_combo
+        and all(c in df.columns for c in _unique_combo)
+        and df.duplicated(subset=_unique_combo).any()
+    ):
+        _dupe_cols.append(tuple(_unique_combo))
+    if _dupe_cols:
+        msg = f"Validation to {model.__name__} failed. Duplicate values in {_dupe_cols}."
+        WranglerLogger.error(msg)
+        raise TableValidationError(msg)
+
+
 def identify_model(
     data: Union[pd.DataFrame, dict], models: list
 ) -> Union[DataFrameModel, BaseModel]:
@@ -10,13 +10,19 @@ Internal function terminology for timespan scopes:
 - `conflicting`: a timespan that is overlapping but not matching. By definition default
      scope values are not conflicting.
 - `independent` a timespan that is not overlapping.
+
+Vectorized operations on timespans use integer seconds from midnight where hours past 24 (and
+end times earlier than start times) are in the next day, e.g. `["22:00", "26:00"]` is
+`(79200, 93600)`.
 """
 
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from pydantic import validate_call
 
@@ -24,6 +30,8 @@ from ..logger import WranglerLogger
 from ..models._base.series import TimeStrSeriesSchema
 from ..models._base.types import TimespanString, TimeString
 
+SECONDS_PER_DAY = 24 * 60 * 60
+
 
 class TimespanDfQueryError(Exception):
     """Error for timespan query errors."""
@@ -160,6 +168,126 @@ def seconds_from_midnight_to_str(seconds: int) -> TimeString:
     return str(timedelta(seconds=seconds))
 
 
+def str_to_seconds(time_str: TimeString) -> int:
+    """Convert TimeString (HH:MM<:SS>) to seconds from midnight.
+
+    Unlike `str_to_seconds_from_midnight`, hours past 24 are kept as the next day.
+    """
+    parts = time_str.split(":")
+    seconds = int(parts[2]) if len(parts) == 3 else 0  # noqa: PLR2004
+    return int(parts[0]) * 3600 + int(parts[1]) * 60 + seconds
+
+
+@lru_cache(maxsize=1024)
+def _timespan_to_seconds(timespan: tuple[TimeString, ...]) -> tuple[int, int]:
+    start_sec, end_sec = (str_to_seconds(t) for t in timespan)
+    if end_sec < start_sec:
+        end_sec += SECONDS_PER_DAY
+    return start_sec, end_sec
+
+
+def timespan_to_seconds(timespan: list[TimeString]) -> tuple[int, int]:
+    """Convert a timespan of TimeStrings to start and end seconds from midnight.
+
+    If the end time is less than the start time, it is assumed to be the next day.
+    """
+    return _timespan_to_seconds(tuple(timespan))
+
+
+def str_series_to_seconds(time_str_s: pd.Series) -> np.ndarray:
+    """Convert a series of TimeStrings (HH:MM<:SS>) to an int32 array of seconds from midnight."""
+    if time_str_s.empty:
+        return np.array([], dtype=np.int32)
+    time_parts = time_str_s.str.split(":", expand=True).astype(np.int32).to_numpy()
+    seconds = time_parts[:, 0] * 3600 + time_parts[:, 1] * 60
+    if time_parts.shape[1] == 3:  # noqa: PLR2004
+        seconds += time_parts[:, 2]
+    return seconds.astype(np.int32)
+
+
+def dt_series_to_seconds(dt_s: pd.Series, base_date: Optional[date] = None) -> np.ndarray:
+    """Convert a datetime series to an int32 array of seconds from midnight of base_date.
+
+    Times on days after base_date are past 24 hours, consistent with `str_to_time`.
+
+    Args:
+        dt_s: series of datetimes.
+        base_date: date that times are relative to. Defaults to today, which is the default
+            base date of `str_to_time` and `str_to_time_series`.
+    """
+    base_dt = pd.Timestamp(base_date if base_date is not None else date.today())
+    return (
+        ((pd.to_datetime(dt_s) - base_dt) // pd.Timedelta(seconds=1)).to_numpy().astype(np.int32)
+    )
+
+
+def series_to_seconds(time_s: pd.Series, base_date: Optional[date] = None) -> np.ndarray:
+    """Convert a series of datetimes, TimeStrings or seconds to an int32 array of seconds."""
+    if pd.api.types.is_datetime64_any_dtype(time_s):
+        return dt_series_to_seconds(time_s, base_date=base_date)
+    if pd.api.types.is_integer_dtype(time_s):
+        return time_s.to_numpy().astype(np.int32)
+    return str_series_to_seconds(time_s)
+
+
+def df_to_start_end_seconds(
+    df: pd.DataFrame, start_col: str = "start_time", end_col: str = "end_time"
+) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end seconds from midnight for timespans in `start_col` and `end_col` of df.
+
+    If the end time is less than the start time, it is assumed to be the next day.
+
+    Raises:
+        TimespanDfQueryError: if df doesn't have start_col and end_col.
+    """
+    if start_col not in df.columns or end_col not in df.columns:
+        msg = f"DataFrame must have '{start_col}' and '{end_col}' columns"
+        WranglerLogger.error(msg)
+        raise TimespanDfQueryError(msg)
+    start_sec = series_to_seconds(df[start_col])
+    end_sec = series_to_seconds(df[end_col])
+    end_sec = np.where(end_sec < start_sec, end_sec + SECONDS_PER_DAY, end_sec).astype(np.int32)
+    return start_sec, end_sec
+
+
+def seconds_overlap_duration(
+    start_sec: np.ndarray, end_sec: np.ndarray, q_start_sec, q_end_sec
+) -> np.ndarray:
+    """Seconds of overlap between timespans and query timespan(s). Negative if not overlapping.
+
+    Query start and end can be scalars or arrays which broadcast with start_sec and end_sec.
+    """
+    return np.minimum(end_sec, q_end_sec) - np.maximum(start_sec, q_start_sec)
+
+
+def seconds_overlaps(
+    start_sec: np.ndarray, end_sec: np.ndarray, q_start_sec, q_end_sec
+) -> np.ndarray:
+    """Mask of timespans which overlap the query timespan(s) by at least a second."""
+    return (start_sec < q_end_sec) & (q_start_sec < end_sec)
+
+
+def seconds_contains(
+    start_sec: np.ndarray, end_sec: np.ndarray, q_start_sec, q_end_sec
+) -> np.ndarray:
+    """Mask of timespans which inclusively contain the query timespan(s)."""
+    return (start_sec <= q_start_sec) & (end_sec >= q_end_sec)
+
+
+def max_overlap_positions(groups: np.ndarray, overlap: np.ndarray) -> np.ndarray:
+    """Positions of the maximum overlap for each group, using the first position for ties.
+
+    Args:
+        groups: array of group labels or codes, e.g. `model_link_id`.
+        overlap: array of overlap durations, same length as groups.
+    """
+    order = np.lexsort((-overlap, groups))
+    sorted_groups = groups[order]
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    return order[is_first]
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 def filter_df_to_overlapping_timespans(
     orig_df: pd.DataFrame,
@@ -174,19 +302,10 @@ def filter_df_to_overlapping_timespans(
         query_timespans: List of a list of TimespanStr of format ['HH:MM','HH:MM'] to query orig_df
             for overlapping records.
     """
-    if "start_time" not in orig_df.columns or "end_time" not in orig_df.columns:
-        msg = "DataFrame must have 'start_time' and 'end_time' columns"
-        WranglerLogger.error(msg)
-        raise TimespanDfQueryError(msg)
-
-    mask = pd.Series([False] * len(orig_df), index=orig_df.index)
-    for query_timespan in query_timespans:
-        q_start_time, q_end_time = str_to_time_list(query_timespan)
-        end_time_s = orig_df["end_time"]
-        end_time_s.loc[orig_df["end_time"] < orig_df["start_time"]] += pd.Timedelta(days=1)
-        this_ts_mask = (orig_df["start_time"] < q_end_time) & (q_start_time < end_time_s)
-        mask |= this_ts_mask
-    return orig_df.loc[mask]
+    start_sec, end_sec = df_to_start_end_seconds(orig_df)
+    q_sec = np.array([timespan_to_seconds(ts) for ts in query_timespans]).reshape(-1, 2)
+    mask = seconds_overlaps(start_sec[:, None], end_sec[:, None], q_sec[:, 0], q_sec[:, 1])
+    return orig_df.loc[mask.any(axis=1)]
 
 
 def calc_overlap_duration_with_query(
@@ -202,12 +321,13 @@ def calc_overlap_duration_with_query(
         end_time_s: Series of end times to calculate overlap with.
         start_time_q: Query start time to calculate overlap with.
         end_time_q: Query end time to calculate overlap with.
-    """
-    overlap_start = start_time_s.combine(start_time_q, max)
-    overlap_end = end_time_s.combine(end_time_q, min)
-    overlap_duration_s = (overlap_end - overlap_start).dt.total_seconds() / 60
 
-    return overlap_duration_s
+    Returns: Series of overlap duration in minutes.
+    """
+    overlap_start = np.maximum(start_time_s.to_numpy(), np.datetime64(start_time_q))
+    overlap_end = np.minimum(end_time_s.to_numpy(), np.datetime64(end_time_q))
+    overlap_duration = (overlap_end - overlap_start) / np.timedelta64(1, "m")
+    return pd.Series(overlap_duration, index=start_time_s.index)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -233,33 +353,27 @@ def filter_df_to_max_overlapping_timespans(
             Defaults to 1.
         keep_max_of_cols: list of fields to return the maximum value of overlap for.  If None,
             will return all overlapping time periods. Defaults to `['model_link_id']`
+
+    Returns: filtered copy of orig_df with an added `overlap_duration` field in minutes.
     """
     if keep_max_of_cols is None:
         keep_max_of_cols = ["model_link_id"]
-    if "start_time" not in orig_df.columns or "end_time" not in orig_df.columns:
-        msg = "DataFrame must have 'start_time' and 'end_time' columns"
-        WranglerLogger.error(msg)
-        raise TimespanDfQueryError(msg)
-    q_start, q_end = str_to_time_list(query_timespan)
-
-    real_end = orig_df["end_time"]
-    real_end.loc[orig_df["end_time"] < orig_df["start_time"]] += pd.Timedelta(days=1)
+    start_sec, end_sec = df_to_start_end_seconds(orig_df)
+    q_start, q_end = timespan_to_seconds(query_timespan)
 
-    orig_df["overlap_duration"] = calc_overlap_duration_with_query(
-        orig_df["start_time"],
-        real_end,
-        q_start,
-        q_end,
-    )
+    overlap_sec = seconds_overlap_duration(start_sec, end_sec, q_start, q_end)
     if strict_match:
-        overlap_df = orig_df.loc[(orig_df.start_time <= q_start) & (real_end >= q_end)]
+        keep = seconds_contains(start_sec, end_sec, q_start, q_end)
     else:
-        overlap_df = orig_df.loc[orig_df.overlap_duration > min_overlap_minutes]
-    WranglerLogger.debug(f"overlap_df: \n{overlap_df}")
+        keep = overlap_sec > min_overlap_minutes * 60
+    positions = np.flatnonzero(keep)
     if keep_max_of_cols:
         # keep only the maximum overlap
-        idx = overlap_df.groupby(keep_max_of_cols)["overlap_duration"].idxmax()
-        overlap_df = overlap_df.loc[idx]
+        groups = orig_df[keep_max_of_cols].iloc[positions]
+        group_codes = groups.groupby(keep_max_of_cols, sort=False).ngroup().to_numpy()
+        positions = np.sort(positions[max_overlap_positions(group_codes, overlap_sec[positions])])
+    overlap_df = orig_df.iloc[positions].assign(overlap_duration=overlap_sec[positions] / 60)
+    WranglerLogger.debug(f"overlap_df: \n{overlap_df}")
     return overlap_df
 
 
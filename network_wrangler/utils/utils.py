@@ -1,6 +1,7 @@
 """General utility functions used throughout package."""
 
 import hashlib
+import itertools
 import re
 from typing import Union
 
@@ -13,6 +14,19 @@ class DictionaryMergeError(Exception):
     """Error raised when there is a conflict in merging two dictionaries."""
 
 
+_VERSION_COUNTER = itertools.count(1)
+
+
+def next_version() -> int:
+    """Returns a new version number which is unique and monotonically increasing in a process.
+
+    Used to tag mutations of network tables so that caches can be validated in O(1) without
+    re-hashing the tables. Because the counter is shared, two different tables never get the
+    same version number unless one was copied from the other.
+    """
+    return next(_VERSION_COUNTER)
+
+
 def topological_sort(adjacency_list, visited_list):
     """Topological sorting for Acyclic Directed Graph.
 
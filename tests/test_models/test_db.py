@@ -46,3 +46,54 @@ def test_validate_db_table():
 
     with pytest.raises(TableValidationError):
         db.table_a = pd.DataFrame({"B_ID": ["hi", "there", "buddy"], "a_value": [3, 4, 5]})
+
+
+def test_batch_update_db_tables():
+    db = MockDBModel()
+    db.table_a = pd.DataFrame({"A_ID": [1, 2, 3], "name": ["a", "b", "c"]})
+    db.table_b = pd.DataFrame({"B_ID": [4, 5, 6], "a_value": [1, 2, 3]})
+    assert db.key_index("table_a", "A_ID").tolist() == [1, 2, 3]
+
+    # fks are only checked once both tables are set
+    with db.batch_update():
+        db.table_b = pd.DataFrame({"B_ID": [4, 5], "a_value": [7, 8]})
+        db.table_a = pd.DataFrame({"A_ID": [7, 8], "name": ["g", "h"]})
+    assert db.key_index("table_a", "A_ID").tolist() == [7, 8]
+
+    with pytest.raises(ForeignKeyValueError), db.batch_update():
+        db.table_b = pd.DataFrame({"B_ID": [4, 5], "a_value": [7, 9]})
+
+
+def _batch_set_tables(db, **tables):
+    with db.batch_update():
+        for table_name, table in tables.items():
+            setattr(db, table_name, table)
+
+
+def test_failed_batch_update_rolls_back():
+    db = MockDBModel()
+    db.table_a = pd.DataFrame({"A_ID": [1, 2, 3], "name": ["a", "b", "c"]})
+    db.table_b = pd.DataFrame({"B_ID": [4, 5, 6], "a_value": [1, 2, 3]})
+    table_a, table_b, version = db.table_a, db.table_b, db.version
+
+    with pytest.raises(ForeignKeyValueError):
+        _batch_set_tables(
+            db,
+            table_a=pd.DataFrame({"A_ID": [7, 8], "name": ["g", "h"]}),
+            table_b=pd.DataFrame({"B_ID": [4, 5], "a_value": [7, 9]}),
+        )
+    assert db.table_a is table_a
+    assert db.table_b is table_b
+    assert db.version == version
+    assert db.key_index("table_a", "A_ID").tolist() == [1, 2, 3]
+
+    # tables which weren't set before a failed batch still aren't
+    new_db = MockDBModel()
+    with pytest.raises(ForeignKeyValueError):
+        _batch_set_tables(
+            new_db,
+            table_a=pd.DataFrame({"A_ID": [1], "name": ["a"]}),
+            table_b=pd.DataFrame({"B_ID": [4], "a_value": [2]}),
+        )
+    assert "table_a" not in new_db.__dict__
+    assert "table_b" not in new_db.__dict__
@@ -0,0 +1,74 @@
+"""Tests for network_wrangler.models.roadway module."""
+
+import numpy as np
+import pandas as pd
+
+from network_wrangler.models.roadway.types import (
+    ScopedLinkValueItem,
+    valid_scoped_link_values,
+)
+
+
+def test_valid_scoped_link_values():
+    scoped_values = pd.Series(
+        [
+            None,
+            np.nan,
+            [{"timespan": ["6:00", "9:00"], "value": 2}],
+            [{"category": "hov2", "value": 3}, {"category": "hov3", "value": 3.5}],
+            [
+                {"category": "sov", "timespan": ["6:00", "9:00"], "value": 2},
+                {"category": "sov", "timespan": ["9:00", "10:00"], "value": 3},
+            ],
+            [ScopedLinkValueItem(category="sov", timespan=["16:00", "19:00"], value=1)],
+            # missing both category and timespan
+            [{"value": 2}],
+            # badly formatted timespan
+            [{"timespan": ["6", "9:00"], "value": 2}],
+            # extra field
+            [{"timespan": ["6:00", "9:00"], "value": 2, "lanes": 3}],
+            # invalid value type
+            [{"timespan": ["6:00", "9:00"], "value": [2]}],
+            # overlapping timespans for the same category
+            [
+                {"category": "sov", "timespan": ["6:00", "9:00"], "value": 2},
+                {"category": "sov", "timespan": ["8:00", "10:00"], "value": 3},
+            ],
+        ],
+        index=range(100, 111),
+        dtype=object,
+    )
+    expected = pd.Series([True] * 6 + [False] * 5, index=scoped_values.index)
+
+    pd.testing.assert_series_equal(valid_scoped_link_values(scoped_values), expected)
+
+
+def test_valid_scoped_link_values_from_parquet(tmp_path):
+    """Scoped values read from parquet are arrays of dicts with arrays of timespans."""
+    scoped_values = pd.Series(
+        [
+            None,
+            [{"timespan": ["6:00", "9:00"], "value": 2}],
+            [{"category": "hov2", "value": 3}, {"category": "hov3", "value": 3.5}],
+            [
+                {"category": "sov", "timespan": ["6:00", "9:00"], "value": 2},
+                {"category": "sov", "timespan": ["9:00", "10:00"], "value": 3},
+            ],
+            # badly formatted timespan
+            [{"timespan": ["6", "9:00"], "value": 2}],
+            # overlapping timespans for the same category
+            [
+                {"category": "sov", "timespan": ["6:00", "9:00"], "value": 2},
+                {"category": "sov", "timespan": ["8:00", "10:00"], "value": 3},
+            ],
+        ],
+        name="sc_lanes",
+        dtype=object,
+    )
+    scoped_values.to_frame().to_parquet(tmp_path / "scoped.parquet")
+    read_values = pd.read_parquet(tmp_path / "scoped.parquet")["sc_lanes"]
+    assert isinstance(read_values[1][0]["timespan"], np.ndarray)
+
+    expected = pd.Series([True] * 4 + [False] * 2, index=read_values.index)
+    pd.testing.assert_series_equal(valid_scoped_link_values(read_values), expected)
+    pd.testing.assert_series_equal(valid_scoped_link_values(scoped_values), expected)
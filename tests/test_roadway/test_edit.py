@@ -7,6 +7,7 @@ import pytest
 
 from network_wrangler.errors import LinkAddError, NodeAddError
 from network_wrangler.logger import WranglerLogger
+from network_wrangler.roadway.graph import net_to_graph
 from network_wrangler.utils.models import TableValidationError
 
 
@@ -213,3 +214,159 @@ def test_move_nodes(request, small_net):
         assert net.links_df.loc[link_id, "geometry"].coords[-1][1] == new_geo.loc[b_id, "Y"]
 
     WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_move_nodes_shared_shape(request):
+    """Moving a node should only patch the end of links and shapes which use it."""
+    import geopandas as gpd
+    from shapely.geometry import LineString, Point
+
+    from network_wrangler.roadway.links.edit import edit_link_geometry_from_nodes
+    from network_wrangler.roadway.links.links import NodeIncidenceIndex
+    from network_wrangler.roadway.shapes.edit import edit_shape_geometry_from_nodes
+
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    nodes_df = gpd.GeoDataFrame(
+        {"model_node_id": [1, 2, 3]},
+        geometry=[Point(0, 0), Point(1, 0), Point(2, 0)],
+        index=[1, 2, 3],
+    )
+    # links 10 and 11 are the same road in both directions and share a shape
+    links_df = gpd.GeoDataFrame(
+        {"A": [1, 2, 2], "B": [2, 1, 3], "shape_id": ["s1", "s1", "s2"]},
+        geometry=[
+            LineString([(0, 0), (1, 0)]),
+            LineString([(1, 0), (0, 0)]),
+            LineString([(1, 0), (2, 0)]),
+        ],
+        index=[10, 11, 12],
+    )
+    shapes_df = gpd.GeoDataFrame(
+        {"shape_id": ["s1", "s2"]},
+        geometry=[LineString([(0, 0), (0.5, 0.5), (1, 0)]), LineString([(1, 0), (2, 0)])],
+        index=["s1", "s2"],
+    )
+    incidence = NodeIncidenceIndex(links_df)
+    assert sorted(incidence.link_labels([1])) == [10, 11]
+    assert set(incidence.links([1]).itertuples(index=False, name=None)) == {
+        (10, 1, 0),
+        (11, 1, -1),
+    }
+
+    moved_nodes_df = nodes_df.copy()
+    moved_nodes_df.loc[1, "geometry"] = Point(0, 5)
+    new_links_df = edit_link_geometry_from_nodes(
+        links_df, moved_nodes_df, [1], node_incidence=incidence
+    )
+    assert new_links_df.loc[10, "geometry"].equals(LineString([(0, 5), (1, 0)]))
+    assert new_links_df.loc[11, "geometry"].equals(LineString([(1, 0), (0, 5)]))
+    assert new_links_df.loc[12, "geometry"] is links_df.loc[12, "geometry"]
+    assert links_df.loc[10, "geometry"].equals(LineString([(0, 0), (1, 0)]))
+
+    new_shapes_df = edit_shape_geometry_from_nodes(
+        shapes_df,
+        new_links_df,
+        moved_nodes_df,
+        [1],
+        node_incidence=incidence,
+        prev_nodes_df=nodes_df,
+    )
+    assert new_shapes_df.loc["s1", "geometry"].equals(LineString([(0, 5), (0.5, 0.5), (1, 0)]))
+    assert new_shapes_df.loc["s2", "geometry"].equals(shapes_df.loc["s2", "geometry"])
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_network_versions(request, small_net):
+    """Versions should change with every mutation and drive cache invalidation."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = copy.deepcopy(small_net)
+    og_versions = net.versions
+    assert net.versions == small_net.versions
+
+    model_net = net.model_net
+    graph = net.get_modal_graph("drive")
+    assert net.model_net is model_net
+    assert net.get_modal_graph("drive") is graph
+
+    net.add_links(
+        pd.DataFrame(
+            {"model_link_id": [999], "A": [8], "B": [3], "name": ["Link 1"], "lanes": [1]}
+        )
+    )
+    assert net.versions["links"] > og_versions["links"]
+    assert net.versions["nodes"] == og_versions["nodes"]
+    # copy should be unaffected
+    assert small_net.versions == og_versions
+    assert net.model_net is not model_net
+    # graph is updated in place rather than rebuilt
+    assert net.get_modal_graph("drive") is graph
+    assert graph.has_edge(8, 3, 999)
+
+    # in-place mutations are only detected if flagged
+    link_version = net.versions["links"]
+    net.links_df.loc[net.links_df.index[0], "lanes"] = 5
+    assert net.versions["links"] == link_version
+    net.mark_modified("links")
+    assert net.versions["links"] > link_version
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def _graph_contents(G) -> tuple:
+    """Nodes and edges of a networkx graph with their non-geometry attributes."""
+
+    def _attrs(d: dict) -> dict:
+        return {k: v for k, v in d.items() if k != "geometry"}
+
+    return (
+        {n: _attrs(d) for n, d in G.nodes(data=True)},
+        {(u, v, k): _attrs(d) for u, v, k, d in G.edges(keys=True, data=True)},
+    )
+
+
+def test_modal_graphs_updated_incrementally(request, small_net):
+    """Cached modal graphs should be updated in place and match a full rebuild."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = copy.deepcopy(small_net)
+    nx_graph = net.get_modal_graph("drive")
+    csr_graph = net.get_modal_graph("drive", backend="csr")
+    builds = net.modal_graph_builds
+
+    net.add_nodes(pd.DataFrame({"model_node_id": [999], "X": [-93.09], "Y": [44.95]}))
+    net.add_links(
+        pd.DataFrame(
+            {"model_link_id": [999], "A": [8], "B": [999], "name": ["Link 1"], "lanes": [1]}
+        )
+    )
+    net.delete_links({"model_link_id": [111, 112]})
+    net = net.apply(
+        {
+            "project": "close to cars",
+            "roadway_property_change": {
+                "facility": {"links": {"model_link_id": [113]}},
+                "property_changes": {"drive_access": {"set": False}, "lanes": {"set": 3}},
+            },
+        }
+    )
+    net.move_nodes(pd.DataFrame({"model_node_id": [3], "X": [-93.1], "Y": [44.96]}))
+
+    assert net.get_modal_graph("drive") is nx_graph
+    assert net.get_modal_graph("drive", backend="csr") is csr_graph
+    assert net.modal_graph_builds == builds
+
+    assert nx_graph.has_edge(8, 999, 999)
+    assert not nx_graph.has_edge(1, 2, 111)
+    assert not nx_graph.has_edge(2, 3, 113)
+    assert nx_graph.nodes[3]["x"] == -93.1
+    assert _graph_contents(nx_graph) == _graph_contents(net_to_graph(net, "drive"))
+
+    rebuilt_csr_graph = net_to_graph(net, "drive", backend="csr")
+    assert set(csr_graph.to_networkx().edges(keys=True, data="weight")) == set(
+        rebuilt_csr_graph.to_networkx().edges(keys=True, data="weight")
+    )
+    assert csr_graph.node_ids.tolist() == rebuilt_csr_graph.node_ids.tolist()
+
+    # in-place changes can't be applied incrementally so the graph is rebuilt
+    net.mark_modified("links")
+    assert net.get_modal_graph("drive") is not nx_graph
+    assert net.modal_graph_builds == builds + 1
+    WranglerLogger.info(f"--Finished: {request.node.name}")
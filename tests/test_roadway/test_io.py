@@ -12,13 +12,15 @@ from network_wrangler import (
     load_roadway_from_dir,
     write_roadway,
 )
-from network_wrangler.models.roadway.tables import RoadLinksTable
+from network_wrangler.configs import load_wrangler_config
+from network_wrangler.models.roadway.tables import RoadLinksTable, RoadNodesTable
 from network_wrangler.roadway import diff_nets
 from network_wrangler.roadway.io import (
     convert_roadway_file_serialization,
     id_roadway_file_paths_in_dir,
 )
 from network_wrangler.roadway.network import RoadwayNetwork
+from network_wrangler.utils.io_table import has_schema_stamp, write_table
 
 
 def test_id_roadway_file_paths_in_dir(request, tmpdir):
@@ -178,18 +180,20 @@ def test_load_roadway_no_shapes(request, example_dir):
     assert roadway_network._shapes_df is None
 
 
+ONE_BLOCK = Polygon(
+    [
+        [-93.09424891687992, 44.950667556032386],
+        [-93.09318302493314, 44.949458919295751],
+        [-93.09110424119152, 44.950413327659845],
+        [-93.09238213374682, 44.951563597873246],
+        [-93.09424891687992, 44.950667556032386],
+    ]
+)
+
+
 def test_load_roadway_within_boundary(request, example_dir):
     WranglerLogger.info(f"--Starting: {request.node.name}")
-    one_block = Polygon(
-        [
-            [-93.09424891687992, 44.950667556032386],
-            [-93.09318302493314, 44.949458919295751],
-            [-93.09110424119152, 44.950413327659845],
-            [-93.09238213374682, 44.951563597873246],
-            [-93.09424891687992, 44.950667556032386],
-        ]
-    )
-    boundary_gdf = GeoDataFrame({"geometry": [one_block]}, crs="EPSG:4326")
+    boundary_gdf = GeoDataFrame({"geometry": [ONE_BLOCK]}, crs="EPSG:4326")
     roadway_network = load_roadway_from_dir(example_dir / "small", boundary_gdf=boundary_gdf)
 
     assert isinstance(roadway_network, RoadwayNetwork)
@@ -198,3 +202,111 @@ def test_load_roadway_within_boundary(request, example_dir):
     assert set(roadway_network.nodes_df.index) == set(expected_node_ids)
     assert set(roadway_network.links_df["A"]).issubset(set(expected_node_ids))
     assert set(roadway_network.links_df["B"]).issubset(set(expected_node_ids))
+
+
+@pytest.mark.parametrize("io_format", ["geojson", "parquet"])
+def test_load_roadway_in_chunks(request, example_dir, test_out_dir, io_format):
+    """Reading in chunks should give the same network as reading whole files."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = load_roadway_from_dir(example_dir / "stpaul", read_in_shapes=True)
+    test_io_dir = test_out_dir / "chunks"
+    write_roadway(net, file_format=io_format, out_dir=test_io_dir, overwrite=True)
+
+    whole_net = load_roadway_from_dir(test_io_dir, file_format=io_format, read_in_shapes=True)
+    chunked_net = load_roadway_from_dir(
+        test_io_dir, file_format=io_format, read_in_shapes=True, chunk_size=500
+    )
+    assert len(chunked_net.links_df) == len(whole_net.links_df)
+    assert len(chunked_net.nodes_df) == len(whole_net.nodes_df)
+    assert len(chunked_net.shapes_df) == len(whole_net.shapes_df)
+    assert chunked_net.links_df.index.equals(whole_net.links_df.index)
+    assert chunked_net.nodes_df.geometry.geom_equals(whole_net.nodes_df.geometry).all()
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_load_roadway_columns_and_filters(request, example_dir, test_out_dir):
+    """Reading a subset of columns and links shouldn't drop the other columns when written."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = load_roadway_from_dir(example_dir / "small")
+    test_io_dir = test_out_dir / "projection"
+    write_roadway(net, file_format="parquet", out_dir=test_io_dir, overwrite=True)
+
+    sub_net = load_roadway_from_dir(
+        test_io_dir,
+        file_format="parquet",
+        links_columns=["lanes"],
+        links_filters=[("model_link_id", "in", net.links_df.model_link_id.tolist()[:5])],
+    )
+    assert len(sub_net.links_df) == 5
+    assert "sc_lanes" in sub_net.links_df.columns
+    assert "county" not in sub_net.links_df.columns
+    assert "county" in sub_net.omitted_columns["links"]
+
+    out_dir = test_out_dir / "projection_out"
+    write_roadway(sub_net, file_format="parquet", out_dir=out_dir, overwrite=True)
+    written_net = load_roadway_from_dir(out_dir, file_format="parquet")
+    assert "county" in written_net.links_df.columns
+    assert len(written_net.links_df) == 5
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_load_roadway_trusted(request, example_dir, test_out_dir):
+    """Trusted reads of stamped files should give the same network as fully validated reads."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    test_io_dir = test_out_dir / "trusted"
+    net = load_roadway_from_dir(example_dir / "small")
+    write_roadway(net, file_format="parquet", out_dir=test_io_dir, overwrite=True)
+    assert not (test_io_dir / "link.parquet.stamp").exists()
+
+    config = load_wrangler_config({"VALIDATION": {"MODE": "trusted", "STAMP_FILES": True}})
+    net = load_roadway_from_dir(example_dir / "small", config=config)
+    write_roadway(net, file_format="parquet", out_dir=test_io_dir, overwrite=True)
+    assert (test_io_dir / "link.parquet.stamp").exists()
+    assert has_schema_stamp(test_io_dir / "link.parquet", RoadLinksTable)
+
+    trusted_net = load_roadway_from_dir(test_io_dir, file_format="parquet", config=config)
+    full_net = load_roadway_from_dir(test_io_dir, file_format="parquet")
+    assert trusted_net.links_df.index.equals(full_net.links_df.index)
+    assert (trusted_net.links_df.dtypes == full_net.links_df.dtypes).all()
+    assert trusted_net.nodes_df.geometry.geom_equals(full_net.nodes_df.geometry).all()
+
+    # files changed after they were stamped aren't trusted
+    nodes_df = full_net.nodes_df.copy()
+    nodes_df.loc[nodes_df.index[0], "X"] += 0.001
+    write_table(nodes_df, test_io_dir / "node.parquet", overwrite=True)
+    assert not has_schema_stamp(test_io_dir / "node.parquet", RoadNodesTable)
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+@pytest.mark.parametrize("tile_level", [None, 18])
+def test_spatial_parquet_within_boundary(request, example_dir, test_out_dir, tile_level):
+    """Spatially sorted and tiled parquet should read the same network within a boundary."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = load_roadway_from_dir(example_dir / "small")
+    test_io_dir = test_out_dir / f"spatial_{tile_level}"
+    write_roadway(
+        net,
+        file_format="parquet",
+        out_dir=test_io_dir,
+        overwrite=True,
+        spatial_index=True,
+        tile_level=tile_level,
+    )
+    if tile_level is not None:
+        assert (test_io_dir / "node.parquet" / "_tiles.json").exists()
+
+    full_net = load_roadway_from_dir(test_io_dir, file_format="parquet")
+    assert set(full_net.links_df.index) == set(net.links_df.index)
+    assert set(full_net.nodes_df.index) == set(net.nodes_df.index)
+    assert "bbox" not in full_net.nodes_df.columns
+
+    boundary_gdf = GeoDataFrame({"geometry": [ONE_BLOCK]}, crs="EPSG:4326")
+    expected_net = load_roadway_from_dir(example_dir / "small", boundary_gdf=boundary_gdf)
+    sub_net = load_roadway_from_dir(test_io_dir, file_format="parquet", boundary_gdf=boundary_gdf)
+    assert set(expected_net.nodes_df.index).issubset(set(sub_net.nodes_df.index))
+    sub_net_links = sub_net.links_df.loc[
+        sub_net.links_df.A.isin(expected_net.nodes_df.index)
+        & sub_net.links_df.B.isin(expected_net.nodes_df.index)
+    ]
+    assert set(sub_net_links.index) == set(expected_net.links_df.index)
+    WranglerLogger.info(f"--Finished: {request.node.name}")
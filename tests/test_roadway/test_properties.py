@@ -1,7 +1,12 @@
 """To run these tests, use `pytest -s tests/test_roadway/test_properties.py`."""
 
+import networkx as nx
+import pytest
+
 from network_wrangler import WranglerLogger
-from network_wrangler.roadway.graph import assess_connectivity
+from network_wrangler.errors import NodeNotFoundError
+from network_wrangler.roadway.csr_graph import CSRGraph
+from network_wrangler.roadway.graph import assess_connectivity, shortest_path
 
 
 def test_network_connectivity(request, stpaul_net):
@@ -25,3 +30,92 @@ def test_network_connectivity_ignore_single_nodes(request, stpaul_net):
     assert len(disconnected_nodes) == 5
 
     WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_csr_graph_matches_networkx(request, small_net):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+
+    net = small_net
+    nx_G = net.get_modal_graph("drive")
+    csr_G = net.get_modal_graph("drive", backend="csr")
+    assert net.get_modal_graph("drive", backend="csr") is csr_G
+    assert csr_G.num_nodes == nx_G.number_of_nodes()
+    assert csr_G.num_edges == nx_G.number_of_edges()
+
+    _nx_components = sorted(sorted(c) for c in nx.strongly_connected_components(nx_G))
+    _csr_components = sorted(sorted(c) for c in csr_G.strongly_connected_components())
+    assert _nx_components == _csr_components
+    assert csr_G._tarjan_labels().max() + 1 == len(_csr_components)
+    assert net.is_connected("drive", backend="csr") == net.is_connected("drive")
+
+    _nodes = list(nx_G.nodes)
+    for O_id, D_id in zip(_nodes[:-1], _nodes[1:]):
+        _nx_path = shortest_path(nx_G, O_id, D_id)
+        _csr_path = shortest_path(csr_G, O_id, D_id)
+        if _nx_path is None:
+            assert _csr_path is None
+            continue
+        _path_weight = nx.path_weight(nx.DiGraph(nx_G), _nx_path, "weight")
+        assert nx.path_weight(nx.DiGraph(nx_G), _csr_path, "weight") == _path_weight
+        _link_ids = csr_G.link_ids_in_path(_csr_path)
+        assert net.links_df.loc[_link_ids, "A"].tolist() == _csr_path[:-1]
+
+    assert set(csr_G.to_networkx().edges(keys=True)) == set(nx_G.edges(keys=True))
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_csr_graph_connectivity(request):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+
+    # 1 <-> 2 -> 3 <-> 4, plus isolated node 5
+    G = CSRGraph(
+        A=[1, 2, 2, 3, 4],
+        B=[2, 1, 3, 4, 3],
+        weights=[1, 1, 1, 1, 1],
+        link_ids=[10, 20, 30, 40, 50],
+        node_ids=[5],
+    )
+    _components = sorted(sorted(c) for c in G.strongly_connected_components())
+    assert _components == [[1, 2], [3, 4], [5]]
+    assert G._tarjan_labels().max() == 2
+    assert not G.is_strongly_connected()
+    assert G.shortest_path(1, 4) == [1, 2, 3, 4]
+    assert G.link_ids_in_path([1, 2, 3, 4]) == [10, 30, 40]
+    assert G.shortest_path(4, 1) is None
+    with pytest.raises(NodeNotFoundError):
+        G.shortest_path(1, 6)
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_csr_graph_update(request):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+
+    G = CSRGraph(
+        A=[1, 2, 2, 3, 4],
+        B=[2, 1, 3, 4, 3],
+        weights=[1, 1, 1, 1, 1],
+        link_ids=[10, 20, 30, 40, 50],
+        node_ids=[5],
+    )
+    G.update(
+        remove_link_ids=[30, 50],
+        A=[2, 6],
+        B=[6, 4],
+        weights=[2, 3],
+        link_ids=[60, 70],
+        remove_node_ids=[3, 5],
+    )
+    # node 3 is still the start of link 40 so it isn't removed
+    expected_G = CSRGraph(
+        A=[1, 2, 3, 2, 6],
+        B=[2, 1, 4, 6, 4],
+        weights=[1, 1, 1, 2, 3],
+        link_ids=[10, 20, 40, 60, 70],
+    )
+    for attr in ["node_ids", "indptr", "indices", "weights", "link_ids"]:
+        assert getattr(G, attr).tolist() == getattr(expected_G, attr).tolist()
+    assert G.shortest_path(1, 4) == [1, 2, 6, 4]
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
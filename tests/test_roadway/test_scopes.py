@@ -1,13 +1,20 @@
 """Tests for scoped link values."""
 
 # Rest of the code...
+import copy
+
+import pandas as pd
+
+from network_wrangler import WranglerLogger
 from network_wrangler.roadway.links.scopes import (
+    SCOPED_PROP_TABLE_COLUMNS,
     _filter_to_conflicting_scopes,
     _filter_to_conflicting_timespan_scopes,
     _filter_to_matching_scope,
     _filter_to_matching_timespan_scopes,
     _filter_to_overlapping_scopes,
     _filter_to_overlapping_timespan_scopes,
+    scoped_prop_table,
 )
 
 
@@ -115,3 +122,96 @@ def test_filter_to_overlapping_scopes():
     ]
     result = _filter_to_overlapping_scopes(scoped_prop_list, category, timespan)
     assert [i.model_dump(exclude_none=True) for i in result] == expected_result
+
+
+def test_scoped_prop_table(request, small_net):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = copy.deepcopy(small_net)
+
+    def _scoped_lanes_card(link_ids, scoped):
+        return {
+            "project": f"scoped lanes {link_ids}",
+            "roadway_property_change": {
+                "facility": {"links": {"model_link_id": link_ids}},
+                "property_changes": {"lanes": {"set": 3, "scoped": scoped}},
+            },
+        }
+
+    net = net.apply(
+        _scoped_lanes_card(
+            [111, 112],
+            [
+                {"timespan": ["6:00", "9:00"], "set": 2},
+                {"category": "hov2", "timespan": ["15:00", "19:00"], "set": 1},
+                {"timespan": ["22:00", "4:00"], "set": 4},
+            ],
+        )
+    )
+    table = net.scoped_prop_table("lanes")
+    assert table.columns.tolist() == SCOPED_PROP_TABLE_COLUMNS
+    assert table.loc[table.link_idx == 111, "start_sec"].tolist() == [21600, 54000, 79200]
+    assert table.loc[table.link_idx == 111, "end_sec"].tolist() == [32400, 68400, 100800]
+
+    def _lanes(**kwargs):
+        return net.get_property_by_timespan_and_group("lanes", **kwargs).loc[[111, 113], "lanes"]
+
+    assert _lanes(timespan=["6:00", "9:00"]).tolist() == [2, small_net.links_df.lanes[113]]
+    assert _lanes(timespan=["7:00", "12:00"]).tolist()[0] == 2
+    assert _lanes(timespan=["7:00", "12:00"], strict_timespan_match=True).tolist()[0] == 3
+    assert _lanes(timespan=["15:00", "18:00"], category="hov2").tolist()[0] == 1
+    assert _lanes(timespan=["15:00", "18:00"], category="sov").tolist()[0] == 3
+    assert _lanes(timespan=["23:00", "3:00"]).tolist()[0] == 4
+
+    # the table is updated rather than re-created when links are edited
+    net = net.apply(_scoped_lanes_card([113], [{"timespan": ["6:00", "9:00"], "set": 1}]))
+    net.delete_links({"model_link_id": [112]})
+    updated_table = net.scoped_prop_table("lanes")
+    assert updated_table is net.scoped_prop_table("lanes")
+    assert _lanes(timespan=["6:00", "9:00"]).tolist() == [2, 1]
+    pd.testing.assert_frame_equal(
+        updated_table.sort_values(["link_idx", "start_sec"]).reset_index(drop=True),
+        scoped_prop_table(net.links_df, "lanes"),
+    )
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_get_properties_by_timespans_and_groups(request, small_net):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = copy.deepcopy(small_net)
+    net = net.apply(
+        {
+            "project": "scoped lanes",
+            "roadway_property_change": {
+                "facility": {"links": {"model_link_id": [111, 112]}},
+                "property_changes": {
+                    "lanes": {
+                        "set": 3,
+                        "scoped": [
+                            {"timespan": ["6:00", "9:00"], "set": 2},
+                            {"category": "hov2", "timespan": ["15:00", "19:00"], "set": 1},
+                        ],
+                    }
+                },
+            },
+        }
+    )
+    timespans = {"AM": ["6:00", "9:00"], "PM": ["15:00", "19:00"], "day": ["00:00", "24:00"]}
+    categories = ["any", "hov2"]
+    wide_df = net.get_properties_by_timespans_and_groups(
+        ["lanes", "drive_access"], timespans, categories=categories
+    )
+    assert wide_df.loc[111, ["lanes_AM", "lanes_hov2_AM", "lanes_hov2_PM"]].tolist() == [2, 2, 1]
+    assert wide_df.loc[113, "lanes_AM"] == small_net.links_df.loc[113, "lanes"]
+    # same as querying each property, category and timespan individually
+    for prop in ["lanes", "drive_access"]:
+        for category in categories:
+            for ts_name, timespan in timespans.items():
+                col = f"{prop}_{ts_name}" if category == "any" else f"{prop}_{category}_{ts_name}"
+                pd.testing.assert_series_equal(
+                    wide_df[col],
+                    net.get_property_by_timespan_and_group(
+                        prop, category=category, timespan=timespan
+                    )[prop],
+                    check_names=False,
+                )
+    WranglerLogger.info(f"--Finished: {request.node.name}")
@@ -403,3 +403,46 @@ def test_query_builder(request, test_spec):
     assert sel_query == answer
 
     WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_get_segment_selections(request, small_net):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    net = copy.deepcopy(small_net)
+    _selection_dicts = [
+        {
+            "links": {"name": ["7th St East"]},
+            "from": {"model_node_id": 5},
+            "to": {"model_node_id": 8},
+        },
+        {
+            "links": {"name": ["7th St East"]},
+            "from": {"model_node_id": 5},
+            "to": {"model_node_id": 7},
+        },
+        {
+            "links": {"name": ["7th St East"]},
+            "from": {"model_node_id": 8},
+            "to": {"model_node_id": 5},
+        },
+        {
+            "links": {"name": ["9th St East"]},
+            "from": {"model_node_id": 1},
+            "to": {"model_node_id": 4},
+        },
+        {"links": {"model_link_id": [111, 112]}},
+    ]
+    answer_selected_links = [[119, 121, 123], [119, 121], [124, 122, 120], [111, 113, 115]]
+
+    selections = net.get_segment_selections(_selection_dicts)
+    for _selection, answer in zip(selections, answer_selected_links):
+        # found without building a subnet per segment
+        assert _selection.segment._subnet is None
+        assert set(_selection.selected_links) == set(answer)
+        assert net.get_selection(_selection.raw_selection_dict) is _selection
+
+    # should match the subnet-based search
+    for selection_dict, answer in zip(_selection_dicts, answer_selected_links):
+        assert set(small_net.get_selection(selection_dict).selected_links) == set(answer)
+
+    assert set(selections[-1].selected_links) == {111, 112}
+    WranglerLogger.info(f"--Finished: {request.node.name}")
@@ -6,6 +6,8 @@ To run with print statments, use `pytest -s tests/test_scenario.py`
 
 import copy
 
+import numpy as np
+import pandas as pd
 import pytest
 from projectcard import ProjectCard, read_card, write_card
 
@@ -17,6 +19,7 @@ from network_wrangler.scenario import (
     create_scenario,
     load_scenario,
 )
+from network_wrangler.utils.io_table import SCHEMA_STAMP_SUFFIX
 
 
 def test_default_config(request):
@@ -261,6 +264,65 @@ def test_scenario_write_load(request, small_net, small_transit_net, test_out_dir
     )
 
 
+def test_scenario_write_concurrently(request, small_net, small_transit_net, test_out_dir):
+    """Writing tables at once in threads should give the same files with no temporary files."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    base_scenario = {"road_net": small_net, "transit_net": small_transit_net}
+    scenario = create_scenario(base_scenario=base_scenario, name="concurrent")
+    scenario_write_dir = test_out_dir / "concurrent_scenario"
+    scenario_file_path = scenario.write(
+        scenario_write_dir, "concurrent", projects_write=False, max_workers=4
+    )
+    assert not list(scenario_write_dir.rglob("*.tmp-*"))
+    transit_files = [
+        f for f in (scenario_write_dir / "transit").iterdir() if f.suffix != SCHEMA_STAMP_SUFFIX
+    ]
+    assert len(transit_files) == len(small_transit_net.feed.table_names)
+
+    loaded_scenario = load_scenario(scenario_file_path, name="loaded")
+    assert loaded_scenario.road_net.links_df.shape == small_net.links_df.shape
+    assert loaded_scenario.transit_net.feed.trips.shape == small_transit_net.feed.trips.shape
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_scenario_shared_base(request, small_net, small_transit_net):
+    """Scenarios sharing a base should share its tables until they are edited."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    base_scenario = {"road_net": small_net, "transit_net": small_transit_net}
+    base_lanes = small_net.links_df["lanes"].copy()
+    alt_scenarios = [
+        create_scenario(base_scenario=base_scenario, name=f"alt_{i}", shared_base=True)
+        for i in range(2)
+    ]
+    assert base_scenario["road_net"] is small_net
+    for scenario in alt_scenarios:
+        assert np.shares_memory(
+            scenario.road_net.links_df["lanes"].to_numpy(), small_net.links_df["lanes"].to_numpy()
+        )
+        assert scenario.transit_net.feed.trips is not small_transit_net.feed.trips
+        assert scenario.transit_net.road_net is scenario.road_net
+
+    alt_scenarios[0].road_net = alt_scenarios[0].road_net.apply(
+        {
+            "project": "widen",
+            "roadway_property_change": {
+                "facility": {"links": {"model_link_id": [111, 112]}},
+                "property_changes": {"lanes": {"set": 7}},
+            },
+        }
+    )
+    alt_scenarios[1].road_net = alt_scenarios[1].road_net.apply(
+        {
+            "project": "pycode",
+            "pycode": "roadway_net.links_df.loc[:, 'lanes'] = 9",
+        }
+    )
+    assert (alt_scenarios[0].road_net.links_df.loc[[111, 112], "lanes"] == 7).all()
+    assert (alt_scenarios[1].road_net.links_df["lanes"] == 9).all()
+    pd.testing.assert_series_equal(small_net.links_df["lanes"], base_lanes)
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
 def test_scenario_building_from_config(request, example_dir, test_out_dir):
     WranglerLogger.info(f"--Starting: {request.node.name}")
 
@@ -277,6 +339,33 @@ def test_scenario_building_from_config(request, example_dir, test_out_dir):
     WranglerLogger.info(f"--Finished: {request.node.name}")
 
 
+def test_build_scenarios_from_configs(request, example_dir, test_out_dir):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+
+    from network_wrangler.configs import ScenarioConfig
+    from network_wrangler.scenario import build_scenarios_from_configs
+    from network_wrangler.utils.io_dict import load_dict
+
+    scenario_config_file = example_dir / "stpaul" / "myscenario.config.yml"
+    scenario_configs = []
+    for name in ["alt_a", "alt_b"]:
+        config_data = load_dict(scenario_config_file)
+        config_data["name"] = name
+        config_data["output_scenario"]["path"] = str(test_out_dir / name)
+        scenario_configs.append(
+            ScenarioConfig(**config_data, base_path=scenario_config_file.parent)
+        )
+
+    reports = build_scenarios_from_configs(scenario_configs, max_workers=2)
+    assert [r["name"] for r in reports] == ["alt_a", "alt_b"]
+    for report in reports:
+        assert report["seconds"] > 0
+        assert report["memory_bytes"] > 0
+        assert (test_out_dir / report["name"] / f"{report['name']}_scenario.yml").is_file()
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
 def test_tiered_scenario(request, stpaul_card_dir, stpaul_net, stpaul_transit_net, test_out_dir):
     WranglerLogger.info(f"--Starting: {request.node.name}")
 
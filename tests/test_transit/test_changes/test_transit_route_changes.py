@@ -297,6 +297,76 @@ def test_route_changes_project_card(
     WranglerLogger.info(f"--Finished: {request.node.name}")
 
 
+def test_route_changes_multiple_trips(
+    request,
+    stpaul_net: RoadwayNetwork,
+    stpaul_card_dir: str,
+    stpaul_transit_net: TransitNetwork,
+):
+    """Trips with the same stop pattern get the same new pattern but keep their own times."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+
+    transit_net = copy.deepcopy(stpaul_transit_net)
+    project_card = read_card(stpaul_card_dir / "transit.routing_change.yml")
+    sel = transit_net.get_selection(project_card.transit_routing_change["service"])
+    trip_ids = sel.selected_trips
+    orig_st = transit_net.feed.stop_times
+    orig_patterns = {
+        t: tuple(stop_times_for_trip_id(orig_st, t)["stop_id"].tolist()) for t in trip_ids
+    }
+    orig_departures = {
+        t: set(stop_times_for_trip_id(orig_st, t)["departure_time"].dropna()) for t in trip_ids
+    }
+
+    transit_net = transit_net.apply(project_card, reference_road_net=stpaul_net)
+
+    updated_st = transit_net.feed.stop_times
+    assert len(updated_st.loc[~updated_st.trip_id.isin(trip_ids)]) == len(
+        orig_st.loc[~orig_st.trip_id.isin(trip_ids)]
+    )
+    new_patterns = {}
+    for t in trip_ids:
+        trip_st = stop_times_for_trip_id(updated_st, t)
+        assert trip_st["stop_sequence"].tolist() == list(range(1, len(trip_st) + 1))
+        assert set(trip_st["departure_time"].dropna()) <= orig_departures[t]
+        pattern = tuple(trip_st["stop_id"].tolist())
+        assert new_patterns.setdefault(orig_patterns[t], pattern) == pattern
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_route_changes_shape_patterns(
+    request,
+    stpaul_net: RoadwayNetwork,
+    stpaul_card_dir: str,
+    stpaul_transit_net: TransitNetwork,
+):
+    """Trips whose shapes had the same node pattern get shapes with the same new pattern."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+
+    transit_net = copy.deepcopy(stpaul_transit_net)
+    project_card = read_card(stpaul_card_dir / "transit.routing_change.yml")
+    sel = transit_net.get_selection(project_card.transit_routing_change["service"])
+    trip_ids = sel.selected_trips
+    orig_feed = transit_net.feed
+    orig_patterns = {
+        t: tuple(shapes_for_trip_id(orig_feed.shapes, orig_feed.trips, t)["shape_model_node_id"])
+        for t in trip_ids
+    }
+
+    transit_net = transit_net.apply(project_card, reference_road_net=stpaul_net)
+
+    feed = transit_net.feed
+    new_patterns = {}
+    for t in trip_ids:
+        trip_shape = shapes_for_trip_id(feed.shapes, feed.trips, t)
+        assert trip_shape["shape_pt_sequence"].is_monotonic_increasing
+        pattern = tuple(trip_shape["shape_model_node_id"])
+        assert new_patterns.setdefault(orig_patterns[t], pattern) == pattern
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
 def test_wo_existing(request, stpaul_net: RoadwayNetwork, stpaul_transit_net: TransitNetwork):
     WranglerLogger.info(f"--Starting: {request.node.name}")
 
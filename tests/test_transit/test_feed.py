@@ -34,6 +34,23 @@ def test_table_names_with_field(request, small_transit_net, prop, expected_table
     WranglerLogger.info(f"--Finished: {request.node.name}")
 
 
+def test_feed_copy(request, small_transit_net):
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    feed = small_transit_net.feed
+    orig_trips = feed.trips.copy()
+    feed_copy = feed.copy()
+    assert feed_copy == feed
+
+    trips = feed_copy.trips.copy(deep=False)
+    trips["projects"] = "copied,"
+    feed_copy.trips = trips
+    assert feed_copy.version != feed.version
+    pd.testing.assert_frame_equal(feed.trips, orig_trips)
+    assert (feed_copy.trips["projects"] == "copied,").all()
+
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
 def test_trip_stop_times(request, small_transit_net):
     WranglerLogger.info(f"--Starting: {request.node.name}")
     from network_wrangler.transit.feed.stop_times import stop_times_for_trip_id
@@ -3,6 +3,8 @@
 Run just these tests using `pytest tests/test_utils/test_data.py`
 """
 
+import contextlib
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -14,8 +16,11 @@ from network_wrangler.utils.data import (
     DataSegmentationError,
     InvalidJoinFieldError,
     MissingPropertiesError,
+    TokenIndex,
+    copy_on_write,
     dict_to_query,
     diff_dfs,
+    filter_df_to_predicates,
     isin_dict,
     list_like_columns,
     segment_data_by_selection,
@@ -624,3 +629,107 @@ def test_isin_dict_empty_dataframe():
     expected_df = pd.DataFrame(columns=["col1", "col2"])
     result_df = isin_dict(df, d)
     pd.testing.assert_frame_equal(result_df, expected_df)
+
+
+def test_token_index():
+    df = pd.DataFrame(
+        {
+            "name": ["6th Street", "East 16th St", "Sixth Ave", None, "I-35E", "Main St"],
+            "ref": ["", "", "", "I 94", "I 35E", ""],
+            "lanes": [1, 2, 3, 4, 5, 6],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+    token_index = TokenIndex(df, ["name", "ref", "missing"])
+    assert token_index.columns == ["name", "ref"]
+
+    assert set(token_index.candidates("name", "6th")) == {10, 11}
+    assert set(token_index.candidates("name", "h St")) == {10, 11}
+    assert set(token_index.candidates("name", "35E")) == {14}
+    assert len(token_index.candidates("name", "Broadway")) == 0
+    # can't be used for non-string values or regex patterns
+    assert token_index.candidates("lanes", "1") is None
+    assert token_index.candidates("name", "St.") is None
+    assert token_index.candidates("name", 6) is None
+
+    _sel = {"name": ["Sixth", "6th"], "ref": "", "lanes": [1, 2]}
+    assert set(token_index.candidates_for_selection(_sel)) == {10, 11, 12}
+    assert token_index.candidates_for_selection({"lanes": 1}) is None
+
+    # results are the same with and without the index
+    for sel in [{"name": ["6th", "Sixth"]}, {"name": "St", "lanes": 2}, {"ref": "I 35E"}]:
+        tm.assert_frame_equal(df.dict_query(sel), df.dict_query(sel, token_index=token_index))
+        tm.assert_frame_equal(isin_dict(df, sel), isin_dict(df, sel, token_index=token_index))
+
+
+def test_dict_query():
+    df = pd.DataFrame(
+        {
+            "name": ["6th Street", ["Sixth Ave", "MN 5"], 'Joe\'s "Place"', None, "Main St"],
+            "lanes": [1, 2, 3, 4, 2],
+            "drive_access": [True, True, False, True, True],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+    assert df.dict_query({"name": "6th"}).index.tolist() == [10]
+    # list-valued cells match if any of their items match
+    assert df.dict_query({"name": ["6th", "Sixth"]}).index.tolist() == [10, 11]
+    # values with quotes
+    assert df.dict_query({"name": '"Place"'}).index.tolist() == [12]
+    assert df.dict_query({"name": "St", "lanes": [2, 3]}).index.tolist() == [14]
+    assert df.dict_query({"lanes": 2, "drive_access": True}).index.tolist() == [11, 14]
+
+    # cached factorizations are re-used for the same version and refreshed for a new one
+    assert df.dict_query({"name": "Street"}, version=1).index.tolist() == [10]
+    df.loc[14, "name"] = "Main Street"
+    assert df.dict_query({"name": "Street"}, version=1).index.tolist() == [10]
+    assert df.dict_query({"name": "Street"}, version=2).index.tolist() == [10, 14]
+    df.loc[10, "name"] = "Broadway"
+    assert df.dict_query({"name": "Street"}).index.tolist() == [14]
+    assert df.dict_query({"name": "Broadway"}).index.tolist() == [10]
+
+
+def test_copy_on_write():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    orig_df = df.copy()
+    cow_df = copy_on_write(df, ["a"])
+    cow_df.loc[[0, 2], "a"] = 10
+    cow_df["b"] = cow_df["b"] + "!"
+    cow_df["c"] = True
+    tm.assert_frame_equal(df, orig_df)
+    assert cow_df["a"].tolist() == [10, 2, 10]
+    assert cow_df["b"].tolist() == ["x!", "y!", "z!"]
+
+    # editing a shared column in place either raises or copies it, but never changes df
+    cow_df = copy_on_write(df, ["a"])
+    with contextlib.suppress(ValueError):
+        cow_df.loc[1, "b"] = "changed"
+    tm.assert_frame_equal(df, orig_df)
+    df.loc[1, "b"] = "base can still be edited"
+
+
+def test_filter_df_to_predicates():
+    df = pd.DataFrame(
+        {
+            "roadway": ["primary", "secondary", "residential", None],
+            "drive_access": [True, True, False, True],
+            "lanes": [3, 2, 1, 1],
+        }
+    )
+    assert filter_df_to_predicates(df, None) is df
+    filtered_df = filter_df_to_predicates(
+        df, [("drive_access", "==", True), ("roadway", "in", ["primary", "secondary"])]
+    )
+    assert filtered_df.index.tolist() == [0, 1]
+    # list of lists is an "or" of "and"s
+    filtered_df = filter_df_to_predicates(df, [[("lanes", ">=", 3)], [("roadway", "==", None)]])
+    assert filtered_df.index.tolist() == [0]
+    assert filter_df_to_predicates(df, [("roadway", "not in", ["primary"])]).index.tolist() == [
+        1,
+        2,
+        3,
+    ]
+    with pytest.raises(ValueError, match="Filter op ~ not one of"):
+        filter_df_to_predicates(df, [("lanes", "~", 1)])
+    with pytest.raises(DataframeSelectionError):
+        filter_df_to_predicates(df, [("name", "==", "Main St")])
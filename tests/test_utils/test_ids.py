@@ -0,0 +1,38 @@
+"""Tests for /utils/ids.
+
+Run just these tests using `pytest tests/test_utils/test_ids.py`
+"""
+
+import pandas as pd
+import pytest
+
+from network_wrangler.utils.ids import (
+    IdAllocator,
+    IdCreationError,
+    generate_list_of_new_ids_from_existing,
+)
+
+
+def test_id_allocator_from_range():
+    allocator = IdAllocator(pd.Series([100, 110, 130, 5]))
+    new_ids = allocator.from_range(3, (100, 200), step=10)
+    assert new_ids.tolist() == [120, 140, 150]
+    assert allocator.is_taken([120, 160]).tolist() == [True, False]
+    assert allocator.from_range(2, (100, 200), step=10, reserve=False).tolist() == [160, 170]
+    assert allocator.from_range(1, (100, 200), step=10).tolist() == [160]
+    with pytest.raises(IdCreationError):
+        allocator.from_range(5, (100, 200), step=10)
+
+
+def test_id_allocator_from_scalar():
+    allocator = IdAllocator([1, 2, 3, 1002])
+    assert allocator.from_scalar([1, 3], 1000).tolist() == [1001, 1003]
+    with pytest.raises(IdCreationError):
+        allocator.from_scalar([2], 1000)
+
+
+def test_generate_list_of_new_ids_from_existing():
+    new_ids = generate_list_of_new_ids_from_existing(
+        ["a1", "a2"], pd.Series(["a1", "a2", "a111"]), 100
+    )
+    assert new_ids == ["a121", "a112"]
@@ -125,3 +125,45 @@ def test_convert_v1_v0_links():
     val_converted_v1 = links_converted_v0_df.loc[1, "lanes"]
     assert val_v0["default"] == val_converted_v1["default"]
     assert val_v0["timeofday"] == val_converted_v1["timeofday"]
+
+
+def test_write_table_atomic(request, tmp_path):
+    """A failed write shouldn't touch the existing file or leave a temporary file behind."""
+    import pandas as pd
+
+    from network_wrangler.utils.io_table import write_table
+
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    out_file = tmp_path / "table.csv"
+    write_table(pd.DataFrame({"a": [1, 2]}), out_file)
+    original = out_file.read_text()
+
+    with pytest.raises(NotImplementedError):
+        write_table(pd.DataFrame({"a": [3]}), tmp_path / "table.xyz")
+    with pytest.raises(TypeError):
+        write_table(pd.DataFrame({"a": [3]}), out_file, overwrite=True, not_a_kwarg=True)
+    assert out_file.read_text() == original
+    assert [p.name for p in tmp_path.iterdir()] == ["table.csv"]
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_run_table_writes(request):
+    from network_wrangler.utils.io_table import run_table_writes
+
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    written = []
+
+    def _fail():
+        msg = "failed write"
+        raise ValueError(msg)
+
+    timings = run_table_writes(
+        {"a": lambda: written.append("a"), "b": lambda: written.append("b")}, max_workers=2
+    )
+    assert set(timings) == {"a", "b"}
+    assert sorted(written) == ["a", "b"]
+
+    with pytest.raises(ValueError, match="failed write"):
+        run_table_writes({"fail": _fail, "c": lambda: written.append("c")}, max_workers=2)
+    assert "c" in written
+    WranglerLogger.info(f"--Finished: {request.node.name}")
@@ -4,11 +4,22 @@ Run just these tests using `pytest tests/test_utils/test_models.py`
 """
 
 import pandas as pd
+import pandera as pa
+import pytest
+from pandera.typing import Series
 from pydantic import BaseModel
 
+from network_wrangler.utils.data import (
+    VALIDATION_ATTR,
+    concat_with_attr,
+    copy_on_write,
+    validation_stamp,
+)
 from network_wrangler.utils.models import (
+    TableValidationError,
     coerce_extra_fields_to_type_in_df,
     submodel_fields_in_model,
+    validate_df_to_model,
 )
 
 
@@ -64,3 +75,68 @@ def test_coerce_extra_fields_to_type_in_df():
 
     # Check if list values are coerced
     assert coerced_data.field5 == ["5", "7"]
+
+
+class SampleTable(pa.DataFrameModel):
+    id: Series[int] = pa.Field(coerce=True, unique=True)
+    value: Series[float] = pa.Field(coerce=True, ge=0)
+    label: Series[str] = pa.Field(nullable=True, default="none")
+
+
+def test_validate_df_to_model_incremental():
+    df = pd.DataFrame({"id": [1, 2, 3], "value": [1.0, 2.0, 3.0], "label": ["a", "b", "c"]})
+    valid_df = validate_df_to_model(df, SampleTable)
+    assert valid_df.attrs[VALIDATION_ATTR]["modified_columns"] == []
+
+    edit_df = copy_on_write(valid_df, ["value", "label"], rows=[1])
+    edit_df.loc[1, "value"] = 5.0
+    edit_df.loc[1, "label"] = None
+    assert edit_df.attrs[VALIDATION_ATTR]["modified_rows"] == [1]
+    assert valid_df.attrs[VALIDATION_ATTR]["modified_rows"] == []
+
+    edit_df = validate_df_to_model(edit_df, SampleTable, mode="incremental")
+    assert edit_df.loc[1, "label"] == "none"
+    assert edit_df.attrs[VALIDATION_ATTR]["modified_columns"] == []
+
+    bad_df = copy_on_write(edit_df, ["value"], rows=[2])
+    bad_df.loc[2, "value"] = -1.0
+    with pytest.raises(TableValidationError):
+        validate_df_to_model(bad_df, SampleTable, mode="incremental")
+
+    dupe_df = copy_on_write(edit_df, ["id"], rows=[2])
+    dupe_df.loc[2, "id"] = 1
+    with pytest.raises(TableValidationError):
+        validate_df_to_model(dupe_df, SampleTable, mode="incremental")
+
+
+def test_validate_df_to_model_trusted():
+    df = pd.DataFrame({"id": [1, 1], "value": [-1.0, 2.0], "label": ["a", "b"]})
+    # values aren't checked when trusted and dtypes match
+    trusted_df = validate_df_to_model(df, SampleTable, mode="trusted")
+    assert trusted_df.attrs[VALIDATION_ATTR]["model"] == "SampleTable"
+    # but fall back to full validation if they don't
+    with pytest.raises(TableValidationError):
+        validate_df_to_model(df.astype({"value": object}), SampleTable, mode="trusted")
+
+
+def test_validate_df_to_model_incremental_untracked_edits():
+    df = pd.DataFrame({"id": [1, 2, 3], "value": [1.0, 2.0, 3.0], "label": ["a", "b", "c"]})
+    valid_df = validate_df_to_model(df, SampleTable)
+
+    # attrs are carried over to copies and slices, but they weren't validated
+    copy_df = valid_df.copy()
+    copy_df.loc[1, "value"] = -1.0
+    assert validation_stamp(copy_df) is None
+    assert validation_stamp(valid_df.iloc[:2]) is None
+    with pytest.raises(TableValidationError):
+        validate_df_to_model(copy_df, SampleTable, mode="incremental")
+
+    # tables which weren't modified since they were validated aren't validated again
+    assert validate_df_to_model(valid_df, SampleTable, mode="incremental") is valid_df
+    # in-place edits which change dtypes are still detected
+    valid_df["value"] = ["x", "2.0", "3.0"]
+    with pytest.raises(TableValidationError):
+        validate_df_to_model(valid_df, SampleTable, mode="incremental")
+
+    concat_df = concat_with_attr([copy_df, copy_df.iloc[:0]])
+    assert VALIDATION_ATTR not in concat_df.attrs
@@ -87,3 +87,29 @@ def test_filter_df_to_overlapping_timespans(case):
     filtered_df = filter_df_to_overlapping_timespans(overlap_df, query)
     result = filtered_df["id"].tolist()
     assert result == expected_result
+
+
+def test_timespan_to_seconds():
+    from network_wrangler.utils.time import timespan_to_seconds
+
+    assert timespan_to_seconds(["6:00", "9:00"]) == (21600, 32400)
+    assert timespan_to_seconds(["22:00", "2:00"]) == (79200, 93600)
+    assert timespan_to_seconds(["22:00", "26:00"]) == (79200, 93600)
+
+
+def test_filter_df_to_max_overlapping_timespans():
+    from network_wrangler.utils.time import filter_df_to_max_overlapping_timespans
+
+    df = pd.DataFrame(
+        {
+            "model_link_id": [1, 1, 2, 2],
+            "start_time": ["6:00", "7:00", "6:00", "12:00"],
+            "end_time": ["7:30", "10:00", "9:00", "13:00"],
+        }
+    ).astype({"start_time": "datetime64[s]", "end_time": "datetime64[s]"})
+    end_times = df["end_time"].copy()
+    result = filter_df_to_max_overlapping_timespans(df, ["7:00", "9:00"])
+    assert result.index.tolist() == [1, 2]
+    assert result["overlap_duration"].tolist() == [120, 120]
+    assert df["end_time"].equals(end_times)
+    assert "overlap_duration" not in df.columns
@@ -150,3 +150,79 @@ def test_check_one_or_one_superset_present(request):
     mixed_list = ["b", "c", "d"]
     assert check_one_or_one_superset_present(mixed_list, field_list) is False
     WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_df_hash_detects_changes(request):
+    """Makes sure df_hash picks up changes anywhere in large or complex dataframes."""
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+    from shapely.geometry import Point
+
+    n = 10000
+    df = pd.DataFrame({"a": np.arange(n), "b": np.arange(n) * 0.5, "c": [[1, 2]] * n})
+    hash1 = df.df_hash()
+    assert hash1 == df.copy().df_hash()
+
+    # change in the middle of a frame that is too large to print fully
+    df.loc[n // 2, "b"] = -1.0
+    hash2 = df.df_hash()
+    assert hash1 != hash2
+
+    # change to a list-like cell
+    df.at[n // 2, "c"] = [1, 3]
+    assert hash2 != df.df_hash()
+    assert df.df_hash.column_hashes(["a"]) == {"a": df.copy().df_hash.column_hashes()["a"]}
+
+    gdf = gpd.GeoDataFrame({"a": [1, 2]}, geometry=[Point(0, 0), Point(1, 1)])
+    hash1 = gdf.df_hash()
+    gdf.loc[1, "geometry"] = Point(1, 2)
+    assert hash1 != gdf.df_hash()
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_linestring_from_nodes(request):
+    import geopandas as gpd
+    import pandas as pd
+    from shapely.geometry import Point
+
+    from network_wrangler.errors import MissingNodesError
+    from network_wrangler.utils.geo import linestring_from_lats_lons, linestring_from_nodes
+
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    nodes_df = gpd.GeoDataFrame(
+        {"model_node_id": [3, 1, 2]}, geometry=[Point(3, 30), Point(1, 10), Point(2, 20)]
+    )
+    links_df = pd.DataFrame({"A": [1, 2, 3], "B": [2, 3, 1]}, index=[10, 20, 30])
+
+    geoms = linestring_from_nodes(links_df, nodes_df)
+    assert geoms.index.tolist() == [10, 20, 30]
+    assert geoms.loc[20].equals(LineString([(2, 20), (3, 30)]))
+    assert geoms.loc[30].equals(LineString([(3, 30), (1, 10)]))
+
+    with pytest.raises(MissingNodesError):
+        linestring_from_nodes(pd.DataFrame({"A": [1], "B": [4]}), nodes_df)
+
+    lat_lon_df = pd.DataFrame({"lat_a": [10.0], "lon_a": [1.0], "lat_b": [20.0], "lon_b": [2.0]})
+    geoms = linestring_from_lats_lons(lat_lon_df, ["lat_a", "lat_b"], ["lon_a", "lon_b"])
+    assert geoms.iloc[0].equals(LineString([(1, 10), (2, 20)]))
+    WranglerLogger.info(f"--Finished: {request.node.name}")
+
+
+def test_quadkeys(request):
+    from network_wrangler.utils.geo import (
+        lon_lat_to_quadkey,
+        quadkeys_for_bounds,
+        tile_xy_to_quadkey,
+    )
+
+    WranglerLogger.info(f"--Starting: {request.node.name}")
+    assert tile_xy_to_quadkey([3], [5], 3).tolist() == ["213"]
+    assert lon_lat_to_quadkey([10, -10], [10, -10], 1).tolist() == ["1", "2"]
+    assert lon_lat_to_quadkey([-93.09], [44.95], 12)[0].startswith(
+        lon_lat_to_quadkey([-93.09], [44.95], 6)[0]
+    )
+    assert set(quadkeys_for_bounds((-10, -10, 10, 10), 1)) == {"0", "1", "2", "3"}
+    assert quadkeys_for_bounds((1, 1, 2, 2), 1) == ["1"]
+    WranglerLogger.info(f"--Finished: {request.node.name}")